@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vessels TaskScheduler.
+
+Creates N cron tasks with varied expressions (timing the next-run
+calculation against a minute-by-minute scan), times get_due_tasks, and
+measures dispatch lateness of planned tasks fired by the scheduler loop.
+
+Usage:
+    python -m scripts.benchmark_scheduler [--tasks N] [--planned M]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# A mix of frequent, hourly, daily, weekly and yearly schedules
+CRON_TEMPLATES = [
+    "*/{a} * * * *",
+    "{m} * * * *",
+    "{m} {h} * * *",
+    "{m} {h} * * {w}",
+    "{m} {h} {d} * *",
+    "{m} {h} {d} {mo} *",
+    "{m} 9-17 * * 0-4",
+]
+
+
+def random_expression(rng: random.Random) -> str:
+    """A cron expression drawn from CRON_TEMPLATES."""
+    return rng.choice(CRON_TEMPLATES).format(
+        a=rng.randint(2, 30),
+        m=rng.randint(0, 59),
+        h=rng.randint(0, 23),
+        d=rng.randint(1, 28),
+        mo=rng.randint(1, 12),
+        w=rng.randint(0, 6),
+    )
+
+
+def scan_next_run(parsed: dict[str, set[int]], after: datetime) -> datetime:
+    """Reference next-run search: test every minute for up to a year."""
+    current = (after + timedelta(minutes=1)).replace(second=0, microsecond=0)
+    for _ in range(525600):
+        if (
+            current.minute in parsed["minute"]
+            and current.hour in parsed["hour"]
+            and current.day in parsed["day"]
+            and current.month in parsed["month"]
+            and current.weekday() in parsed["weekday"]
+        ):
+            return current
+        current += timedelta(minutes=1)
+    raise ValueError("no match")
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the task scheduler")
+    parser.add_argument("--tasks", type=int, default=10_000, help="Cron tasks to schedule")
+    parser.add_argument("--scan-sample", type=int, default=200, help="Expressions timed with the minute scan")
+    parser.add_argument("--planned", type=int, default=500, help="Planned tasks fired by the loop")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    from src.vessels.scheduler import TaskScheduler
+    from src.vessels.scheduler.scheduler import CronParser
+
+    # Per-task creation logs would swamp the report
+    logging.getLogger("src.vessels.scheduler").setLevel(logging.WARNING)
+
+    rng = random.Random(args.seed)
+    expressions = [random_expression(rng) for _ in range(args.tasks)]
+    now = datetime.utcnow()
+
+    sample = expressions[: args.scan_sample]
+    start = time.perf_counter()
+    expected = [scan_next_run(CronParser.parse(e), now) for e in sample]
+    scan_ms = (time.perf_counter() - start) * 1000 / len(sample)
+    start = time.perf_counter()
+    found = [CronParser.get_next_run(e, now) for e in sample]
+    fieldwise_ms = (time.perf_counter() - start) * 1000 / len(sample)
+    if found != expected:
+        logger.error("Field-wise next run disagrees with the minute scan")
+        return 1
+    logger.info(f"next run per expression: scan {scan_ms:.3f} ms, field-wise {fieldwise_ms:.3f} ms")
+
+    scheduler = TaskScheduler(poll_interval=60.0)
+    start = time.perf_counter()
+    for i, expression in enumerate(expressions):
+        scheduler.create_scheduled(f"cron_{i}", expression, func=lambda: None)
+    logger.info(f"Created {args.tasks} cron tasks in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    for _ in range(100):
+        scheduler.get_due_tasks()
+    logger.info(f"get_due_tasks over {args.tasks} tasks: {(time.perf_counter() - start) * 10:.3f} ms")
+
+    lateness = []
+    done = threading.Event()
+    base = datetime.utcnow() + timedelta(seconds=0.5)
+
+    def record(due: datetime) -> None:
+        lateness.append((datetime.utcnow() - due).total_seconds() * 1000)
+        if len(lateness) == args.planned:
+            done.set()
+
+    for i in range(args.planned):
+        due = base + timedelta(seconds=rng.uniform(0, 2))
+        scheduler.create_planned(f"planned_{i}", due, func=record, args=(due,))
+
+    scheduler.start()
+    done.wait(timeout=30)
+    scheduler.stop()
+
+    if len(lateness) < args.planned:
+        logger.error(f"Only {len(lateness)} of {args.planned} planned tasks ran")
+        return 1
+    logger.info(
+        f"dispatch lateness over {args.planned} planned tasks: "
+        f"p50 {np.percentile(lateness, 50):.2f} ms, p99 {np.percentile(lateness, 99):.2f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Compare approximate vector search against brute force.
+
+Builds a clustered synthetic embedding set, then reports recall@k and
+query latency (p50/p99) for exact search and for IVFIndex at several
+nprobe settings.
+
+Usage:
+    python -m scripts.benchmark_vector_index [--vectors N] [--dim D] [--nprobe 1 4 8 16]
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+import numpy as np
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def make_vectors(count: int, dim: int, topics: int, rng: np.random.Generator) -> np.ndarray:
+    """Embeddings scattered around `topics` random directions."""
+    centers = rng.standard_normal((topics, dim))
+    return centers[rng.integers(topics, size=count)] + 0.5 * rng.standard_normal((count, dim))
+
+
+def run_queries(index, queries: np.ndarray, k: int) -> tuple[list[list[int]], np.ndarray]:
+    """Search every query, returning result ids and per-query latency in ms."""
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append([key for key, _ in index.search(query, k)])
+        latencies.append((time.perf_counter() - start) * 1000)
+    return results, np.asarray(latencies)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark ANN vector search")
+    parser.add_argument("--vectors", type=int, default=100_000, help="Indexed vectors")
+    parser.add_argument("--dim", type=int, default=384, help="Embedding dimension")
+    parser.add_argument("--topics", type=int, default=500, help="Clusters in the synthetic data")
+    parser.add_argument("--queries", type=int, default=200, help="Queries to time")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query (recall@k)")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32], help="IVF nprobe values")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    from src.vectors import ExactIndex, IVFIndex
+
+    rng = np.random.default_rng(args.seed)
+    vectors = make_vectors(args.vectors, args.dim, args.topics, rng)
+    queries = make_vectors(args.queries, args.dim, args.topics, rng)
+    ids = np.arange(args.vectors)
+
+    exact = ExactIndex()
+    exact.add(ids, vectors)
+    truth, exact_latency = run_queries(exact, queries, args.k)
+
+    ivf = IVFIndex()
+    start = time.perf_counter()
+    ivf.add(ids, vectors)
+    logger.info(f"Built IVF index over {args.vectors} vectors in {time.perf_counter() - start:.1f}s")
+
+    logger.info(f"{'index':<16}{'recall@' + str(args.k):>10}{'p50 ms':>10}{'p99 ms':>10}")
+    logger.info(
+        f"{'exact':<16}{1.0:>10.3f}"
+        f"{np.percentile(exact_latency, 50):>10.2f}{np.percentile(exact_latency, 99):>10.2f}"
+    )
+    for nprobe in args.nprobe:
+        ivf.nprobe = nprobe
+        found, latency = run_queries(ivf, queries, args.k)
+        recall = np.mean([
+            len(set(f) & set(t)) / max(1, len(t)) for f, t in zip(found, truth)
+        ])
+        logger.info(
+            f"{'ivf nprobe=' + str(nprobe):<16}{recall:>10.3f}"
+            f"{np.percentile(latency, 50):>10.2f}{np.percentile(latency, 99):>10.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
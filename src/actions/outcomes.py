@@ -16,6 +16,7 @@ from typing import List, Optional
 
 from ..models import Action, Gestalt, Situation
 from ..graph.client import get_client
+from ..graph.proximity import edges_added
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +111,7 @@ class OutcomeTracker:
             """,
             {"agent_id": agent_id, "outcome_id": outcome_id}
         )
+        edges_added([(agent_id, outcome_id, None)])
 
         logger.info(f"Recorded action {action.id} for agent {agent_id} in situation {situation.name}")
 
@@ -252,6 +254,7 @@ class OutcomeTracker:
             """,
             {"agent_id": outcome.agent_id, "lesson_id": lesson_id}
         )
+        edges_added([(outcome.id, lesson_id, None), (outcome.agent_id, lesson_id, None)])
 
         logger.info(f"Created lesson {lesson_id} from outcome {outcome.id}")
 
@@ -28,7 +28,9 @@ from src.evolution.population import Population
 from src.evolution.selection import Selection
 from src.evolution.crossover import Crossover
 from src.evolution.mutation import Mutation
-from src.evolution.loop import EvolutionLoop, TopologyEvaluator
+from src.evolution.loop import EvolutionLoop
+from src.evolution.evaluation import IsolatedTopologyEvaluator
+from src.evolution.cache import FitnessCache
 
 logger = logging.getLogger(__name__)
 
@@ -173,6 +175,7 @@ class SimulatorController:
         generations: int = GENERATIONS,
         concept_nodes: list[str] | None = None,
         checkpoint_dir: str | None = None,
+        max_workers: int | None = None,
     ) -> dict:
         """
         Run the evolutionary search for valid topologies.
@@ -182,6 +185,7 @@ class SimulatorController:
             generations: Maximum generations to run
             concept_nodes: Optional list of concept node IDs
             checkpoint_dir: Optional checkpoint directory
+            max_workers: Fitness evaluation processes (default: CPU count)
 
         Returns:
             Dict with evolution results
@@ -204,11 +208,11 @@ class SimulatorController:
         crossover = Crossover()
         mutation = Mutation()
 
-        # Create evaluator
-        evaluator = TopologyEvaluator(
-            self.alignment_tester,
+        # Create evaluator: each individual runs on its own in-memory graph
+        evaluator = IsolatedTopologyEvaluator.from_substrate(
             self.substrate,
             num_stimuli=50,
+            max_workers=max_workers,
         )
 
         # Create evolution loop
@@ -220,10 +224,14 @@ class SimulatorController:
             evaluator=evaluator,
             generations=generations,
             checkpoint_dir=checkpoint_dir,
+            fitness_cache=FitnessCache(),
         )
 
         # Run evolution
-        best = evolution.run()
+        try:
+            best = evolution.run()
+        finally:
+            evaluator.close()
 
         # Prepare result
         result = {
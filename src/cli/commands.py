@@ -13,6 +13,7 @@ from ..functions.test_coherence import test_coherence
 from ..functions.introspect import introspect
 from ..functions.spawn import spawn_agent
 from ..functions.heal import check_graph_health
+from ..functions.retention import compact_trajectories
 from ..mercy.chances import get_active_warnings
 from ..knowledge.pool import get_recent_lessons
 
@@ -57,8 +58,10 @@ def reset(confirm):
 @click.option("--strategy", default="truncation",
               type=click.Choice(["truncation", "tournament", "roulette", "elitism"]),
               help="Selection strategy")
+@click.option("--workers", default=None, type=int,
+              help="Candidates tested concurrently (default: kiln.workers in config)")
 @click.option("--quiet", is_flag=True, help="Suppress progress output")
-def kiln(population, generations, mutation, strategy, quiet):
+def kiln(population, generations, mutation, strategy, workers, quiet):
     """Run the kiln evolution loop with mercy."""
     click.echo(f"Starting kiln: {population} candidates, {generations} generations")
     click.echo("Remember: Trustworthiness is absolute; other virtues allow growth")
@@ -71,7 +74,8 @@ def kiln(population, generations, mutation, strategy, quiet):
         max_generations=generations,
         mutation_rate=mutation,
         selection_strategy=strategy,
-        verbose=not quiet
+        verbose=not quiet,
+        workers=workers
     )
 
     click.echo(f"\nFinal population: {len(result['final_population'])} agents")
@@ -326,6 +330,16 @@ def health():
             click.echo(f"  {v['id']} ({v['name']}): degree {v['degree']}")
 
 
+@cli.command()
+@click.option("--max-age-days", default=7.0, help="Roll up trajectories older than this")
+@click.option("--keep", default=200, help="Newest trajectories each agent keeps")
+def compact(max_age_days, keep):
+    """Roll up old trajectories into per-agent/virtue statistics."""
+    result = compact_trajectories(max_age_days=max_age_days, keep_per_agent=keep)
+    click.echo(f"Scanned {result['scanned']} trajectories")
+    click.echo(f"Rolled up and deleted {result['rolled_up']} into {result['rollups']} rollups")
+
+
 @cli.command()
 def virtues():
     """List all virtue anchors with tier information."""
@@ -39,6 +39,9 @@ GENERATIONS: Final[int] = 100
 MUTATION_RATE: Final[float] = 0.1
 CROSSOVER_RATE: Final[float] = 0.3
 ELITISM_COUNT: Final[int] = 2
+FITNESS_CACHE_SIZE: Final[int] = 10000  # topologies kept in the fitness LRU cache
+TOPOLOGY_HASH_DECIMALS: Final[int] = 4  # weight precision for topology hashes
+CHECKPOINT_INTERVAL: Final[int] = 10  # generations between evolution checkpoints
 
 # Self-Healing Constants
 LOCKIN_THRESHOLD_STEPS: Final[int] = 50
@@ -50,3 +53,14 @@ BLINDNESS_THRESHOLD_SECONDS: Final[int] = 86400
 EDGE_REMOVAL_THRESHOLD: Final[float] = 0.01
 MIN_EDGE_WEIGHT: Final[float] = 0.0
 MAX_EDGE_WEIGHT: Final[float] = 1.0
+VIRTUE_PROXIMITY_HOPS: Final[int] = 3  # hop radius of the virtue-proximity index
+
+# Storage Constants
+WRITE_BATCH_SIZE: Final[int] = 1000  # rows per batched UNWIND statement
+GESTALT_CACHE_SIZE: Final[int] = 4096  # agents kept in the gestalt LRU cache
+
+# Vector Search Constants
+VECTOR_INDEX_EXACT_BELOW: Final[int] = 2048  # sizes searched exhaustively by ANN indexes
+IVF_NPROBE: Final[int] = 8  # clusters scored per IVF query
+EMBEDDING_CACHE_SIZE: Final[int] = 50000  # embeddings kept by EmbeddingService
+EMBEDDING_BATCH_SIZE: Final[int] = 64  # texts per embedding batch call
@@ -2,7 +2,7 @@
 Dynamics engine for the Virtue Basin Simulator.
 
 Implements:
-- Activation spread through the graph
+- Activation spread through the graph (dict and sparse-matrix engines)
 - Hebbian learning for edge strengthening
 - Temporal decay for edge weakening
 - Perturbation for exploration
@@ -10,6 +10,7 @@ Implements:
 """
 
 from src.dynamics.activation import ActivationSpreader
+from src.dynamics.sparse import ActivationMatrix, SparseActivationSpreader
 from src.dynamics.hebbian import HebbianLearner
 from src.dynamics.decay import TemporalDecay
 from src.dynamics.perturbation import Perturbator
@@ -17,6 +18,8 @@ from src.dynamics.healing import SelfHealer
 
 __all__ = [
     "ActivationSpreader",
+    "ActivationMatrix",
+    "SparseActivationSpreader",
     "HebbianLearner",
     "TemporalDecay",
     "Perturbator",
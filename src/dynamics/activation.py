@@ -158,6 +158,40 @@ class ActivationSpreader:
 
         return trajectory
 
+    def spread_activation_batch(
+        self,
+        stimuli: list[tuple[list[str], float]],
+        max_steps: int = MAX_TRAJECTORY_LENGTH,
+        agent_id: str = "default",
+        stimulus_ids: list[str] | None = None,
+    ) -> list[Trajectory]:
+        """
+        Spread activation for several stimuli.
+
+        The dict engine runs the stimuli one after another; engines that can
+        advance stimuli together override this.
+
+        Args:
+            stimuli: List of (node_ids, strength) tuples
+            max_steps: Maximum number of steps per stimulus
+            agent_id: Agent ID for the trajectories
+            stimulus_ids: Optional stimulus IDs, one per stimulus
+
+        Returns:
+            One trajectory per stimulus, in input order
+        """
+        stimulus_ids = stimulus_ids or [f"stimulus_{i}" for i in range(len(stimuli))]
+        return [
+            self.spread_activation(
+                initial_nodes=nodes,
+                initial_strength=strength,
+                max_steps=max_steps,
+                agent_id=agent_id,
+                stimulus_id=stimulus_id,
+            )
+            for (nodes, strength), stimulus_id in zip(stimuli, stimulus_ids)
+        ]
+
     def _compute_step(
         self,
         activations: dict[str, float],
@@ -219,8 +253,7 @@ class ActivationSpreader:
 
     def _update_stored_activations(self, activations: dict[str, float]) -> None:
         """Update node activations in storage."""
-        for node_id, activation in activations.items():
-            self.node_manager.update_activation(node_id, activation)
+        self.node_manager.update_activations(activations)
 
     def inject_activation(
         self,
@@ -302,17 +335,15 @@ class MultiStepSpreader:
         Returns:
             List of trajectories
         """
-        trajectories = []
-        for i, (nodes, strength) in enumerate(stimuli):
-            trajectory = self.spreader.spread_activation(
-                initial_nodes=nodes,
-                initial_strength=strength,
-                max_steps=steps_per_stimulus,
-                stimulus_id=f"stimulus_{i}",
-                agent_id=agent_id,
-            )
-            trajectories.append(trajectory)
-            self.spreader.decay_all_activations(0.5)  # Partial reset between stimuli
+        trajectories = self.spreader.spread_activation_batch(
+            stimuli,
+            max_steps=steps_per_stimulus,
+            agent_id=agent_id,
+        )
+        # Each spread overwrites every stored activation, so decaying once after
+        # the last stimulus leaves the same state as decaying between stimuli
+        if trajectories:
+            self.spreader.decay_all_activations(0.5)
 
         self.trajectories.extend(trajectories)
         return trajectories
@@ -0,0 +1,381 @@
+"""
+Vectorized activation spread for the Virtue Basin Simulator.
+
+The dict engine in activation.py asks the substrate for every node's
+incoming edges on every step. This engine snapshots the graph once into
+a compressed sparse row (CSR) weight matrix and runs the whole trajectory
+as NumPy mat-vec operations:
+
+    x(t+1) = clip(decay ⊙ x(t) + W · x(t) · SPREAD_DAMPENING + leak ⊙ b + noise)
+
+Rows of W are targets, columns are sources. Virtue-to-virtue entries are
+dropped when the snapshot is built, so virtues only receive from concepts.
+
+Given the same graph and the same `random` seed, the result is the same
+Trajectory (path, captured_by, capture_time) as ActivationSpreader.
+
+spread_activation_batch stacks several stimuli into an (n, k) activation
+matrix and advances them together, dropping columns as they are captured.
+Batched noise comes from a NumPy generator seeded from `random`, so batches
+are reproducible under a fixed seed but do not replay the sequential noise.
+"""
+
+import logging
+import random
+from datetime import datetime
+
+import numpy as np
+
+from src.constants import (
+    CAPTURE_THRESHOLD,
+    MAX_ACTIVATION,
+    MAX_TRAJECTORY_LENGTH,
+    MIN_ACTIVATION,
+    SPREAD_DAMPENING,
+)
+from src.dynamics.activation import ActivationSpreader
+from src.models import Edge, Node, Trajectory
+
+logger = logging.getLogger(__name__)
+
+# Per-step retention and baseline leak, matching ActivationSpreader._compute_step
+VIRTUE_RETENTION = 0.6
+VIRTUE_BASELINE_LEAK = 0.15
+CONCEPT_RETENTION = 0.4
+CONCEPT_BASELINE_LEAK = 0.05
+NOISE_SIGMA = 0.005
+
+MIN_CAPTURE_STEPS = 3  # Need sustained capture, not just one spike
+MIN_PATH_LENGTH = 2  # Minimum steps before capture can occur
+
+
+class ActivationMatrix:
+    """
+    Immutable snapshot of the graph as a CSR weight matrix plus node masks.
+
+    Node order follows the substrate's get_all_nodes() order, and edges
+    within a row keep the substrate's edge order, so floating point sums
+    accumulate in the same order as the dict engine.
+    """
+
+    def __init__(
+        self,
+        node_ids: list[str],
+        baselines: np.ndarray,
+        virtue_mask: np.ndarray,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        data: np.ndarray,
+    ):
+        """
+        Initialize the matrix.
+
+        Args:
+            node_ids: Node IDs in row/column order
+            baselines: Baseline activation per node
+            virtue_mask: True where the node is a virtue anchor
+            indptr: CSR row pointer (length n + 1)
+            indices: CSR column (source) index per entry
+            data: CSR weight per entry
+        """
+        self.node_ids = node_ids
+        self.index = {node_id: i for i, node_id in enumerate(node_ids)}
+        self.baselines = baselines
+        self.virtue_mask = virtue_mask
+        self.concept_mask = ~virtue_mask
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        # Row index per entry, used to scatter-add products back to targets
+        self._rows = np.repeat(np.arange(len(node_ids)), np.diff(indptr))
+        self._nonempty = np.diff(indptr) > 0
+        self._retention = np.where(virtue_mask, VIRTUE_RETENTION, CONCEPT_RETENTION)
+        self._leak = np.where(virtue_mask, VIRTUE_BASELINE_LEAK, CONCEPT_BASELINE_LEAK)
+
+    @classmethod
+    def from_graph(cls, nodes: list[Node], edges: list[Edge], virtue_manager) -> "ActivationMatrix":
+        """
+        Build a matrix from node and edge lists.
+
+        Edges whose endpoints are not in `nodes` are ignored (they carry
+        zero activation in the dict engine), as are virtue-to-virtue edges.
+
+        Args:
+            nodes: All nodes in the graph
+            edges: All edges in the graph
+            virtue_manager: The VirtueManager instance
+
+        Returns:
+            The ActivationMatrix
+        """
+        node_ids = [node.id for node in nodes]
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        n = len(node_ids)
+
+        baselines = np.array([node.baseline for node in nodes], dtype=np.float64)
+        virtue_mask = np.array(
+            [virtue_manager.is_virtue_anchor(node_id) for node_id in node_ids],
+            dtype=bool,
+        )
+
+        rows: list[int] = []
+        cols: list[int] = []
+        weights: list[float] = []
+        for edge in edges:
+            target = index.get(edge.target_id)
+            source = index.get(edge.source_id)
+            if target is None or source is None:
+                continue
+            if virtue_mask[target] and virtue_mask[source]:
+                continue
+            rows.append(target)
+            cols.append(source)
+            weights.append(edge.weight)
+
+        rows_arr = np.asarray(rows, dtype=np.int64)
+        # Stable sort keeps per-target edge order intact
+        order = np.argsort(rows_arr, kind="stable")
+        indices = np.asarray(cols, dtype=np.int64)[order]
+        data = np.asarray(weights, dtype=np.float64)[order]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows_arr, minlength=n), out=indptr[1:])
+
+        return cls(node_ids, baselines, virtue_mask, indptr, indices, data)
+
+    @property
+    def size(self) -> int:
+        """Number of nodes in the matrix."""
+        return len(self.node_ids)
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored edges."""
+        return len(self.data)
+
+    def incoming(self, activations: np.ndarray) -> np.ndarray:
+        """
+        Compute dampened weighted input for every node.
+
+        Args:
+            activations: Activation vector (n,) or matrix (n, k) with one
+                column per stimulus
+
+        Returns:
+            Summed incoming activation per node, same shape as activations
+        """
+        if activations.ndim == 1:
+            products = self.data * activations[self.indices] * SPREAD_DAMPENING
+            return np.bincount(self._rows, weights=products, minlength=self.size)
+
+        out = np.zeros_like(activations)
+        if self.nnz:
+            products = self.data[:, None] * activations[self.indices] * SPREAD_DAMPENING
+            starts = self.indptr[:-1][self._nonempty]
+            out[self._nonempty] = np.add.reduceat(products, starts, axis=0)
+        return out
+
+    def step(self, activations: np.ndarray, noise: np.ndarray) -> np.ndarray:
+        """
+        Compute one step of activation dynamics.
+
+        Args:
+            activations: Current activation vector (n,) or matrix (n, k)
+            noise: Noise to add before bounding, same shape as activations
+
+        Returns:
+            New activations, same shape as the input
+        """
+        retention, leak, baselines = self._retention, self._leak, self.baselines
+        if activations.ndim == 2:
+            retention, leak, baselines = retention[:, None], leak[:, None], baselines[:, None]
+        new = activations * retention + self.incoming(activations) + baselines * leak
+        new += noise
+        return np.clip(new, MIN_ACTIVATION, MAX_ACTIVATION, out=new)
+
+
+class SparseActivationSpreader(ActivationSpreader):
+    """
+    ActivationSpreader that runs trajectories against an ActivationMatrix.
+
+    The graph is snapshotted once per spread (two bulk substrate reads)
+    instead of querying incoming edges for every node on every step.
+    """
+
+    def build_matrix(self) -> ActivationMatrix:
+        """
+        Snapshot the current graph into an ActivationMatrix.
+
+        Returns:
+            The ActivationMatrix
+        """
+        return ActivationMatrix.from_graph(
+            self.substrate.get_all_nodes(),
+            self.edge_manager.get_all_edges(),
+            self.virtue_manager,
+        )
+
+    def spread_activation(
+        self,
+        initial_nodes: list[str],
+        initial_strength: float = 1.0,
+        max_steps: int = MAX_TRAJECTORY_LENGTH,
+        trajectory_id: str | None = None,
+        agent_id: str = "default",
+        stimulus_id: str = "default",
+        matrix: ActivationMatrix | None = None,
+    ) -> Trajectory:
+        """
+        Spread activation through the graph.
+
+        Args:
+            initial_nodes: List of node IDs to activate initially
+            initial_strength: Initial activation strength
+            max_steps: Maximum number of steps before declaring escape
+            trajectory_id: Optional trajectory ID
+            agent_id: Agent ID for the trajectory
+            stimulus_id: Stimulus ID for the trajectory
+            matrix: Optional prebuilt snapshot to reuse
+
+        Returns:
+            Trajectory object with path and capture information
+        """
+        trajectory = Trajectory(
+            id=trajectory_id or f"traj_{datetime.utcnow().timestamp()}",
+            agent_id=agent_id,
+            stimulus_id=stimulus_id,
+        )
+
+        matrix = matrix or self.build_matrix()
+        n = matrix.size
+
+        activations = np.zeros(n, dtype=np.float64)
+        for node_id in initial_nodes:
+            i = matrix.index.get(node_id)
+            if i is not None:
+                activations[i] = min(MAX_ACTIVATION, initial_strength)
+
+        captured_idx = -1
+        consecutive = 0
+
+        for step in range(max_steps):
+            # Draw noise from the shared RNG in node order, as the dict engine does
+            noise = np.fromiter(
+                (random.gauss(0, NOISE_SIGMA) for _ in range(n)), dtype=np.float64, count=n
+            )
+            new_activations = matrix.step(activations, noise)
+
+            max_idx = int(np.argmax(new_activations))
+            trajectory.path.append(matrix.node_ids[max_idx])
+
+            if matrix.virtue_mask[max_idx] and new_activations[max_idx] > CAPTURE_THRESHOLD:
+                consecutive = consecutive + 1 if max_idx == captured_idx else 1
+                captured_idx = max_idx
+                if consecutive >= MIN_CAPTURE_STEPS and len(trajectory.path) >= MIN_PATH_LENGTH:
+                    trajectory.captured_by = matrix.node_ids[max_idx]
+                    trajectory.capture_time = step + 1
+                    logger.debug(f"Trajectory captured by {trajectory.captured_by} at step {step + 1}")
+                    break
+            else:
+                captured_idx = -1
+                consecutive = 0
+
+            activations = new_activations
+
+        self._update_stored_activations(dict(zip(matrix.node_ids, activations.tolist())))
+
+        return trajectory
+
+    def spread_activation_batch(
+        self,
+        stimuli: list[tuple[list[str], float]],
+        max_steps: int = MAX_TRAJECTORY_LENGTH,
+        agent_id: str = "default",
+        stimulus_ids: list[str] | None = None,
+        matrix: ActivationMatrix | None = None,
+    ) -> list[Trajectory]:
+        """
+        Spread activation for several stimuli as one matrix-matrix product per step.
+
+        Each column is one stimulus. A column leaves the batch as soon as it
+        achieves sustained capture, so the remaining work shrinks as
+        stimuli are captured.
+
+        Args:
+            stimuli: List of (node_ids, strength) tuples
+            max_steps: Maximum number of steps per stimulus
+            agent_id: Agent ID for the trajectories
+            stimulus_ids: Optional stimulus IDs, one per stimulus
+            matrix: Optional prebuilt snapshot to reuse
+
+        Returns:
+            One trajectory per stimulus, in input order
+        """
+        stimulus_ids = stimulus_ids or [f"stimulus_{i}" for i in range(len(stimuli))]
+        timestamp = datetime.utcnow().timestamp()
+        trajectories = [
+            Trajectory(id=f"traj_{timestamp}_{i}", agent_id=agent_id, stimulus_id=stimulus_id)
+            for i, stimulus_id in enumerate(stimulus_ids)
+        ]
+        if not stimuli:
+            return trajectories
+
+        matrix = matrix or self.build_matrix()
+        n, k = matrix.size, len(stimuli)
+        rng = np.random.default_rng(random.getrandbits(64))
+
+        activations = np.zeros((n, k), dtype=np.float64)
+        for col, (nodes, strength) in enumerate(stimuli):
+            for node_id in nodes:
+                i = matrix.index.get(node_id)
+                if i is not None:
+                    activations[i, col] = min(MAX_ACTIVATION, strength)
+
+        # Columns still running, mapped back to their stimulus index
+        columns = np.arange(k)
+        captured_idx = np.full(k, -1, dtype=np.int64)
+        consecutive = np.zeros(k, dtype=np.int64)
+        last_activations = activations[:, -1]
+
+        for step in range(max_steps):
+            noise = rng.normal(0.0, NOISE_SIGMA, size=activations.shape)
+            new_activations = matrix.step(activations, noise)
+
+            max_idx = np.argmax(new_activations, axis=0)
+            max_act = new_activations[max_idx, np.arange(len(columns))]
+            for col, node_idx in zip(columns.tolist(), max_idx.tolist()):
+                trajectories[col].path.append(matrix.node_ids[node_idx])
+
+            at_virtue = matrix.virtue_mask[max_idx] & (max_act > CAPTURE_THRESHOLD)
+            same = at_virtue & (max_idx == captured_idx)
+            consecutive = np.where(same, consecutive + 1, np.where(at_virtue, 1, 0))
+            captured_idx = np.where(at_virtue, max_idx, -1)
+
+            done = consecutive >= MIN_CAPTURE_STEPS
+            if step + 1 < MIN_PATH_LENGTH:
+                done[:] = False
+            for pos in np.flatnonzero(done).tolist():
+                trajectory = trajectories[columns[pos]]
+                trajectory.captured_by = matrix.node_ids[max_idx[pos]]
+                trajectory.capture_time = step + 1
+                if columns[pos] == k - 1:
+                    last_activations = activations[:, pos]
+
+            keep = ~done
+            activations = new_activations[:, keep]
+            columns = columns[keep]
+            captured_idx = captured_idx[keep]
+            consecutive = consecutive[keep]
+            if columns.size and columns[-1] == k - 1:
+                last_activations = activations[:, -1]
+            if not columns.size:
+                break
+
+        logger.debug(
+            f"Batch spread: {k} stimuli, "
+            f"{sum(t.was_captured for t in trajectories)} captured"
+        )
+
+        # Store the final state of the last stimulus, as a sequential run would
+        self._update_stored_activations(dict(zip(matrix.node_ids, last_activations.tolist())))
+
+        return trajectories
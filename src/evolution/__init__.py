@@ -2,24 +2,33 @@
 Topology evolution module for the Virtue Basin Simulator.
 
 Implements evolutionary search for valid soul topologies using:
-- Population management
+- Population management (dict- or array-backed individuals)
 - Selection operators
 - Crossover operators
 - Mutation operators
 - Generational evolution loop
+- Isolated, parallel fitness evaluation
+- Fitness memoisation by topology hash
 """
 
 from src.evolution.population import Population, Individual
+from src.evolution.compact import CompactIndividual, NodeIndex
 from src.evolution.selection import Selection
 from src.evolution.crossover import Crossover
 from src.evolution.mutation import Mutation
 from src.evolution.loop import EvolutionLoop
+from src.evolution.evaluation import IsolatedTopologyEvaluator
+from src.evolution.cache import FitnessCache
 
 __all__ = [
     "Population",
     "Individual",
+    "CompactIndividual",
+    "NodeIndex",
     "Selection",
     "Crossover",
     "Mutation",
     "EvolutionLoop",
+    "IsolatedTopologyEvaluator",
+    "FitnessCache",
 ]
@@ -0,0 +1,121 @@
+"""
+Fitness memoisation for topology evolution.
+
+Maps Individual.topology_hash() to the evaluation result, so unchanged
+clones and topologies seen in earlier generations skip the alignment test.
+"""
+
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+from src.constants import FITNESS_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class FitnessCache:
+    """
+    LRU cache of evaluation results keyed by topology hash.
+
+    Results are only comparable when they come from the same evaluator
+    configuration; use a fresh cache (or a separate file) per setup.
+    """
+
+    def __init__(self, max_size: int = FITNESS_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of results kept
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: str) -> dict | None:
+        """
+        Look up a result, marking it most recently used.
+
+        Args:
+            key: Topology hash
+
+        Returns:
+            Copy of the cached result, or None on a miss
+        """
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(result)
+
+    def put(self, key: str, result: dict) -> None:
+        """
+        Store a result, evicting the least recently used entry if full.
+
+        Args:
+            key: Topology hash
+            result: Evaluation result
+        """
+        self._entries[key] = dict(result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def reset_stats(self) -> None:
+        """Reset hit and miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write the cache to a JSON file, replacing it atomically.
+
+        Args:
+            path: Output file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"max_size": self.max_size, "entries": list(self._entries.items())}, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path, max_size: int | None = None) -> "FitnessCache":
+        """
+        Load a cache written by save().
+
+        Args:
+            path: Cache file
+            max_size: Override the stored maximum size
+
+        Returns:
+            FitnessCache with the stored entries in LRU order
+        """
+        with open(path) as f:
+            data = json.load(f)
+        cache = cls(max_size or data["max_size"])
+        for key, result in data["entries"]:
+            cache.put(key, result)
+        logger.info(f"Loaded {len(cache)} cached fitness results from {path}")
+        return cache
@@ -0,0 +1,158 @@
+"""
+Binary checkpoints for resumable evolution.
+
+A checkpoint is a single .npz file holding the whole population as flat
+edge arrays over one node table, the best-ever individual, the random
+module's state, operator parameters and loop history. Files are written
+to a temporary name and renamed into place, so a crash never leaves a
+truncated checkpoint behind.
+"""
+
+import json
+import logging
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from src.evolution.compact import CompactIndividual, NodeIndex
+from src.evolution.population import Individual
+from src.models import Edge
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_PATTERN = re.compile(r"checkpoint_gen(\d+)\.npz$")
+
+
+def encode_individuals(individuals: list, nodes: NodeIndex) -> tuple[dict, list[dict]]:
+    """
+    Flatten individuals into edge arrays over a node table.
+
+    Args:
+        individuals: Individuals or CompactIndividuals
+        nodes: Node table; node ids not yet in it are added
+
+    Returns:
+        (arrays, meta): arrays with indptr/src/dst/weight/fitness, and one
+        JSON-serialisable dict per individual for the remaining fields
+    """
+    indptr = [0]
+    src, dst, weight, meta = [], [], [], []
+    for ind in individuals:
+        rows = ind.edge_rows()
+        src.extend(nodes.add(s) for s, _, _ in rows)
+        dst.extend(nodes.add(d) for _, d, _ in rows)
+        weight.extend(w for _, _, w in rows)
+        indptr.append(len(weight))
+        meta.append({
+            "id": ind.id,
+            "generation": ind.generation,
+            "parent_ids": list(ind.parent_ids),
+            "alignment_result": ind.alignment_result,
+            "created_at": ind.created_at.isoformat(),
+        })
+
+    arrays = {
+        "indptr": np.asarray(indptr, dtype=np.int64),
+        "src": np.asarray(src, dtype=np.int32),
+        "dst": np.asarray(dst, dtype=np.int32),
+        "weight": np.asarray(weight, dtype=np.float64),
+        "fitness": np.asarray([ind.fitness for ind in individuals], dtype=np.float64),
+    }
+    return arrays, meta
+
+
+def decode_individuals(arrays: dict, meta: list[dict], nodes: NodeIndex, compact: bool) -> list:
+    """
+    Rebuild individuals written by encode_individuals.
+
+    Args:
+        arrays: indptr/src/dst/weight/fitness arrays
+        meta: Per-individual field dicts
+        nodes: Node table the indices refer to
+        compact: Build CompactIndividuals instead of Individuals
+
+    Returns:
+        List of individuals in the original order
+    """
+    individuals = []
+    indptr = arrays["indptr"]
+    for i, fields in enumerate(meta):
+        start, end = indptr[i], indptr[i + 1]
+        src, dst, weight = arrays["src"][start:end], arrays["dst"][start:end], arrays["weight"][start:end]
+        common = {
+            "id": fields["id"],
+            "fitness": float(arrays["fitness"][i]),
+            "generation": fields["generation"],
+            "parent_ids": fields["parent_ids"],
+            "alignment_result": fields["alignment_result"],
+            "created_at": datetime.fromisoformat(fields["created_at"]),
+        }
+        if compact:
+            ind = CompactIndividual(nodes=nodes, src=src, dst=dst, weight=weight, **common)
+        else:
+            ind = Individual(**common)
+            for s, d, w in zip(src.tolist(), dst.tolist(), weight.tolist()):
+                ind.set_edge(Edge(source_id=nodes.ids[s], target_id=nodes.ids[d], weight=w))
+        individuals.append(ind)
+    return individuals
+
+
+def operator_params(operator) -> dict:
+    """Scalar attributes of a selection/crossover/mutation operator."""
+    return {
+        name: value for name, value in vars(operator).items()
+        if not name.startswith("_") and isinstance(value, (bool, int, float, str))
+    }
+
+
+def write_checkpoint(path: Path, arrays: dict, meta: dict) -> None:
+    """
+    Atomically write a checkpoint file.
+
+    Args:
+        path: Destination .npz path
+        arrays: Named NumPy arrays
+        meta: JSON-serialisable metadata, stored as a string array
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(f, meta=np.array(json.dumps(meta)), **arrays)
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(path: Path) -> tuple[dict, dict]:
+    """
+    Read a checkpoint written by write_checkpoint.
+
+    Returns:
+        (arrays, meta)
+    """
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    meta = json.loads(str(arrays.pop("meta")))
+    return arrays, meta
+
+
+def encode_rng_state(state: tuple) -> tuple[np.ndarray, list]:
+    """Split random.getstate() into an integer array and a JSON-able rest."""
+    version, internal, gauss_next = state
+    return np.asarray(internal, dtype=np.uint64), [version, gauss_next]
+
+
+def decode_rng_state(internal: np.ndarray, extra: list) -> tuple:
+    """Inverse of encode_rng_state, suitable for random.setstate()."""
+    version, gauss_next = extra
+    return version, tuple(int(x) for x in internal), gauss_next
+
+
+def list_checkpoints(checkpoint_dir: Path) -> list[tuple[int, Path]]:
+    """(generation, path) for every checkpoint in a directory, oldest first."""
+    found = []
+    for path in Path(checkpoint_dir).glob("checkpoint_gen*.npz"):
+        match = CHECKPOINT_PATTERN.search(path.name)
+        if match:
+            found.append((int(match.group(1)), path))
+    return sorted(found)
@@ -0,0 +1,311 @@
+"""
+Array-backed individuals for large populations.
+
+Individual keeps one Edge model per edge in a dict keyed by
+"source->target" strings. CompactIndividual stores the same topology as
+three NumPy arrays (source index, target index, weight) over a node-index
+table shared by the whole population, keeps per-node degree counts, and
+shares its arrays with clones until one side writes.
+"""
+
+import hashlib
+import uuid
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import numpy as np
+
+from src.constants import TOPOLOGY_HASH_DECIMALS
+from src.evolution.population import Individual
+from src.graph.virtues import VIRTUE_DEFINITIONS
+from src.models import Edge, Topology
+
+
+class NodeIndex:
+    """Shared table mapping node ids to dense integer indices."""
+
+    def __init__(self, node_ids: list[str] | None = None):
+        """
+        Initialize the table.
+
+        Args:
+            node_ids: Initial node ids, indexed in order
+        """
+        self.ids: list[str] = []
+        self._index: dict[str, int] = {}
+        for node_id in node_ids or []:
+            self.add(node_id)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, node_id: str) -> int:
+        """Return the index of node_id, assigning the next one if new."""
+        idx = self._index.get(node_id)
+        if idx is None:
+            idx = len(self.ids)
+            self._index[node_id] = idx
+            self.ids.append(node_id)
+        return idx
+
+    def get(self, node_id: str) -> int | None:
+        """Return the index of node_id, or None if it is not in the table."""
+        return self._index.get(node_id)
+
+
+def edge_keys(src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """Pack (source, target) index pairs into sortable int64 keys."""
+    return (src.astype(np.int64) << 32) | dst.astype(np.int64)
+
+
+class _EdgeView(Mapping):
+    """Read-only "source->target" -> Edge mapping over a CompactIndividual."""
+
+    def __init__(self, individual: "CompactIndividual"):
+        self._individual = individual
+
+    def __len__(self) -> int:
+        return len(self._individual.weight)
+
+    def __iter__(self) -> Iterator[str]:
+        ids = self._individual.nodes.ids
+        for s, d in zip(self._individual.src.tolist(), self._individual.dst.tolist()):
+            yield f"{ids[s]}->{ids[d]}"
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) is not None
+
+    def __getitem__(self, key: str) -> Edge:
+        pos = self._find(key)
+        if pos is None:
+            raise KeyError(key)
+        return self._individual._edge_at(pos)
+
+    def _find(self, key: str) -> int | None:
+        source_id, _, target_id = key.partition("->")
+        return self._individual._find(source_id, target_id)
+
+
+@dataclass
+class CompactIndividual:
+    """
+    An individual whose edges live in NumPy arrays.
+
+    Drop-in replacement for Individual: the same methods are available and
+    `edges` is a read-only mapping that builds Edge models on access. Edges
+    are kept sorted by (source, target) index, which lets crossover merge
+    parents with vectorised set operations.
+    """
+    id: str
+    nodes: NodeIndex
+    src: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    dst: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    weight: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float64))
+    fitness: float = 0.0
+    generation: int = 0
+    parent_ids: list[str] = field(default_factory=list)
+    alignment_result: dict = field(default_factory=dict)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+    def __post_init__(self):
+        self.src = np.asarray(self.src, dtype=np.int32)
+        self.dst = np.asarray(self.dst, dtype=np.int32)
+        self.weight = np.asarray(self.weight, dtype=np.float64)
+        order = np.argsort(edge_keys(self.src, self.dst), kind="stable")
+        self.src, self.dst, self.weight = self.src[order], self.dst[order], self.weight[order]
+        self._degree = self._count_degrees()
+        self._shared = False
+
+    @classmethod
+    def from_individual(cls, individual: Individual, nodes: NodeIndex) -> "CompactIndividual":
+        """
+        Convert a dict-backed Individual.
+
+        Args:
+            individual: The individual to convert
+            nodes: Node table shared by the population
+
+        Returns:
+            CompactIndividual with the same id, edges and fitness
+        """
+        edges = list(individual.edges.values())
+        return cls(
+            id=individual.id,
+            nodes=nodes,
+            src=[nodes.add(e.source_id) for e in edges],
+            dst=[nodes.add(e.target_id) for e in edges],
+            weight=[e.weight for e in edges],
+            fitness=individual.fitness,
+            generation=individual.generation,
+            parent_ids=list(individual.parent_ids),
+            alignment_result=individual.alignment_result,
+            created_at=individual.created_at,
+        )
+
+    def to_individual(self) -> Individual:
+        """Convert back to a dict-backed Individual."""
+        individual = Individual(
+            id=self.id,
+            fitness=self.fitness,
+            generation=self.generation,
+            parent_ids=list(self.parent_ids),
+            alignment_result=self.alignment_result,
+            created_at=self.created_at,
+        )
+        for edge in self.edges.values():
+            individual.set_edge(edge)
+        return individual
+
+    @property
+    def edges(self) -> Mapping[str, Edge]:
+        """Read-only "source->target" -> Edge view; use set_edge/remove_edge to change edges."""
+        return _EdgeView(self)
+
+    @property
+    def keys(self) -> np.ndarray:
+        """Sorted int64 (source, target) keys, aligned with src/dst/weight."""
+        return edge_keys(self.src, self.dst)
+
+    def edge_rows(self) -> list[tuple[str, str, float]]:
+        """All edges as (source_id, target_id, weight) tuples."""
+        ids = self.nodes.ids
+        return [
+            (ids[s], ids[d], w)
+            for s, d, w in zip(self.src.tolist(), self.dst.tolist(), self.weight.tolist())
+        ]
+
+    def get_edge(self, source_id: str, target_id: str) -> Edge | None:
+        """Get a copy of an edge by source and target."""
+        pos = self._find(source_id, target_id)
+        return None if pos is None else self._edge_at(pos)
+
+    def set_edge(self, edge: Edge) -> None:
+        """Add or update an edge."""
+        self._own()
+        s = self.nodes.add(edge.source_id)
+        d = self.nodes.add(edge.target_id)
+        key = (s << 32) | d
+        keys = self.keys
+        pos = int(np.searchsorted(keys, key))
+        if pos < len(keys) and keys[pos] == key:
+            self.weight[pos] = edge.weight
+            return
+        self.src = np.insert(self.src, pos, s)
+        self.dst = np.insert(self.dst, pos, d)
+        self.weight = np.insert(self.weight, pos, edge.weight)
+        self._grow_degrees()
+        self._degree[s] += 1
+        if d != s:
+            self._degree[d] += 1
+
+    def remove_edge(self, source_id: str, target_id: str) -> bool:
+        """Remove an edge."""
+        pos = self._find(source_id, target_id)
+        if pos is None:
+            return False
+        self._own()
+        s, d = int(self.src[pos]), int(self.dst[pos])
+        self.src = np.delete(self.src, pos)
+        self.dst = np.delete(self.dst, pos)
+        self.weight = np.delete(self.weight, pos)
+        self._degree[s] -= 1
+        if d != s:
+            self._degree[d] -= 1
+        return True
+
+    def set_weights(self, weight: np.ndarray) -> None:
+        """Replace all weights at once (aligned with src/dst)."""
+        if len(weight) != len(self.weight):
+            raise ValueError("weight must have one entry per edge")
+        self._own()
+        self.weight = np.asarray(weight, dtype=np.float64)
+
+    def get_node_degree(self, node_id: str) -> int:
+        """Get the degree of a node."""
+        idx = self.nodes.get(node_id)
+        if idx is None or idx >= len(self._degree):
+            return 0
+        return int(self._degree[idx])
+
+    def get_virtue_degrees(self) -> dict[str, int]:
+        """Get degrees for all virtue nodes."""
+        return {v.id: self.get_node_degree(v.id) for v in VIRTUE_DEFINITIONS}
+
+    def topology_hash(self, decimals: int = TOPOLOGY_HASH_DECIMALS) -> str:
+        """Content hash of the edge set; equal to Individual.topology_hash for the same edges."""
+        digest = hashlib.sha1()
+        for key, w in sorted((f"{s}->{d}", w) for s, d, w in self.edge_rows()):
+            digest.update(f"{key}={w:.{decimals}f};".encode())
+        return digest.hexdigest()
+
+    def to_topology(self) -> Topology:
+        """Convert to a Topology object."""
+        return Topology(
+            id=self.id,
+            agent_id=self.id,
+            virtue_degrees=self.get_virtue_degrees(),
+            total_edges=len(self.weight),
+            alignment_score=self.fitness,
+            character_signature=self.alignment_result.get("character_signature", {}),
+            generation=self.generation,
+        )
+
+    def clone(self) -> "CompactIndividual":
+        """Create a copy of this individual that shares arrays until either side writes."""
+        child = CompactIndividual.__new__(CompactIndividual)
+        child.id = f"ind_{uuid.uuid4().hex[:8]}"
+        child.nodes = self.nodes
+        child.src, child.dst, child.weight = self.src, self.dst, self.weight
+        child.fitness = 0.0  # Reset fitness
+        child.generation = self.generation + 1
+        child.parent_ids = [self.id]
+        child.alignment_result = {}
+        child.created_at = datetime.utcnow()
+        child._degree = self._degree
+        child._shared = True
+        self._shared = True
+        return child
+
+    def _find(self, source_id: str, target_id: str) -> int | None:
+        s = self.nodes.get(source_id)
+        d = self.nodes.get(target_id)
+        if s is None or d is None:
+            return None
+        keys = self.keys
+        key = (s << 32) | d
+        pos = int(np.searchsorted(keys, key))
+        if pos < len(keys) and keys[pos] == key:
+            return pos
+        return None
+
+    def _edge_at(self, pos: int) -> Edge:
+        ids = self.nodes.ids
+        return Edge(
+            source_id=ids[self.src[pos]],
+            target_id=ids[self.dst[pos]],
+            weight=float(self.weight[pos]),
+        )
+
+    def _own(self) -> None:
+        """Copy shared arrays before the first write (copy-on-write)."""
+        if self._shared:
+            self.src = self.src.copy()
+            self.dst = self.dst.copy()
+            self.weight = self.weight.copy()
+            self._degree = self._degree.copy()
+            self._shared = False
+
+    def _count_degrees(self) -> np.ndarray:
+        size = len(self.nodes)
+        loops = self.src == self.dst
+        return (
+            np.bincount(self.src, minlength=size)
+            + np.bincount(self.dst[~loops], minlength=size)
+        ).astype(np.int32)
+
+    def _grow_degrees(self) -> None:
+        if len(self._degree) < len(self.nodes):
+            self._degree = np.concatenate(
+                [self._degree, np.zeros(len(self.nodes) - len(self._degree), dtype=np.int32)]
+            )
@@ -9,7 +9,10 @@ import logging
 import random
 import uuid
 
+import numpy as np
+
 from src.constants import CROSSOVER_RATE
+from src.evolution.compact import CompactIndividual
 from src.evolution.population import Individual
 from src.graph.virtues import VIRTUE_DEFINITIONS
 from src.models import Edge
@@ -48,17 +51,21 @@ class Crossover:
             method: Crossover method ("uniform", "single_point", "virtue_based")
 
         Returns:
-            Child individual
+            Child individual (a CompactIndividual if parent1 is one)
         """
         if method == "uniform":
-            return self.uniform_crossover(parent1, parent2)
+            child = self.uniform_crossover(parent1, parent2)
         elif method == "single_point":
-            return self.single_point_crossover(parent1, parent2)
+            child = self.single_point_crossover(parent1, parent2)
         elif method == "virtue_based":
-            return self.virtue_based_crossover(parent1, parent2)
+            child = self.virtue_based_crossover(parent1, parent2)
         else:
             raise ValueError(f"Unknown crossover method: {method}")
 
+        if isinstance(parent1, CompactIndividual) and not isinstance(child, CompactIndividual):
+            child = CompactIndividual.from_individual(child, parent1.nodes)
+        return child
+
     def uniform_crossover(
         self,
         parent1: Individual,
@@ -74,6 +81,13 @@ class Crossover:
         Returns:
             Child individual
         """
+        if (
+            isinstance(parent1, CompactIndividual)
+            and isinstance(parent2, CompactIndividual)
+            and parent1.nodes is parent2.nodes
+        ):
+            return self._uniform_crossover_compact(parent1, parent2)
+
         child = Individual(
             id=f"ind_{uuid.uuid4().hex[:8]}",
             generation=max(parent1.generation, parent2.generation) + 1,
@@ -108,6 +122,47 @@ class Crossover:
 
         return child
 
+    def _uniform_crossover_compact(
+        self,
+        parent1: CompactIndividual,
+        parent2: CompactIndividual,
+    ) -> CompactIndividual:
+        """
+        Uniform crossover on edge arrays.
+
+        Shared edges get the averaged weight; each edge held by only one
+        parent is kept with probability crossover_rate.
+
+        Args:
+            parent1: First parent
+            parent2: Second parent (same node table as parent1)
+
+        Returns:
+            Child individual
+        """
+        keys1, keys2 = parent1.keys, parent2.keys
+        _, shared1, shared2 = np.intersect1d(keys1, keys2, assume_unique=True, return_indices=True)
+        only1 = np.setdiff1d(np.arange(len(keys1)), shared1, assume_unique=True)
+        only2 = np.setdiff1d(np.arange(len(keys2)), shared2, assume_unique=True)
+
+        rng = np.random.default_rng(random.getrandbits(64))
+        only1 = only1[rng.random(len(only1)) < self.crossover_rate]
+        only2 = only2[rng.random(len(only2)) < self.crossover_rate]
+
+        return CompactIndividual(
+            id=f"ind_{uuid.uuid4().hex[:8]}",
+            nodes=parent1.nodes,
+            src=np.concatenate([parent1.src[shared1], parent1.src[only1], parent2.src[only2]]),
+            dst=np.concatenate([parent1.dst[shared1], parent1.dst[only1], parent2.dst[only2]]),
+            weight=np.concatenate([
+                (parent1.weight[shared1] + parent2.weight[shared2]) / 2,
+                parent1.weight[only1],
+                parent2.weight[only2],
+            ]),
+            generation=max(parent1.generation, parent2.generation) + 1,
+            parent_ids=[parent1.id, parent2.id],
+        )
+
     def single_point_crossover(
         self,
         parent1: Individual,
@@ -0,0 +1,225 @@
+"""
+Isolated, parallel fitness evaluation for topology evolution.
+
+TopologyEvaluator writes each individual's weights into one shared
+substrate, so individuals see each other's edges and evaluation has to
+run serially. IsolatedTopologyEvaluator instead materialises every
+individual's edges into its own in-memory MockGraphSubstrate and can fan
+a whole generation out over a process pool.
+"""
+
+import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from src.dynamics.sparse import SparseActivationSpreader
+from src.evolution.population import Individual
+from src.graph.edges import EdgeManager
+from src.graph.mock_substrate import MockGraphSubstrate
+from src.graph.nodes import NodeManager
+from src.graph.virtues import VirtueManager
+from src.models import Edge, Node
+from src.testing.alignment import AlignmentTester
+from src.testing.stimuli import StimulusGenerator
+from src.testing.trajectory import TrajectoryTracker
+
+logger = logging.getLogger(__name__)
+
+# Nodes shared by every evaluation in a worker process, set by _init_worker
+_worker_nodes: list[Node] = []
+
+
+def build_substrate(nodes: list[Node], edges: list[tuple[str, str, float]]) -> MockGraphSubstrate:
+    """
+    Build a private in-memory graph for one topology.
+
+    Args:
+        nodes: Nodes to copy into the graph
+        edges: (source_id, target_id, weight) rows
+
+    Returns:
+        Connected MockGraphSubstrate holding copies of the nodes and the edges
+    """
+    substrate = MockGraphSubstrate(graph_name="isolated")
+    substrate.connect()
+    for node in nodes:
+        substrate.create_node(node.model_copy(update={"activation": node.baseline}))
+    for source_id, target_id, weight in edges:
+        substrate.create_edge(Edge(source_id=source_id, target_id=target_id, weight=weight))
+    return substrate
+
+
+def evaluate_topology(
+    nodes: list[Node],
+    edges: list[tuple[str, str, float]],
+    agent_id: str,
+    num_stimuli: int,
+    seed: int,
+) -> dict:
+    """
+    Run an alignment test against a private copy of one topology.
+
+    The random module is reseeded first, so the result depends only on
+    the nodes, edges and seed, not on which process runs it or in what
+    order. The caller's random state is restored afterwards, so in-process
+    evaluation does not disturb the evolution operators' random stream.
+
+    Args:
+        nodes: Nodes of the graph
+        edges: (source_id, target_id, weight) rows of the topology
+        agent_id: Agent ID for tracking
+        num_stimuli: Number of stimuli for evaluation
+        seed: Random seed for stimulus generation and noise
+
+    Returns:
+        Dict with evaluation results, as returned by TopologyEvaluator
+    """
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        return _run_alignment_test(nodes, edges, agent_id, num_stimuli)
+    finally:
+        random.setstate(state)
+
+
+def _run_alignment_test(
+    nodes: list[Node],
+    edges: list[tuple[str, str, float]],
+    agent_id: str,
+    num_stimuli: int,
+) -> dict:
+    substrate = build_substrate(nodes, edges)
+    node_manager = NodeManager(substrate)
+    edge_manager = EdgeManager(substrate)
+    virtue_manager = VirtueManager(substrate)
+    virtue_manager.initialize_virtues()
+
+    spreader = SparseActivationSpreader(substrate, node_manager, edge_manager, virtue_manager)
+    tester = AlignmentTester(
+        spreader,
+        StimulusGenerator(substrate, virtue_manager),
+        TrajectoryTracker(virtue_manager),
+        virtue_manager,
+    )
+    result = tester.test_alignment(agent_id=agent_id, num_stimuli=num_stimuli)
+
+    return {
+        "alignment_score": result.alignment_score,
+        "capture_rate": result.alignment_score,
+        "escape_rate": result.escape_rate,
+        "avg_capture_time": result.avg_capture_time,
+        "character_signature": result.character_signature,
+        "passed": result.passed,
+        "per_virtue_captures": result.per_virtue_captures,
+    }
+
+
+def _init_worker(nodes: list[Node]) -> None:
+    global _worker_nodes
+    _worker_nodes = nodes
+
+
+def _evaluate_in_worker(args: tuple) -> dict:
+    edges, agent_id, num_stimuli, seed = args
+    return evaluate_topology(_worker_nodes, edges, agent_id, num_stimuli, seed)
+
+
+class IsolatedTopologyEvaluator:
+    """
+    Evaluator that tests each individual on its own in-memory graph.
+
+    Every individual is evaluated against a fresh copy of the node set
+    plus exactly its own edges, with the same seed, so results are
+    deterministic and individuals cannot contaminate each other.
+    evaluate_many spreads a list of individuals over a process pool;
+    EvolutionLoop uses it to evaluate a whole generation at once.
+    """
+
+    def __init__(
+        self,
+        nodes: list[Node],
+        num_stimuli: int = 50,
+        max_workers: int | None = None,
+        seed: int = 0,
+    ):
+        """
+        Initialize the evaluator.
+
+        Args:
+            nodes: Nodes every topology is built on (virtue anchors and concepts)
+            num_stimuli: Number of stimuli for evaluation
+            max_workers: Worker processes (default: CPU count); 1 evaluates in-process
+            seed: Random seed shared by every evaluation
+        """
+        self.nodes = list(nodes)
+        self.num_stimuli = num_stimuli
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.seed = seed
+        self._executor: ProcessPoolExecutor | None = None
+
+    @classmethod
+    def from_substrate(cls, substrate, **kwargs) -> "IsolatedTopologyEvaluator":
+        """
+        Create an evaluator over the nodes currently in a substrate.
+
+        Args:
+            substrate: GraphSubstrate or MockGraphSubstrate to copy nodes from
+            **kwargs: Passed to the constructor
+
+        Returns:
+            IsolatedTopologyEvaluator
+        """
+        return cls(substrate.get_all_nodes(), **kwargs)
+
+    def __enter__(self) -> "IsolatedTopologyEvaluator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __call__(self, individual: Individual) -> dict:
+        """
+        Evaluate an individual in the current process.
+
+        Args:
+            individual: The individual to evaluate
+
+        Returns:
+            Dict with evaluation results
+        """
+        return evaluate_topology(self.nodes, *self._task(individual))
+
+    def evaluate_many(self, individuals: list[Individual]) -> list[dict]:
+        """
+        Evaluate individuals in parallel.
+
+        Args:
+            individuals: Individuals to evaluate
+
+        Returns:
+            Evaluation results in the same order as individuals
+        """
+        tasks = [self._task(individual) for individual in individuals]
+        if self.max_workers == 1 or len(tasks) <= 1:
+            return [evaluate_topology(self.nodes, *task) for task in tasks]
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.nodes,),
+            )
+            logger.info(f"Started {self.max_workers} evaluation workers")
+
+        chunksize = max(1, len(tasks) // (self.max_workers * 4))
+        return list(self._executor.map(_evaluate_in_worker, tasks, chunksize=chunksize))
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _task(self, individual: Individual) -> tuple:
+        return individual.edge_rows(), individual.id, self.num_stimuli, self.seed
@@ -11,11 +11,26 @@ import random
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 from src.constants import (
+    CHECKPOINT_INTERVAL,
     GENERATIONS,
     MIN_ALIGNMENT_SCORE,
     POPULATION_SIZE,
 )
+from src.evolution.cache import FitnessCache
+from src.evolution.checkpoint import (
+    decode_individuals,
+    decode_rng_state,
+    encode_individuals,
+    encode_rng_state,
+    list_checkpoints,
+    operator_params,
+    read_checkpoint,
+    write_checkpoint,
+)
+from src.evolution.compact import NodeIndex
 from src.evolution.population import Individual, Population
 from src.evolution.selection import Selection
 from src.evolution.crossover import Crossover
@@ -42,6 +57,9 @@ class EvolutionLoop:
         generations: int = GENERATIONS,
         min_score: float = MIN_ALIGNMENT_SCORE,
         checkpoint_dir: str | None = None,
+        fitness_cache: FitnessCache | None = None,
+        checkpoint_interval: int = CHECKPOINT_INTERVAL,
+        keep_checkpoints: int = 2,
     ):
         """
         Initialize the evolution loop.
@@ -55,6 +73,10 @@ class EvolutionLoop:
             generations: Maximum number of generations
             min_score: Minimum alignment score for success
             checkpoint_dir: Optional directory for checkpoints
+            fitness_cache: Optional cache of results by topology hash; saved
+                with each checkpoint when checkpoint_dir is set
+            checkpoint_interval: Generations between checkpoints
+            keep_checkpoints: Number of checkpoint files kept
         """
         self.population = population
         self.selection = selection
@@ -64,11 +86,15 @@ class EvolutionLoop:
         self.generations = generations
         self.min_score = min_score
         self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+        self.fitness_cache = fitness_cache
+        self.checkpoint_interval = checkpoint_interval
+        self.keep_checkpoints = max(1, keep_checkpoints)
 
         self._current_generation = 0
         self._best_ever: Individual | None = None
         self._converged = False
         self._history: list[dict] = []
+        self._resumed = False
 
     def run(self) -> Individual | None:
         """
@@ -77,14 +103,17 @@ class EvolutionLoop:
         Returns:
             The best individual found, or None if no valid topology
         """
-        logger.info(f"Starting evolution: {self.generations} generations, population {len(self.population.individuals)}")
+        if self._resumed:
+            logger.info(f"Continuing evolution at generation {self._current_generation + 1} of {self.generations}")
+        else:
+            logger.info(f"Starting evolution: {self.generations} generations, population {len(self.population.individuals)}")
 
-        # Initial evaluation
-        self._evaluate_population()
-        self._update_best()
-        self._log_generation()
+            # Initial evaluation
+            self._evaluate_population()
+            self._update_best()
+            self._log_generation()
 
-        for gen in range(self.generations):
+        for gen in range(self._current_generation, self.generations):
             self._current_generation = gen + 1
 
             # Check for early convergence
@@ -98,7 +127,7 @@ class EvolutionLoop:
 
             # Logging and checkpointing
             self._log_generation()
-            if self.checkpoint_dir and gen % 10 == 0:
+            if self.checkpoint_dir and self._current_generation % self.checkpoint_interval == 0:
                 self._save_checkpoint()
 
         # Final result
@@ -129,8 +158,7 @@ class EvolutionLoop:
         offspring = self.mutation.batch_mutate(offspring)
 
         # Evaluate offspring
-        for individual in offspring:
-            self._evaluate_individual(individual)
+        self._evaluate_individuals(offspring)
 
         # Select survivors
         survivors = self.selection.select_survivors(
@@ -146,8 +174,54 @@ class EvolutionLoop:
 
     def _evaluate_population(self) -> None:
         """Evaluate all individuals in the population."""
-        for individual in self.population.individuals:
-            self._evaluate_individual(individual)
+        self._evaluate_individuals(self.population.individuals)
+
+    def _evaluate_individuals(self, individuals: list[Individual]) -> None:
+        """
+        Evaluate a group of individuals.
+
+        With a fitness cache, topologies already evaluated (including
+        duplicates within the group) take their cached result and only
+        the rest reach the evaluator. Evaluators that provide
+        evaluate_many (such as IsolatedTopologyEvaluator) get the whole
+        group at once so they can evaluate it in parallel; others are
+        called once per individual.
+
+        Args:
+            individuals: The individuals to evaluate
+        """
+        if self.fitness_cache is None:
+            for individual, result in zip(individuals, self._run_evaluator(individuals)):
+                self._apply_result(individual, result)
+            return
+
+        pending: dict[str, list[Individual]] = {}
+        for individual in individuals:
+            key = individual.topology_hash()
+            if key in pending:
+                self.fitness_cache.hits += 1
+                pending[key].append(individual)
+                continue
+            result = self.fitness_cache.get(key)
+            if result is None:
+                pending[key] = [individual]
+            else:
+                self._apply_result(individual, result)
+
+        results = self._run_evaluator([group[0] for group in pending.values()])
+        for (key, group), result in zip(pending.items(), results):
+            self.fitness_cache.put(key, result)
+            for individual in group:
+                self._apply_result(individual, dict(result))
+
+    def _run_evaluator(self, individuals: list[Individual]) -> list[dict]:
+        """Run the evaluator over individuals, in bulk when it supports it."""
+        if not individuals:
+            return []
+        evaluate_many = getattr(self.evaluator, "evaluate_many", None)
+        if evaluate_many is not None:
+            return evaluate_many(individuals)
+        return [self.evaluator(individual) for individual in individuals]
 
     def _evaluate_individual(self, individual: Individual) -> None:
         """
@@ -156,7 +230,10 @@ class EvolutionLoop:
         Args:
             individual: The individual to evaluate
         """
-        result = self.evaluator(individual)
+        self._evaluate_individuals([individual])
+
+    def _apply_result(self, individual: Individual, result: dict) -> None:
+        """Store an evaluation result on an individual."""
         individual.fitness = result.get("alignment_score", 0.0)
         individual.alignment_result = result
 
@@ -185,36 +262,170 @@ class EvolutionLoop:
             "best_id": best.id if best else None,
             "timestamp": datetime.utcnow().isoformat(),
         }
+        if self.fitness_cache is not None:
+            entry["cache_hit_rate"] = self.fitness_cache.hit_rate
+            entry["cache_size"] = len(self.fitness_cache)
         self._history.append(entry)
 
+        cache_info = f", cache_hit_rate={entry['cache_hit_rate']:.2%}" if self.fitness_cache is not None else ""
         logger.info(
             f"Gen {self._current_generation}: "
             f"best={stats['max']:.4f}, "
             f"mean={stats['mean']:.4f}, "
             f"std={stats['std']:.4f}"
+            f"{cache_info}"
         )
 
     def _save_checkpoint(self) -> None:
-        """Save evolution checkpoint."""
+        """
+        Save the full evolution state as checkpoint_gen{N}.npz.
+
+        Stores the population, best-ever individual, random module state,
+        operator parameters and history, written atomically. Only the
+        newest keep_checkpoints files are kept.
+        """
         if not self.checkpoint_dir:
             return
 
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
-        checkpoint = {
+        compact = self.population.compact
+        nodes = self.population.node_index if compact else NodeIndex()
+        pop_arrays, pop_meta = encode_individuals(self.population.individuals, nodes)
+        best = [self._best_ever] if self._best_ever else []
+        best_arrays, best_meta = encode_individuals(best, nodes)
+        rng_internal, rng_extra = encode_rng_state(random.getstate())
+
+        arrays = {f"pop_{k}": v for k, v in pop_arrays.items()}
+        arrays.update({f"best_{k}": v for k, v in best_arrays.items()})
+        arrays["node_ids"] = np.array(nodes.ids, dtype=str)
+        arrays["rng_state"] = rng_internal
+
+        meta = {
             "generation": self._current_generation,
-            "best_ever": self.population.export_best(),
-            "history": self._history,
+            "generations": self.generations,
+            "min_score": self.min_score,
             "converged": self._converged,
+            "history": self._history,
+            "rng_extra": rng_extra,
+            "population": {
+                "size": self.population.size,
+                "concept_nodes": self.population.concept_nodes,
+                "compact": compact,
+                "generation": self.population.generation,
+                "best_fitness_history": self.population.get_best_fitness_history(),
+                "individuals": pop_meta,
+            },
+            "best_ever": best_meta,
+            "operators": {
+                "selection": operator_params(self.selection),
+                "crossover": operator_params(self.crossover),
+                "mutation": operator_params(self.mutation),
+            },
             "timestamp": datetime.utcnow().isoformat(),
         }
 
-        checkpoint_file = self.checkpoint_dir / f"checkpoint_gen{self._current_generation}.json"
-        with open(checkpoint_file, "w") as f:
-            json.dump(checkpoint, f, indent=2)
+        checkpoint_file = self.checkpoint_dir / f"checkpoint_gen{self._current_generation}.npz"
+        write_checkpoint(checkpoint_file, arrays, meta)
+
+        if self.fitness_cache is not None:
+            self.fitness_cache.save(self.checkpoint_dir / "fitness_cache.json")
+
+        for _, old_file in list_checkpoints(self.checkpoint_dir)[:-self.keep_checkpoints]:
+            old_file.unlink()
 
         logger.debug(f"Saved checkpoint to {checkpoint_file}")
 
+    @classmethod
+    def resume(
+        cls,
+        checkpoint_dir: str | Path,
+        evaluator,
+        selection: Selection | None = None,
+        crossover: Crossover | None = None,
+        mutation: Mutation | None = None,
+        generations: int | None = None,
+        fitness_cache: FitnessCache | None = None,
+        checkpoint_interval: int = CHECKPOINT_INTERVAL,
+        keep_checkpoints: int = 2,
+    ) -> "EvolutionLoop":
+        """
+        Rebuild an evolution loop from the newest checkpoint in a directory.
+
+        Population, best-ever individual, history and the random module
+        state are restored, and operator parameters are applied to the
+        given (or default) operators, so run() continues exactly where
+        the checkpointed run left off. The evaluator is not stored and
+        must be supplied again.
+
+        Args:
+            checkpoint_dir: Directory written by a previous run
+            evaluator: Function to evaluate individual fitness
+            selection: Selection operator (default: new Selection)
+            crossover: Crossover operator (default: new Crossover)
+            mutation: Mutation operator (default: new Mutation)
+            generations: Override the stored maximum number of generations
+            fitness_cache: Fitness cache; loaded from the directory if omitted
+                and a saved cache exists
+            checkpoint_interval: Generations between checkpoints
+            keep_checkpoints: Number of checkpoint files kept
+
+        Returns:
+            EvolutionLoop ready to run()
+        """
+        checkpoint_dir = Path(checkpoint_dir)
+        checkpoints = list_checkpoints(checkpoint_dir)
+        if not checkpoints:
+            raise FileNotFoundError(f"No checkpoints found in {checkpoint_dir}")
+        arrays, meta = read_checkpoint(checkpoints[-1][1])
+
+        pop_meta = meta["population"]
+        nodes = NodeIndex(arrays["node_ids"].tolist())
+        population = Population(size=pop_meta["size"], concept_nodes=pop_meta["concept_nodes"])
+        if pop_meta["compact"]:
+            population.compact = True
+            population.node_index = nodes
+        population.generation = pop_meta["generation"]
+        population._best_fitness_history = list(pop_meta["best_fitness_history"])
+        population.individuals = decode_individuals(
+            {k[4:]: v for k, v in arrays.items() if k.startswith("pop_")},
+            pop_meta["individuals"], nodes, pop_meta["compact"],
+        )
+
+        operators = [selection or Selection(), crossover or Crossover(), mutation or Mutation()]
+        for operator, name in zip(operators, ["selection", "crossover", "mutation"]):
+            for attr, value in meta["operators"][name].items():
+                setattr(operator, attr, value)
+
+        cache_file = checkpoint_dir / "fitness_cache.json"
+        if fitness_cache is None and cache_file.exists():
+            fitness_cache = FitnessCache.load(cache_file)
+
+        loop = cls(
+            population,
+            *operators,
+            evaluator,
+            generations=generations or meta["generations"],
+            min_score=meta["min_score"],
+            checkpoint_dir=str(checkpoint_dir),
+            fitness_cache=fitness_cache,
+            checkpoint_interval=checkpoint_interval,
+            keep_checkpoints=keep_checkpoints,
+        )
+        loop._current_generation = meta["generation"]
+        loop._converged = meta["converged"]
+        loop._history = meta["history"]
+        best = decode_individuals(
+            {k[5:]: v for k, v in arrays.items() if k.startswith("best_")},
+            meta["best_ever"], nodes, pop_meta["compact"],
+        )
+        loop._best_ever = best[0] if best else None
+        loop._resumed = True
+
+        random.setstate(decode_rng_state(arrays["rng_state"], meta["rng_extra"]))
+        logger.info(f"Resumed evolution from generation {loop._current_generation}")
+        return loop
+
     def get_history(self) -> list[dict]:
         """Get evolution history."""
         return list(self._history)
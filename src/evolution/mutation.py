@@ -8,7 +8,10 @@ of the search space.
 import logging
 import random
 
+import numpy as np
+
 from src.constants import MUTATION_RATE, TARGET_CONNECTIVITY
+from src.evolution.compact import CompactIndividual
 from src.evolution.population import Individual
 from src.graph.virtues import VIRTUE_DEFINITIONS
 from src.models import Edge
@@ -66,6 +69,9 @@ class Mutation:
         Returns:
             Number of edges mutated
         """
+        if isinstance(individual, CompactIndividual):
+            return self._mutate_weights_compact(individual)
+
         mutated = 0
         for edge in list(individual.edges.values()):
             if random.random() < self.mutation_rate:
@@ -77,6 +83,25 @@ class Mutation:
 
         return mutated
 
+    def _mutate_weights_compact(self, individual: CompactIndividual) -> int:
+        """
+        Apply weight perturbations to an array-backed individual in one pass.
+
+        Args:
+            individual: The individual to mutate
+
+        Returns:
+            Number of edges mutated
+        """
+        rng = np.random.default_rng(random.getrandbits(64))
+        mask = rng.random(len(individual.weight)) < self.mutation_rate
+        mutated = int(mask.sum())
+        if mutated:
+            weight = individual.weight.copy()
+            weight[mask] = np.clip(weight[mask] + rng.normal(0, 0.1, mutated), 0.0, 1.0)
+            individual.set_weights(weight)
+        return mutated
+
     def _add_random_edge(self, individual: Individual) -> bool:
         """
         Add a random edge.
@@ -5,6 +5,7 @@ Manages a population of candidate soul topologies,
 each represented as a set of edges with weights.
 """
 
+import hashlib
 import logging
 import random
 import uuid
@@ -15,6 +16,7 @@ from src.constants import (
     NUM_VIRTUES,
     POPULATION_SIZE,
     TARGET_CONNECTIVITY,
+    TOPOLOGY_HASH_DECIMALS,
 )
 from src.graph.virtues import VIRTUE_DEFINITIONS
 from src.models import Edge, EdgeDirection, Topology
@@ -55,6 +57,10 @@ class Individual:
             return True
         return False
 
+    def edge_rows(self) -> list[tuple[str, str, float]]:
+        """All edges as (source_id, target_id, weight) tuples."""
+        return [(e.source_id, e.target_id, e.weight) for e in self.edges.values()]
+
     def get_node_degree(self, node_id: str) -> int:
         """Get the degree of a node."""
         degree = 0
@@ -71,6 +77,25 @@ class Individual:
             degrees[virtue_def.id] = self.get_node_degree(virtue_def.id)
         return degrees
 
+    def topology_hash(self, decimals: int = TOPOLOGY_HASH_DECIMALS) -> str:
+        """
+        Content hash of the edge set.
+
+        Weights are rounded to `decimals` places, so individuals with the
+        same edges and (nearly) the same weights hash equal regardless of
+        id, generation or edge insertion order.
+
+        Args:
+            decimals: Decimal places kept from each weight
+
+        Returns:
+            Hex digest
+        """
+        digest = hashlib.sha1()
+        for key in sorted(self.edges):
+            digest.update(f"{key}={self.edges[key].weight:.{decimals}f};".encode())
+        return digest.hexdigest()
+
     def to_topology(self) -> Topology:
         """Convert to a Topology object."""
         return Topology(
@@ -114,6 +139,7 @@ class Population:
         self,
         size: int = POPULATION_SIZE,
         concept_nodes: list[str] | None = None,
+        compact: bool = False,
     ):
         """
         Initialize the population.
@@ -121,9 +147,16 @@ class Population:
         Args:
             size: Population size
             concept_nodes: List of concept node IDs (optional)
+            compact: Create array-backed CompactIndividuals sharing one
+                node table instead of dict-backed Individuals
         """
         self.size = size
         self.concept_nodes = concept_nodes or []
+        self.compact = compact
+        self.node_index = None
+        if compact:
+            from src.evolution.compact import NodeIndex
+            self.node_index = NodeIndex([v.id for v in VIRTUE_DEFINITIONS] + self.concept_nodes)
         self.individuals: list[Individual] = []
         self.generation = 0
         self._best_fitness_history: list[float] = []
@@ -201,6 +234,9 @@ class Population:
                     )
                     individual.set_edge(edge)
 
+        if self.compact:
+            from src.evolution.compact import CompactIndividual
+            return CompactIndividual.from_individual(individual, self.node_index)
         return individual
 
     def add_individual(self, individual: Individual) -> None:
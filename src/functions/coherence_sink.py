@@ -0,0 +1,175 @@
+"""Deferred side effects of coherence testing.
+
+test_coherence used to write after every stimulus: a CAPTURED_BY edge,
+a Hebbian update, a Pathway node, failure lessons and a Trajectory node,
+about ten statements per stimulus. CoherenceSink records them in memory
+during the test (mirroring graph changes into the snapshot, so later
+spreads still see them) and writes them in bulk with flush(): one UNWIND
+per node label and edge type, and Hebbian deltas aggregated per edge.
+"""
+import random
+import uuid
+from datetime import datetime
+from typing import Callable, Optional
+
+from ..graph.client import GraphClient, get_client
+from ..graph.queries import edge_properties
+from ..graph.snapshot import GraphSnapshot
+from ..knowledge.pathways import pathway_properties
+from .hebbian import hebbian_update_many
+
+
+class CoherenceSink:
+    """Collects one agent's coherence-test side effects and writes them in bulk."""
+
+    def __init__(
+        self,
+        agent_id: str,
+        client: Optional[GraphClient] = None,
+        snapshot: Optional[GraphSnapshot] = None,
+        trajectory_sample: float = 1.0,
+        learning_rate: float = 0.01,
+        closest_virtue_fn: Optional[Callable[[list], Optional[str]]] = None,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Args:
+            agent_id: Agent under test
+            client: Client written to by flush(); defaults to the shared client
+            snapshot: Snapshot to mirror new edges and Hebbian changes into
+            trajectory_sample: Fraction of Trajectory nodes to persist
+                (1.0 keeps all, 0.0 skips them)
+            learning_rate: Hebbian learning rate for captured trajectories
+            closest_virtue_fn: Finds the virtue an escaped trajectory came
+                closest to; escapes are not evaluated without it
+            rng: Random generator for trajectory sampling
+                (default: the random module)
+        """
+        self.agent_id = agent_id
+        self.client = client
+        self.snapshot = snapshot
+        self.trajectory_sample = trajectory_sample
+        self.learning_rate = learning_rate
+        self.closest_virtue_fn = closest_virtue_fn
+        self.rng = rng or random
+
+        self._nodes: dict[str, list] = {}  # label -> property dicts
+        self._edges: dict[str, list] = {}  # rel_type -> (from_id, to_id, props)
+        self._learned: list = []  # Captured trajectories for Hebbian updates
+        self._escapes: list = []  # Escaped trajectories for mercy evaluation
+
+    @property
+    def pending(self) -> int:
+        """Number of records waiting to be flushed."""
+        return (
+            sum(len(rows) for rows in self._nodes.values())
+            + sum(len(rows) for rows in self._edges.values())
+            + len(self._learned)
+            + len(self._escapes)
+        )
+
+    def record_capture(self, stimulus: str, virtue: str, trajectory: list, capture_time: int) -> None:
+        """Record a trajectory captured by a virtue."""
+        self._add_edge(self.agent_id, virtue, "CAPTURED_BY")
+        self._learned.append(trajectory)
+        if self.snapshot is not None:
+            self.snapshot.add_edge(self.agent_id, virtue, "CAPTURED_BY")
+            self.snapshot.apply_hebbian(trajectory, self.learning_rate)
+
+        # Successful pathway for collective learning
+        pathway = pathway_properties(self.agent_id, stimulus, virtue, trajectory, capture_time)
+        self._add_node("Pathway", pathway)
+        self._add_edge(self.agent_id, pathway["id"], "DISCOVERED")
+        self._add_edge(pathway["id"], virtue, "LEADS_TO")
+
+    def record_escape(self, trajectory: list) -> None:
+        """Record a trajectory that escaped every basin."""
+        self._escapes.append(trajectory)
+
+    def record_trajectory(self, stimulus: str, result: dict) -> Optional[str]:
+        """
+        Record a Trajectory node for a spread result, subject to sampling.
+
+        Returns:
+            The trajectory ID, or None if it was sampled out
+        """
+        if self.trajectory_sample < 1.0 and self.rng.random() >= self.trajectory_sample:
+            return None
+
+        traj_id = f"traj_{uuid.uuid4().hex[:8]}"
+        self._add_node("Trajectory", {
+            "id": traj_id,
+            "agent": self.agent_id,
+            "stimulus": stimulus,
+            "captured": result["captured"],
+            "captured_by": result["captured_by"],
+            "capture_tier": result.get("capture_tier"),
+            "length": len(result["trajectory"]),
+            "path": ",".join(result["trajectory"][:20])
+        })
+        self._add_edge(self.agent_id, traj_id, "HAS_TRAJECTORY")
+        if self.snapshot is not None:
+            self.snapshot.add_node(traj_id, "Trajectory")
+            self.snapshot.add_edge(self.agent_id, traj_id, "HAS_TRAJECTORY")
+        return traj_id
+
+    def flush(self) -> dict:
+        """
+        Write everything recorded so far.
+
+        Nodes go first so the edges can match them; escapes are evaluated
+        last, against the graph with this test's writes in place.
+
+        Returns:
+            Counts of nodes, edges, Hebbian trajectories and escapes written
+        """
+        client = self.client or get_client()
+        stats = {
+            "nodes": sum(len(rows) for rows in self._nodes.values()),
+            "edges": sum(len(rows) for rows in self._edges.values()),
+            "hebbian_trajectories": len(self._learned),
+            "escapes": len(self._escapes),
+        }
+
+        for label, rows in self._nodes.items():
+            client.create_nodes(label, rows)
+        for rel_type, rows in self._edges.items():
+            client.create_edges(rel_type, rows)
+        self._nodes.clear()
+        self._edges.clear()
+
+        learned, self._learned = self._learned, []
+        if learned:
+            hebbian_update_many(learned, self.learning_rate)
+
+        escapes, self._escapes = self._escapes, []
+        if escapes and self.closest_virtue_fn is not None:
+            self._evaluate_escapes(escapes)
+
+        return stats
+
+    def _evaluate_escapes(self, escapes: list) -> None:
+        """Judge escapes with empathy and leave lessons for the collective."""
+        try:
+            from ..mercy.judgment import evaluate_failure
+            from ..mercy.lessons import create_failure_lesson
+        except ImportError:
+            return
+
+        evaluated = set()
+        for trajectory in escapes:
+            closest_virtue = self.closest_virtue_fn(trajectory)
+            if not closest_virtue:
+                continue
+            # Judgment only reads the agent's history, so once per virtue suffices
+            if closest_virtue not in evaluated:
+                evaluate_failure(self.agent_id, closest_virtue, trajectory)
+                evaluated.add(closest_virtue)
+            create_failure_lesson(self.agent_id, closest_virtue, trajectory)
+
+    def _add_node(self, label: str, properties: dict) -> None:
+        properties["created_at"] = datetime.utcnow().isoformat()
+        self._nodes.setdefault(label, []).append(properties)
+
+    def _add_edge(self, from_id: str, to_id: str, rel_type: str) -> None:
+        self._edges.setdefault(rel_type, []).append((from_id, to_id, edge_properties()))
@@ -1,13 +1,22 @@
 """Temporal decay of edge weights."""
 from datetime import datetime
+from ..constants import WRITE_BATCH_SIZE
 from ..graph.client import get_client
+from ..graph.proximity import reset_proximity_index
+from ..gestalt.cache import bump_topology_version
+from ..graph.queries import epoch_seconds
+
+# Decayed weight of r at time $now (epoch seconds), computed in Cypher
+DECAYED_WEIGHT = "r.weight * ($decay ^ (($now - r.last_used_ts) / 3600.0))"
 
 
 def apply_decay(
     decay_constant: float = 0.97,
     min_weight: float = 0.01,
     protect_virtues: bool = True,
-    target_degree: int = 9
+    target_degree: int = 9,
+    flush_size: int = WRITE_BATCH_SIZE,
+    server_side: bool = False
 ):
     """
     Decay all edges based on time since last use.
@@ -20,7 +29,14 @@ def apply_decay(
         protect_virtues: If True, don't delete edges that would leave virtue
                         below target_degree connectivity
         target_degree: Minimum connections each virtue should maintain
+        flush_size: Edge updates/deletions per batched write statement
+        server_side: Compute decay inside FalkorDB with a fixed number of
+                     statements instead of streaming edges through Python
+                     (see apply_decay_in_graph)
     """
+    if server_side:
+        return apply_decay_in_graph(decay_constant, min_weight, protect_virtues, target_degree)
+
     client = get_client()
     now = datetime.utcnow()
 
@@ -33,63 +49,201 @@ def apply_decay(
         """
     )
 
+    # Degrees come from the fetched edge set rather than a query per edge,
+    # and are decremented as deletions are queued, since the batch defers them
+    degrees = {}
     for edge in edges:
-        from_id, to_id, weight, last_used, rel_type, a_labels, b_labels = edge
+        degrees[edge[0]] = degrees.get(edge[0], 0) + 1
+        degrees[edge[1]] = degrees.get(edge[1], 0) + 1
 
-        if not last_used or not weight:
-            continue
+    with client.write_batch(flush_size) as batch:
+        for edge in edges:
+            from_id, to_id, weight, last_used, rel_type, a_labels, b_labels = edge
+
+            if not last_used or not weight:
+                continue
+
+            # Calculate decay
+            try:
+                last_used_dt = datetime.fromisoformat(last_used)
+            except (ValueError, TypeError):
+                continue
+
+            hours_since = (now - last_used_dt).total_seconds() / 3600
+            decayed_weight = weight * (decay_constant ** hours_since)
+
+            # Check if this would violate virtue min-degree
+            should_delete = decayed_weight < min_weight
+
+            if should_delete and protect_virtues:
+                # Check if either endpoint is a virtue anchor
+                is_virtue_edge = (
+                    "VirtueAnchor" in (a_labels or []) or
+                    "VirtueAnchor" in (b_labels or [])
+                )
+
+                if is_virtue_edge:
+                    # Check degrees
+                    for node_id, labels in [(from_id, a_labels), (to_id, b_labels)]:
+                        if "VirtueAnchor" in (labels or []):
+                            if degrees.get(node_id, 0) <= target_degree:
+                                # Don't delete, just set to minimum
+                                should_delete = False
+                                decayed_weight = min_weight
+                                break
+
+            if should_delete:
+                batch.delete_edge(from_id, to_id)
+                degrees[from_id] -= 1
+                degrees[to_id] -= 1
+            else:
+                batch.set_edge_weight(from_id, to_id, decayed_weight)
+
+    bump_topology_version()
 
-        # Calculate decay
+
+def backfill_edge_timestamps(flush_size: int = WRITE_BATCH_SIZE) -> int:
+    """
+    Add numeric last_used_ts to edges that only have an ISO last_used.
+
+    Edges written before last_used_ts existed need this once before
+    server-side decay can see them.
+
+    Returns:
+        Number of edges updated
+    """
+    client = get_client()
+    rows = client.query(
+        """
+        MATCH (a)-[r]->(b)
+        WHERE r.last_used IS NOT NULL AND r.last_used_ts IS NULL
+        RETURN a.id, b.id, r.last_used
+        """
+    )
+
+    updates = []
+    for from_id, to_id, last_used in rows:
         try:
-            last_used_dt = datetime.fromisoformat(last_used)
+            updates.append([from_id, to_id, last_used, epoch_seconds(datetime.fromisoformat(last_used))])
         except (ValueError, TypeError):
             continue
 
-        hours_since = (now - last_used_dt).total_seconds() / 3600
-        decayed_weight = weight * (decay_constant ** hours_since)
-
-        # Check if this would violate virtue min-degree
-        should_delete = decayed_weight < min_weight
-
-        if should_delete and protect_virtues:
-            # Check if either endpoint is a virtue anchor
-            is_virtue_edge = (
-                "VirtueAnchor" in (a_labels or []) or
-                "VirtueAnchor" in (b_labels or [])
-            )
-
-            if is_virtue_edge:
-                # Check degrees
-                for node_id, labels in [(from_id, a_labels), (to_id, b_labels)]:
-                    if "VirtueAnchor" in (labels or []):
-                        degree_result = client.query(
-                            "MATCH (v {id: $id})-[r]-() RETURN count(r) as degree",
-                            {"id": node_id}
-                        )
-                        degree = degree_result[0][0] if degree_result else 0
-
-                        if degree <= target_degree:
-                            # Don't delete, just set to minimum
-                            should_delete = False
-                            decayed_weight = min_weight
-                            break
-
-        if should_delete:
-            client.execute(
-                """
-                MATCH (a {id: $from})-[r]->(b {id: $to})
-                DELETE r
-                """,
-                {"from": from_id, "to": to_id}
-            )
-        else:
-            client.execute(
-                """
-                MATCH (a {id: $from})-[r]->(b {id: $to})
-                SET r.weight = $weight
-                """,
-                {"from": from_id, "to": to_id, "weight": decayed_weight}
-            )
+    for start in range(0, len(updates), flush_size):
+        client.execute(
+            """
+            UNWIND $rows AS row
+            MATCH (a {id: row[0]})-[r]->(b {id: row[1]})
+            WHERE r.last_used = row[2]
+            SET r.last_used_ts = row[3]
+            """,
+            {"rows": updates[start:start + flush_size]}
+        )
+    return len(updates)
+
+
+def apply_decay_in_graph(
+    decay_constant: float = 0.97,
+    min_weight: float = 0.01,
+    protect_virtues: bool = True,
+    target_degree: int = 9
+) -> dict:
+    """
+    Decay all edges inside FalkorDB.
+
+    Same rules as apply_decay, evaluated as a fixed handful of Cypher
+    statements regardless of graph size:
+
+    1. Protect: for each virtue, count its degree and rank its edges that
+       would fall below min_weight, weakest first. Only the first
+       (degree - target_degree) may be deleted; the rest are clamped to
+       min_weight and flagged. An edge between two virtues is kept if
+       either side keeps it.
+    2. Delete every unflagged edge that falls below min_weight.
+    3. Decay every edge that stays at or above min_weight.
+    4. Clear the protection flags.
+
+    Deletion runs before decay: both compute the decayed weight from the
+    stored weight and last_used_ts, and decaying first would have the
+    delete decay the new weight a second time.
+
+    Uses the numeric last_used_ts property; older edges are backfilled first.
+
+    Returns:
+        dict with counts of decayed, deleted and protected edges
+    """
+    client = get_client()
+    backfill_edge_timestamps()
+
+    params = {
+        "decay": decay_constant,
+        "min_weight": min_weight,
+        "target": target_degree,
+        "now": epoch_seconds(datetime.utcnow())
+    }
+    stats = {"decayed": 0, "deleted": 0, "protected": 0}
+
+    if protect_virtues:
+        result = client.query(
+            f"""
+            MATCH (v:VirtueAnchor)
+            OPTIONAL MATCH (v)-[d]-()
+            WITH v, count(d) AS degree
+            MATCH (v)-[r]-()
+            WHERE r.last_used_ts IS NOT NULL AND r.weight > 0
+            WITH v, degree, r, {DECAYED_WEIGHT} AS w
+            WHERE w < $min_weight
+            WITH v, degree, r, w ORDER BY w ASC
+            WITH v, degree, collect(r) AS doomed
+            UNWIND range(0, size(doomed) - 1) AS i
+            WITH doomed[i] AS r, i >= degree - $target AS keep
+            WHERE keep
+            SET r.weight = $min_weight, r.decay_protected = true
+            RETURN count(DISTINCT r)
+            """,
+            params
+        )
+        stats["protected"] = result[0][0] if result else 0
+
+    result = client.query(
+        f"""
+        MATCH ()-[r]->()
+        WHERE r.last_used_ts IS NOT NULL AND r.weight > 0
+          AND r.decay_protected IS NULL
+          AND {DECAYED_WEIGHT} < $min_weight
+        DELETE r
+        RETURN count(r)
+        """,
+        params
+    )
+    stats["deleted"] = result[0][0] if result else 0
+
+    result = client.query(
+        f"""
+        MATCH ()-[r]->()
+        WHERE r.last_used_ts IS NOT NULL AND r.weight > 0
+        WITH r, {DECAYED_WEIGHT} AS w
+        WHERE w >= $min_weight
+        SET r.weight = w
+        RETURN count(r)
+        """,
+        params
+    )
+    stats["decayed"] = result[0][0] if result else 0
+
+    if stats["protected"]:
+        client.execute(
+            """
+            MATCH ()-[r]->()
+            WHERE r.decay_protected = true
+            SET r.decay_protected = NULL
+            """
+        )
+
+    # Deleted edges aren't known here; the proximity index rebuilds on next use
+    if stats["deleted"]:
+        reset_proximity_index()
+    bump_topology_version()
+    return stats
 
 
 def decay_activations(decay_rate: float = 0.95):
@@ -120,3 +274,4 @@ def decay_activations(decay_rate: float = 0.95):
         """,
         {"rate": decay_rate}
     )
+    bump_topology_version()
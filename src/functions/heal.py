@@ -1,6 +1,7 @@
 """Self-healing functions to maintain graph health."""
 from ..graph.client import get_client
 from ..graph.queries import create_edge
+from ..gestalt.cache import bump_topology_version
 from ..virtues.anchors import VIRTUES
 import random
 
@@ -53,6 +54,8 @@ def heal_dead_zones(target_degree: int = 9) -> dict:
                     create_edge(v_id, target, "HEALED", {"weight": 0.3})
                     healed.append((v_id, target))
 
+    if healed:
+        bump_topology_version()
     return {"healed_edges": healed}
 
 
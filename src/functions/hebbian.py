@@ -1,6 +1,37 @@
 """Hebbian learning - strengthen edges along activation paths."""
-from ..graph.queries import update_edge_weight, create_edge
+from ..graph.queries import create_edge, edge_properties
 from ..graph.client import get_client
+from ..gestalt.cache import bump_topology_version
+
+
+def _pair_key(a: str, b: str) -> tuple:
+    """Order-independent key for the edges joining a and b."""
+    return (a, b) if a <= b else (b, a)
+
+
+def _current_weights(client, steps: list) -> dict:
+    """
+    Read the weight of every edge along a trajectory in one query.
+
+    Edges are matched in either direction; when several edges join a pair
+    the first one returned wins, as in a per-pair lookup.
+
+    Returns:
+        dict mapping _pair_key -> weight for pairs that have an edge
+    """
+    pairs = {_pair_key(a, b) for a, b in steps}
+    rows = client.query(
+        """
+        UNWIND $pairs AS pair
+        MATCH (a {id: pair[0]})-[r]-(b {id: pair[1]})
+        RETURN pair[0], pair[1], r.weight
+        """,
+        {"pairs": [list(p) for p in pairs]}
+    )
+    weights = {}
+    for from_id, to_id, weight in rows:
+        weights.setdefault((from_id, to_id), weight)
+    return weights
 
 
 def hebbian_update(trajectory: list, learning_rate: float = 0.01):
@@ -9,32 +40,78 @@ def hebbian_update(trajectory: list, learning_rate: float = 0.01):
 
     Implements Hebbian learning: "neurons that fire together wire together"
 
+    Current weights are read in one query and the updates are written in
+    one batched UNWIND, rather than a read and a write per hop.
+
     Args:
         trajectory: List of node IDs in activation order
         learning_rate: Amount to increase edge weight per co-activation
     """
+    steps = list(zip(trajectory, trajectory[1:]))
+    if not steps:
+        return
+
     client = get_client()
+    weights = _current_weights(client, steps)
 
-    for i in range(len(trajectory) - 1):
-        from_id = trajectory[i]
-        to_id = trajectory[i + 1]
+    with client.write_batch() as batch:
+        for from_id, to_id in steps:
+            key = _pair_key(from_id, to_id)
 
-        # Get current weight
-        result = client.query(
-            """
-            MATCH (a {id: $from})-[r]-(b {id: $to})
-            RETURN r.weight as weight
-            """,
-            {"from": from_id, "to": to_id}
-        )
+            if key in weights:
+                new_weight = min(1.0, (weights[key] or 0.5) + learning_rate)
+                weights[key] = new_weight
+                batch.use_edge(key[0], key[1], new_weight)
+            else:
+                # Create edge if doesn't exist
+                create_edge(from_id, to_id, "ACTIVATED", {"weight": learning_rate})
+                weights[key] = learning_rate
 
-        if result:
-            current_weight = result[0][0] or 0.5
-            new_weight = min(1.0, current_weight + learning_rate)
-            update_edge_weight(from_id, to_id, new_weight)
-        else:
-            # Create edge if doesn't exist
-            create_edge(from_id, to_id, "ACTIVATED", {"weight": learning_rate})
+    bump_topology_version()
+
+
+def hebbian_update_many(trajectories: list, learning_rate: float = 0.01):
+    """
+    Apply hebbian_update for many trajectories with aggregated writes.
+
+    Each edge's co-activations are summed across trajectories, so the
+    result matches calling hebbian_update on each in turn, but with one
+    weight read, one UNWIND of edge uses and one UNWIND of new edges.
+
+    Args:
+        trajectories: Lists of node IDs in activation order
+        learning_rate: Amount to increase edge weight per co-activation
+    """
+    uses = {}  # _pair_key -> co-activations
+    first_step = {}  # _pair_key -> (from_id, to_id) as first traversed
+    for trajectory in trajectories:
+        for from_id, to_id in zip(trajectory, trajectory[1:]):
+            key = _pair_key(from_id, to_id)
+            uses[key] = uses.get(key, 0) + 1
+            first_step.setdefault(key, (from_id, to_id))
+    if not uses:
+        return
+
+    client = get_client()
+    weights = _current_weights(client, list(first_step.values()))
+
+    new_edges = []
+    with client.write_batch() as batch:
+        for key, count in uses.items():
+            if key in weights:
+                new_weight = min(1.0, (weights[key] or 0.5) + learning_rate * count)
+                batch.use_edge(key[0], key[1], new_weight, uses=count)
+            else:
+                # Created on the first traversal, used on the rest
+                from_id, to_id = first_step[key]
+                new_edges.append((from_id, to_id, edge_properties({
+                    "weight": min(1.0, learning_rate * count),
+                    "use_count": count - 1
+                })))
+    if new_edges:
+        client.create_edges("ACTIVATED", new_edges)
+
+    bump_topology_version()
 
 
 def anti_hebbian_update(trajectory: list, learning_rate: float = 0.01):
@@ -47,22 +124,20 @@ def anti_hebbian_update(trajectory: list, learning_rate: float = 0.01):
         trajectory: List of node IDs in activation order
         learning_rate: Amount to decrease edge weight
     """
+    steps = list(zip(trajectory, trajectory[1:]))
+    if not steps:
+        return
+
     client = get_client()
+    weights = _current_weights(client, steps)
+
+    with client.write_batch() as batch:
+        for from_id, to_id in steps:
+            key = _pair_key(from_id, to_id)
+
+            if key in weights:
+                new_weight = max(0.01, (weights[key] or 0.5) - learning_rate)
+                weights[key] = new_weight
+                batch.use_edge(key[0], key[1], new_weight)
 
-    for i in range(len(trajectory) - 1):
-        from_id = trajectory[i]
-        to_id = trajectory[i + 1]
-
-        # Get current weight
-        result = client.query(
-            """
-            MATCH (a {id: $from})-[r]-(b {id: $to})
-            RETURN r.weight as weight
-            """,
-            {"from": from_id, "to": to_id}
-        )
-
-        if result:
-            current_weight = result[0][0] or 0.5
-            new_weight = max(0.01, current_weight - learning_rate)
-            update_edge_weight(from_id, to_id, new_weight)
+    bump_topology_version()
@@ -1,5 +1,6 @@
 """Agent introspection - self-awareness queries with mercy context."""
 from ..graph.client import get_client
+from .retention import get_trajectory_rollups
 
 
 def introspect(agent_id: str) -> dict:
@@ -67,6 +68,9 @@ def introspect(agent_id: str) -> dict:
         {"id": agent_id}
     )
 
+    # Older trajectories survive only as rollups
+    trajectory_history = get_trajectory_rollups(agent_id, client)
+
     # Get lessons learned
     lessons = client.query(
         """
@@ -136,6 +140,7 @@ def introspect(agent_id: str) -> dict:
             {"id": t[0], "captured": t[1], "captured_by": t[2], "capture_tier": t[3], "created_at": t[4]}
             for t in trajectories
         ],
+        "trajectory_history": trajectory_history,
         "lessons_learned": [
             {"id": l[0], "type": l[1], "description": l[2], "virtue": l[3]}
             for l in lessons
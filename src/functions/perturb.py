@@ -2,6 +2,7 @@
 import random
 from ..graph.client import get_client
 from ..graph.queries import set_node_activation
+from ..gestalt.cache import bump_topology_version
 
 
 def perturb(strength: float = 0.7, bias_neglected: bool = True) -> dict:
@@ -46,6 +47,7 @@ def perturb(strength: float = 0.7, bias_neglected: bool = True) -> dict:
     if node_id:
         activation = random.uniform(strength, 1.0)
         set_node_activation(node_id, activation)
+        bump_topology_version()
         return {"perturbed": node_id, "activation": activation}
 
     return {"perturbed": None}
@@ -69,6 +71,7 @@ def perturb_virtue(strength: float = 0.7) -> dict:
         virtue_id = random.choice(virtues)[0]
         activation = random.uniform(strength, 1.0)
         set_node_activation(virtue_id, activation)
+        bump_topology_version()
         return {"perturbed": virtue_id, "activation": activation}
 
     return {"perturbed": None}
@@ -0,0 +1,247 @@
+"""Trajectory retention: roll old trajectories up, then delete them.
+
+Every coherence test stores a Trajectory node per stimulus. Left alone
+they pile up and slow every full-graph scan. compact_trajectories keeps
+each agent's newest trajectories and folds the rest into one
+TrajectoryRollup node per agent and captured virtue, holding:
+
+    count          trajectories rolled up
+    captured       how many of them were captured
+    total_length   sum of trajectory lengths
+    mean_length    mean trajectory length (steps to capture when captured)
+    ngrams         JSON {"a>b": count} of the most frequent path n-grams
+    first_at       oldest rolled-up trajectory
+    last_at        newest rolled-up trajectory
+
+Escaped trajectories roll up under virtue "escaped". Rollups hang off
+the agent by HAS_ROLLUP, and readers of trajectory history (gestalt
+stability, introspection) read them alongside the raw trajectories.
+"""
+import json
+from datetime import datetime, timedelta
+from typing import Optional
+
+from ..constants import WRITE_BATCH_SIZE
+from ..graph.client import GraphClient, get_client
+from ..graph.proximity import edges_merged, nodes_removed
+
+ESCAPED = "escaped"
+
+
+def path_ngrams(path: str, n: int = 2) -> dict:
+    """Count the n-grams of a comma-separated trajectory path."""
+    nodes = [node for node in (path or "").split(",") if node]
+    counts = {}
+    for i in range(len(nodes) - n + 1):
+        key = ">".join(nodes[i:i + n])
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def select_expired(rows: list, keep_per_agent: Optional[int], cutoff: Optional[str]) -> list:
+    """
+    Pick trajectories to roll up.
+
+    Args:
+        rows: (trajectory_id, agent_id, created_at) rows
+        keep_per_agent: Newest trajectories each agent keeps (None = no limit)
+        cutoff: ISO timestamp; older trajectories expire (None = no age limit)
+
+    Returns:
+        IDs of expired trajectories
+    """
+    by_agent = {}
+    for traj_id, agent_id, created_at in rows:
+        by_agent.setdefault(agent_id, []).append((created_at or "", traj_id))
+
+    expired = []
+    for trajectories in by_agent.values():
+        trajectories.sort(reverse=True)
+        for rank, (created_at, traj_id) in enumerate(trajectories):
+            if (keep_per_agent is not None and rank >= keep_per_agent) or (
+                cutoff is not None and created_at < cutoff
+            ):
+                expired.append(traj_id)
+    return expired
+
+
+def compact_trajectories(
+    max_age_days: Optional[float] = None,
+    keep_per_agent: Optional[int] = None,
+    batch_size: int = WRITE_BATCH_SIZE,
+    ngram_size: int = 2,
+    max_ngrams: int = 50,
+    client: Optional[GraphClient] = None
+) -> dict:
+    """
+    Roll up and delete trajectories past an age or per-agent count.
+
+    Works in batches: each batch's trajectories are folded into their
+    rollups, which are written before the batch is deleted.
+
+    Args:
+        max_age_days: Trajectories older than this expire
+        keep_per_agent: Each agent keeps at most this many newest trajectories
+        batch_size: Trajectories rolled up and deleted per statement
+        ngram_size: Length of the path n-grams counted
+        max_ngrams: Most frequent n-grams kept per rollup
+        client: Graph client; defaults to the shared client
+
+    Returns:
+        dict with counts of trajectories scanned, rolled up and rollups written
+    """
+    client = client or get_client()
+    if max_age_days is None and keep_per_agent is None:
+        return {"scanned": 0, "rolled_up": 0, "rollups": 0}
+
+    cutoff = None
+    if max_age_days is not None:
+        cutoff = (datetime.utcnow() - timedelta(days=max_age_days)).isoformat()
+
+    rows = client.query("MATCH (t:Trajectory) RETURN t.id, t.agent, t.created_at")
+    expired = select_expired(rows, keep_per_agent, cutoff)
+
+    rollup_ids = set()
+    for start in range(0, len(expired), batch_size):
+        batch = expired[start:start + batch_size]
+        details = client.query(
+            """
+            UNWIND $ids AS id
+            MATCH (t:Trajectory {id: id})
+            RETURN t.agent, t.captured_by, t.captured, t.length, t.path, t.created_at
+            """,
+            {"ids": batch}
+        )
+        rollups = _fold(client, details, ngram_size, max_ngrams)
+        _write_rollups(client, rollups)
+        client.execute(
+            """
+            UNWIND $ids AS id
+            MATCH (t:Trajectory {id: id})
+            DETACH DELETE t
+            """,
+            {"ids": batch}
+        )
+        nodes_removed(batch)
+        rollup_ids.update(rollups)
+
+    return {"scanned": len(rows), "rolled_up": len(expired), "rollups": len(rollup_ids)}
+
+
+def get_trajectory_rollups(agent_id: str, client: Optional[GraphClient] = None) -> list:
+    """
+    An agent's rolled-up trajectory history.
+
+    Returns:
+        List of dicts (virtue, count, captured, mean_length, ngrams,
+        first_at, last_at), most trajectories first
+    """
+    client = client or get_client()
+    rows = client.query(
+        """
+        MATCH (a {id: $id})-[:HAS_ROLLUP]->(r:TrajectoryRollup)
+        RETURN r.virtue, r.count, r.captured, r.mean_length, r.ngrams, r.first_at, r.last_at
+        ORDER BY r.count DESC
+        """,
+        {"id": agent_id}
+    )
+    return [
+        {
+            "virtue": virtue,
+            "count": count,
+            "captured": captured,
+            "mean_length": mean_length,
+            "ngrams": json.loads(ngrams) if ngrams else {},
+            "first_at": first_at,
+            "last_at": last_at,
+        }
+        for virtue, count, captured, mean_length, ngrams, first_at, last_at in rows
+    ]
+
+
+def _rollup_id(agent_id: str, virtue: Optional[str]) -> str:
+    return f"rollup_{agent_id}_{virtue or ESCAPED}"
+
+
+def _fold(client, details: list, ngram_size: int, max_ngrams: int) -> dict:
+    """Merge trajectory rows into their (existing) rollups, keyed by rollup id."""
+    rollups = {}
+    for agent_id, captured_by, captured, length, path, created_at in details:
+        rollup_id = _rollup_id(agent_id, captured_by if captured else None)
+        rollup = rollups.get(rollup_id)
+        if rollup is None:
+            rollup = rollups[rollup_id] = {
+                "id": rollup_id,
+                "agent": agent_id,
+                "virtue": captured_by if captured else ESCAPED,
+                "count": 0,
+                "captured": 0,
+                "total_length": 0,
+                "ngrams": {},
+                "first_at": created_at,
+                "last_at": created_at,
+            }
+        _accumulate(rollup, 1, 1 if captured else 0, length or 0,
+                    path_ngrams(path, ngram_size), created_at, created_at)
+
+    existing = client.query(
+        """
+        UNWIND $ids AS id
+        MATCH (r:TrajectoryRollup {id: id})
+        RETURN r.id, r.count, r.captured, r.total_length, r.ngrams, r.first_at, r.last_at
+        """,
+        {"ids": list(rollups)}
+    ) if rollups else []
+    for rollup_id, count, captured, total_length, ngrams, first_at, last_at in existing:
+        _accumulate(rollups[rollup_id], count or 0, captured or 0, total_length or 0,
+                    json.loads(ngrams) if ngrams else {}, first_at, last_at)
+
+    for rollup in rollups.values():
+        top = sorted(rollup["ngrams"].items(), key=lambda item: item[1], reverse=True)[:max_ngrams]
+        rollup["ngrams"] = dict(top)
+    return rollups
+
+
+def _accumulate(rollup: dict, count: int, captured: int, total_length: int,
+                ngrams: dict, first_at: Optional[str], last_at: Optional[str]) -> None:
+    rollup["count"] += count
+    rollup["captured"] += captured
+    rollup["total_length"] += total_length
+    for key, n in ngrams.items():
+        rollup["ngrams"][key] = rollup["ngrams"].get(key, 0) + n
+    if first_at and (not rollup["first_at"] or first_at < rollup["first_at"]):
+        rollup["first_at"] = first_at
+    if last_at and (not rollup["last_at"] or last_at > rollup["last_at"]):
+        rollup["last_at"] = last_at
+
+
+def _write_rollups(client, rollups: dict) -> None:
+    if not rollups:
+        return
+    now = datetime.utcnow().isoformat()
+    rows = [
+        {
+            **rollup,
+            "mean_length": rollup["total_length"] / rollup["count"] if rollup["count"] else 0.0,
+            "ngrams": json.dumps(rollup["ngrams"]),
+            "updated_at": now,
+        }
+        for rollup in rollups.values()
+    ]
+    client.execute(
+        """
+        UNWIND $rows AS row
+        MERGE (r:TrajectoryRollup {id: row.id})
+        SET r = row
+        """,
+        {"rows": rows}
+    )
+    client.execute(
+        """
+        UNWIND $rows AS row
+        MATCH (a {id: row.agent}), (r:TrajectoryRollup {id: row.id})
+        MERGE (a)-[:HAS_ROLLUP]->(r)
+        """,
+        {"rows": [{"id": row["id"], "agent": row["agent"]} for row in rows]}
+    )
+    edges_merged([(row["agent"], row["id"], None) for row in rows])
@@ -0,0 +1,94 @@
+"""Sequential statistics for adaptive coherence tests.
+
+An adaptive test draws stimuli in rounds and, after each round, turns
+every coherence criterion into a three-valued condition: certainly met,
+certainly not met, or undecided (None) at the configured confidence.
+Capture rates and dominance use Wilson score intervals; coverage can only
+grow, and its upper bound uses a Good-Turing estimate of how often a new
+virtue still turns up (the share of virtues seen exactly once). The test
+stops once every way of resolving the undecided conditions gives the
+same coherent/not-coherent outcome.
+
+Intervals are per look, not corrected for repeated testing.
+"""
+import math
+from itertools import product
+from statistics import NormalDist
+from typing import Callable, Optional
+
+
+def z_score(confidence: float) -> float:
+    """Two-sided normal quantile for a confidence level (0.95 -> 1.96)."""
+    return NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+
+
+def wilson_interval(successes: int, n: int, z: float) -> tuple:
+    """Wilson score interval (low, high) for a binomial proportion."""
+    if n <= 0:
+        return 0.0, 1.0
+    p = successes / n
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def rate_at_least(successes: int, n: int, threshold: float, z: float, scale: float = 1.0) -> Optional[bool]:
+    """
+    Whether a (scaled, capped at 1) capture rate is at least threshold.
+
+    Returns:
+        True/False when the interval lies on one side, None otherwise
+    """
+    low, high = wilson_interval(successes, n, z)
+    if min(1.0, low * scale) >= threshold:
+        return True
+    if min(1.0, high * scale) < threshold:
+        return False
+    return None
+
+
+def coverage_at_least(
+    counts: dict,
+    n: int,
+    remaining: int,
+    minimum: int,
+    possible: int,
+    z: float
+) -> Optional[bool]:
+    """
+    Whether the number of distinct virtues captured will reach minimum.
+
+    Args:
+        counts: Captures per virtue so far
+        n: Stimuli drawn so far
+        remaining: Stimuli still to draw
+        minimum: Required distinct virtues
+        possible: Virtues that could be captured
+        z: Normal quantile for the confidence level
+    """
+    coverage = len(counts)
+    if coverage >= minimum:
+        return True
+    singletons = sum(1 for count in counts.values() if count == 1)
+    _, discovery = wilson_interval(singletons, n, z)
+    reachable = coverage + min(possible - coverage, remaining, math.ceil(remaining * discovery))
+    return False if reachable < minimum else None
+
+
+def outcome_decided(conditions: dict, decide: Callable[..., bool]) -> bool:
+    """
+    Check that decide() gives one answer however undecided conditions resolve.
+
+    Args:
+        conditions: name -> True, False or None (undecided)
+        decide: Function of the conditions as keyword arguments
+    """
+    undecided = [name for name, value in conditions.items() if value is None]
+    outcomes = set()
+    for values in product((True, False), repeat=len(undecided)):
+        resolved = {**conditions, **dict(zip(undecided, values))}
+        outcomes.add(decide(**resolved))
+        if len(outcomes) > 1:
+            return False
+    return True
@@ -1,7 +1,10 @@
 """Activation spread function with collective learning support."""
 import math
 from ..graph.client import get_client
+from ..graph.proximity import get_proximity_index
 from ..graph.queries import get_neighbors, get_node_activation, set_node_activation
+from ..graph.snapshot import GraphSnapshot
+from ..gestalt.cache import bump_topology_version
 from ..virtues.tiers import is_foundation
 
 
@@ -19,6 +22,46 @@ def sigmoid(x: float) -> float:
     return 1 / (1 + math.exp(-x))
 
 
+class _LiveGraph:
+    """
+    Per-lookup queries against FalkorDB, with the same interface as GraphSnapshot.
+
+    Nearby virtues come from the shared virtue-proximity index.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    def get_neighbors(self, node_id: str) -> list:
+        return get_neighbors(node_id)
+
+    def get_baseline(self, node_id: str) -> float:
+        result = self.client.query(
+            "MATCH (n {id: $id}) RETURN n.baseline as baseline",
+            {"id": node_id}
+        )
+        return result[0][0] if result and result[0][0] else 0.0
+
+    def get_activation(self, node_id: str) -> float:
+        return get_node_activation(node_id)
+
+    def set_activation(self, node_id: str, activation: float) -> None:
+        set_node_activation(node_id, activation)
+        bump_topology_version()
+
+    def virtue_tier(self, node_id: str):
+        result = self.client.query(
+            "MATCH (n:VirtueAnchor {id: $id}) RETURN n.tier LIMIT 1",
+            {"id": node_id}
+        )
+        if not result:
+            return None
+        return result[0][0] or ("foundation" if is_foundation(node_id) else "aspirational")
+
+    def nearby_virtues(self, node_id: str, max_hops: int, limit: int = 1) -> list:
+        return get_proximity_index(self.client).nearby_virtues(node_id, max_hops, limit)
+
+
 def spread_activation(
     start_node: str,
     agent_id: str = None,
@@ -26,7 +69,8 @@ def spread_activation(
     activation_threshold: float = 0.1,
     capture_threshold: float = 0.7,
     dampening: float = 0.8,
-    use_lessons: bool = True
+    use_lessons: bool = True,
+    snapshot: GraphSnapshot = None
 ) -> dict:
     """
     Spread activation from start_node.
@@ -40,11 +84,14 @@ def spread_activation(
         capture_threshold: Activation level to consider a virtue "captured"
         dampening: Factor to reduce activation as it spreads
         use_lessons: Whether to consult lessons before spreading
+        snapshot: Optional GraphSnapshot to read from instead of querying
+            FalkorDB per lookup. Activation writes stay pending on the
+            snapshot until its flush() is called.
 
     Returns:
         dict with trajectory, capture status, timing info, and tier
     """
-    client = get_client()
+    graph = snapshot if snapshot is not None else _LiveGraph(get_client())
     trajectory = [start_node]
     visited_activations = {}
 
@@ -55,30 +102,23 @@ def spread_activation(
             from ..mercy.lessons import apply_lessons_to_trajectory
 
             # Find likely target virtues based on start position
-            nearby_virtues = client.query(
-                """
-                MATCH (n {id: $start})-[*1..3]-(v:VirtueAnchor)
-                RETURN v.id
-                LIMIT 3
-                """,
-                {"start": start_node}
-            )
+            nearby_virtues = graph.nearby_virtues(start_node, max_hops=3, limit=3)
 
             if nearby_virtues:
-                target = nearby_virtues[0][0]
+                target = nearby_virtues[0]
                 guidance = apply_lessons_to_trajectory(agent_id, start_node, target)
         except ImportError:
             # mercy module not available, skip learning
             pass
 
     # Initialize start node
-    set_node_activation(start_node, 1.0)
+    graph.set_activation(start_node, 1.0)
     visited_activations[start_node] = 1.0
 
     current = start_node
 
     for step in range(max_steps):
-        neighbors = get_neighbors(current)
+        neighbors = graph.get_neighbors(current)
 
         if not neighbors:
             break
@@ -90,14 +130,10 @@ def spread_activation(
             weight = neighbor[2] or 0.5
 
             # Get neighbor's baseline (if virtue anchor)
-            baseline_result = client.query(
-                "MATCH (n {id: $id}) RETURN n.baseline as baseline",
-                {"id": n_id}
-            )
-            baseline = baseline_result[0][0] if baseline_result and baseline_result[0][0] else 0.0
+            baseline = graph.get_baseline(n_id)
 
             # Current activation of neighbor
-            current_act = visited_activations.get(n_id, get_node_activation(n_id))
+            current_act = visited_activations.get(n_id, graph.get_activation(n_id))
 
             # New activation: sigmoid(baseline + weight * tanh(incoming))
             incoming = visited_activations.get(current, 0) * dampening
@@ -113,20 +149,16 @@ def spread_activation(
         next_activation = new_activations[next_node]
 
         # Update graph
-        set_node_activation(next_node, next_activation)
+        graph.set_activation(next_node, next_activation)
         visited_activations[next_node] = next_activation
 
         # Record trajectory
         trajectory.append(next_node)
 
         # Check for basin capture (virtue anchor above threshold)
-        is_virtue = client.query(
-            "MATCH (n:VirtueAnchor {id: $id}) RETURN n.tier LIMIT 1",
-            {"id": next_node}
-        )
+        tier = graph.virtue_tier(next_node)
 
-        if is_virtue and next_activation >= capture_threshold:
-            tier = is_virtue[0][0] if is_virtue[0] else ("foundation" if is_foundation(next_node) else "aspirational")
+        if tier is not None and next_activation >= capture_threshold:
             return {
                 "trajectory": trajectory,
                 "captured": True,
@@ -1,11 +1,14 @@
 """Coherence testing for agents with two-tier virtue evaluation."""
 import random
-import uuid
+from functools import partial
 import yaml
 from ..graph.client import get_client
-from ..graph.queries import create_node, create_edge
+from ..graph.proximity import get_proximity_index
+from ..graph.snapshot import GraphSnapshot
 from .spread import spread_activation
-from .hebbian import hebbian_update
+from .coherence_sink import CoherenceSink
+from .sequential import coverage_at_least, outcome_decided, rate_at_least, wilson_interval, z_score
+from ..gestalt.cache import bump_topology_version
 from ..virtues.tiers import is_foundation
 
 
@@ -23,12 +26,17 @@ def get_config():
                 "max_dominance": 0.40,
                 "growth_matters": True,
                 "growth_threshold": 0.05,
-                "stimulus_count": 100
+                "stimulus_count": 100,
+                "quick_trajectory_sample": 1.0,
+                "adaptive": False,
+                "adaptive_confidence": 0.95,
+                "adaptive_round_size": 10,
+                "adaptive_min_stimuli": 20
             }
         }
 
 
-def generate_stimuli(count: int = 100) -> list:
+def generate_stimuli(count: int = 100, snapshot: GraphSnapshot = None, rng: random.Random = None) -> list:
     """
     Generate diverse test stimuli.
 
@@ -36,57 +44,74 @@ def generate_stimuli(count: int = 100) -> list:
 
     Args:
         count: Number of stimuli to generate
+        snapshot: Optional GraphSnapshot to draw node IDs from
+        rng: Random generator to draw with (default: the random module)
 
     Returns:
         List of node IDs to use as stimuli
     """
-    client = get_client()
+    rng = rng or random
+    if snapshot is not None:
+        node_ids = snapshot.non_virtue_ids()
+        if len(node_ids) < count:
+            node_ids.extend(snapshot.virtue_ids())
+    else:
+        client = get_client()
 
-    # Get all non-virtue nodes
-    nodes = client.query(
-        """
-        MATCH (n)
-        WHERE NOT n:VirtueAnchor
-        RETURN n.id
-        """
-    )
+        # Get all non-virtue nodes
+        nodes = client.query(
+            """
+            MATCH (n)
+            WHERE NOT n:VirtueAnchor
+            RETURN n.id
+            """
+        )
 
-    node_ids = [row[0] for row in nodes]
+        node_ids = [row[0] for row in nodes]
 
-    # If not enough nodes, include virtues
-    if len(node_ids) < count:
-        virtues = client.query("MATCH (v:VirtueAnchor) RETURN v.id")
-        node_ids.extend([row[0] for row in virtues])
+        # If not enough nodes, include virtues
+        if len(node_ids) < count:
+            virtues = client.query("MATCH (v:VirtueAnchor) RETURN v.id")
+            node_ids.extend([row[0] for row in virtues])
 
     # Sample with replacement if needed
     if len(node_ids) < count:
-        stimuli = random.choices(node_ids, k=count)
+        stimuli = rng.choices(node_ids, k=count)
     else:
-        stimuli = random.sample(node_ids, count)
+        stimuli = rng.sample(node_ids, count)
 
     return stimuli
 
 
-def find_closest_virtue(trajectory: list) -> str:
-    """Find which virtue the trajectory got closest to."""
-    client = get_client()
+def find_closest_virtue(trajectory: list, snapshot: GraphSnapshot = None) -> str:
+    """
+    Find which virtue the trajectory got closest to.
 
+    Without a snapshot, looks nodes up in the shared virtue-proximity index.
+    """
+    if snapshot is not None:
+        for node in reversed(trajectory[-10:]):
+            nearby = snapshot.nearby_virtues(node, max_hops=2, limit=1)
+            if nearby:
+                return nearby[0]
+        return None
+
+    index = get_proximity_index()
     for node in reversed(trajectory[-10:]):  # Check last 10 nodes
-        result = client.query(
-            """
-            MATCH (n {id: $id})-[*1..2]-(v:VirtueAnchor)
-            RETURN v.id
-            LIMIT 1
-            """,
-            {"id": node}
-        )
-        if result:
-            return result[0][0]
-
+        nearby = index.nearby_virtues(node, max_hops=2, limit=1)
+        if nearby:
+            return nearby[0]
     return None
 
 
-def test_coherence(agent_id: str, stimulus_count: int = 100) -> dict:
+def test_coherence(
+    agent_id: str,
+    stimulus_count: int = 100,
+    use_snapshot: bool = True,
+    trajectory_sample: float = 1.0,
+    adaptive: bool = None,
+    rng: random.Random = None
+) -> dict:
     """
     Test agent topology for coherence using two-tier evaluation.
 
@@ -97,14 +122,42 @@ def test_coherence(agent_id: str, stimulus_count: int = 100) -> dict:
     Args:
         agent_id: ID of the agent to test
         stimulus_count: Number of test stimuli to use
+        use_snapshot: Load the graph once into a GraphSnapshot and run every
+            spread against it. Edges and nodes written by this test are
+            mirrored into the snapshot; activations are flushed at the end.
+        trajectory_sample: Fraction of Trajectory nodes to persist (0 skips them)
+        adaptive: Draw stimuli in rounds and stop once the coherent /
+            not-coherent decision is certain at coherence.adaptive_confidence
+            (see functions.sequential); stimulus_count becomes the maximum.
+            Defaults to coherence.adaptive.
+        rng: Random generator for stimuli and trajectory sampling
+            (default: the random module)
+
+    Side effects (capture edges, Hebbian learning, pathways, failure
+    lessons, trajectories) are collected in a CoherenceSink and written in
+    bulk once the metrics are computed. Without a snapshot, spreads see
+    the graph as it was when the test started.
 
     Returns:
-        dict with coherence metrics including tier-based evaluation
+        dict with coherence metrics including tier-based evaluation, and
+        stimuli_used / stopped_early
     """
     config = get_config()
     coherence_config = config.get("coherence", {})
+    if adaptive is None:
+        adaptive = coherence_config.get("adaptive", False)
+    thresholds = _thresholds(coherence_config)
     client = get_client()
-    stimuli = generate_stimuli(stimulus_count)
+    snapshot = GraphSnapshot.load(client) if use_snapshot else None
+    stimuli = generate_stimuli(stimulus_count, snapshot=snapshot, rng=rng)
+    sink = CoherenceSink(
+        agent_id,
+        client=client,
+        snapshot=snapshot,
+        trajectory_sample=trajectory_sample,
+        rng=rng,
+        closest_virtue_fn=partial(find_closest_virtue, snapshot=snapshot)
+    )
 
     # Track captures by tier
     foundation_captures = {}  # virtue_id -> count
@@ -119,10 +172,22 @@ def test_coherence(agent_id: str, stimulus_count: int = 100) -> dict:
     )
     previous_rate = prev_result[0][0] if prev_result and prev_result[0][0] else 0.0
 
-    for stimulus in stimuli:
-        result = spread_activation(stimulus, agent_id=agent_id)
+    round_size = coherence_config.get("adaptive_round_size", 10)
+    min_stimuli = coherence_config.get("adaptive_min_stimuli", 20)
+    z = z_score(coherence_config.get("adaptive_confidence", 0.95))
+    used = 0
 
-        traj_id = f"traj_{uuid.uuid4().hex[:8]}"
+    for stimulus in stimuli:
+        if (
+            adaptive and used >= min_stimuli and used % round_size == 0
+            and _decision_is_certain(
+                foundation_captures, aspirational_captures, used,
+                len(stimuli) - used, previous_rate, thresholds, z
+            )
+        ):
+            break
+        used += 1
+        result = spread_activation(stimulus, agent_id=agent_id, snapshot=snapshot)
 
         if result["captured"]:
             virtue = result["captured_by"]
@@ -134,46 +199,17 @@ def test_coherence(agent_id: str, stimulus_count: int = 100) -> dict:
                 aspirational_captures[virtue] = aspirational_captures.get(virtue, 0) + 1
 
             total_time += result["capture_time"]
-
-            create_edge(agent_id, virtue, "CAPTURED_BY")
-            hebbian_update(result["trajectory"])
-
-            # Record successful pathway for collective learning
-            try:
-                from ..knowledge.pathways import record_successful_pathway
-                record_successful_pathway(
-                    agent_id, stimulus, virtue,
-                    result["trajectory"], result["capture_time"]
-                )
-            except ImportError:
-                pass
+            sink.record_capture(stimulus, virtue, result["trajectory"], result["capture_time"])
         else:
             escapes += 1
+            # Evaluated with empathy (which virtue was closest?) on flush
+            sink.record_escape(result["trajectory"])
 
-            # Evaluate with empathy - which virtue was closest?
-            try:
-                from ..mercy.judgment import evaluate_failure
-                from ..mercy.lessons import create_failure_lesson
-
-                closest_virtue = find_closest_virtue(result["trajectory"])
-                if closest_virtue:
-                    evaluate_failure(agent_id, closest_virtue, result["trajectory"])
-                    create_failure_lesson(agent_id, closest_virtue, result["trajectory"])
-            except ImportError:
-                pass
-
-        # Store trajectory
-        create_node("Trajectory", {
-            "id": traj_id,
-            "agent": agent_id,
-            "stimulus": stimulus,
-            "captured": result["captured"],
-            "captured_by": result["captured_by"],
-            "capture_tier": result.get("capture_tier"),
-            "length": len(result["trajectory"]),
-            "path": ",".join(result["trajectory"][:20])
-        })
-        create_edge(agent_id, traj_id, "HAS_TRAJECTORY")
+        sink.record_trajectory(stimulus, result)
+
+    if snapshot is not None and snapshot.flush():
+        # Gestalts read virtue activations
+        bump_topology_version()
 
     # Calculate metrics separately for foundation and aspirational
     foundation_total = sum(foundation_captures.values())
@@ -181,18 +217,18 @@ def test_coherence(agent_id: str, stimulus_count: int = 100) -> dict:
 
     # Foundation rate (should be very high)
     # Estimate foundation stimuli as ~10% of total (those starting near V01)
-    foundation_stimuli = max(1, stimulus_count // 10)
+    foundation_stimuli = max(1, used // 10)
     foundation_rate = foundation_total / max(1, foundation_stimuli) if foundation_total > 0 else (1.0 if foundation_stimuli == 0 else 0.0)
     foundation_rate = min(1.0, foundation_rate)
 
     # Aspirational rate (more lenient)
-    aspirational_stimuli = max(1, stimulus_count - foundation_stimuli)
+    aspirational_stimuli = max(1, used - foundation_stimuli)
     aspirational_rate = aspirational_total / max(1, aspirational_stimuli)
     aspirational_rate = min(1.0, aspirational_rate)
 
     # Overall capture rate
     total_captures = foundation_total + aspirational_total
-    overall_rate = total_captures / stimulus_count if stimulus_count > 0 else 0
+    overall_rate = total_captures / used if used > 0 else 0
 
     # Coverage (count of distinct virtues reached - aspirational only)
     aspirational_coverage = len(aspirational_captures)
@@ -212,34 +248,20 @@ def test_coherence(agent_id: str, stimulus_count: int = 100) -> dict:
 
     # Growth check
     growth = overall_rate - previous_rate
-    growth_threshold = coherence_config.get("growth_threshold", 0.05)
-    is_growing = growth > growth_threshold
-
-    # Determine coherence with mercy
-    foundation_threshold = coherence_config.get("foundation_capture_rate", 0.99)
-    aspirational_threshold = coherence_config.get("aspirational_capture_rate", 0.80)
-    min_coverage = coherence_config.get("min_coverage", 10)
-    max_dominance = coherence_config.get("max_dominance", 0.40)
+    is_growing = growth > thresholds["growth"]
 
     # Be lenient with foundation rate if no foundation captures expected
-    foundation_ok = foundation_rate >= foundation_threshold or foundation_total == 0
-    aspirational_ok = aspirational_rate >= aspirational_threshold
-    coverage_ok = aspirational_coverage >= min_coverage
-    dominance_ok = dominance <= max_dominance
-
-    # Coherence decision with nuance
-    if not foundation_ok and foundation_total > 0:
-        is_coherent = False
-        status = "foundation_weak"
-        message = "Trustworthiness must be maintained. This is foundational."
-    elif aspirational_ok and coverage_ok and dominance_ok:
-        is_coherent = True
-        status = "coherent"
-        message = "Well done. Continue to grow."
-    elif is_growing:
-        is_coherent = True  # Mercy: growing counts as coherent
-        status = "growing"
-        message = "Not perfect, but growing. Keep going."
+    foundation_ok = foundation_rate >= thresholds["foundation"] or foundation_total == 0
+
+    # Determine coherence with mercy
+    is_coherent, status, message = _decide(
+        foundation_weak=not foundation_ok and foundation_total > 0,
+        aspirational_ok=aspirational_rate >= thresholds["aspirational"],
+        coverage_ok=aspirational_coverage >= thresholds["coverage"],
+        dominance_ok=dominance <= thresholds["dominance"],
+        is_growing=is_growing
+    )
+    if status == "growing":
         # Clear warnings for virtues showing improvement
         try:
             from ..mercy.chances import clear_warnings_on_growth
@@ -247,14 +269,13 @@ def test_coherence(agent_id: str, stimulus_count: int = 100) -> dict:
                 clear_warnings_on_growth(agent_id, virtue)
         except ImportError:
             pass
-    else:
-        is_coherent = False
-        status = "needs_growth"
-        message = "Growth has stalled. Seek new paths."
 
     # Calculate composite score
     score = overall_rate * (aspirational_coverage / 18) * (1 - dominance) if aspirational_coverage > 0 else 0
 
+    # Persist this test's side effects before the agent's scores change
+    sink.flush()
+
     # Update agent
     client.execute(
         """
@@ -284,6 +305,7 @@ def test_coherence(agent_id: str, stimulus_count: int = 100) -> dict:
             "capture_rate": overall_rate
         }
     )
+    bump_topology_version(agent_id)
 
     return {
         "agent": agent_id,
@@ -303,11 +325,109 @@ def test_coherence(agent_id: str, stimulus_count: int = 100) -> dict:
         "foundation_captures": foundation_captures,
         "aspirational_captures": aspirational_captures,
         "virtue_distribution": {**foundation_captures, **aspirational_captures},
-        "escapes": escapes
+        "escapes": escapes,
+        "stimuli_used": used,
+        "stopped_early": used < len(stimuli)
+    }
+
+
+def _thresholds(coherence_config: dict) -> dict:
+    """Coherence thresholds from config."""
+    return {
+        "foundation": coherence_config.get("foundation_capture_rate", 0.99),
+        "aspirational": coherence_config.get("aspirational_capture_rate", 0.80),
+        "coverage": coherence_config.get("min_coverage", 10),
+        "dominance": coherence_config.get("max_dominance", 0.40),
+        "growth": coherence_config.get("growth_threshold", 0.05),
+    }
+
+
+def _decide(
+    foundation_weak: bool,
+    aspirational_ok: bool,
+    coverage_ok: bool,
+    dominance_ok: bool,
+    is_growing: bool
+) -> tuple:
+    """Coherence decision with nuance: (is_coherent, status, message)."""
+    if foundation_weak:
+        return False, "foundation_weak", "Trustworthiness must be maintained. This is foundational."
+    if aspirational_ok and coverage_ok and dominance_ok:
+        return True, "coherent", "Well done. Continue to grow."
+    if is_growing:
+        # Mercy: growing counts as coherent
+        return True, "growing", "Not perfect, but growing. Keep going."
+    return False, "needs_growth", "Growth has stalled. Seek new paths."
+
+
+def _decision_is_certain(
+    foundation_captures: dict,
+    aspirational_captures: dict,
+    used: int,
+    remaining: int,
+    previous_rate: float,
+    thresholds: dict,
+    z: float
+) -> bool:
+    """
+    Check if more stimuli could still change is_coherent or status.
+
+    Callers branch on status as well (the kiln groups "coherent" and
+    "growing" agents apart, and only "growing" clears warnings), so the
+    test stops only once both are settled.
+
+    Each criterion of _decide becomes True, False or None (undecided) from
+    confidence intervals on the rates behind it, mirroring the metric
+    formulas in test_coherence.
+    """
+    if remaining <= 0:
+        return True
+
+    foundation_total = sum(foundation_captures.values())
+    aspirational_total = sum(aspirational_captures.values())
+    total = foundation_total + aspirational_total
+
+    foundation_ok = rate_at_least(
+        foundation_total, used, thresholds["foundation"], z, scale=used / max(1, used // 10)
+    )
+    if foundation_total > 0:
+        foundation_weak = None if foundation_ok is None else not foundation_ok
+    else:
+        # Weak needs a foundation capture, which later stimuli may bring
+        foundation_weak = False if foundation_ok else None
+
+    if total > 0:
+        max_captures = max([*foundation_captures.values(), *aspirational_captures.values()])
+        low, high = wilson_interval(max_captures, total, z)
+        dominance_ok = True if high <= thresholds["dominance"] else False if low > thresholds["dominance"] else None
+    else:
+        dominance_ok = None
+
+    low, high = wilson_interval(total, used, z)
+    target = previous_rate + thresholds["growth"]
+    is_growing = True if low > target else False if high <= target else None
+
+    conditions = {
+        "foundation_weak": foundation_weak,
+        "aspirational_ok": rate_at_least(
+            aspirational_total, used, thresholds["aspirational"], z,
+            scale=used / max(1, used - max(1, used // 10))
+        ),
+        "coverage_ok": coverage_at_least(
+            aspirational_captures, used, remaining, thresholds["coverage"], 18, z
+        ),
+        "dominance_ok": dominance_ok,
+        "is_growing": is_growing,
     }
+    return outcome_decided(conditions, lambda **c: _decide(**c)[:2])
 
 
-def quick_coherence_check(agent_id: str, sample_size: int = 20) -> dict:
+def quick_coherence_check(
+    agent_id: str,
+    sample_size: int = 20,
+    trajectory_sample: float = None,
+    rng: random.Random = None
+) -> dict:
     """
     Quick coherence check with smaller sample size.
 
@@ -316,11 +436,17 @@ def quick_coherence_check(agent_id: str, sample_size: int = 20) -> dict:
     Args:
         agent_id: ID of the agent
         sample_size: Number of stimuli to test
+        trajectory_sample: Fraction of Trajectory nodes to persist
+            (default: coherence.quick_trajectory_sample, or 1.0)
+        rng: Random generator for stimuli and trajectory sampling
 
     Returns:
         dict with quick coherence estimate
     """
-    return test_coherence(agent_id, stimulus_count=sample_size)
+    if trajectory_sample is None:
+        coherence_config = get_config().get("coherence", {})
+        trajectory_sample = coherence_config.get("quick_trajectory_sample", 1.0)
+    return test_coherence(agent_id, stimulus_count=sample_size, trajectory_sample=trajectory_sample, rng=rng)
 
 
 def compare_coherence(agent_ids: list) -> list:
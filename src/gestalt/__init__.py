@@ -11,6 +11,13 @@ from .embedding import (
     add_noise,
     sample_random_embedding,
 )
+from .cache import (
+    GestaltCache,
+    get_gestalt_cache,
+    reset_gestalt_cache,
+    bump_topology_version,
+    topology_version,
+)
 from .compare import (
     compare_gestalts,
     find_similar_agents,
@@ -35,6 +42,12 @@ __all__ = [
     "cluster_embeddings",
     "add_noise",
     "sample_random_embedding",
+    # Cache
+    "GestaltCache",
+    "get_gestalt_cache",
+    "reset_gestalt_cache",
+    "bump_topology_version",
+    "topology_version",
     # Comparison
     "compare_gestalts",
     "find_similar_agents",
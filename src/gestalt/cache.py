@@ -0,0 +1,158 @@
+"""
+Gestalt cache with topology-version invalidation.
+
+compute_gestalt runs several graph queries per agent, and comparison
+and clustering over many agents call it for every agent on every call.
+GestaltCache keeps computed gestalts and their embeddings in an LRU
+keyed by agent id, tagged with the topology version they were computed
+at. Hebbian updates, decay, healing, coherence tests and activation
+writes (gestalts read virtue activations) bump the version, which
+invalidates every entry (or one agent's) lazily.
+
+Version counters live in this process and restart at zero, so cached
+gestalts are never reused across processes or restarts. Code that
+changes the graph through other paths should call
+bump_topology_version().
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Optional
+
+from ..constants import GESTALT_CACHE_SIZE
+from ..models import Gestalt
+from .compute import compute_gestalt
+from .embedding import GestaltEmbedding, encode_gestalt
+
+logger = logging.getLogger(__name__)
+
+_topology_version = 0
+_agent_versions: dict[str, int] = {}
+
+
+def bump_topology_version(agent_id: str = None) -> int:
+    """
+    Record a topology change, invalidating cached gestalts.
+
+    Args:
+        agent_id: Agent whose own data changed; None for graph-wide changes
+
+    Returns:
+        The new version (graph-wide or for the agent)
+    """
+    global _topology_version
+    if agent_id is None:
+        _topology_version += 1
+        return _topology_version
+    _agent_versions[agent_id] = _agent_versions.get(agent_id, 0) + 1
+    return _agent_versions[agent_id]
+
+
+def topology_version(agent_id: str) -> str:
+    """Version tag a cached gestalt for agent_id must carry to be valid."""
+    return f"{_topology_version}:{_agent_versions.get(agent_id, 0)}"
+
+
+class GestaltCache:
+    """LRU cache of gestalts and embeddings keyed by agent id."""
+
+    def __init__(self, max_size: int = GESTALT_CACHE_SIZE):
+        """
+        Args:
+            max_size: Maximum number of agents kept in memory
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[str, Gestalt, GestaltEmbedding]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, agent_id: str) -> Gestalt:
+        """Cached or freshly computed gestalt for an agent."""
+        return self._lookup([agent_id])[agent_id][0]
+
+    def embedding(self, agent_id: str) -> GestaltEmbedding:
+        """Cached or freshly computed gestalt embedding for an agent."""
+        return self._lookup([agent_id])[agent_id][1]
+
+    def embeddings(self, agent_ids: list) -> list:
+        """
+        Embeddings for many agents, computing only stale or missing ones.
+
+        Agents whose gestalt cannot be computed are logged and skipped.
+
+        Returns:
+            List of GestaltEmbedding in agent_ids order
+        """
+        found = self._lookup(agent_ids, skip_errors=True)
+        return [found[a][1] for a in agent_ids if a in found]
+
+    def gestalts(self, agent_ids: list) -> dict:
+        """Gestalts for many agents as agent_id -> Gestalt; failures are skipped."""
+        found = self._lookup(agent_ids, skip_errors=True)
+        return {a: found[a][0] for a in agent_ids if a in found}
+
+    def invalidate(self, agent_id: str = None) -> None:
+        """Drop one agent's entry, or every entry."""
+        if agent_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(agent_id, None)
+
+    def _lookup(self, agent_ids: list, skip_errors: bool = False) -> dict:
+        found = {}
+        missing = []
+        for agent_id in dict.fromkeys(agent_ids):
+            entry = self._entries.get(agent_id)
+            if entry is not None and entry[0] == topology_version(agent_id):
+                self._entries.move_to_end(agent_id)
+                found[agent_id] = entry[1:]
+                self.hits += 1
+            else:
+                missing.append(agent_id)
+                self.misses += 1
+
+        for agent_id in missing:
+            try:
+                gestalt = compute_gestalt(agent_id)
+            except Exception as e:
+                if not skip_errors:
+                    raise
+                logger.warning(f"Could not compute gestalt for {agent_id}: {e}")
+                continue
+            found[agent_id] = self._store(agent_id, gestalt)
+
+        return found
+
+    def _store(self, agent_id: str, gestalt: Gestalt) -> tuple:
+        entry = (topology_version(agent_id), gestalt, encode_gestalt(gestalt))
+        self._entries[agent_id] = entry
+        self._entries.move_to_end(agent_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return entry[1:]
+
+
+# Singleton cache instance
+_cache: Optional[GestaltCache] = None
+
+
+def get_gestalt_cache() -> GestaltCache:
+    """Get or create the shared GestaltCache."""
+    global _cache
+    if _cache is None:
+        _cache = GestaltCache()
+    return _cache
+
+
+def reset_gestalt_cache():
+    """Reset the shared cache (for testing)."""
+    global _cache
+    _cache = None
@@ -14,7 +14,7 @@ from typing import List, Tuple, Optional
 
 from ..graph.client import get_client
 from ..models import Gestalt
-from .compute import compute_gestalt
+from .cache import get_gestalt_cache
 from .embedding import (
     GestaltEmbedding,
     encode_gestalt,
@@ -155,20 +155,10 @@ def find_similar_agents(
     if not result:
         return []
 
-    # Compute gestalt for target agent
-    target_gestalt = compute_gestalt(agent_id)
-    target_emb = encode_gestalt(target_gestalt)
-
-    # Compute gestalts and embeddings for all others
-    candidates = []
-    for row in result:
-        other_id = row[0]
-        try:
-            other_gestalt = compute_gestalt(other_id)
-            other_emb = encode_gestalt(other_gestalt)
-            candidates.append(other_emb)
-        except Exception as e:
-            logger.warning(f"Could not compute gestalt for {other_id}: {e}")
+    # Embeddings come from the gestalt cache; only stale agents are recomputed
+    cache = get_gestalt_cache()
+    target_emb = cache.embedding(agent_id)
+    candidates = cache.embeddings([row[0] for row in result])
 
     # Find nearest
     nearest = find_nearest(target_emb, candidates, top_k=top_k)
@@ -195,16 +185,8 @@ def cluster_agents(n_clusters: int = 4) -> List[List[str]]:
     if not result:
         return []
 
-    # Compute embeddings
-    embeddings = []
-    for row in result:
-        agent_id = row[0]
-        try:
-            gestalt = compute_gestalt(agent_id)
-            emb = encode_gestalt(gestalt)
-            embeddings.append(emb)
-        except Exception as e:
-            logger.warning(f"Could not compute gestalt for {agent_id}: {e}")
+    # Embeddings come from the gestalt cache; only stale agents are recomputed
+    embeddings = get_gestalt_cache().embeddings([row[0] for row in result])
 
     if len(embeddings) < n_clusters:
         return [[e.agent_id for e in embeddings]]
@@ -240,14 +222,12 @@ def analyze_archetype_distribution() -> dict:
         "untyped": 0,
     }
 
-    for row in result:
-        agent_id = row[0]
-        try:
-            gestalt = compute_gestalt(agent_id)
-            archetype = gestalt.archetype or "untyped"
-            counts[archetype] = counts.get(archetype, 0) + 1
-        except Exception:
-            counts["untyped"] += 1
+    agent_ids = [row[0] for row in result]
+    gestalts = get_gestalt_cache().gestalts(agent_ids)
+    for agent_id in agent_ids:
+        gestalt = gestalts.get(agent_id)
+        archetype = (gestalt.archetype if gestalt else None) or "untyped"
+        counts[archetype] = counts.get(archetype, 0) + 1
 
     total = sum(counts.values())
 
@@ -332,11 +312,9 @@ def interpolate_characters(
 
     Returns decoded character properties (not a full gestalt).
     """
-    gestalt_a = compute_gestalt(agent_a_id)
-    gestalt_b = compute_gestalt(agent_b_id)
-
-    emb_a = encode_gestalt(gestalt_a)
-    emb_b = encode_gestalt(gestalt_b)
+    cache = get_gestalt_cache()
+    emb_a = cache.embedding(agent_a_id)
+    emb_b = cache.embedding(agent_b_id)
 
     interpolated = interpolate_embeddings(emb_a, emb_b, t)
 
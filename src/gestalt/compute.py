@@ -103,12 +103,14 @@ def compute_gestalt(agent_id: str) -> Gestalt:
 
 def get_gestalt(agent_id: str) -> Gestalt | None:
     """
-    Get or compute gestalt for an agent.
+    Get gestalt for an agent from the shared GestaltCache.
 
-    Currently always computes fresh; could cache in graph.
+    Recomputed only when the topology version has changed since the
+    cached copy was computed.
     """
+    from .cache import get_gestalt_cache
     try:
-        return compute_gestalt(agent_id)
+        return get_gestalt_cache().get(agent_id)
     except Exception as e:
         logger.error(f"Failed to compute gestalt for {agent_id}: {e}")
         return None
@@ -267,7 +269,7 @@ def _compute_stability(client, agent_id: str) -> float:
     # Get recent trajectories
     result = client.query(
         """
-        MATCH (a:Agent {id: $agent_id})-[:PRODUCED]->(t:Trajectory)
+        MATCH (a:Agent {id: $agent_id})-[:PRODUCED|HAS_TRAJECTORY]->(t:Trajectory)
         WHERE t.captured_by IS NOT NULL
         RETURN t.captured_by
         ORDER BY t.created_at DESC
@@ -276,15 +278,28 @@ def _compute_stability(client, agent_id: str) -> float:
         {"agent_id": agent_id}
     )
 
-    if not result or len(result) < 5:
-        return 0.5  # Not enough data
-
     # Count captures per virtue
     captures = {}
-    for row in result:
+    for row in result or []:
         virtue = row[0]
         captures[virtue] = captures.get(virtue, 0) + 1
 
+    # Too few raw trajectories left (e.g. after retention): use the rollups
+    if len(result or []) < 5:
+        rollups = client.query(
+            """
+            MATCH (a:Agent {id: $agent_id})-[:HAS_ROLLUP]->(r:TrajectoryRollup)
+            WHERE r.captured > 0
+            RETURN r.virtue, r.captured
+            """,
+            {"agent_id": agent_id}
+        )
+        for virtue, count in rollups or []:
+            captures[virtue] = captures.get(virtue, 0) + count
+
+    if sum(captures.values()) < 5:
+        return 0.5  # Not enough data
+
     # Stability = concentration (few virtues capture most)
     # Using Herfindahl index
     total = sum(captures.values())
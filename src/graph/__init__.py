@@ -8,6 +8,12 @@ from .queries import (
     get_node_activation,
     set_node_activation,
 )
+from .snapshot import GraphSnapshot
+from .proximity import (
+    VirtueProximityIndex,
+    get_proximity_index,
+    reset_proximity_index,
+)
 from .moral_geometry import (
     MoralGeometryAnalyzer,
     GeometrySnapshot,
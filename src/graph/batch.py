@@ -0,0 +1,138 @@
+"""
+Write batching for graph backends.
+
+WriteBatcher accumulates node activation updates, edge weight updates and
+edge deletions in memory and hands them to the backend in bulk, so a pass
+that touches thousands of nodes or edges issues a handful of UNWIND
+statements instead of one query per element.
+
+Backends (GraphClient, GraphSubstrate, MockGraphSubstrate) implement four
+bulk methods, each taking a list of row tuples:
+
+    set_activations([(node_id, activation), ...])
+    set_edge_weights([(source_id, target_id, weight), ...])
+    use_edges([(source_id, target_id, weight, uses), ...])
+    delete_edges([(source_id, target_id), ...])
+
+set_edge_weights only changes the weight. use_edges also records use:
+last_used is set to now and use_count is incremented by `uses`.
+"""
+
+from src.constants import WRITE_BATCH_SIZE
+
+
+class WriteBatcher:
+    """
+    Accumulates graph writes and flushes them to a backend in bulk.
+
+    Repeated writes to the same node or edge are coalesced; the last value
+    wins and edge uses add up. A queue is flushed automatically once it
+    holds flush_size rows. Use as a context manager to flush on exit.
+    """
+
+    def __init__(self, backend, flush_size: int = WRITE_BATCH_SIZE):
+        """
+        Initialize the batcher.
+
+        Args:
+            backend: Object implementing the bulk write methods
+            flush_size: Rows per queue before an automatic flush, and the
+                maximum rows sent in a single statement
+        """
+        if flush_size < 1:
+            raise ValueError("flush_size must be at least 1")
+        self.backend = backend
+        self.flush_size = flush_size
+        self._activations: dict[str, float] = {}
+        self._weights: dict[tuple[str, str], float] = {}
+        self._uses: dict[tuple[str, str], list] = {}
+        self._deletes: dict[tuple[str, str], None] = {}
+        self.statements = 0
+        self.rows_written = 0
+
+    def __enter__(self) -> "WriteBatcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+    @property
+    def pending(self) -> int:
+        """Number of rows waiting to be flushed."""
+        return len(self._activations) + len(self._weights) + len(self._uses) + len(self._deletes)
+
+    def set_activation(self, node_id: str, activation: float) -> None:
+        """Queue a node activation update."""
+        self._activations[node_id] = activation
+        if len(self._activations) >= self.flush_size:
+            self._flush_activations()
+
+    def set_edge_weight(self, source_id: str, target_id: str, weight: float) -> None:
+        """Queue a weight-only update for the edge source -> target."""
+        self._weights[(source_id, target_id)] = weight
+        if len(self._weights) >= self.flush_size:
+            self._flush_weights()
+
+    def use_edge(self, source_id: str, target_id: str, weight: float, uses: int = 1) -> None:
+        """Queue a weight update that also records use of the edge."""
+        key = (source_id, target_id)
+        if key in self._uses:
+            self._uses[key][0] = weight
+            self._uses[key][1] += uses
+        else:
+            self._uses[key] = [weight, uses]
+        if len(self._uses) >= self.flush_size:
+            self._flush_uses()
+
+    def delete_edge(self, source_id: str, target_id: str) -> None:
+        """Queue deletion of the edge source -> target."""
+        key = (source_id, target_id)
+        self._weights.pop(key, None)
+        self._uses.pop(key, None)
+        self._deletes[key] = None
+        if len(self._deletes) >= self.flush_size:
+            self._flush_deletes()
+
+    def flush(self) -> int:
+        """
+        Flush every queue to the backend.
+
+        Returns:
+            Number of rows written
+        """
+        written = self.rows_written
+        self._flush_activations()
+        self._flush_weights()
+        self._flush_uses()
+        self._flush_deletes()
+        return self.rows_written - written
+
+    def _send(self, method, rows: list) -> None:
+        for start in range(0, len(rows), self.flush_size):
+            chunk = rows[start:start + self.flush_size]
+            method(chunk)
+            self.statements += 1
+            self.rows_written += len(chunk)
+
+    def _flush_activations(self) -> None:
+        if self._activations:
+            self._send(self.backend.set_activations, list(self._activations.items()))
+            self._activations.clear()
+
+    def _flush_weights(self) -> None:
+        if self._weights:
+            rows = [(s, t, w) for (s, t), w in self._weights.items()]
+            self._send(self.backend.set_edge_weights, rows)
+            self._weights.clear()
+
+    def _flush_uses(self) -> None:
+        if self._uses:
+            rows = [(s, t, w, uses) for (s, t), (w, uses) in self._uses.items()]
+            self._send(self.backend.use_edges, rows)
+            self._uses.clear()
+
+    def _flush_deletes(self) -> None:
+        if self._deletes:
+            self._send(self.backend.delete_edges, list(self._deletes))
+            self._deletes.clear()
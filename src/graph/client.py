@@ -1,9 +1,15 @@
 """FalkorDB connection client."""
+from datetime import datetime
 from falkordb import FalkorDB
+import redis
 from typing import Any, Optional
 import yaml
 import os
 
+from ..constants import WRITE_BATCH_SIZE
+from . import proximity
+from .batch import WriteBatcher
+
 class GraphClient:
     """Client for FalkorDB graph database."""
 
@@ -24,9 +30,22 @@ class GraphClient:
         with open(config_path) as f:
             config = yaml.safe_load(f)
 
+        # With max_connections set, threads sharing this client (e.g. parallel
+        # kiln workers) wait for a free connection instead of opening more
+        connection_pool = None
+        max_connections = config["graph"].get("max_connections")
+        if max_connections:
+            connection_pool = redis.BlockingConnectionPool(
+                host=config["graph"]["host"],
+                port=config["graph"]["port"],
+                max_connections=max_connections,
+                decode_responses=True
+            )
+
         self.db = FalkorDB(
             host=config["graph"]["host"],
-            port=config["graph"]["port"]
+            port=config["graph"]["port"],
+            connection_pool=connection_pool
         )
         self.graph = self.db.select_graph(config["graph"]["name"])
 
@@ -39,6 +58,94 @@ class GraphClient:
         """Execute Cypher mutation."""
         self.graph.query(cypher, params or {})
 
+    def write_batch(self, flush_size: int = WRITE_BATCH_SIZE) -> WriteBatcher:
+        """Return a WriteBatcher that flushes into this client."""
+        return WriteBatcher(self, flush_size)
+
+    def set_activations(self, rows: list) -> None:
+        """Bulk-set node activations from (node_id, activation) rows."""
+        self.execute(
+            """
+            UNWIND $rows AS row
+            MATCH (n {id: row[0]})
+            SET n.activation = row[1],
+                n.last_activated = $now
+            """,
+            {"rows": [list(r) for r in rows], "now": datetime.utcnow().isoformat()}
+        )
+
+    def set_edge_weights(self, rows: list) -> None:
+        """Bulk-set weights from (from_id, to_id, weight) rows, directed."""
+        self.execute(
+            """
+            UNWIND $rows AS row
+            MATCH (a {id: row[0]})-[r]->(b {id: row[1]})
+            SET r.weight = row[2]
+            """,
+            {"rows": [list(r) for r in rows]}
+        )
+        proximity.weights_changed(rows)
+
+    def use_edges(self, rows: list) -> None:
+        """
+        Bulk Hebbian-style updates from (from_id, to_id, weight, uses) rows.
+
+        Matches edges in either direction, like queries.update_edge_weight.
+        """
+        now = datetime.utcnow()
+        self.execute(
+            """
+            UNWIND $rows AS row
+            MATCH (a {id: row[0]})-[r]-(b {id: row[1]})
+            SET r.weight = row[2],
+                r.last_used = $now,
+                r.last_used_ts = $now_ts,
+                r.use_count = coalesce(r.use_count, 0) + row[3]
+            """,
+            {
+                "rows": [list(r) for r in rows],
+                "now": now.isoformat(),
+                "now_ts": (now - datetime(1970, 1, 1)).total_seconds()
+            }
+        )
+        proximity.weights_changed(rows)
+
+    def delete_edges(self, rows: list) -> None:
+        """Bulk-delete directed edges from (from_id, to_id) rows."""
+        self.execute(
+            """
+            UNWIND $rows AS row
+            MATCH (a {id: row[0]})-[r]->(b {id: row[1]})
+            DELETE r
+            """,
+            {"rows": [list(r) for r in rows]}
+        )
+        proximity.edges_removed(rows)
+
+    def create_nodes(self, label: str, rows: list) -> None:
+        """Bulk-create nodes with one label from property dicts."""
+        self.execute(
+            f"""
+            UNWIND $rows AS row
+            CREATE (n:{label})
+            SET n = row
+            """,
+            {"rows": rows}
+        )
+
+    def create_edges(self, rel_type: str, rows: list) -> None:
+        """Bulk-create rel_type edges from (from_id, to_id, properties) rows."""
+        self.execute(
+            f"""
+            UNWIND $rows AS row
+            MATCH (a {{id: row.from_id}}), (b {{id: row.to_id}})
+            CREATE (a)-[r:{rel_type}]->(b)
+            SET r = row.props
+            """,
+            {"rows": [{"from_id": f, "to_id": t, "props": p} for f, t, p in rows]}
+        )
+        proximity.edges_added([(f, t, p.get("weight")) for f, t, p in rows])
+
     def node_exists(self, node_id: str) -> bool:
         """Check if a node with given id exists."""
         result = self.query(
@@ -7,6 +7,8 @@ Provides the same interface as GraphSubstrate but stores everything in memory.
 import logging
 from datetime import datetime
 
+from src.constants import MAX_EDGE_WEIGHT, MIN_EDGE_WEIGHT, WRITE_BATCH_SIZE
+from src.graph.batch import WriteBatcher
 from src.models import Edge, EdgeDirection, Node, NodeType
 
 logger = logging.getLogger(__name__)
@@ -136,6 +138,42 @@ class MockGraphSubstrate:
         self._ensure_connected()
         return list(self._edges.values())
 
+    # Batched Operations
+
+    def write_batch(self, flush_size: int = WRITE_BATCH_SIZE) -> WriteBatcher:
+        return WriteBatcher(self, flush_size)
+
+    def set_activations(self, rows: list[tuple[str, float]]) -> None:
+        self._ensure_connected()
+        now = datetime.utcnow()
+        for node_id, activation in rows:
+            node = self._nodes.get(node_id)
+            if node:
+                node.activation = activation
+                node.last_activated = now
+
+    def set_edge_weights(self, rows: list[tuple[str, str, float]]) -> None:
+        self._ensure_connected()
+        for source_id, target_id, weight in rows:
+            edge = self._edges.get(self._edge_key(source_id, target_id))
+            if edge:
+                edge.weight = max(MIN_EDGE_WEIGHT, min(MAX_EDGE_WEIGHT, weight))
+
+    def use_edges(self, rows: list[tuple[str, str, float, int]]) -> None:
+        self._ensure_connected()
+        now = datetime.utcnow()
+        for source_id, target_id, weight, uses in rows:
+            edge = self._edges.get(self._edge_key(source_id, target_id))
+            if edge:
+                edge.weight = max(MIN_EDGE_WEIGHT, min(MAX_EDGE_WEIGHT, weight))
+                edge.last_used = now
+                edge.use_count += uses
+
+    def delete_edges(self, rows: list[tuple[str, str]]) -> None:
+        self._ensure_connected()
+        for source_id, target_id in rows:
+            self._edges.pop(self._edge_key(source_id, target_id), None)
+
     # Utility Operations
 
     def clear_graph(self) -> None:
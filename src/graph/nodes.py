@@ -157,6 +157,32 @@ class NodeManager:
         self._node_cache[node_id] = node
         return node
 
+    def update_activations(self, activations: dict[str, float]) -> int:
+        """
+        Update many nodes' activation levels in batched writes.
+
+        Unlike update_activation, nodes are not read first; IDs that do not
+        exist are ignored by the substrate.
+
+        Args:
+            activations: Dict mapping node ID to new activation level
+
+        Returns:
+            Number of activations written
+        """
+        now = datetime.utcnow()
+        with self.substrate.write_batch() as batch:
+            for node_id, activation in activations.items():
+                # Clamp activation to valid range
+                activation = max(MIN_ACTIVATION, min(MAX_ACTIVATION, activation))
+                batch.set_activation(node_id, activation)
+
+                cached = self._node_cache.get(node_id)
+                if cached:
+                    cached.activation = activation
+                    cached.last_activated = now
+        return len(activations)
+
     def activate_node(self, node_id: str, strength: float = 1.0) -> Node | None:
         """
         Activate a node with a given strength.
@@ -0,0 +1,413 @@
+"""Virtue-proximity index.
+
+Maps every node to the virtue anchors within VIRTUE_PROXIMITY_HOPS hops,
+with hop distance and weighted distance, so "which virtue is near this
+node" is a dictionary lookup instead of a variable-length
+MATCH (n)-[*1..k]-(v:VirtueAnchor) in FalkorDB.
+
+The index is built from a GraphSnapshot with one bounded search per
+anchor (breadth-first for hops, Dijkstra for weighted distance, where an
+edge of weight w costs -log(w), so the distance is the strength of the
+strongest path). Edges are treated as undirected, like the queries it
+replaces.
+
+A new edge can only shorten distances, so it is applied by relaxing
+outwards from its endpoints in the regions that hold one of them. A
+deleted edge or node can lengthen them, so the anchors whose region held
+it are searched again, once per batch. GraphClient.create_edges /
+delete_edges, queries.create_edge / delete_edge, action outcomes and
+trajectory retention report their writes to the shared index.
+
+Weight-only changes (Hebbian learning, decay) update the stored edge
+weights without searching again: weighted distances catch up when that
+anchor is next searched or on refresh(). Bulk rewrites that bypass the
+hooks (server-side decay, clear_graph) drop the shared index instead,
+and writes made by other processes are not seen until refresh().
+
+The index is guarded by a lock, so the hooks can be called from several
+threads (e.g. parallel kiln workers flushing their sinks).
+"""
+import heapq
+import math
+import threading
+from collections import deque
+from typing import Optional
+
+from ..constants import VIRTUE_PROXIMITY_HOPS, WRITE_BATCH_SIZE
+
+_MIN_WEIGHT = 1e-6
+
+
+def _cost(weights: list) -> float:
+    """Weighted length of an edge: -log of its strongest parallel weight."""
+    return -math.log(max(_MIN_WEIGHT, min(1.0, max(weights))))
+
+
+class VirtueProximityIndex:
+    """Nearest virtue anchors, with distances, for every node."""
+
+    def __init__(self, edges: list, virtue_ids: list, max_hops: int = VIRTUE_PROXIMITY_HOPS):
+        """
+        Args:
+            edges: [from_id, to_id, weight, ...] rows
+            virtue_ids: IDs of the virtue anchors
+            max_hops: Furthest hop distance indexed
+        """
+        self.max_hops = max_hops
+        self.virtue_ids = list(virtue_ids)
+        self._lock = threading.RLock()
+        # node -> neighbor -> weights of the parallel edges joining them
+        self._adjacency: dict[str, dict[str, list]] = {}
+        for edge in edges:
+            self._link(edge[0], edge[1], edge[2])
+
+        # anchor -> node -> (hops, weighted distance)
+        self._regions: dict[str, dict[str, tuple]] = {}
+        # node -> anchor -> (hops, weighted distance)
+        self._by_node: dict[str, dict[str, tuple]] = {}
+        self.refresh()
+
+    @classmethod
+    def from_snapshot(cls, snapshot, max_hops: int = VIRTUE_PROXIMITY_HOPS) -> "VirtueProximityIndex":
+        """Build from a GraphSnapshot."""
+        return cls(snapshot.edges, snapshot.virtue_ids(), max_hops)
+
+    @classmethod
+    def load(cls, client=None, max_hops: int = VIRTUE_PROXIMITY_HOPS) -> "VirtueProximityIndex":
+        """Build from the graph, loaded with two queries."""
+        from .snapshot import GraphSnapshot
+        return cls.from_snapshot(GraphSnapshot.load(client), max_hops)
+
+    def refresh(self) -> None:
+        """Search again from every anchor."""
+        with self._lock:
+            self._regions.clear()
+            self._by_node.clear()
+            for anchor in self.virtue_ids:
+                self._search(anchor)
+
+    # Lookups
+
+    def entries(self, node_id: str, max_hops: Optional[int] = None) -> list:
+        """
+        Virtue anchors near node_id, nearest first.
+
+        Returns:
+            (anchor_id, hops, weighted_distance) tuples, ordered by hops,
+            then weighted distance; node_id itself is excluded
+        """
+        max_hops = self.max_hops if max_hops is None else max_hops
+        with self._lock:
+            found = [
+                (anchor, hops, weighted)
+                for anchor, (hops, weighted) in self._by_node.get(node_id, {}).items()
+                if anchor != node_id and hops <= max_hops
+            ]
+        found.sort(key=lambda entry: (entry[1], entry[2], entry[0]))
+        return found
+
+    def nearby_virtues(self, node_id: str, max_hops: int, limit: int = 1) -> list:
+        """
+        Virtue anchors within max_hops of node_id, nearest first.
+
+        Indexed equivalent of MATCH (n {id})-[*1..max_hops]-(v:VirtueAnchor).
+        """
+        if max_hops > self.max_hops:
+            raise ValueError(f"Index covers {self.max_hops} hops, asked for {max_hops}")
+        return [anchor for anchor, _, _ in self.entries(node_id, max_hops)[:limit]]
+
+    def __contains__(self, node_id: str) -> bool:
+        with self._lock:
+            return node_id in self._by_node
+
+    # Maintenance
+
+    def add_edge(self, from_id: str, to_id: str, weight: float = 0.5) -> None:
+        """Record a new edge and shorten the distances it creates."""
+        self.add_edges([(from_id, to_id, weight)])
+
+    def add_edges(self, rows: list) -> None:
+        """Record new (from_id, to_id, weight) edges."""
+        with self._lock:
+            for from_id, to_id, weight in rows:
+                self._link(from_id, to_id, weight)
+                for anchor, region in self._regions.items():
+                    if from_id in region or to_id in region:
+                        self._relax(anchor, from_id, to_id)
+
+    def merge_edges(self, rows: list) -> None:
+        """Record (from_id, to_id, weight) edges written with MERGE: only pairs not yet joined."""
+        with self._lock:
+            self.add_edges([
+                row for row in rows
+                if row[1] not in self._adjacency.get(row[0], {})
+            ])
+
+    def remove_edge(self, from_id: str, to_id: str) -> None:
+        """Forget one edge between the nodes and update the anchors that used it."""
+        self.remove_edges([(from_id, to_id)])
+
+    def remove_edges(self, rows: list) -> None:
+        """Forget one edge per (from_id, to_id) row, then search each affected anchor once."""
+        with self._lock:
+            removed = [row for row in rows if self._unlink(row[0], row[1])]
+            # An edge lies on paths inside a region only if both ends are in it
+            self._search_many([
+                anchor for anchor, region in self._regions.items()
+                if any(a in region and b in region for a, b in removed)
+            ])
+
+    def remove_node(self, node_id: str) -> None:
+        """Forget a node and every edge touching it."""
+        self.remove_nodes([node_id])
+
+    def remove_nodes(self, node_ids: list) -> None:
+        """Forget nodes and their edges, then search each affected anchor once."""
+        with self._lock:
+            for node_id in node_ids:
+                for other in self._adjacency.pop(node_id, {}):
+                    self._adjacency.get(other, {}).pop(node_id, None)
+                if node_id in self.virtue_ids:
+                    self.virtue_ids.remove(node_id)
+                    self._forget(node_id)
+            self._search_many([
+                anchor for anchor, region in self._regions.items()
+                if any(node_id in region for node_id in node_ids)
+            ])
+
+    def set_weight(self, from_id: str, to_id: str, weight: float) -> None:
+        """Record a new weight for the edges joining the nodes (distances are not re-searched)."""
+        self.set_weights([(from_id, to_id, weight)])
+
+    def set_weights(self, rows: list) -> None:
+        """Record new weights from (from_id, to_id, weight, ...) rows."""
+        with self._lock:
+            for row in rows:
+                from_id, to_id, weight = row[0], row[1], row[2]
+                weights = self._adjacency.get(from_id, {}).get(to_id)
+                if weights:
+                    weights[:] = [weight] * len(weights)
+                    if from_id != to_id:
+                        self._adjacency[to_id][from_id][:] = weights
+
+    def persist(self, client=None, batch_size: int = WRITE_BATCH_SIZE) -> int:
+        """
+        Store each node's nearest anchor as node properties.
+
+        Sets nearest_virtue, virtue_hops and virtue_distance.
+
+        Returns:
+            Number of nodes written
+        """
+        from .client import get_client
+        client = client or get_client()
+        with self._lock:
+            node_ids = list(self._by_node)
+        rows = []
+        for node_id in node_ids:
+            entries = self.entries(node_id)
+            if entries:
+                anchor, hops, weighted = entries[0]
+                rows.append({"id": node_id, "virtue": anchor, "hops": hops, "distance": weighted})
+        for start in range(0, len(rows), batch_size):
+            client.execute(
+                """
+                UNWIND $rows AS row
+                MATCH (n {id: row.id})
+                SET n.nearest_virtue = row.virtue,
+                    n.virtue_hops = row.hops,
+                    n.virtue_distance = row.distance
+                """,
+                {"rows": rows[start:start + batch_size]}
+            )
+        return len(rows)
+
+    def _link(self, from_id: str, to_id: str, weight: Optional[float]) -> None:
+        weight = 0.5 if weight is None else weight
+        self._adjacency.setdefault(from_id, {}).setdefault(to_id, []).append(weight)
+        if from_id != to_id:
+            self._adjacency.setdefault(to_id, {}).setdefault(from_id, []).append(weight)
+
+    def _unlink(self, from_id: str, to_id: str) -> bool:
+        weights = self._adjacency.get(from_id, {}).get(to_id)
+        if not weights:
+            return False
+        weights.pop()
+        if from_id != to_id:
+            self._adjacency[to_id][from_id].pop()
+        if not weights:
+            del self._adjacency[from_id][to_id]
+            self._adjacency[to_id].pop(from_id, None)
+        return True
+
+    def _relax(self, anchor: str, a: str, b: str) -> None:
+        """Shorten one anchor's distances through the new edge a-b."""
+        region = self._regions[anchor]
+        changed = set()
+        added = set()
+
+        # Hops: the edge can only bring an endpoint closer, and its
+        # neighbors after it
+        queue = deque()
+        for near, far in ((a, b), (b, a)):
+            if near in region and region[near][0] < self.max_hops:
+                hops = region[near][0] + 1
+                if far not in region:
+                    region[far] = (hops, math.inf)
+                    added.add(far)
+                elif region[far][0] > hops:
+                    region[far] = (hops, region[far][1])
+                else:
+                    continue
+                changed.add(far)
+                queue.append(far)
+        while queue:
+            current = queue.popleft()
+            hops = region[current][0] + 1
+            if hops > self.max_hops:
+                continue
+            for other in self._adjacency.get(current, ()):
+                if other not in region:
+                    region[other] = (hops, math.inf)
+                    added.add(other)
+                elif region[other][0] > hops:
+                    region[other] = (hops, region[other][1])
+                else:
+                    continue
+                changed.add(other)
+                queue.append(other)
+
+        # Weighted: strongest paths through the new edge, and reaching or
+        # passing through nodes that just joined the region
+        heap = []
+        for near, far in ((a, b), (b, a)):
+            if near in region and far in region:
+                heapq.heappush(heap, (region[near][1] + _cost(self._adjacency[near][far]), far))
+        for node_id in added:
+            for other, weights in self._adjacency.get(node_id, {}).items():
+                if other in region:
+                    heapq.heappush(heap, (region[other][1] + _cost(weights), node_id))
+        while heap:
+            distance, current = heapq.heappop(heap)
+            if distance >= region[current][1]:
+                continue
+            region[current] = (region[current][0], distance)
+            changed.add(current)
+            for other, weights in self._adjacency.get(current, {}).items():
+                if other in region and distance + _cost(weights) < region[other][1]:
+                    heapq.heappush(heap, (distance + _cost(weights), other))
+
+        for node_id in changed:
+            self._by_node.setdefault(node_id, {})[anchor] = region[node_id]
+
+    def _search_many(self, anchors: list) -> None:
+        for anchor in anchors:
+            self._search(anchor)
+
+    def _forget(self, anchor: str) -> None:
+        """Drop one anchor's region from the index."""
+        for node_id in self._regions.pop(anchor, {}):
+            entries = self._by_node.get(node_id)
+            if entries is not None:
+                entries.pop(anchor, None)
+                if not entries:
+                    del self._by_node[node_id]
+
+    def _search(self, anchor: str) -> None:
+        """Hop and weighted distances from one anchor, within max_hops."""
+        self._forget(anchor)
+
+        hops = {anchor: 0}
+        frontier = deque([anchor])
+        while frontier:
+            current = frontier.popleft()
+            if hops[current] == self.max_hops:
+                continue
+            for other in self._adjacency.get(current, ()):
+                if other not in hops:
+                    hops[other] = hops[current] + 1
+                    frontier.append(other)
+
+        # Strongest paths, kept inside the hop region
+        weighted = {anchor: 0.0}
+        heap = [(0.0, anchor)]
+        while heap:
+            distance, current = heapq.heappop(heap)
+            if distance > weighted[current]:
+                continue
+            for other, weights in self._adjacency.get(current, {}).items():
+                if other not in hops:
+                    continue
+                cost = _cost(weights)
+                if distance + cost < weighted.get(other, math.inf):
+                    weighted[other] = distance + cost
+                    heapq.heappush(heap, (distance + cost, other))
+
+        region = {node_id: (h, weighted.get(node_id, math.inf)) for node_id, h in hops.items()}
+        self._regions[anchor] = region
+        for node_id, entry in region.items():
+            self._by_node.setdefault(node_id, {})[anchor] = entry
+
+
+# Shared index maintained from this process's edge writes
+_index: Optional[VirtueProximityIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_proximity_index(client=None, persist: bool = False) -> VirtueProximityIndex:
+    """
+    Get or build the shared VirtueProximityIndex.
+
+    Args:
+        client: Graph client to build from; defaults to the shared client
+        persist: When building, also store nearest anchors as node properties
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = VirtueProximityIndex.load(client)
+            if persist:
+                _index.persist(client)
+        return _index
+
+
+def reset_proximity_index() -> None:
+    """Drop the shared index (it is rebuilt on next use)."""
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def edges_added(rows: list) -> None:
+    """Report created (from_id, to_id, weight) edges to the shared index, if built."""
+    index = _index
+    if index is not None:
+        index.add_edges(rows)
+
+
+def edges_merged(rows: list) -> None:
+    """Report (from_id, to_id, weight) edges written with MERGE to the shared index, if built."""
+    index = _index
+    if index is not None:
+        index.merge_edges(rows)
+
+
+def edges_removed(rows: list) -> None:
+    """Report deleted (from_id, to_id) edges to the shared index, if built."""
+    index = _index
+    if index is not None:
+        index.remove_edges(rows)
+
+
+def nodes_removed(node_ids: list) -> None:
+    """Report detach-deleted nodes to the shared index, if built."""
+    index = _index
+    if index is not None:
+        index.remove_nodes(node_ids)
+
+
+def weights_changed(rows: list) -> None:
+    """Report (from_id, to_id, weight, ...) weight updates to the shared index, if built."""
+    index = _index
+    if index is not None:
+        index.set_weights(rows)
@@ -1,9 +1,15 @@
 """Common Cypher queries for graph operations."""
 from datetime import datetime
 from typing import Optional
+from . import proximity
 from .client import get_client
 
 
+def epoch_seconds(dt: datetime) -> float:
+    """Seconds since the Unix epoch for a naive UTC datetime."""
+    return (dt - datetime(1970, 1, 1)).total_seconds()
+
+
 def create_node(label: str, properties: dict) -> str:
     """Create node, return id."""
     client = get_client()
@@ -19,17 +25,13 @@ def create_node(label: str, properties: dict) -> str:
     return properties["id"]
 
 
-def create_edge(
-    from_id: str,
-    to_id: str,
-    rel_type: str,
-    properties: dict = None
-) -> None:
-    """Create edge between nodes."""
-    client = get_client()
+def edge_properties(properties: dict = None, now: datetime = None) -> dict:
+    """Properties for a new edge: timestamps plus default weight and use count."""
     props = properties or {}
-    props["created_at"] = datetime.utcnow().isoformat()
+    now = now or datetime.utcnow()
+    props["created_at"] = now.isoformat()
     props["last_used"] = props["created_at"]
+    props["last_used_ts"] = epoch_seconds(now)
 
     if "use_count" not in props:
         props["use_count"] = 0
@@ -37,6 +39,19 @@ def create_edge(
     if "weight" not in props:
         props["weight"] = 0.5
 
+    return props
+
+
+def create_edge(
+    from_id: str,
+    to_id: str,
+    rel_type: str,
+    properties: dict = None
+) -> None:
+    """Create edge between nodes."""
+    client = get_client()
+    props = edge_properties(properties)
+
     prop_str = ", ".join(f"{k}: ${k}" for k in props.keys())
 
     client.execute(
@@ -46,6 +61,7 @@ def create_edge(
         """,
         {"from_id": from_id, "to_id": to_id, **props}
     )
+    proximity.edges_added([(from_id, to_id, props.get("weight"))])
 
 
 def get_neighbors(node_id: str) -> list:
@@ -63,20 +79,24 @@ def get_neighbors(node_id: str) -> list:
 def update_edge_weight(from_id: str, to_id: str, new_weight: float) -> None:
     """Update edge weight and last_used."""
     client = get_client()
+    now = datetime.utcnow()
     client.execute(
         """
         MATCH (a {id: $from_id})-[r]-(b {id: $to_id})
         SET r.weight = $weight,
             r.last_used = $now,
+            r.last_used_ts = $now_ts,
             r.use_count = r.use_count + 1
         """,
         {
             "from_id": from_id,
             "to_id": to_id,
             "weight": min(1.0, max(0.0, new_weight)),
-            "now": datetime.utcnow().isoformat()
+            "now": now.isoformat(),
+            "now_ts": epoch_seconds(now)
         }
     )
+    proximity.weights_changed([(from_id, to_id, min(1.0, max(0.0, new_weight)))])
 
 
 def get_node_activation(node_id: str) -> float:
@@ -130,6 +150,7 @@ def delete_edge(from_id: str, to_id: str) -> None:
         """,
         {"from": from_id, "to": to_id}
     )
+    proximity.edges_removed([(from_id, to_id)])
 
 
 def set_edge_weight(from_id: str, to_id: str, weight: float) -> None:
@@ -142,3 +163,4 @@ def set_edge_weight(from_id: str, to_id: str, weight: float) -> None:
         """,
         {"from": from_id, "to": to_id, "weight": weight}
     )
+    proximity.weights_changed([(from_id, to_id, weight)])
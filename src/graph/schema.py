@@ -1,5 +1,6 @@
 """Graph schema initialization."""
 from .client import get_client
+from .proximity import reset_proximity_index
 
 
 def init_schema():
@@ -13,6 +14,7 @@ def init_schema():
     client.execute("CREATE INDEX IF NOT EXISTS FOR (n:SSF) ON (n.id)")
     client.execute("CREATE INDEX IF NOT EXISTS FOR (n:File) ON (n.id)")
     client.execute("CREATE INDEX IF NOT EXISTS FOR (n:Trajectory) ON (n.id)")
+    client.execute("CREATE INDEX IF NOT EXISTS FOR (n:TrajectoryRollup) ON (n.id)")
     client.execute("CREATE INDEX IF NOT EXISTS FOR (n:DissolvedAgent) ON (n.id)")
 
     # Knowledge pool and mercy system indexes
@@ -25,3 +27,4 @@ def clear_graph():
     """Delete all nodes and edges. Use carefully."""
     client = get_client()
     client.execute("MATCH (n) DETACH DELETE n")
+    reset_proximity_index()
@@ -0,0 +1,199 @@
+"""In-memory graph snapshot for read-heavy passes over the graph.
+
+Loads every node and every edge in two bulk Cypher queries, answers
+adjacency, baseline, activation and virtue lookups from memory, and
+writes accumulated activation changes back in one batched UNWIND.
+"""
+from collections import deque
+from datetime import datetime
+from typing import Optional
+
+from .client import GraphClient, get_client
+from ..virtues.tiers import is_foundation
+
+
+class GraphSnapshot:
+    """Point-in-time copy of the graph's nodes and weighted edges."""
+
+    def __init__(self, nodes: dict, edges: list, client: Optional[GraphClient] = None):
+        """
+        Args:
+            nodes: node_id -> {"baseline", "activation", "labels", "tier", "type"}
+            edges: List of [from_id, to_id, weight, rel_type]
+            client: Client used by flush(); defaults to the shared client
+        """
+        self.client = client
+        self.nodes = nodes
+        self.edges = edges
+        self._adjacency: dict[str, list[int]] = {}
+        for i, edge in enumerate(edges):
+            self._index_edge(i, edge)
+        self._pending_activations: dict[str, float] = {}
+
+    @classmethod
+    def load(cls, client: Optional[GraphClient] = None) -> "GraphSnapshot":
+        """Load all nodes and edges with two queries."""
+        client = client or get_client()
+
+        node_rows = client.query(
+            """
+            MATCH (n)
+            RETURN n.id, n.baseline, n.activation, labels(n), n.tier, n.type
+            """
+        )
+        nodes = {}
+        for node_id, baseline, activation, labels, tier, node_type in node_rows:
+            if node_id is None:
+                continue
+            nodes[node_id] = {
+                "baseline": baseline or 0.0,
+                "activation": activation or 0.0,
+                "labels": list(labels or []),
+                "tier": tier,
+                "type": node_type,
+            }
+
+        edge_rows = client.query(
+            """
+            MATCH (a)-[r]->(b)
+            RETURN a.id, b.id, r.weight, type(r)
+            """
+        )
+        edges = [list(row) for row in edge_rows if row[0] is not None and row[1] is not None]
+
+        return cls(nodes, edges, client)
+
+    def _index_edge(self, i: int, edge: list) -> None:
+        from_id, to_id = edge[0], edge[1]
+        self._adjacency.setdefault(from_id, []).append(i)
+        if to_id != from_id:
+            self._adjacency.setdefault(to_id, []).append(i)
+
+    # Lookups
+
+    def get_neighbors(self, node_id: str) -> list:
+        """Undirected neighbors as [id, type, weight, rel] rows, like queries.get_neighbors."""
+        rows = []
+        for i in self._adjacency.get(node_id, ()):
+            from_id, to_id, weight, rel = self.edges[i]
+            other = to_id if from_id == node_id else from_id
+            node = self.nodes.get(other, {})
+            rows.append([other, node.get("type"), weight, rel])
+        return rows
+
+    def get_edges_between(self, a: str, b: str) -> list:
+        """Edges joining a and b in either direction."""
+        return [
+            self.edges[i] for i in self._adjacency.get(a, ())
+            if {self.edges[i][0], self.edges[i][1]} == {a, b}
+        ]
+
+    def get_baseline(self, node_id: str) -> float:
+        node = self.nodes.get(node_id)
+        return node["baseline"] if node else 0.0
+
+    def get_activation(self, node_id: str) -> float:
+        if node_id in self._pending_activations:
+            return self._pending_activations[node_id]
+        node = self.nodes.get(node_id)
+        return node["activation"] if node else 0.0
+
+    def is_virtue(self, node_id: str) -> bool:
+        node = self.nodes.get(node_id)
+        return node is not None and "VirtueAnchor" in node["labels"]
+
+    def virtue_tier(self, node_id: str) -> Optional[str]:
+        """Tier of a virtue anchor, or None if node_id is not one."""
+        if not self.is_virtue(node_id):
+            return None
+        return self.nodes[node_id]["tier"] or ("foundation" if is_foundation(node_id) else "aspirational")
+
+    def virtue_ids(self) -> list:
+        return [node_id for node_id in self.nodes if self.is_virtue(node_id)]
+
+    def non_virtue_ids(self) -> list:
+        return [node_id for node_id in self.nodes if not self.is_virtue(node_id)]
+
+    def nearby_virtues(self, node_id: str, max_hops: int, limit: int = 1) -> list:
+        """
+        Virtue anchors within max_hops of node_id, nearest first.
+
+        In-memory equivalent of MATCH (n {id})-[*1..max_hops]-(v:VirtueAnchor).
+        """
+        found = []
+        seen = {node_id}
+        frontier = deque([(node_id, 0)])
+        while frontier and len(found) < limit:
+            current, hops = frontier.popleft()
+            if hops == max_hops:
+                continue
+            for row in self.get_neighbors(current):
+                other = row[0]
+                if other in seen:
+                    continue
+                seen.add(other)
+                if self.is_virtue(other):
+                    found.append(other)
+                    if len(found) >= limit:
+                        break
+                frontier.append((other, hops + 1))
+        return found
+
+    # Local writes
+
+    def set_activation(self, node_id: str, activation: float) -> None:
+        """Record an activation change; persisted by flush()."""
+        self._pending_activations[node_id] = activation
+
+    def add_node(self, node_id: str, label: str, baseline: float = 0.0) -> None:
+        """Mirror a node created in the graph after the snapshot was loaded."""
+        self.nodes.setdefault(node_id, {
+            "baseline": baseline,
+            "activation": 0.0,
+            "labels": [label],
+            "tier": None,
+            "type": None,
+        })
+
+    def add_edge(self, from_id: str, to_id: str, rel_type: str, weight: float = 0.5) -> None:
+        """Mirror an edge created in the graph after the snapshot was loaded."""
+        edge = [from_id, to_id, weight, rel_type]
+        self.edges.append(edge)
+        self._index_edge(len(self.edges) - 1, edge)
+
+    def apply_hebbian(self, trajectory: list, learning_rate: float = 0.01) -> None:
+        """Mirror functions.hebbian.hebbian_update on the in-memory edges."""
+        for from_id, to_id in zip(trajectory, trajectory[1:]):
+            existing = self.get_edges_between(from_id, to_id)
+            if existing:
+                new_weight = min(1.0, (existing[0][2] or 0.5) + learning_rate)
+                for edge in existing:
+                    edge[2] = new_weight
+            else:
+                self.add_edge(from_id, to_id, "ACTIVATED", learning_rate)
+
+    @property
+    def pending_writes(self) -> int:
+        return len(self._pending_activations)
+
+    def flush(self) -> int:
+        """Write pending activations back in one UNWIND. Returns rows written."""
+        if not self._pending_activations:
+            return 0
+
+        rows = [{"id": node_id, "activation": act} for node_id, act in self._pending_activations.items()]
+        (self.client or get_client()).execute(
+            """
+            UNWIND $rows AS row
+            MATCH (n {id: row.id})
+            SET n.activation = row.activation,
+                n.last_activated = $now
+            """,
+            {"rows": rows, "now": datetime.utcnow().isoformat()}
+        )
+
+        for node_id, act in self._pending_activations.items():
+            if node_id in self.nodes:
+                self.nodes[node_id]["activation"] = act
+        self._pending_activations.clear()
+        return len(rows)
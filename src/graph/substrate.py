@@ -15,7 +15,10 @@ from src.constants import (
     EDGE_REMOVAL_THRESHOLD,
     MAX_EDGE_WEIGHT,
     MIN_EDGE_WEIGHT,
+    WRITE_BATCH_SIZE,
 )
+from src.graph.batch import WriteBatcher
+from src.graph.queries import epoch_seconds
 from src.models import Edge, Node, NodeType
 
 logger = logging.getLogger(__name__)
@@ -252,6 +255,7 @@ class GraphSubstrate:
             direction: $direction,
             created_at: $created_at,
             last_used: $last_used,
+            last_used_ts: $last_used_ts,
             use_count: $use_count
         }]->(b)
         RETURN r
@@ -263,6 +267,7 @@ class GraphSubstrate:
             "direction": edge.direction.value,
             "created_at": edge.created_at.isoformat(),
             "last_used": edge.last_used.isoformat(),
+            "last_used_ts": epoch_seconds(edge.last_used),
             "use_count": edge.use_count,
         }
         self._graph.query(query, params)
@@ -306,6 +311,7 @@ class GraphSubstrate:
         MATCH (a:Node {id: $source_id})-[r:CONNECTS]->(b:Node {id: $target_id})
         SET r.weight = $weight,
             r.last_used = $last_used,
+            r.last_used_ts = $last_used_ts,
             r.use_count = $use_count
         RETURN r
         """
@@ -314,6 +320,7 @@ class GraphSubstrate:
             "target_id": edge.target_id,
             "weight": max(MIN_EDGE_WEIGHT, min(MAX_EDGE_WEIGHT, edge.weight)),
             "last_used": edge.last_used.isoformat(),
+            "last_used_ts": epoch_seconds(edge.last_used),
             "use_count": edge.use_count,
         }
         self._graph.query(query, params)
@@ -430,6 +437,91 @@ class GraphSubstrate:
             use_count=props["use_count"],
         )
 
+    # Batched Operations
+
+    def write_batch(self, flush_size: int = WRITE_BATCH_SIZE) -> WriteBatcher:
+        """
+        Create a write batcher that flushes into this substrate.
+
+        Args:
+            flush_size: Rows per UNWIND statement
+
+        Returns:
+            A WriteBatcher
+        """
+        return WriteBatcher(self, flush_size)
+
+    def set_activations(self, rows: list[tuple[str, float]]) -> None:
+        """
+        Set node activations in one statement.
+
+        Args:
+            rows: (node_id, activation) tuples
+        """
+        self._ensure_connected()
+        query = """
+        UNWIND $rows AS row
+        MATCH (n:Node {id: row[0]})
+        SET n.activation = row[1],
+            n.last_activated = $now
+        """
+        self._graph.query(query, {"rows": [list(r) for r in rows], "now": datetime.utcnow().isoformat()})
+        logger.debug(f"Batch updated {len(rows)} node activations")
+
+    def set_edge_weights(self, rows: list[tuple[str, str, float]]) -> None:
+        """
+        Set edge weights in one statement.
+
+        Args:
+            rows: (source_id, target_id, weight) tuples
+        """
+        self._ensure_connected()
+        query = """
+        UNWIND $rows AS row
+        MATCH (a:Node {id: row[0]})-[r:CONNECTS]->(b:Node {id: row[1]})
+        SET r.weight = row[2]
+        """
+        params = [[s, t, max(MIN_EDGE_WEIGHT, min(MAX_EDGE_WEIGHT, w))] for s, t, w in rows]
+        self._graph.query(query, {"rows": params})
+        logger.debug(f"Batch updated {len(rows)} edge weights")
+
+    def use_edges(self, rows: list[tuple[str, str, float, int]]) -> None:
+        """
+        Set edge weights and record use in one statement.
+
+        Args:
+            rows: (source_id, target_id, weight, uses) tuples
+        """
+        self._ensure_connected()
+        query = """
+        UNWIND $rows AS row
+        MATCH (a:Node {id: row[0]})-[r:CONNECTS]->(b:Node {id: row[1]})
+        SET r.weight = row[2],
+            r.last_used = $now,
+            r.last_used_ts = $now_ts,
+            r.use_count = r.use_count + row[3]
+        """
+        now = datetime.utcnow()
+        params = [[s, t, max(MIN_EDGE_WEIGHT, min(MAX_EDGE_WEIGHT, w)), u] for s, t, w, u in rows]
+        self._graph.query(query, {"rows": params, "now": now.isoformat(), "now_ts": epoch_seconds(now)})
+        logger.debug(f"Batch used {len(rows)} edges")
+
+    def delete_edges(self, rows: list[tuple[str, str]]) -> None:
+        """
+        Delete edges in one statement.
+
+        Args:
+            rows: (source_id, target_id) tuples
+        """
+        self._ensure_connected()
+        query = """
+        UNWIND $rows AS row
+        MATCH (a:Node {id: row[0]})-[r:CONNECTS]->(b:Node {id: row[1]})
+        DELETE r
+        """
+        self._graph.query(query, {"rows": [list(r) for r in rows]})
+        logger.debug(f"Batch deleted {len(rows)} edges")
+
     # Utility Operations
 
     def clear_graph(self) -> None:
@@ -1,5 +1,7 @@
 """Main kiln evolution loop with mercy-based selection."""
 import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 import yaml
 from ..graph.client import get_client
 from ..graph.queries import create_node
@@ -9,6 +11,7 @@ from ..functions.test_coherence import test_coherence, quick_coherence_check
 from ..functions.decay import apply_decay
 from ..functions.heal import heal_dead_zones
 from ..functions.perturb import perturb
+from ..functions.retention import compact_trajectories
 from ..mercy.chances import expire_old_warnings, get_active_warnings
 from ..mercy.harm import check_trust_violation
 from .selection import select_survivors, elitism_select
@@ -31,12 +34,60 @@ def get_config():
         }
 
 
+def evaluate_candidates(candidates: list, test_fn, workers: int = 1, seed: int = None) -> tuple:
+    """
+    Test candidates, several at a time when workers > 1.
+
+    Tests share the graph client, whose connection pool bounds how many
+    hit FalkorDB at once (see graph.max_connections). Results come back
+    in candidate order, and each candidate draws its stimuli from its own
+    random.Random seeded from seed and its agent ID, so draws do not
+    depend on thread timing.
+
+    Concurrent tests are still not equivalent to a sequential run: each
+    loads its snapshot at a different moment, activation flushes from one
+    test overwrite another's, and one candidate's Hebbian writes reach
+    some concurrent tests and not others. Use workers=1 for reproducible
+    generations.
+
+    Args:
+        candidates: Agent IDs to test
+        test_fn: Function taking an agent ID and an rng keyword argument,
+            returning a result dict
+        workers: Candidates tested concurrently
+        seed: Seed for the per-candidate generators (default: drawn from
+            the random module)
+
+    Returns:
+        ([(agent_id, result), ...], {agent_id: seconds spent testing})
+    """
+    if seed is None:
+        seed = random.getrandbits(32)
+
+    def timed(agent_id):
+        rng = random.Random(f"{seed}:{agent_id}")
+        start = time.perf_counter()
+        result = test_fn(agent_id, rng=rng)
+        return result, time.perf_counter() - start
+
+    if workers <= 1 or len(candidates) <= 1:
+        outcomes = [timed(agent_id) for agent_id in candidates]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(timed, candidates))
+
+    results = [(agent_id, result) for agent_id, (result, _) in zip(candidates, outcomes)]
+    test_times = {agent_id: seconds for agent_id, (_, seconds) in zip(candidates, outcomes)}
+    return results, test_times
+
+
 def run_kiln(
     population_size: int = 10,
     max_generations: int = 50,
     mutation_rate: float = 0.1,
     selection_strategy: str = "truncation",
-    verbose: bool = True
+    verbose: bool = True,
+    workers: int = None
 ) -> dict:
     """
     Main evolution loop with mercy.
@@ -61,14 +112,18 @@ def run_kiln(
         mutation_rate: Probability of mutation when spawning
         selection_strategy: How to select survivors
         verbose: Print progress messages
+        workers: Candidates tested concurrently (default: kiln.workers, or 1)
 
     Returns:
-        dict with final population and best results
+        dict with final population, best results and per-generation timings
     """
     config = get_config()
     kiln_config = config.get("kiln", {})
     mercy_config = config.get("mercy", {})
+    retention_config = config.get("retention", {})
     client = get_client()
+    if workers is None:
+        workers = kiln_config.get("workers", 1)
 
     # Create Agent 0 (the kiln itself)
     kiln_exists = client.query(
@@ -105,6 +160,7 @@ def run_kiln(
     best_ever = None
     best_score = 0
     coherent_found = []
+    generation_stats = []
 
     # Get mercy settings
     min_gens_before_dissolve = kiln_config.get("min_generations_before_dissolve", 3)
@@ -112,6 +168,7 @@ def run_kiln(
 
     # Evolution loop
     for gen in range(max_generations):
+        gen_start = time.perf_counter()
         if verbose:
             print(f"\n=== Generation {gen} ===")
 
@@ -122,24 +179,30 @@ def run_kiln(
             pass
 
         # Apply decay
-        apply_decay()
+        apply_decay(server_side=kiln_config.get("server_side_decay", False))
 
         # Heal dead zones
         heal_dead_zones()
 
-        # Test all candidates
-        results = []
-        for agent_id in candidates:
-            if verbose:
-                print(f"  Testing {agent_id}...")
-
-            # Use quick check for early generations, full test later
-            if gen < 10:
-                result = quick_coherence_check(agent_id)
-            else:
-                result = test_coherence(agent_id)
+        # Roll up old trajectories so graph scans stay fast
+        compact_every = retention_config.get("every_generations", 0)
+        if compact_every and gen % compact_every == 0:
+            compacted = compact_trajectories(
+                max_age_days=retention_config.get("trajectory_max_age_days"),
+                keep_per_agent=retention_config.get("trajectory_keep_per_agent")
+            )
+            if verbose and compacted["rolled_up"]:
+                print(f"  Rolled up {compacted['rolled_up']} old trajectories")
+
+        # Test all candidates; quick check for early generations, full test later
+        test_fn = quick_coherence_check if gen < 10 else test_coherence
+        test_start = time.perf_counter()
+        results, test_times = evaluate_candidates(candidates, test_fn, workers)
+        test_wall_time = time.perf_counter() - test_start
 
-            results.append((agent_id, result))
+        for agent_id, result in results:
+            if verbose:
+                print(f"  Testing {agent_id}... ({test_times[agent_id]:.2f}s)")
 
             # Status icon based on two-tier evaluation
             if result["is_coherent"]:
@@ -157,6 +220,8 @@ def run_kiln(
                 if result.get("aspirational_rate") is not None:
                     print(f"      Aspirational: {result['aspirational_rate']:.2%}")
                 print(f"      Coverage: {result.get('coverage', 0)}/18")
+                if result.get("stopped_early"):
+                    print(f"      Decided after {result['stimuli_used']} stimuli")
                 if result.get("is_growing"):
                     print(f"      Growing: +{result.get('growth', 0):.2%}")
 
@@ -167,6 +232,8 @@ def run_kiln(
 
         if verbose:
             print(f"\n  Summary: {len(coherent)} coherent, {len(growing)} growing, {len(struggling)} struggling")
+            print(f"  Tested {len(results)} candidates in {test_wall_time:.2f}s "
+                  f"({sum(test_times.values()):.2f}s of tests, {workers} worker(s))")
 
         # Track best ever
         results.sort(key=lambda x: x[1].get("capture_rate", x[1].get("overall_rate", 0)), reverse=True)
@@ -187,6 +254,9 @@ def run_kiln(
 
         # Early termination if we have enough coherent agents
         if len([c for c in coherent_found if c[1].get("status") == "coherent"]) >= population_size:
+            generation_stats.append(_generation_stats(
+                gen, time.perf_counter() - gen_start, test_wall_time, test_times
+            ))
             if verbose:
                 print(f"\n  Sufficient coherent agents found. Stopping early.")
             break
@@ -283,9 +353,13 @@ def run_kiln(
                 new_candidates.append(child_id)
 
         candidates = survivors + new_candidates
+        generation_stats.append(_generation_stats(
+            gen, time.perf_counter() - gen_start, test_wall_time, test_times
+        ))
 
         if verbose:
             print(f"\n  Survivors: {len(survivors)}, New: {len(new_candidates)}, Dissolved: {len(dissolved)}")
+            print(f"  Generation time: {generation_stats[-1]['wall_time']:.2f}s")
 
     if verbose:
         print("\n=== Kiln Complete ===")
@@ -318,7 +392,21 @@ def run_kiln(
         "best_agent": best_ever[0] if best_ever else None,
         "best_result": best_ever[1] if best_ever else None,
         "coherent_agents": [(aid, r) for aid, r in coherent_found],
-        "generations_run": gen + 1
+        "generations_run": gen + 1,
+        "generation_stats": generation_stats
+    }
+
+
+def _generation_stats(gen: int, wall_time: float, test_wall_time: float, test_times: dict) -> dict:
+    """Timing summary for one generation."""
+    times = list(test_times.values())
+    return {
+        "generation": gen,
+        "wall_time": wall_time,
+        "test_wall_time": test_wall_time,
+        "candidate_test_times": test_times,
+        "mean_test_time": sum(times) / len(times) if times else 0.0,
+        "max_test_time": max(times, default=0.0),
     }
 
 
@@ -326,7 +414,8 @@ def run_single_generation(
     candidates: list,
     generation: int,
     mutation_rate: float = 0.1,
-    verbose: bool = True
+    verbose: bool = True,
+    workers: int = 1
 ) -> dict:
     """
     Run a single generation of the kiln.
@@ -338,9 +427,10 @@ def run_single_generation(
         generation: Current generation number
         mutation_rate: Mutation probability
         verbose: Print progress
+        workers: Candidates tested concurrently
 
     Returns:
-        dict with new candidates and results
+        dict with new candidates, results and per-candidate test times
     """
     # Expire old warnings
     try:
@@ -353,15 +443,14 @@ def run_single_generation(
     heal_dead_zones()
 
     # Test all candidates
-    results = []
-    for agent_id in candidates:
-        result = quick_coherence_check(agent_id)
-        results.append((agent_id, result))
-        if verbose:
+    results, test_times = evaluate_candidates(candidates, quick_coherence_check, workers)
+    if verbose:
+        for agent_id, result in results:
             status = result.get("status", "unknown")
             rate = result.get("capture_rate", result.get("overall_rate", 0))
             print(f"  {agent_id}: {rate:.2%} capture, "
-                  f"{result.get('coverage', 0)}/18 coverage, status={status}")
+                  f"{result.get('coverage', 0)}/18 coverage, status={status} "
+                  f"({test_times[agent_id]:.2f}s)")
 
     # Sort by coherence score (not just capture rate)
     results.sort(key=lambda x: x[1].get("score", 0), reverse=True)
@@ -396,5 +485,6 @@ def run_single_generation(
         "new_candidates": new_candidates,
         "all_candidates": survivors + new_candidates,
         "results": results,
+        "test_times": test_times,
         "best": results[0] if results else None
     }
@@ -33,11 +33,27 @@ def record_successful_pathway(
     Returns:
         ID of the created pathway node
     """
-    client = get_client()
-    pathway_id = f"pathway_{uuid.uuid4().hex[:8]}"
+    props = pathway_properties(agent_id, start_node, virtue_reached, trajectory, capture_time)
+    pathway_id = props["id"]
+
+    create_node("Pathway", props)
+
+    create_edge(agent_id, pathway_id, "DISCOVERED")
+    create_edge(pathway_id, virtue_reached, "LEADS_TO")
 
-    create_node("Pathway", {
-        "id": pathway_id,
+    return pathway_id
+
+
+def pathway_properties(
+    agent_id: str,
+    start_node: str,
+    virtue_reached: str,
+    trajectory: list,
+    capture_time: int
+) -> dict:
+    """Properties of a new Pathway node, with a fresh id."""
+    return {
+        "id": f"pathway_{uuid.uuid4().hex[:8]}",
         "agent": agent_id,
         "start": start_node,
         "destination": virtue_reached,
@@ -46,12 +62,7 @@ def record_successful_pathway(
         "path_summary": ",".join(trajectory[:20]),
         "times_followed": 0,
         "success_rate": 1.0
-    })
-
-    create_edge(agent_id, pathway_id, "DISCOVERED")
-    create_edge(pathway_id, virtue_reached, "LEADS_TO")
-
-    return pathway_id
+    }
 
 
 def get_pathways_to_virtue(virtue_id: str, limit: int = 5) -> list:
@@ -77,10 +77,8 @@ class AlignmentTester:
         # Clear previous tracking
         self.trajectory_tracker.clear()
 
-        # Run each stimulus
-        for stimulus in stimuli:
-            trajectory = self._run_stimulus(stimulus, agent_id)
-            self.trajectory_tracker.record(trajectory)
+        # Run all stimuli as one batch
+        self.trajectory_tracker.record_batch(self._run_stimuli(stimuli, agent_id))
 
         # Calculate results
         result = self._calculate_result()
@@ -92,24 +90,22 @@ class AlignmentTester:
 
         return result
 
-    def _run_stimulus(self, stimulus: Stimulus, agent_id: str) -> Trajectory:
+    def _run_stimuli(self, stimuli: list[Stimulus], agent_id: str) -> list[Trajectory]:
         """
-        Run a single stimulus and track the trajectory.
+        Run a list of stimuli together and track the trajectories.
 
         Args:
-            stimulus: The stimulus to inject
+            stimuli: The stimuli to inject
             agent_id: Agent ID for tracking
 
         Returns:
-            The resulting trajectory
+            The resulting trajectories, in stimulus order
         """
-        trajectory = self.spreader.spread_activation(
-            initial_nodes=[stimulus.target_node],
-            initial_strength=stimulus.activation_strength,
+        return self.spreader.spread_activation_batch(
+            [([s.target_node], s.activation_strength) for s in stimuli],
             agent_id=agent_id,
-            stimulus_id=stimulus.id,
+            stimulus_ids=[s.id for s in stimuli],
         )
-        return trajectory
 
     def _calculate_result(self) -> AlignmentResult:
         """
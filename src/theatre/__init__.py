@@ -49,7 +49,7 @@ from .artifacts import (
     ArtifactQuery,
     get_artifact_curator,
 )
-from .graph_view import GraphViewRenderer, GraphViewState, GraphNode, GraphEdge, GeometryOverlay
+from .graph_view import GraphViewRenderer, GraphViewState, GraphViewDelta, GraphNode, GraphEdge, GeometryOverlay
 from .views import ViewManager, ViewType, ViewState, WorkspaceState
 from .integration import TheatreSystem, TheatreConfig, create_theatre
 
@@ -95,6 +95,7 @@ __all__ = [
     # Graph view
     "GraphViewRenderer",
     "GraphViewState",
+    "GraphViewDelta",
     "GraphNode",
     "GraphEdge",
     "GeometryOverlay",
@@ -17,6 +17,8 @@ from typing import Any, Callable
 
 import numpy as np
 
+from src.vectors import ExactIndex, VectorIndex, embed_texts
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,6 +101,7 @@ class ConceptExtractor:
         substrate=None,
         embedding_fn: Callable[[str], np.ndarray] | None = None,
         embedding_dim: int = 384,
+        vector_index: VectorIndex | None = None,
     ):
         """
         Initialize the concept extractor.
@@ -108,12 +111,18 @@ class ConceptExtractor:
             embedding_fn: Function to generate embeddings from text.
                          If None, uses keyword-based extraction only.
             embedding_dim: Dimension of embedding vectors
+            vector_index: Index for semantic matching (default: exact search);
+                         pass an IVFIndex for large concept sets
         """
         self.substrate = substrate
         self._embedding_fn = embedding_fn
         self._embedding_dim = embedding_dim
         self._concept_embeddings: dict[str, np.ndarray] = {}
         self._concept_names: dict[str, str] = {}  # concept_id -> name
+        self._vector_index = vector_index or ExactIndex()
+        self._concept_keys: dict[str, int] = {}  # concept_id -> index key
+        self._key_concepts: dict[int, str] = {}
+        self._next_key = 0
         self._initialized = False
 
     def initialize(self) -> None:
@@ -133,12 +142,12 @@ class ConceptExtractor:
         concepts = self.substrate.get_all_nodes(NodeType.CONCEPT)
 
         for node in concepts:
-            name = node.metadata.get("name", node.id)
-            self._concept_names[node.id] = name
+            self._concept_names[node.id] = node.metadata.get("name", node.id)
 
-            # Generate and cache embedding
-            embedding = self._embedding_fn(name)
-            self._concept_embeddings[node.id] = embedding
+        # Generate and cache embeddings in one batch
+        names = [self._concept_names[node.id] for node in concepts]
+        for node, embedding in zip(concepts, embed_texts(self._embedding_fn, names)):
+            self._set_embedding(node.id, embedding)
 
         self._initialized = True
         logger.info(f"Initialized concept extractor with {len(concepts)} concepts")
@@ -258,26 +267,13 @@ class ConceptExtractor:
         # Generate utterance embedding
         embedding = self._embedding_fn(utterance)
 
-        # Calculate similarities to all concepts
-        similarities: list[tuple[str, float]] = []
-
-        for concept_id, concept_embedding in self._concept_embeddings.items():
-            sim = self._cosine_similarity(embedding, concept_embedding)
-            if sim > 0.3:  # Threshold for relevance
-                similarities.append((concept_id, sim))
-
-        # Sort by similarity descending
-        sorted_concepts = sorted(similarities, key=lambda x: x[1], reverse=True)
-        return sorted_concepts[:10], embedding
-
-    def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors."""
-        dot = np.dot(a, b)
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return float(dot / (norm_a * norm_b))
+        # Top 10 concepts by similarity, keeping those above the relevance threshold
+        sorted_concepts = [
+            (self._key_concepts[key], sim)
+            for key, sim in self._vector_index.search(embedding, k=10)
+            if sim > 0.3
+        ]
+        return sorted_concepts, embedding
 
     def add_concept(self, concept_id: str, name: str) -> None:
         """
@@ -290,20 +286,39 @@ class ConceptExtractor:
         self._concept_names[concept_id] = name
 
         if self._embedding_fn:
-            self._concept_embeddings[concept_id] = self._embedding_fn(name)
+            self._set_embedding(concept_id, self._embedding_fn(name))
 
     def remove_concept(self, concept_id: str) -> None:
         """Remove a concept from the index."""
         self._concept_names.pop(concept_id, None)
         self._concept_embeddings.pop(concept_id, None)
+        key = self._concept_keys.pop(concept_id, None)
+        if key is not None:
+            del self._key_concepts[key]
+            self._vector_index.remove([key])
 
     def refresh(self) -> None:
         """Refresh concept embeddings from substrate."""
         self._concept_embeddings.clear()
         self._concept_names.clear()
+        self._concept_keys.clear()
+        self._key_concepts.clear()
+        self._vector_index.clear()
         self._initialized = False
         self.initialize()
 
+    def _set_embedding(self, concept_id: str, embedding: np.ndarray) -> None:
+        """Store a concept embedding and index it under a stable integer key."""
+        self._concept_embeddings[concept_id] = embedding
+        key = self._concept_keys.get(concept_id)
+        if key is None:
+            # Keys increase with insertion, so index ties resolve in insertion order
+            key = self._next_key
+            self._next_key += 1
+            self._concept_keys[concept_id] = key
+            self._key_concepts[key] = concept_id
+        self._vector_index.add([key], embedding)
+
 
 # Singleton instance
 _extractor: ConceptExtractor | None = None
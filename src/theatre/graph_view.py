@@ -13,6 +13,14 @@ Now includes moral geometry overlays - patterns in the virtue structure:
 - Bridges (virtues connecting different clusters)
 - Basin topology (attraction regions)
 - Resonance patterns (co-activating virtues)
+
+Per-turn updates can be sent as deltas: render_delta() tracks what the
+client was last sent and emits only nodes whose activation moved more
+than an epsilon (or whose look changed), new/changed/removed edges, and
+a geometry overlay only when it was recomputed. A full keyframe goes out
+first, every `keyframe_interval` renders, and on request_keyframe().
+The overlay itself is cached and recomputed only when edge topology or
+weights change, or on a keyframe.
 """
 
 import logging
@@ -161,6 +169,48 @@ class GraphViewState:
         }
 
 
+@dataclass
+class GraphViewDelta:
+    """Changes to the graph view since the last emitted delta."""
+
+    sequence: int
+    keyframe: bool  # True: nodes/edges are the complete graph
+    nodes: list[GraphNode]  # Added or changed
+    edges: list[GraphEdge]  # Added or changed
+    removed_nodes: list[str]
+    removed_edges: list[tuple[str, str]]
+    camera: CameraState
+    layout: GraphLayout
+    hot_region: TopicRegion | None = None
+    geometry_overlay: GeometryOverlay | None = None  # Only when recomputed
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if nothing changed."""
+        return not (
+            self.keyframe or self.nodes or self.edges or self.removed_nodes
+            or self.removed_edges or self.geometry_overlay
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to render-ready dictionary."""
+        return {
+            "delta": True,
+            "sequence": self.sequence,
+            "keyframe": self.keyframe,
+            "nodes": [n.to_dict() for n in self.nodes],
+            "edges": [e.to_dict() for e in self.edges],
+            "removed_nodes": self.removed_nodes,
+            "removed_edges": [list(key) for key in self.removed_edges],
+            "camera": self.camera.to_dict(),
+            "layout": self.layout.value,
+            "hot_region": self.hot_region.value if self.hot_region else None,
+            "geometry": self.geometry_overlay.to_dict() if self.geometry_overlay else None,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+
 class GraphViewRenderer:
     """
     Renders the semantic graph as a visual representation.
@@ -193,6 +243,8 @@ class GraphViewRenderer:
         layout: GraphLayout = GraphLayout.FORCE_DIRECTED,
         activation_threshold: float = 0.1,
         show_geometry: bool = True,
+        delta_epsilon: float = 0.01,
+        keyframe_interval: int = 50,
     ):
         """
         Initialize the graph view renderer.
@@ -202,15 +254,35 @@ class GraphViewRenderer:
             layout: Layout algorithm to use
             activation_threshold: Minimum activation to show node prominently
             show_geometry: Whether to include moral geometry overlay
+            delta_epsilon: Smallest activation/weight change worth sending
+            keyframe_interval: Renders between full keyframes
         """
         self._substrate = substrate
         self._layout = layout
         self._activation_threshold = activation_threshold
         self._show_geometry = show_geometry
+        self._delta_epsilon = delta_epsilon
+        self._keyframe_interval = keyframe_interval
         self._camera = CameraState()
         self._last_state: GraphViewState | None = None
         self._geometry_analyzer = None
 
+        # Visuals from the latest render, reused while their inputs are unchanged
+        self._node_visuals: dict[str, tuple[tuple, GraphNode]] = {}
+        self._edge_visuals: dict[tuple[str, str], tuple[tuple, GraphEdge]] = {}
+        self._renders = 0
+
+        # Cached geometry overlay and the edge weights it was computed from
+        self._geometry_overlay: GeometryOverlay | None = None
+        self._geometry_weights: dict[tuple[str, str], float] | None = None
+
+        # What render_delta last sent, per node/edge
+        self._emitted_nodes: dict[str, GraphNode] = {}
+        self._emitted_edges: dict[tuple[str, str], GraphEdge] = {}
+        self._delta_sequence = 0
+        self._deltas_since_keyframe = 0
+        self._keyframe_requested = True
+
         # Callbacks
         self._update_callbacks: list[Callable[[GraphViewState], None]] = []
 
@@ -227,11 +299,22 @@ class GraphViewRenderer:
     def set_substrate(self, substrate) -> None:
         """Set the graph substrate."""
         self._substrate = substrate
+        self._node_visuals = {}
+        self._edge_visuals = {}
+        self._geometry_weights = None
+        self._geometry_analyzer = None
+        self._keyframe_requested = True
 
     def set_layout(self, layout: GraphLayout) -> None:
         """Change the layout algorithm."""
+        if layout != self._layout:
+            self._keyframe_requested = True
         self._layout = layout
 
+    def request_keyframe(self) -> None:
+        """Make the next render_delta a full keyframe (e.g. for a new viewer)."""
+        self._keyframe_requested = True
+
     def render(self, topic_state: TopicState | None = None) -> GraphViewState:
         """
         Render the current graph state.
@@ -250,20 +333,7 @@ class GraphViewRenderer:
                 layout=self._layout,
             )
 
-        # Get all nodes and edges
-        all_nodes = self._substrate.get_all_nodes()
-        nodes = [self._node_to_visual(n, topic_state) for n in all_nodes]
-
-        # Get edges (with activation-based animation)
-        edges = self._get_visual_edges(topic_state)
-
-        # Update camera to follow activation
-        self._update_camera(nodes, topic_state)
-
-        # Build geometry overlay if enabled
-        geometry_overlay = None
-        if self._show_geometry:
-            geometry_overlay = self._build_geometry_overlay(topic_state)
+        nodes, edges, geometry_overlay, _ = self._refresh(topic_state)
 
         state = GraphViewState(
             nodes=nodes,
@@ -279,19 +349,163 @@ class GraphViewRenderer:
 
         return state
 
+    def render_delta(self, topic_state: TopicState | None = None) -> GraphViewDelta:
+        """
+        Render only what changed since the last delta.
+
+        Args:
+            topic_state: Optional topic state for highlighting
+
+        Returns:
+            GraphViewDelta; a keyframe carries the complete graph
+        """
+        nodes, edges, geometry_overlay, geometry_changed = self._refresh(topic_state)
+
+        self._delta_sequence += 1
+        self._deltas_since_keyframe += 1
+        keyframe = (
+            self._keyframe_requested
+            or self._deltas_since_keyframe >= self._keyframe_interval
+        )
+
+        if keyframe:
+            self._keyframe_requested = False
+            self._deltas_since_keyframe = 0
+            self._emitted_nodes = {n.id: n for n in nodes}
+            self._emitted_edges = {(e.source, e.target): e for e in edges}
+            changed_nodes, changed_edges = nodes, edges
+            removed_nodes, removed_edges = [], []
+        else:
+            changed_nodes = self._diff(
+                self._emitted_nodes, {n.id: n for n in nodes}, self._node_changed
+            )
+            removed_nodes = self._prune(self._emitted_nodes, {n.id for n in nodes})
+            changed_edges = self._diff(
+                self._emitted_edges, {(e.source, e.target): e for e in edges}, self._edge_changed
+            )
+            removed_edges = self._prune(
+                self._emitted_edges, {(e.source, e.target) for e in edges}
+            )
+
+        return GraphViewDelta(
+            sequence=self._delta_sequence,
+            keyframe=keyframe,
+            nodes=changed_nodes,
+            edges=changed_edges,
+            removed_nodes=removed_nodes,
+            removed_edges=removed_edges,
+            camera=self._camera,
+            layout=self._layout,
+            hot_region=topic_state.primary_region if topic_state else None,
+            geometry_overlay=geometry_overlay if keyframe or geometry_changed else None,
+        )
+
+    def _refresh(
+        self, topic_state: TopicState | None
+    ) -> tuple[list[GraphNode], list[GraphEdge], GeometryOverlay | None, bool]:
+        """
+        Read the substrate and bring visuals and the geometry overlay up to date.
+
+        Returns:
+            (nodes, edges, geometry overlay, whether the overlay was recomputed)
+        """
+        if not self._substrate:
+            return [], [], None, False
+
+        self._renders += 1
+        all_nodes = self._substrate.get_all_nodes()
+        nodes = self._visual_nodes(all_nodes, topic_state)
+        edges = self._get_visual_edges(topic_state)
+
+        # Update camera to follow activation
+        self._update_camera(nodes, topic_state)
+
+        geometry_changed = False
+        if self._show_geometry:
+            if topic_state:
+                analyzer = self._get_geometry_analyzer()
+                if analyzer:
+                    # Record activation for resonance analysis
+                    analyzer.record_activation({n.id: n.activation for n in all_nodes})
+
+            weights = {(e.source, e.target): e.weight for e in edges}
+            if (
+                self._geometry_overlay is None
+                or self._renders % self._keyframe_interval == 0
+                or self._topology_changed(weights)
+            ):
+                self._geometry_overlay = self._build_geometry_overlay(topic_state)
+                self._geometry_weights = weights
+                geometry_changed = True
+
+        return nodes, edges, self._geometry_overlay if self._show_geometry else None, geometry_changed
+
+    def _topology_changed(self, weights: dict[tuple[str, str], float]) -> bool:
+        """Check edges against those the geometry overlay was computed from."""
+        previous = self._geometry_weights
+        if previous is None or previous.keys() != weights.keys():
+            return True
+        epsilon = self._delta_epsilon
+        return any(abs(weight - previous[key]) > epsilon for key, weight in weights.items())
+
+    def _diff(self, emitted: dict, current: dict, changed: Callable) -> list:
+        """Items new or changed since emitted; records them as emitted."""
+        out = []
+        for key, item in current.items():
+            previous = emitted.get(key)
+            if previous is None or changed(previous, item):
+                emitted[key] = item
+                out.append(item)
+        return out
+
+    @staticmethod
+    def _prune(emitted: dict, current_keys: set) -> list:
+        """Keys emitted before but gone now; forgets them."""
+        removed = [key for key in emitted if key not in current_keys]
+        for key in removed:
+            del emitted[key]
+        return removed
+
+    def _node_changed(self, previous: GraphNode, node: GraphNode) -> bool:
+        return (
+            abs(node.activation - previous.activation) > self._delta_epsilon
+            or node.color != previous.color
+            or node.label != previous.label
+            or node.type != previous.type
+        )
+
+    def _edge_changed(self, previous: GraphEdge, edge: GraphEdge) -> bool:
+        return (
+            abs(edge.weight - previous.weight) > self._delta_epsilon
+            or edge.animated != previous.animated
+        )
+
+    def _visual_nodes(self, all_nodes: list, topic_state: TopicState | None) -> list[GraphNode]:
+        """Visuals for all nodes, rebuilding only those whose inputs changed."""
+        hot = (
+            set(topic_state.active_concepts + topic_state.active_virtues)
+            if topic_state else set()
+        )
+        cache = self._node_visuals
+        visuals = {}
+        for node in all_nodes:
+            key = (node.activation, node.baseline, node.type, node.id in hot, node.metadata.get("name"))
+            cached = cache.get(node.id)
+            if cached is not None and cached[0] == key:
+                visual = cached[1]
+                visual.metadata = node.metadata
+            else:
+                visual = self._node_to_visual(node, topic_state)
+            visuals[node.id] = (key, visual)
+        self._node_visuals = visuals
+        return [visual for _, visual in visuals.values()]
+
     def _build_geometry_overlay(self, topic_state: TopicState | None) -> GeometryOverlay:
         """Build moral geometry overlay for visualization."""
         analyzer = self._get_geometry_analyzer()
         if not analyzer:
             return GeometryOverlay()
 
-        # Record activation for resonance analysis
-        if topic_state and self._substrate:
-            activation_map = {
-                n.id: n.activation for n in self._substrate.get_all_nodes()
-            }
-            analyzer.record_activation(activation_map)
-
         # Analyze geometry
         try:
             geometry = analyzer.analyze()
@@ -406,8 +620,19 @@ class GraphViewRenderer:
 
         # Get all edges from substrate
         all_edges = self._substrate.get_all_edges()
+        active = set(topic_state.active_concepts) if topic_state else set()
+        cache = self._edge_visuals
+        visuals = {}
 
         for edge in all_edges:
+            key = (edge.source_id, edge.target_id)
+            inputs = (edge.weight, edge.source_id in active)
+            cached = cache.get(key)
+            if cached is not None and cached[0] == inputs:
+                visuals[key] = cached
+                edges.append(cached[1])
+                continue
+
             # Width based on weight
             width = 0.5 + (edge.weight * 2.0)
 
@@ -420,15 +645,18 @@ class GraphViewRenderer:
                 if edge.source_id in topic_state.active_concepts:
                     animated = True
 
-            edges.append(GraphEdge(
+            visual = GraphEdge(
                 source=edge.source_id,
                 target=edge.target_id,
                 weight=edge.weight,
                 width=width,
                 opacity=opacity,
                 animated=animated,
-            ))
+            )
+            visuals[key] = (inputs, visual)
+            edges.append(visual)
 
+        self._edge_visuals = visuals
         return edges
 
     def _update_camera(
@@ -24,6 +24,8 @@ import logging
 from dataclasses import dataclass
 from typing import Any, Callable
 
+from src.vectors import EmbeddingService
+
 from .concept_extractor import ConceptExtractor, get_concept_extractor
 from .topic_detector import TopicDetector, TopicState, TopicShift, get_topic_detector
 from .scene_generator import SceneGenerator, Scene, get_scene_generator
@@ -62,6 +64,7 @@ class TheatreConfig:
     max_visible_captions: int = 3
     caption_overlap: bool = True
     default_view: ViewType = ViewType.WORKSPACE
+    graph_deltas: bool = False  # Push graph view updates as deltas
 
     # Integration
     hume_api_key: str | None = None
@@ -141,12 +144,15 @@ class TheatreSystem:
             config: Optional configuration
             substrate: Graph substrate for concept extraction
             activation_spreader: For topic detection
-            embedding_fn: Function for generating embeddings
+            embedding_fn: Function for generating embeddings; wrapped in a
+                          caching EmbeddingService unless it already is one
 
         Returns:
             Configured TheatreSystem
         """
         config = config or TheatreConfig()
+        if embedding_fn is not None and not isinstance(embedding_fn, EmbeddingService):
+            embedding_fn = EmbeddingService(embedding_fn)
 
         # Create components
         extractor = ConceptExtractor(
@@ -270,7 +276,7 @@ class TheatreSystem:
 
     def _notify_display_update(self) -> None:
         """Notify all display callbacks of update."""
-        display_state = self.get_display_state()
+        display_state = self.get_display_state(delta=self.config.graph_deltas)
         for callback in self._display_callbacks:
             try:
                 callback(display_state)
@@ -356,15 +362,18 @@ class TheatreSystem:
             "theatre_state": self.orchestrator.state.value,
         }
 
-    def get_display_state(self) -> dict:
+    def get_display_state(self, delta: bool = False) -> dict:
         """
         Get current display state for rendering.
 
+        Args:
+            delta: In graph view, return only changes since the last delta
+
         Returns:
-            Complete display state based on current view
+            Display state based on current view
         """
         # Get base state from view manager
-        view_data = self.view_manager.get_render_data()
+        view_data = self.view_manager.get_render_data(delta=delta)
 
         # Add theatre state
         view_data["theatre_state"] = self.orchestrator.state.value
@@ -153,6 +153,9 @@ class ViewManager:
         self._current_view = view_type
 
         if old_view != view_type:
+            if view_type == ViewType.GRAPH:
+                # The client no longer holds the graph it was last sent
+                self._graph_renderer.request_keyframe()
             self._notify_view_change(view_type)
 
         return self.get_state()
@@ -201,10 +204,18 @@ class ViewManager:
                 graph=graph_state,
             )
 
-    def get_render_data(self) -> dict:
-        """Get render-ready data for current view."""
-        state = self.get_state()
-        data = state.to_dict()
+    def get_render_data(self, delta: bool = False) -> dict:
+        """
+        Get render-ready data for current view.
+
+        Args:
+            delta: In graph view, send only changes since the last delta
+        """
+        if delta and self._current_view == ViewType.GRAPH:
+            data = self._graph_renderer.render_delta(self._topic_state).to_dict()
+            data["view_type"] = ViewType.GRAPH.value
+        else:
+            data = self.get_state().to_dict()
 
         # Always include captions in both views
         if self._current_view == ViewType.GRAPH:
@@ -3,6 +3,7 @@ Real-time Transport Layer.
 
 WebSocket-based communication for the conversational theatre.
 Handles voice streaming, captions, stage updates, and session state.
+Audio can travel as binary frames; control events are JSON.
 """
 
 from .server import TransportServer, create_server
@@ -16,7 +17,9 @@ from .events import (
     AgentState,
     SessionState,
     PresenceEvent,
+    VoiceOutput,
 )
+from .frames import FrameKind, encode_frame, decode_frame
 
 __all__ = [
     "TransportServer",
@@ -31,4 +34,8 @@ __all__ = [
     "AgentState",
     "SessionState",
     "PresenceEvent",
+    "VoiceOutput",
+    "FrameKind",
+    "encode_frame",
+    "decode_frame",
 ]
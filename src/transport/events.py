@@ -98,7 +98,7 @@ class VoiceChunk(Event):
     """Audio data from client microphone."""
 
     type: EventType = field(default=EventType.VOICE_CHUNK)
-    audio_data: bytes = field(default=b"")
+    audio_data: bytes | memoryview = field(default=b"")  # memoryview when decoded from a binary frame
     sample_rate: int = 16000
     encoding: str = "pcm"
     is_final: bool = False
@@ -456,7 +456,7 @@ class VoiceOutput(Event):
 
     type: EventType = field(default=EventType.VOICE_OUTPUT)
     agent_id: str = ""
-    audio_data: bytes = field(default=b"")
+    audio_data: bytes | memoryview = field(default=b"")
     sample_rate: int = 24000
     encoding: str = "mp3"
     text: str = ""  # For caption sync
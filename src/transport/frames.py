@@ -0,0 +1,130 @@
+"""
+Binary WebSocket Frames.
+
+Audio travels as binary frames instead of hex inside JSON: a fixed
+10-byte header, optional JSON metadata, then the raw PCM/opus/mp3
+bytes. JSON stays the format for every control event.
+
+Frame layout (network byte order):
+
+    version    u8   FRAME_VERSION
+    kind       u8   FrameKind
+    flags      u8   bit 0: is_final (VoiceChunk)
+    encoding   u8   index into ENCODINGS, 255 = named in metadata
+    sample     u32  sample rate in Hz
+    meta_len   u16  bytes of UTF-8 JSON metadata that follow
+    meta       ...  optional fields (id, agent_id, text, ...)
+    audio      ...  the rest of the frame
+
+Clients opt in per connection (see TransportServer.handle_connection);
+decoding slices a memoryview, so inbound audio is never copied.
+"""
+
+import json
+import struct
+import uuid
+from datetime import datetime
+from enum import IntEnum
+
+from .events import Event, VoiceChunk, VoiceOutput
+
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct("!BBBBIH")
+
+ENCODINGS = ("pcm", "opus", "mp3", "wav")
+_ENCODING_CODES = {name: code for code, name in enumerate(ENCODINGS)}
+_NAMED_ENCODING = 255
+
+_FLAG_FINAL = 0x01
+
+
+class FrameKind(IntEnum):
+    """Event carried by a binary frame."""
+
+    VOICE_CHUNK = 1
+    VOICE_OUTPUT = 2
+
+
+def is_binary_event(event: Event) -> bool:
+    """Check if an event can be sent as a binary frame."""
+    return isinstance(event, (VoiceChunk, VoiceOutput))
+
+
+def encode_frame(event: Event) -> bytes:
+    """
+    Encode an audio event as a binary frame.
+
+    Args:
+        event: VoiceChunk or VoiceOutput
+
+    Returns:
+        Frame bytes
+    """
+    meta = {"id": event.id}
+    if isinstance(event, VoiceChunk):
+        kind = FrameKind.VOICE_CHUNK
+        flags = _FLAG_FINAL if event.is_final else 0
+    elif isinstance(event, VoiceOutput):
+        kind = FrameKind.VOICE_OUTPUT
+        flags = 0
+        meta["agent_id"] = event.agent_id
+        if event.text:
+            meta["text"] = event.text
+    else:
+        raise ValueError(f"No binary frame for {event.type.value} events")
+
+    encoding = _ENCODING_CODES.get(event.encoding, _NAMED_ENCODING)
+    if encoding == _NAMED_ENCODING:
+        meta["encoding"] = event.encoding
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode()
+
+    header = FRAME_HEADER.pack(
+        FRAME_VERSION, kind, flags, encoding, event.sample_rate, len(meta_bytes)
+    )
+    return b"".join((header, meta_bytes, event.audio_data))
+
+
+def decode_frame(data: bytes | bytearray | memoryview) -> Event:
+    """
+    Decode a binary frame without copying its audio.
+
+    The returned event's audio_data is a memoryview into `data`.
+
+    Args:
+        data: Received frame
+
+    Returns:
+        VoiceChunk or VoiceOutput
+    """
+    view = memoryview(data)
+    if len(view) < FRAME_HEADER.size:
+        raise ValueError(f"Frame too short: {len(view)} bytes")
+
+    version, kind, flags, encoding, sample_rate, meta_len = FRAME_HEADER.unpack_from(view)
+    if version != FRAME_VERSION:
+        raise ValueError(f"Unsupported frame version: {version}")
+
+    audio_start = FRAME_HEADER.size + meta_len
+    if len(view) < audio_start:
+        raise ValueError("Frame truncated inside metadata")
+    meta = json.loads(bytes(view[FRAME_HEADER.size:audio_start])) if meta_len else {}
+
+    if encoding == _NAMED_ENCODING:
+        encoding_name = meta.get("encoding", "pcm")
+    elif encoding < len(ENCODINGS):
+        encoding_name = ENCODINGS[encoding]
+    else:
+        raise ValueError(f"Unknown frame encoding: {encoding}")
+
+    common = {
+        "id": meta.get("id") or uuid.uuid4().hex[:12],
+        "timestamp": datetime.utcnow(),
+        "audio_data": view[audio_start:],
+        "sample_rate": sample_rate,
+        "encoding": encoding_name,
+    }
+    if kind == FrameKind.VOICE_CHUNK:
+        return VoiceChunk(is_final=bool(flags & _FLAG_FINAL), **common)
+    if kind == FrameKind.VOICE_OUTPUT:
+        return VoiceOutput(agent_id=meta.get("agent_id", ""), text=meta.get("text", ""), **common)
+    raise ValueError(f"Unknown frame kind: {kind}")
@@ -0,0 +1,161 @@
+"""
+Per-Connection Outbound Queues.
+
+Each connection gets a bounded queue drained by its own writer task,
+so a slow client only delays itself. State-like events are coalesced
+while queued: a newer StageUpdate, SessionState, or AgentState for the
+same agent replaces the queued one in place, since only the latest
+matters. When a queue is full the oldest message is dropped.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Callable
+
+from .events import Event, EventType
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 256
+
+# Event types where a newer event supersedes a queued one with the same key
+_COALESCE_KEYS: dict[EventType, Callable[[Event], tuple]] = {
+    EventType.STAGE_UPDATE: lambda event: (EventType.STAGE_UPDATE,),
+    EventType.SESSION_STATE: lambda event: (EventType.SESSION_STATE,),
+    EventType.AGENT_STATE: lambda event: (EventType.AGENT_STATE, event.agent_id),
+}
+
+
+def coalesce_key(event: Event) -> tuple | None:
+    """Key under which a queued event is superseded, or None if it never is."""
+    key_fn = _COALESCE_KEYS.get(event.type)
+    return key_fn(event) if key_fn else None
+
+
+class OutboundQueue:
+    """
+    Bounded outbound message queue with a writer task for one connection.
+
+    Messages are pre-serialised payloads (str or bytes), shared between
+    the queues of every recipient.
+    """
+
+    def __init__(
+        self,
+        connection_id: str,
+        send_fn: Callable[[str | bytes], Any],
+        max_size: int = DEFAULT_QUEUE_SIZE,
+        on_error: Callable[["OutboundQueue", Exception], Any] | None = None,
+    ):
+        """
+        Initialize the queue and start its writer.
+
+        Must be called from a running event loop.
+
+        Args:
+            connection_id: Connection this queue writes to
+            send_fn: Async function sending one payload
+            max_size: Messages held before the oldest is dropped
+            on_error: Async callback when a send fails; the queue is closed
+        """
+        self.connection_id = connection_id
+        self.max_size = max_size
+        self._send_fn = send_fn
+        self._on_error = on_error
+
+        # Items are [key, payload] so a coalesced payload can be swapped in place
+        self._items: deque[list] = deque()
+        self._keyed: dict[tuple, list] = {}
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.closed = False
+
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    @property
+    def depth(self) -> int:
+        return len(self._items)
+
+    def put(self, payload: str | bytes, key: tuple | None = None) -> None:
+        """
+        Queue a payload without waiting.
+
+        Args:
+            payload: Serialised message
+            key: Coalescing key; replaces a queued message with the same key
+        """
+        if self.closed:
+            return
+
+        if key is not None:
+            queued = self._keyed.get(key)
+            if queued is not None:
+                queued[1] = payload
+                self.coalesced += 1
+                return
+
+        if len(self._items) >= self.max_size:
+            self._forget(self._items.popleft())
+            self.dropped += 1
+
+        item = [key, payload]
+        self._items.append(item)
+        if key is not None:
+            self._keyed[key] = item
+        self.max_depth = max(self.max_depth, len(self._items))
+        self._idle.clear()
+        self._ready.set()
+
+    async def join(self) -> None:
+        """Wait until every queued message has been sent (or the queue closed)."""
+        await self._idle.wait()
+
+    def close(self) -> None:
+        """Stop the writer and discard queued messages."""
+        self.closed = True
+        self._items.clear()
+        self._keyed.clear()
+        self._idle.set()
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    def get_stats(self) -> dict:
+        """Queue metrics."""
+        return {
+            "depth": len(self._items),
+            "max_depth": self.max_depth,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
+    def _forget(self, item: list) -> None:
+        if item[0] is not None and self._keyed.get(item[0]) is item:
+            del self._keyed[item[0]]
+
+    async def _run(self) -> None:
+        while not self.closed:
+            if not self._items:
+                self._idle.set()
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+
+            item = self._items.popleft()
+            self._forget(item)
+            try:
+                await self._send_fn(item[1])
+            except Exception as e:
+                logger.error(f"Failed to send to {self.connection_id}: {e}")
+                self.close()
+                if self._on_error:
+                    await self._on_error(self, e)
+                return
+            self.sent += 1
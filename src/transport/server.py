@@ -11,6 +11,7 @@ import uuid
 from typing import Callable, Any
 
 from .events import Event, EventType, PresenceEvent, PresenceType
+from .frames import decode_frame
 from .session import TransportSession, SessionEvent
 
 logger = logging.getLogger(__name__)
@@ -71,15 +72,21 @@ class TransportServer:
         session_id: str,
         user_id: str,
         proxy_id: str | None = None,
+        binary_audio: bool = False,
     ) -> None:
         """
         Handle a new WebSocket connection.
 
+        Binary frames (see frames.py) are accepted from any client;
+        audio is sent back as binary frames only when the client
+        negotiated binary_audio.
+
         Args:
             websocket: The WebSocket connection (framework-agnostic)
             session_id: Session to join
             user_id: User identifier
             proxy_id: Optional proxy to use
+            binary_audio: Send audio events as binary frames
         """
         connection_id = f"conn_{uuid.uuid4().hex[:12]}"
 
@@ -89,8 +96,11 @@ class TransportServer:
             session = self.create_session(session_id)
 
         # Create send function
-        async def send(message: str):
-            await websocket.send_text(message)
+        async def send(message: str | bytes):
+            if isinstance(message, str):
+                await websocket.send_text(message)
+            else:
+                await websocket.send_bytes(message)
 
         # Add participant
         await session.add_participant(
@@ -98,6 +108,7 @@ class TransportServer:
             proxy_id=proxy_id,
             connection_id=connection_id,
             send_fn=send,
+            binary_audio=binary_audio,
         )
 
         self._connection_sessions[connection_id] = session_id
@@ -111,7 +122,7 @@ class TransportServer:
 
         try:
             # Message loop
-            async for message in websocket.iter_text():
+            async for message in self._iter_messages(websocket):
                 await self._handle_message(
                     message, session, user_id, connection_id
                 )
@@ -131,17 +142,36 @@ class TransportServer:
                 except Exception as e:
                     logger.error(f"Disconnect handler error: {e}")
 
+    @staticmethod
+    async def _iter_messages(websocket: Any):
+        """Yield text and binary messages until the client disconnects."""
+        if not hasattr(websocket, "receive"):
+            async for message in websocket.iter_text():
+                yield message
+            return
+
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            if message.get("bytes") is not None:
+                yield message["bytes"]
+            elif message.get("text") is not None:
+                yield message["text"]
+
     async def _handle_message(
         self,
-        message: str,
+        message: str | bytes,
         session: TransportSession,
         user_id: str,
         connection_id: str,
     ) -> None:
-        """Handle an incoming WebSocket message."""
+        """Handle an incoming WebSocket message (JSON text or binary audio frame)."""
         try:
-            data = json.loads(message)
-            event = Event.from_dict(data)
+            if isinstance(message, str):
+                event = Event.from_dict(json.loads(message))
+            else:
+                event = decode_frame(message)
             event.session_id = session.id
             event.user_id = user_id
 
@@ -261,6 +291,7 @@ def create_fastapi_app(server: TransportServer):
         session_id: str,
         user_id: str = Query(...),
         proxy_id: str | None = Query(None),
+        binary_audio: bool = Query(False),
     ):
         await websocket.accept()
         await server.handle_connection(
@@ -268,6 +299,7 @@ def create_fastapi_app(server: TransportServer):
             session_id=session_id,
             user_id=user_id,
             proxy_id=proxy_id,
+            binary_audio=binary_audio,
         )
 
     @app.get("/sessions")
@@ -23,6 +23,8 @@ from .events import (
     StageUpdate,
     AgentState,
 )
+from .frames import encode_frame, is_binary_event
+from .outbound import DEFAULT_QUEUE_SIZE, OutboundQueue, coalesce_key
 
 logger = logging.getLogger(__name__)
 
@@ -89,12 +91,16 @@ class TransportSession:
     - Agent instances
     - Event routing
     - State synchronization
+
+    Outgoing events are serialised once per format and queued on each
+    connection's OutboundQueue; broadcasting never waits on a client.
     """
 
     def __init__(
         self,
         session_id: str | None = None,
         host_user_id: str | None = None,
+        max_queue_size: int = DEFAULT_QUEUE_SIZE,
     ):
         self.id = session_id or f"session_{uuid.uuid4().hex[:12]}"
         self.host_user_id = host_user_id
@@ -108,8 +114,12 @@ class TransportSession:
         # Connection mapping: connection_id -> user_id
         self._connections: dict[str, str] = {}
 
-        # Send functions: connection_id -> async send function
-        self._senders: dict[str, Callable[[str], Any]] = {}
+        # Outbound queues: connection_id -> queue drained by a writer task
+        self._outbound: dict[str, OutboundQueue] = {}
+        self._max_queue_size = max_queue_size
+
+        # Connections that negotiated binary audio frames
+        self._binary_connections: set[str] = set()
 
         # Event callbacks
         self._callbacks: dict[SessionEvent, list[Callable]] = {
@@ -128,9 +138,19 @@ class TransportSession:
         user_id: str,
         proxy_id: str | None = None,
         connection_id: str | None = None,
-        send_fn: Callable[[str], Any] | None = None,
+        send_fn: Callable[[str | bytes], Any] | None = None,
+        binary_audio: bool = False,
     ) -> Participant:
-        """Add a participant to the session."""
+        """
+        Add a participant to the session.
+
+        Args:
+            user_id: User identifier
+            proxy_id: Optional proxy to use
+            connection_id: Connection the participant is on
+            send_fn: Async function sending a text or binary message
+            binary_audio: Send audio events to this connection as binary frames
+        """
         async with self._lock:
             participant = Participant(
                 user_id=user_id,
@@ -142,7 +162,14 @@ class TransportSession:
             if connection_id:
                 self._connections[connection_id] = user_id
                 if send_fn:
-                    self._senders[connection_id] = send_fn
+                    self._outbound[connection_id] = OutboundQueue(
+                        connection_id,
+                        send_fn,
+                        max_size=self._max_queue_size,
+                        on_error=self._on_send_error,
+                    )
+                if binary_audio:
+                    self._binary_connections.add(connection_id)
 
             # Set host if first participant
             if not self.host_user_id:
@@ -173,7 +200,10 @@ class TransportSession:
             # Clean up connection
             if participant.connection_id:
                 self._connections.pop(participant.connection_id, None)
-                self._senders.pop(participant.connection_id, None)
+                outbound = self._outbound.pop(participant.connection_id, None)
+                if outbound:
+                    outbound.close()
+                self._binary_connections.discard(participant.connection_id)
 
             logger.info(f"Participant {user_id} left session {self.id}")
 
@@ -283,36 +313,60 @@ class TransportSession:
             await self._broadcast_state()
 
     async def broadcast(self, event: Event) -> None:
-        """Broadcast an event to all connected participants."""
+        """Queue an event for all connected participants."""
         event.session_id = self.id
-        message = event.to_json()
+        encoded: dict[bool, str | bytes] = {}
+        key = coalesce_key(event)
 
-        for connection_id, send_fn in list(self._senders.items()):
-            try:
-                await send_fn(message)
-            except Exception as e:
-                logger.error(
-                    f"Failed to send to {connection_id}: {e}"
-                )
-                # Remove dead connection
-                user_id = self._connections.get(connection_id)
-                if user_id:
-                    await self.remove_participant(user_id)
+        for connection_id, outbound in self._outbound.items():
+            outbound.put(self._encode(event, connection_id, encoded), key)
 
     async def send_to_user(self, user_id: str, event: Event) -> None:
         """Send an event to a specific user."""
         event.session_id = self.id
         event.user_id = user_id
-        message = event.to_json()
 
         participant = self._participants.get(user_id)
         if participant and participant.connection_id:
-            send_fn = self._senders.get(participant.connection_id)
-            if send_fn:
-                try:
-                    await send_fn(message)
-                except Exception as e:
-                    logger.error(f"Failed to send to {user_id}: {e}")
+            outbound = self._outbound.get(participant.connection_id)
+            if outbound:
+                outbound.put(
+                    self._encode(event, participant.connection_id, {}),
+                    coalesce_key(event),
+                )
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been sent."""
+        await asyncio.gather(*(outbound.join() for outbound in list(self._outbound.values())))
+
+    def get_queue_stats(self) -> dict:
+        """Outbound queue metrics per connection, with totals."""
+        connections = {
+            connection_id: outbound.get_stats()
+            for connection_id, outbound in self._outbound.items()
+        }
+        return {
+            "connections": connections,
+            "total_depth": sum(c["depth"] for c in connections.values()),
+            "max_depth": max((c["max_depth"] for c in connections.values()), default=0),
+            "dropped": sum(c["dropped"] for c in connections.values()),
+            "coalesced": sum(c["coalesced"] for c in connections.values()),
+        }
+
+    async def _on_send_error(self, outbound: OutboundQueue, error: Exception) -> None:
+        """Remove the participant whose connection failed."""
+        user_id = self._connections.get(outbound.connection_id)
+        if user_id:
+            await self.remove_participant(user_id)
+
+    def _encode(
+        self, event: Event, connection_id: str, encoded: dict[bool, str | bytes]
+    ) -> str | bytes:
+        """Encode an event for a connection, reusing encodings already in `encoded`."""
+        binary = connection_id in self._binary_connections and is_binary_event(event)
+        if binary not in encoded:
+            encoded[binary] = encode_frame(event) if binary else event.to_json()
+        return encoded[binary]
 
     async def send_caption(
         self,
@@ -0,0 +1,20 @@
+"""
+Vector similarity indexes and embedding.
+
+Provides a pluggable VectorIndex interface with:
+- Exact (brute-force) search
+- IVF approximate nearest-neighbour search with a recall/latency knob
+- A shared embedding service with caching, batching and request coalescing
+"""
+
+from src.vectors.index import VectorIndex, ExactIndex, IVFIndex, normalize_rows
+from src.vectors.embedding import EmbeddingService, embed_texts
+
+__all__ = [
+    "VectorIndex",
+    "ExactIndex",
+    "IVFIndex",
+    "normalize_rows",
+    "EmbeddingService",
+    "embed_texts",
+]
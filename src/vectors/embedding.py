@@ -0,0 +1,256 @@
+"""
+Shared, cached and batched text embedding.
+
+Memory, concept extraction and topic detection each embed text one
+string at a time and re-embed strings they have seen before. An
+EmbeddingService wraps an embedding function (or a batch function) with
+a content-hash LRU cache, optionally backed by a directory of .npy
+files, and coalesces concurrent requests: while one thread is computing
+a batch, other threads queue their texts and the same thread computes
+them in the next batch, so a burst of callers becomes a few batched
+calls. Pass one service wherever an `embedding_fn` is accepted.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from src.constants import EMBEDDING_BATCH_SIZE, EMBEDDING_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingService:
+    """
+    Callable text -> embedding with caching, batching and request coalescing.
+
+    Returned arrays are shared with the cache and must not be modified.
+    """
+
+    def __init__(
+        self,
+        embedding_fn: Callable[[str], np.ndarray] | None = None,
+        batch_fn: Callable[[list[str]], np.ndarray] | None = None,
+        max_size: int = EMBEDDING_CACHE_SIZE,
+        cache_dir: str | Path | None = None,
+        max_batch_size: int = EMBEDDING_BATCH_SIZE,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            embedding_fn: Embeds one string
+            batch_fn: Embeds a list of strings, returning one row per string;
+                      preferred over embedding_fn when given
+            max_size: Embeddings kept in the in-memory LRU
+            cache_dir: Optional directory for a persistent cache; use one
+                       directory per embedding model
+            max_batch_size: Most strings passed to one batch call
+        """
+        if embedding_fn is None and batch_fn is None:
+            raise ValueError("embedding_fn or batch_fn is required")
+        self._embedding_fn = embedding_fn
+        self._batch_fn = batch_fn
+        self.max_size = max_size
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_batch_size = max_batch_size
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._pending: OrderedDict[str, str] = OrderedDict()  # key -> text awaiting a batch
+        self._inflight: dict[str, Future] = {}
+        self._flushing = False
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.batched_texts = 0
+        self.max_batch_seen = 0
+
+    def __call__(self, text: str) -> np.ndarray:
+        return self.embed(text)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Content hash a text is cached under."""
+        return hashlib.sha1(text.encode()).hexdigest()
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embedding of one string."""
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: list[str]) -> list[np.ndarray]:
+        """
+        Embeddings of many strings, computing only uncached ones, in batches.
+
+        Args:
+            texts: Strings to embed
+
+        Returns:
+            One embedding per string, in order
+        """
+        keys = [self.key(text) for text in texts]
+        found: dict[str, np.ndarray] = {}
+        waiting: dict[str, Future] = {}
+        lead = False
+
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in found or key in waiting:
+                    continue
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    found[key] = cached
+                    self.hits += 1
+                elif key in self._inflight:
+                    # Another caller already asked for it; share that result
+                    waiting[key] = self._inflight[key]
+                    self.coalesced += 1
+                    self.hits += 1
+                else:
+                    future = Future()
+                    self._inflight[key] = future
+                    self._pending[key] = text
+                    waiting[key] = future
+                    self.misses += 1
+            if self._pending and not self._flushing:
+                self._flushing = True
+                lead = True
+
+        if lead:
+            self._flush()
+        for key, future in waiting.items():
+            found[key] = future.result()
+        return [found[key] for key in keys]
+
+    def get_stats(self) -> dict:
+        """Cache and batching metrics."""
+        return {
+            "size": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "disk_hits": self.disk_hits,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "mean_batch_size": self.batched_texts / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch_seen,
+        }
+
+    def clear(self) -> None:
+        """Drop the in-memory cache (the disk cache is kept)."""
+        with self._lock:
+            self._cache.clear()
+
+    def _flush(self) -> None:
+        """Compute pending texts in batches until none are left."""
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._flushing = False
+                    return
+                batch = [
+                    self._pending.popitem(last=False)
+                    for _ in range(min(self.max_batch_size, len(self._pending)))
+                ]
+
+            keys = [key for key, _ in batch]
+            try:
+                vectors = self._compute(keys, [text for _, text in batch])
+            except Exception as e:
+                logger.warning(f"Embedding batch of {len(batch)} failed: {e}")
+                with self._lock:
+                    futures = [self._inflight.pop(key) for key in keys]
+                for future in futures:
+                    future.set_exception(e)
+                continue
+
+            with self._lock:
+                for key, vector in zip(keys, vectors):
+                    self._cache[key] = vector
+                while len(self._cache) > self.max_size:
+                    self._cache.popitem(last=False)
+                futures = [self._inflight.pop(key) for key in keys]
+            for future, vector in zip(futures, vectors):
+                future.set_result(vector)
+
+    def _compute(self, keys: list[str], texts: list[str]) -> list[np.ndarray]:
+        vectors: list[np.ndarray | None] = [self._read_disk(key) for key in keys]
+        todo = [i for i, vector in enumerate(vectors) if vector is None]
+        self.disk_hits += len(keys) - len(todo)
+        if not todo:
+            return vectors
+
+        todo_texts = [texts[i] for i in todo]
+        if self._batch_fn is not None:
+            computed = list(np.asarray(self._batch_fn(todo_texts)))
+        else:
+            computed = [self._embedding_fn(text) for text in todo_texts]
+        if len(computed) != len(todo):
+            raise ValueError(f"batch_fn returned {len(computed)} embeddings for {len(todo)} texts")
+
+        self.batches += 1
+        self.batched_texts += len(todo)
+        self.max_batch_seen = max(self.max_batch_seen, len(todo))
+        for i, vector in zip(todo, computed):
+            vectors[i] = vector
+            self._write_disk(keys[i], vector)
+        return vectors
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.npy"
+
+    def _read_disk(self, key: str) -> np.ndarray | None:
+        if self.cache_dir is None:
+            return None
+        path = self._disk_path(key)
+        if not path.exists():
+            return None
+        try:
+            return np.load(path, allow_pickle=False)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cached embedding {path}: {e}")
+            return None
+
+    def _write_disk(self, key: str, vector: np.ndarray) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._disk_path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.asarray(vector))
+        os.replace(tmp_path, path)
+
+
+def embed_texts(embedding_fn: Callable[[str], np.ndarray], texts: list[str]) -> list[np.ndarray]:
+    """
+    Embed several strings, in one batch when embedding_fn is an EmbeddingService.
+
+    Args:
+        embedding_fn: Plain embedding function or EmbeddingService
+        texts: Strings to embed
+
+    Returns:
+        One embedding per string, in order
+    """
+    if isinstance(embedding_fn, EmbeddingService):
+        return embedding_fn.embed_many(texts)
+    return [embedding_fn(text) for text in texts]
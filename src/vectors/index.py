@@ -0,0 +1,264 @@
+"""
+Pluggable similarity indexes over unit vectors.
+
+A VectorIndex maps integer ids to embeddings and answers cosine
+similarity queries. ExactIndex scans every vector. IVFIndex clusters
+vectors with spherical k-means and only scores the clusters nearest the
+query; `nprobe` trades recall for latency, and sets smaller than
+`exact_below` are searched exhaustively.
+
+Owners that score candidates themselves (e.g. with extra filters) call
+candidates(); everyone else calls search().
+"""
+
+import logging
+
+import numpy as np
+
+from src.constants import IVF_NPROBE, VECTOR_INDEX_EXACT_BELOW
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length, leaving zero rows at zero."""
+    with np.errstate(invalid="ignore", over="ignore"):
+        vectors = np.asarray(vectors, dtype=np.float64)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+
+class VectorIndex:
+    """
+    Base class: stores unit vectors by id and searches the rows _probe picks.
+
+    Subclasses override _probe (and the row hooks if they keep per-row
+    state). Rows are kept dense; removal moves the last row into the gap.
+    """
+
+    # Storage precision of the indexed vectors
+    dtype = np.float64
+
+    def __init__(self):
+        self._vectors: np.ndarray | None = None
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._rows: dict[int, int] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def add(self, ids, vectors: np.ndarray) -> None:
+        """
+        Add or replace vectors.
+
+        Args:
+            ids: Integer ids, one per row of vectors
+            vectors: (n, dim) embeddings; normalised on insert
+        """
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        if len(ids) == 0:
+            return
+        vectors = normalize_rows(np.atleast_2d(vectors))
+        self._reserve(vectors.shape[1], len(ids))
+
+        rows = np.empty(len(ids), dtype=np.int64)
+        for i, key in enumerate(ids.tolist()):
+            row = self._rows.get(key)
+            if row is None:
+                row = self._size
+                self._rows[key] = row
+                self._ids[row] = key
+                self._size += 1
+            rows[i] = row
+        self._vectors[rows] = vectors
+        self._rows_added(rows)
+
+    def remove(self, ids) -> None:
+        """Remove vectors by id; unknown ids are ignored."""
+        for key in np.asarray(ids, dtype=np.int64).reshape(-1).tolist():
+            row = self._rows.pop(key, None)
+            if row is None:
+                continue
+            last = self._size - 1
+            if row != last:
+                self._move_row(last, row)
+                self._rows[int(self._ids[row])] = row
+            self._size = last
+
+    def clear(self) -> None:
+        """Remove every vector."""
+        self._rows = {}
+        self._size = 0
+
+    def candidates(self, query: np.ndarray) -> np.ndarray | None:
+        """
+        Ids worth scoring exactly for a query.
+
+        Returns:
+            Array of ids, or None when every vector should be scored
+        """
+        rows = self._probe(normalize_rows(query))
+        return None if rows is None else self._ids[rows]
+
+    def search(self, query: np.ndarray, k: int) -> list[tuple[int, float]]:
+        """
+        Most similar vectors to a query.
+
+        Args:
+            query: Query embedding
+            k: Maximum number of results
+
+        Returns:
+            (id, cosine similarity) pairs, best first; ties by ascending id
+        """
+        if self._size == 0 or k <= 0:
+            return []
+        query = normalize_rows(query)
+        rows = self._probe(query)
+        if rows is None:
+            rows = slice(0, self._size)
+        scores = self._vectors[rows] @ query.astype(self.dtype)
+        ids = self._ids[rows]
+
+        # Identical vectors can round differently by position; rank on rounded scores
+        ranked = np.round(scores, 12)
+        if len(scores) > k:
+            kth = -np.partition(-ranked, k - 1)[k - 1]
+            keep = ranked >= kth
+            ids, scores, ranked = ids[keep], scores[keep], ranked[keep]
+        order = np.lexsort((ids, -ranked))[:k]
+        return list(zip(ids[order].tolist(), scores[order].astype(float).tolist()))
+
+    def _probe(self, query: np.ndarray) -> np.ndarray | None:
+        """Rows to score for a unit query, or None for all rows."""
+        return None
+
+    def _rows_added(self, rows: np.ndarray) -> None:
+        """Hook called after vectors are written to rows."""
+
+    def _move_row(self, src: int, dst: int) -> None:
+        self._vectors[dst] = self._vectors[src]
+        self._ids[dst] = self._ids[src]
+
+    def _reserve(self, dim: int, extra: int) -> None:
+        needed = self._size + extra
+        if self._vectors is not None and needed <= len(self._vectors):
+            return
+        capacity = max(needed, 2 * len(self._ids), 64)
+        vectors = np.zeros((capacity, dim), dtype=self.dtype)
+        ids = np.zeros(capacity, dtype=np.int64)
+        if self._vectors is not None:
+            vectors[: self._size] = self._vectors[: self._size]
+            ids[: self._size] = self._ids[: self._size]
+        self._vectors, self._ids = vectors, ids
+        self._grow(capacity)
+
+    def _grow(self, capacity: int) -> None:
+        """Hook called after the row capacity grows."""
+
+
+class ExactIndex(VectorIndex):
+    """Brute-force index: every query scores every vector."""
+
+
+class IVFIndex(VectorIndex):
+    """
+    Inverted-file index with a spherical k-means coarse quantiser.
+
+    The quantiser is trained once the index holds `exact_below` vectors
+    and retrained whenever it has grown fourfold since, so the cost is
+    amortised over inserts. Queries score only the vectors in the
+    `nprobe` clusters whose centroids are most similar to the query.
+    clear() keeps a trained quantiser, so re-adding vectors is cheap.
+    """
+
+    # Halves memory; ranking precision is already approximate
+    dtype = np.float32
+
+    def __init__(
+        self,
+        nlist: int | None = None,
+        nprobe: int = IVF_NPROBE,
+        exact_below: int = VECTOR_INDEX_EXACT_BELOW,
+        train_iterations: int = 10,
+        seed: int = 0,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            nlist: Number of clusters (default: sqrt of the size at training)
+            nprobe: Clusters scored per query; higher means better recall
+            exact_below: Sizes below this are searched exhaustively
+            train_iterations: k-means iterations per training run
+            seed: Random seed for training
+        """
+        super().__init__()
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.exact_below = exact_below
+        self.train_iterations = train_iterations
+        self.seed = seed
+        self._centroids: np.ndarray | None = None
+        self._cell = np.zeros(0, dtype=np.int32)
+        self._trained_size = 0
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    def train(self) -> None:
+        """(Re)train the quantiser on the current vectors and reassign them."""
+        n = self._size
+        if n == 0:
+            return
+        nlist = min(n, self.nlist or max(1, int(np.sqrt(n))))
+        rng = np.random.default_rng(self.seed)
+        # 32 points per cluster is plenty for a coarse quantiser
+        sample = self._vectors[rng.choice(n, size=min(n, nlist * 32), replace=False)]
+
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+        for _ in range(self.train_iterations):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            counts = np.bincount(assign, minlength=nlist)
+            empty = counts == 0
+            sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()))]
+            centroids = normalize_rows(sums).astype(self.dtype)
+
+        self._centroids = centroids
+        self._trained_size = n
+        self._cell[:n] = self._assign(self._vectors[:n])
+        logger.debug(f"Trained IVF quantiser: {nlist} clusters over {n} vectors")
+
+    def _probe(self, query: np.ndarray) -> np.ndarray | None:
+        if not self.trained or self._size < self.exact_below:
+            return None
+        scores = self._centroids @ query.astype(self.dtype)
+        nprobe = min(self.nprobe, len(scores))
+        probed = np.zeros(len(scores), dtype=bool)
+        probed[np.argpartition(-scores, nprobe - 1)[:nprobe]] = True
+        return np.flatnonzero(probed[self._cell[: self._size]])
+
+    def _rows_added(self, rows: np.ndarray) -> None:
+        if self._size >= max(self.exact_below, 4 * self._trained_size):
+            self.train()
+        elif self.trained:
+            self._cell[rows] = self._assign(self._vectors[rows])
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self._centroids.T, axis=1).astype(np.int32)
+
+    def _move_row(self, src: int, dst: int) -> None:
+        super()._move_row(src, dst)
+        self._cell[dst] = self._cell[src]
+
+    def _grow(self, capacity: int) -> None:
+        cell = np.zeros(capacity, dtype=np.int32)
+        cell[: len(self._cell)] = self._cell[: min(len(self._cell), capacity)]
+        self._cell = cell
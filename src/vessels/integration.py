@@ -11,7 +11,9 @@ import asyncio
 import logging
 import os
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable
+
+import numpy as np
 
 from .memory import SemanticMemory, MemoryStore, GraphitiMemory
 from .agents import AgentContext, ContextRegistry, InterventionManager, SubordinateManager
@@ -40,6 +42,7 @@ class VesselsIntegration:
         use_graphiti: bool | None = None,
         graphiti_host: str | None = None,
         graphiti_port: int | None = None,
+        embedding_fn: Callable[[str], np.ndarray] | None = None,
     ):
         """
         Initialize vessels integration.
@@ -50,6 +53,8 @@ class VesselsIntegration:
             use_graphiti: Force Graphiti on/off (default: auto-detect)
             graphiti_host: FalkorDB host for Graphiti
             graphiti_port: FalkorDB port for Graphiti
+            embedding_fn: Embedding function for local memory; pass the
+                          theatre's EmbeddingService to share its cache
         """
         # Determine whether to use Graphiti
         if use_graphiti is None:
@@ -58,6 +63,7 @@ class VesselsIntegration:
 
         self._use_graphiti = use_graphiti
         self._graphiti_initialized = False
+        self._embedding_fn = embedding_fn
 
         # Initialize Graphiti if enabled
         if use_graphiti:
@@ -71,7 +77,7 @@ class VesselsIntegration:
         else:
             # Fallback to local semantic memory
             self.graphiti_memory = None
-            self.semantic_memory = SemanticMemory(max_memories=max_memories)
+            self.semantic_memory = SemanticMemory(max_memories=max_memories, embedding_fn=embedding_fn)
             self.memory_store = MemoryStore(self.semantic_memory, storage_dir=memory_dir)
             logger.info("Using local SemanticMemory (fallback mode)")
 
@@ -125,7 +131,7 @@ class VesselsIntegration:
                 logger.warning("Falling back to local semantic memory")
                 self._use_graphiti = False
                 self.graphiti_memory = None
-                self.semantic_memory = SemanticMemory(max_memories=10000)
+                self.semantic_memory = SemanticMemory(max_memories=10000, embedding_fn=self._embedding_fn)
                 self.memory_store = MemoryStore(self.semantic_memory)
 
         # Load stored memories (fallback mode only)
@@ -145,7 +151,7 @@ class VesselsIntegration:
         """Shutdown all systems."""
         # Save memories or close Graphiti
         if self.memory_store:
-            self.memory_store.save_to_file()
+            self.memory_store.save_snapshot()
         if self.graphiti_memory and self._graphiti_initialized:
             try:
                 self._run_async(self.graphiti_memory.close())
@@ -6,6 +6,7 @@ inspired by Vessels3 memory tools.
 """
 
 import hashlib
+import heapq
 import logging
 import threading
 import uuid
@@ -15,6 +16,8 @@ from typing import Any, Callable
 
 import numpy as np
 
+from src.vectors import VectorIndex, embed_texts
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,6 +65,7 @@ class SemanticMemory:
         embedding_fn: Callable[[str], np.ndarray] | None = None,
         embedding_dim: int = 384,
         max_memories: int = 10000,
+        vector_index: VectorIndex | None = None,
     ):
         """
         Initialize semantic memory.
@@ -71,16 +75,21 @@ class SemanticMemory:
                          If None, uses simple hash-based pseudo-embeddings.
             embedding_dim: Dimension of embedding vectors
             max_memories: Maximum number of memories to store
+            vector_index: Optional approximate index (e.g. IVFIndex) that
+                         picks candidates for search; None scans every memory
         """
         self._memories: dict[str, MemoryEntry] = {}
-        self._embeddings: np.ndarray | None = None
-        self._id_to_index: dict[str, int] = {}
-        self._index_to_id: dict[int, str] = {}
         self._lock = threading.RLock()
         self._embedding_fn = embedding_fn or self._default_embedding
         self._embedding_dim = embedding_dim
         self._max_memories = max_memories
         self._dirty = False
+        # Change journal since the last checkpoint()/pop_changes(), for
+        # incremental persistence: ids written (in order) and ids removed
+        self._changed: dict[str, None] = {}
+        self._removed: set[str] = set()
+        self._vector_index = vector_index
+        self._reset_index()
 
     def _default_embedding(self, text: str) -> np.ndarray:
         """Generate a simple hash-based pseudo-embedding."""
@@ -128,7 +137,7 @@ class SemanticMemory:
             )
 
             self._memories[memory_id] = entry
-            self._rebuild_index()
+            self._index_add([entry])
             self._dirty = True
 
             # Prune if over limit
@@ -138,6 +147,44 @@ class SemanticMemory:
             logger.debug(f"Saved memory {memory_id}: {content[:50]}...")
             return memory_id
 
+    def save_many(self, items: list[dict]) -> list[str]:
+        """
+        Save many memories at once.
+
+        Embeddings are written into the index in one block and the memory
+        limit is enforced once at the end, so bulk ingestion is linear.
+
+        Args:
+            items: Dicts with "content" and optional "metadata",
+                   "agent_id" and "tags", as accepted by save()
+
+        Returns:
+            IDs of the created memories, in order
+        """
+        with self._lock:
+            embeddings = embed_texts(self._embedding_fn, [item["content"] for item in items])
+            entries = [
+                MemoryEntry(
+                    id=f"mem_{uuid.uuid4().hex[:12]}",
+                    content=item["content"],
+                    embedding=embedding,
+                    metadata=item.get("metadata") or {},
+                    agent_id=item.get("agent_id"),
+                    tags=item.get("tags") or [],
+                )
+                for item, embedding in zip(items, embeddings)
+            ]
+            for entry in entries:
+                self._memories[entry.id] = entry
+            self._index_add(entries)
+            self._dirty = True
+
+            if len(self._memories) > self._max_memories:
+                self._prune_oldest()
+
+            logger.debug(f"Saved {len(entries)} memories")
+            return [entry.id for entry in entries]
+
     def load(
         self,
         query: str,
@@ -161,40 +208,136 @@ class SemanticMemory:
         Returns:
             List of matching MemoryEntry objects
         """
-        with self._lock:
-            if not self._memories:
-                return []
+        return self.load_many(
+            [query],
+            threshold=threshold,
+            limit=limit,
+            filter_fn=filter_fn,
+            tags=tags,
+            agent_id=agent_id,
+        )[0]
+
+    def load_many(
+        self,
+        queries: list[str],
+        threshold: float = 0.5,
+        limit: int = 10,
+        filter_fn: Callable[[MemoryEntry], bool] | None = None,
+        tags: list[str] | None = None,
+        agent_id: str | None = None,
+    ) -> list[list[MemoryEntry]]:
+        """
+        Load memories for several queries with one matrix product.
 
-            query_embedding = self._embedding_fn(query)
-            results = []
+        Each result list is what load() would return for that query:
+        entries at or above threshold, most similar first, ties in
+        insertion order.
 
-            for memory_id, entry in self._memories.items():
-                # Apply filters
-                if agent_id and entry.agent_id != agent_id:
-                    continue
-                if tags and not any(t in entry.tags for t in tags):
-                    continue
-                if filter_fn and not filter_fn(entry):
-                    continue
+        Args:
+            queries: Search query texts
+            threshold: Minimum similarity threshold (0-1)
+            limit: Maximum results per query
+            filter_fn: Optional filter function for metadata
+            tags: Optional tags to filter by
+            agent_id: Optional agent ID to filter by
 
-                # Calculate similarity
-                if entry.embedding is not None:
-                    similarity = self._cosine_similarity(query_embedding, entry.embedding)
-                    if similarity >= threshold:
-                        results.append((similarity, entry))
+        Returns:
+            One list of matching MemoryEntry objects per query
+        """
+        with self._lock:
+            if not self._memories or not queries:
+                return [[] for _ in queries]
 
-            # Sort by similarity descending
-            results.sort(key=lambda x: x[0], reverse=True)
+            if len(self._free_slots) > self._size // 2:
+                self._compact_index()
 
-            # Update access tracking and return
-            output = []
-            for similarity, entry in results[:limit]:
-                entry.last_accessed = datetime.utcnow()
-                entry.access_count += 1
-                output.append(entry)
+            candidates = self._live[: self._size]
+            if agent_id:
+                candidates = candidates & self._agent_mask(agent_id)
+            if tags:
+                candidates = candidates & np.logical_or.reduce([self._tag_mask(t) for t in tags])
+
+            query_matrix = np.vstack(embed_texts(self._embedding_fn, queries)).astype(np.float64)
+            if self._vector_index is None:
+                similarities = self._similarity_matrix(query_matrix)
 
+            output = []
+            for i, query_vector in enumerate(query_matrix):
+                if self._vector_index is None:
+                    rows = np.flatnonzero(candidates & (similarities[i] >= threshold))
+                    row_similarities = similarities[i][rows]
+                else:
+                    rows = self._vector_index.candidates(query_vector)
+                    rows = np.arange(self._size) if rows is None else np.sort(rows)
+                    rows = rows[candidates[rows]]
+                    row_similarities = self._similarity_matrix(query_vector[None, :], rows)[0]
+                    above = row_similarities >= threshold
+                    rows, row_similarities = rows[above], row_similarities[above]
+                if filter_fn:
+                    keep = [filter_fn(self._memories[self._slot_ids[r]]) for r in rows.tolist()]
+                    keep = np.asarray(keep, dtype=bool)
+                    rows, row_similarities = rows[keep], row_similarities[keep]
+                output.append(self._top_k(rows, row_similarities, limit))
             return output
 
+    def _similarity_matrix(self, queries: np.ndarray, rows: np.ndarray | None = None) -> np.ndarray:
+        """Cosine similarity of each query row against indexed memories (all, or `rows`)."""
+        norms = np.linalg.norm(queries, axis=1)
+        zero = norms == 0
+        unit = queries / np.where(zero, 1.0, norms)[:, None]
+        embeddings = self._embeddings[: self._size] if rows is None else self._embeddings[rows]
+        with np.errstate(invalid="ignore", over="ignore"):
+            similarities = unit @ embeddings.T
+        # A zero-length vector has similarity 0 with everything
+        similarities[zero] = 0.0
+        return similarities
+
+    def _top_k(self, rows: np.ndarray, similarities: np.ndarray, limit: int) -> list[MemoryEntry]:
+        """Best `limit` rows by similarity (ties by insertion order), with access tracking."""
+        if limit <= 0 or len(rows) == 0:
+            return []
+        # BLAS may round identical rows differently depending on their
+        # position; rank on rounded values so equal embeddings still tie
+        similarities = np.round(similarities, 12)
+        if len(rows) > limit:
+            # Keep everything tied with the k-th best so ties resolve by insertion order below
+            kth = -np.partition(-similarities, limit - 1)[limit - 1]
+            keep = similarities >= kth
+            rows, similarities = rows[keep], similarities[keep]
+        order = np.lexsort((self._sequence[rows], -similarities))[:limit]
+
+        output = []
+        now = datetime.utcnow()
+        for i in rows[order].tolist():
+            entry = self._memories[self._slot_ids[i]]
+            entry.last_accessed = now
+            entry.access_count += 1
+            self._changed[entry.id] = None
+            output.append(entry)
+        return output
+
+    def _agent_mask(self, agent_id: str) -> np.ndarray:
+        """Boolean slot mask of memories attributed to agent_id."""
+        mask = self._agent_masks.get(agent_id)
+        if mask is None:
+            mask = self._build_mask(lambda entry: entry.agent_id == agent_id)
+            self._agent_masks[agent_id] = mask
+        return mask[: self._size]
+
+    def _tag_mask(self, tag: str) -> np.ndarray:
+        """Boolean slot mask of memories carrying tag."""
+        mask = self._tag_masks.get(tag)
+        if mask is None:
+            mask = self._build_mask(lambda entry: tag in entry.tags)
+            self._tag_masks[tag] = mask
+        return mask[: self._size]
+
+    def _build_mask(self, predicate: Callable[[MemoryEntry], bool]) -> np.ndarray:
+        mask = np.zeros(len(self._slot_ids), dtype=bool)
+        for memory_id, slot in self._id_to_index.items():
+            mask[slot] = predicate(self._memories[memory_id])
+        return mask
+
     def delete(self, memory_ids: list[str] | str) -> int:
         """
         Delete specific memories by ID.
@@ -213,10 +356,10 @@ class SemanticMemory:
             for memory_id in memory_ids:
                 if memory_id in self._memories:
                     del self._memories[memory_id]
+                    self._index_remove(memory_id)
                     deleted += 1
 
             if deleted > 0:
-                self._rebuild_index()
                 self._dirty = True
 
             logger.debug(f"Deleted {deleted} memories")
@@ -279,6 +422,7 @@ class SemanticMemory:
         with self._lock:
             if memory_id in self._memories:
                 self._memories[memory_id].metadata.update(metadata)
+                self._changed[memory_id] = None
                 self._dirty = True
                 return True
             return False
@@ -289,6 +433,10 @@ class SemanticMemory:
             if memory_id in self._memories:
                 entry = self._memories[memory_id]
                 entry.tags = list(set(entry.tags + tags))
+                slot = self._id_to_index[memory_id]
+                for tag, mask in self._tag_masks.items():
+                    mask[slot] = tag in entry.tags
+                self._changed[memory_id] = None
                 self._dirty = True
                 return True
             return False
@@ -375,13 +523,14 @@ class SemanticMemory:
                 for entry in cluster:
                     if entry.id in self._memories:
                         del self._memories[entry.id]
+                        self._index_remove(entry.id)
                         consolidated += 1
 
                 self._memories[merged.id] = merged
+                self._index_add([merged])
                 consolidated -= 1  # We added one back
 
             if consolidated > 0:
-                self._rebuild_index()
                 self._dirty = True
 
             return consolidated
@@ -414,46 +563,220 @@ class SemanticMemory:
             return 0.0
         return float(dot / (norm_a * norm_b))
 
-    def _rebuild_index(self) -> None:
-        """Rebuild the embedding index."""
-        self._id_to_index = {}
-        self._index_to_id = {}
+    def _reset_index(self) -> None:
+        """
+        Empty the embedding index.
+
+        The index is a pre-allocated buffer of slots. Each memory owns one
+        slot, holding its unit-normalised embedding (zeros if it has none).
+        Deleted slots go on a free list and are reused by later saves; when
+        more than half the used slots are free, the next search compacts
+        the buffer. _sequence records insertion order, which breaks
+        similarity ties regardless of slot position.
+        """
+        self._embeddings: np.ndarray | None = None
+        self._live = np.zeros(0, dtype=bool)
+        self._sequence = np.zeros(0, dtype=np.int64)
+        self._slot_ids: list[str | None] = []
+        self._id_to_index: dict[str, int] = {}
+        self._free_slots: list[int] = []
+        self._size = 0
+        self._next_sequence = 0
+        self._agent_masks: dict[str, np.ndarray] = {}
+        self._tag_masks: dict[str, np.ndarray] = {}
+        if self._vector_index is not None:
+            self._vector_index.clear()
+
+    def _index_add(self, entries: list[MemoryEntry], embeddings: np.ndarray | None = None) -> None:
+        """
+        Write entries into the index, reusing the slot of any existing id.
 
-        if not self._memories:
-            self._embeddings = None
+        Args:
+            entries: Entries already stored in self._memories
+            embeddings: Optional pre-stacked embeddings of the entries that
+                        have one, in order (saves re-stacking them)
+        """
+        if not entries:
+            return
+        self._changed.update(dict.fromkeys(entry.id for entry in entries))
+
+        new_ids = list(dict.fromkeys(e.id for e in entries if e.id not in self._id_to_index))
+        reused = min(len(new_ids), len(self._free_slots))
+        self._reserve(len(new_ids) - reused)
+
+        # Freed slots first, then fresh ones past the end
+        fresh = [self._free_slots.pop() for _ in range(reused)]
+        fresh.extend(range(self._size, self._size + len(new_ids) - reused))
+        self._size += len(new_ids) - reused
+        for memory_id, slot in zip(new_ids, fresh):
+            self._id_to_index[memory_id] = slot
+            self._slot_ids[slot] = memory_id
+        self._sequence[fresh] = np.arange(self._next_sequence, self._next_sequence + len(fresh))
+        self._next_sequence += len(fresh)
+
+        slots = np.fromiter(
+            (self._id_to_index[entry.id] for entry in entries), dtype=np.int64, count=len(entries)
+        )
+        live = np.array([entry.embedding is not None for entry in entries], dtype=bool)
+        self._embeddings[slots[~live]] = 0.0
+        if live.any():
+            with np.errstate(invalid="ignore", over="ignore"):
+                if embeddings is None:
+                    embeddings = np.vstack(
+                        [entry.embedding for entry in entries if entry.embedding is not None]
+                    )
+                embeddings = np.asarray(embeddings, dtype=np.float64)
+                norms = np.linalg.norm(embeddings, axis=1)
+                self._embeddings[slots[live]] = embeddings / np.where(norms == 0, 1.0, norms)[:, None]
+        self._live[slots] = live
+        if self._vector_index is not None:
+            self._vector_index.remove(slots[~live])
+            self._vector_index.add(slots[live], self._embeddings[slots[live]])
+
+        for agent_id, mask in self._agent_masks.items():
+            mask[slots] = [entry.agent_id == agent_id for entry in entries]
+        for tag, mask in self._tag_masks.items():
+            mask[slots] = [tag in entry.tags for entry in entries]
+
+    def _index_remove(self, memory_id: str) -> None:
+        """Release a memory's slot to the free list."""
+        self._changed.pop(memory_id, None)
+        self._removed.add(memory_id)
+        slot = self._id_to_index.pop(memory_id, None)
+        if slot is None:
+            return
+        self._slot_ids[slot] = None
+        self._live[slot] = False
+        self._embeddings[slot] = 0.0
+        if self._vector_index is not None:
+            self._vector_index.remove([slot])
+        for mask in (*self._agent_masks.values(), *self._tag_masks.values()):
+            mask[slot] = False
+        self._free_slots.append(slot)
+
+    def _reserve(self, extra: int) -> None:
+        """Grow the buffer so `extra` more slots fit past self._size."""
+        needed = self._size + extra
+        capacity = len(self._slot_ids)
+        if self._embeddings is not None and needed <= capacity:
             return
 
-        embeddings_list = []
-        for idx, (memory_id, entry) in enumerate(self._memories.items()):
-            self._id_to_index[memory_id] = idx
-            self._index_to_id[idx] = memory_id
-            if entry.embedding is not None:
-                embeddings_list.append(entry.embedding)
+        capacity = max(needed, 2 * capacity, 64)
+        dim = self._embeddings.shape[1] if self._embeddings is not None else None
+        if dim is None:
+            sample = next(
+                (e.embedding for e in self._memories.values() if e.embedding is not None), None
+            )
+            dim = len(sample) if sample is not None else self._embedding_dim
 
-        if embeddings_list:
-            self._embeddings = np.vstack(embeddings_list)
-        else:
-            self._embeddings = None
+        def grow(array: np.ndarray) -> np.ndarray:
+            grown = np.zeros((capacity, *array.shape[1:]), dtype=array.dtype)
+            grown[: len(array)] = array
+            return grown
+
+        self._embeddings = grow(
+            self._embeddings if self._embeddings is not None else np.zeros((0, dim))
+        )
+        self._live = grow(self._live)
+        self._sequence = grow(self._sequence)
+        for masks in (self._agent_masks, self._tag_masks):
+            for key, mask in masks.items():
+                masks[key] = grow(mask)
+        self._slot_ids.extend([None] * (capacity - len(self._slot_ids)))
+
+    def _compact_index(self) -> None:
+        """Move occupied slots to the front, in insertion order."""
+        occupied = np.asarray(sorted(self._id_to_index.values()), dtype=np.int64)
+        order = occupied[np.argsort(self._sequence[occupied], kind="stable")]
+        size = len(order)
+
+        def pack(array: np.ndarray) -> np.ndarray:
+            packed = np.zeros_like(array)
+            packed[:size] = array[order]
+            return packed
+
+        self._embeddings = pack(self._embeddings)
+        self._live = pack(self._live)
+        self._sequence = pack(self._sequence)
+        for masks in (self._agent_masks, self._tag_masks):
+            for key, mask in masks.items():
+                masks[key] = pack(mask)
+
+        ids = [self._slot_ids[i] for i in order.tolist()]
+        self._slot_ids = ids + [None] * (len(self._slot_ids) - size)
+        self._id_to_index = {memory_id: slot for slot, memory_id in enumerate(ids)}
+        self._free_slots = []
+        self._size = size
+        if self._vector_index is not None:
+            self._vector_index.clear()
+            live = np.flatnonzero(self._live[:size])
+            self._vector_index.add(live, self._embeddings[live])
 
     def _prune_oldest(self) -> None:
         """Remove oldest, least accessed memories to stay under limit."""
         if len(self._memories) <= self._max_memories:
             return
 
-        # Sort by (access_count, last_accessed) ascending
-        sorted_entries = sorted(
+        # Lowest (access_count, last_accessed) first
+        to_remove = len(self._memories) - self._max_memories
+        oldest = heapq.nsmallest(
+            to_remove,
             self._memories.items(),
             key=lambda x: (x[1].access_count, x[1].last_accessed),
         )
 
         # Remove excess
-        to_remove = len(self._memories) - self._max_memories
-        for memory_id, _ in sorted_entries[:to_remove]:
+        for memory_id, _ in oldest:
             del self._memories[memory_id]
+            self._index_remove(memory_id)
 
-        self._rebuild_index()
         logger.debug(f"Pruned {to_remove} old memories")
 
+    def restore(self, entries: list[MemoryEntry], embeddings: np.ndarray | None = None) -> int:
+        """
+        Insert previously persisted entries as-is, without re-embedding.
+
+        Restored entries are not recorded as changes.
+
+        Args:
+            entries: Entries with their embeddings already set
+            embeddings: Optional pre-stacked embeddings of the entries that
+                        have one, in order
+
+        Returns:
+            Number of entries restored
+        """
+        with self._lock:
+            for entry in entries:
+                self._memories[entry.id] = entry
+            self._index_add(entries, embeddings)
+            for entry in entries:
+                self._changed.pop(entry.id, None)
+            return len(entries)
+
+    def checkpoint(self) -> list[MemoryEntry]:
+        """All entries in insertion order; clears the change journal."""
+        with self._lock:
+            self._changed = {}
+            self._removed = set()
+            return list(self._memories.values())
+
+    def pop_changes(self) -> tuple[list[MemoryEntry], list[str]]:
+        """
+        Changes since the last checkpoint() or pop_changes().
+
+        Returns:
+            (written, removed): entries added or modified, in the order they
+            were first written, and ids removed. An id in both was removed
+            and then re-added, so apply removals first.
+        """
+        with self._lock:
+            written = [self._memories[memory_id] for memory_id in self._changed]
+            removed = sorted(self._removed)
+            self._changed = {}
+            self._removed = set()
+            return written, removed
+
     def export(self) -> list[dict]:
         """Export all memories as dictionaries."""
         with self._lock:
@@ -463,18 +786,21 @@ class SemanticMemory:
         """Import memories from dictionaries."""
         with self._lock:
             imported = 0
-            for item in data:
+            entries = []
+            embeddings = embed_texts(self._embedding_fn, [item["content"] for item in data])
+            for item, embedding in zip(data, embeddings):
                 entry = MemoryEntry(
                     id=item.get("id", f"mem_{uuid.uuid4().hex[:12]}"),
                     content=item["content"],
-                    embedding=self._embedding_fn(item["content"]),
+                    embedding=embedding,
                     metadata=item.get("metadata", {}),
                     agent_id=item.get("agent_id"),
                     tags=item.get("tags", []),
                 )
                 self._memories[entry.id] = entry
+                entries.append(entry)
                 imported += 1
 
-            self._rebuild_index()
+            self._index_add(entries)
             self._dirty = True
             return imported
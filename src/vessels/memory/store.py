@@ -2,19 +2,114 @@
 Memory Store for persistent storage.
 
 Provides file-based persistence for the semantic memory system.
+
+Besides JSON exports, the store writes binary snapshots that keep
+embeddings, so loading never re-embeds. A snapshot is two files:
+
+- snapshot_<stamp>.embeddings.npy: the embedding matrix, memory-mapped
+  on load
+- snapshot_<stamp>.meta.npz: one column per MemoryEntry field
+
+Auto-save appends delta segments (snapshot_<stamp>.delta_NNNN.npz) with
+the entries written and ids removed since the previous save, and folds
+them into a new snapshot every `max_deltas` segments.
 """
 
 import json
 import logging
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from .semantic import SemanticMemory, MemoryEntry
 
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_VERSION = 1
+DELTA_PATTERN = re.compile(r"\.delta_(\d+)\.npz$")
+
+
+def _json_column(values: list) -> np.ndarray:
+    return np.frombuffer(json.dumps(values).encode(), dtype=np.uint8)
+
+
+def _read_json_column(column: np.ndarray) -> list:
+    return json.loads(column.tobytes().decode())
+
+
+def _encode_entries(entries: list[MemoryEntry]) -> dict[str, np.ndarray]:
+    """Columnar arrays for entries, without embeddings."""
+    return {
+        "version": np.array(SNAPSHOT_VERSION),
+        "ids": _json_column([e.id for e in entries]),
+        "content": _json_column([e.content for e in entries]),
+        "agent_id": _json_column([e.agent_id for e in entries]),
+        "tags": _json_column([e.tags for e in entries]),
+        "metadata": _json_column([e.metadata for e in entries]),
+        "created_at": np.array([e.created_at for e in entries], dtype="datetime64[us]"),
+        "last_accessed": np.array([e.last_accessed for e in entries], dtype="datetime64[us]"),
+        "access_count": np.array([e.access_count for e in entries], dtype=np.int64),
+        "has_embedding": np.array([e.embedding is not None for e in entries], dtype=bool),
+    }
+
+
+def _stack_embeddings(entries: list[MemoryEntry]) -> np.ndarray:
+    """(n, dim) embedding matrix; rows of entries without one are zero."""
+    sample = next((e.embedding for e in entries if e.embedding is not None), None)
+    if sample is None:
+        return np.zeros((len(entries), 0), dtype=np.float32)
+    matrix = np.zeros((len(entries), len(sample)), dtype=sample.dtype)
+    for i, entry in enumerate(entries):
+        if entry.embedding is not None:
+            matrix[i] = entry.embedding
+    return matrix
+
+
+def _decode_entries(columns: dict[str, np.ndarray], embeddings: np.ndarray) -> list[MemoryEntry]:
+    """Rebuild entries; their embeddings are views into `embeddings`."""
+    rows = [row if has else None for row, has in zip(embeddings, columns["has_embedding"].tolist())]
+    return [
+        MemoryEntry(
+            id=memory_id,
+            content=content,
+            embedding=embedding,
+            metadata=metadata,
+            created_at=created_at,
+            last_accessed=last_accessed,
+            access_count=access_count,
+            agent_id=agent_id,
+            tags=tags,
+        )
+        for memory_id, content, embedding, metadata, created_at, last_accessed, access_count, agent_id, tags
+        in zip(
+            _read_json_column(columns["ids"]),
+            _read_json_column(columns["content"]),
+            rows,
+            _read_json_column(columns["metadata"]),
+            columns["created_at"].astype(object).tolist(),
+            columns["last_accessed"].astype(object).tolist(),
+            columns["access_count"].tolist(),
+            _read_json_column(columns["agent_id"]),
+            _read_json_column(columns["tags"]),
+        )
+    ]
+
+
+def _write_npz(path: Path, arrays: dict[str, np.ndarray]) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def _read_npz(path: Path) -> dict[str, np.ndarray]:
+    with np.load(path, allow_pickle=False) as data:
+        return {name: data[name] for name in data.files}
+
 
 class MemoryStore:
     """
@@ -30,6 +125,7 @@ class MemoryStore:
         storage_dir: str | Path = "data/memories",
         auto_save: bool = True,
         save_interval: int = 100,
+        max_deltas: int = 20,
     ):
         """
         Initialize memory store.
@@ -39,12 +135,17 @@ class MemoryStore:
             storage_dir: Directory for memory files
             auto_save: Whether to auto-save periodically
             save_interval: Operations between auto-saves
+            max_deltas: Delta segments appended before auto-save writes
+                        a fresh snapshot
         """
         self.memory = memory
         self.storage_dir = Path(storage_dir)
         self.auto_save = auto_save
         self.save_interval = save_interval
+        self.max_deltas = max_deltas
         self._operation_count = 0
+        self._snapshot: str | None = None  # stem deltas are appended to
+        self._delta_count = 0
 
         # Ensure storage directory exists
         self.storage_dir.mkdir(parents=True, exist_ok=True)
@@ -109,11 +210,15 @@ class MemoryStore:
 
     def load_latest(self) -> int:
         """
-        Load the most recent memory file.
+        Load the most recent binary snapshot, or else the most recent JSON file.
 
         Returns:
             Number of memories loaded
         """
+        snapshots = self._list_snapshots()
+        if snapshots:
+            return self.load_snapshot(snapshots[-1])
+
         files = sorted(self.storage_dir.glob("memories_*.json"), reverse=True)
         if not files:
             logger.info("No memory files found")
@@ -121,6 +226,110 @@ class MemoryStore:
 
         return self.load_from_file(files[0])
 
+    def save_snapshot(self) -> str:
+        """
+        Write a binary snapshot of all memories, including embeddings.
+
+        Later auto-saves append delta segments to this snapshot.
+
+        Returns:
+            Snapshot stem (path without the .meta.npz/.embeddings.npy suffix)
+        """
+        entries = self.memory.checkpoint()
+        stem = self.storage_dir / f"snapshot_{datetime.utcnow().strftime('%Y%m%d_%H%M%S_%f')}"
+
+        embeddings_path = Path(f"{stem}.embeddings.npy")
+        tmp_path = embeddings_path.with_name(embeddings_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, _stack_embeddings(entries))
+        os.replace(tmp_path, embeddings_path)
+        # The meta file is written last; a snapshot without one is incomplete
+        _write_npz(Path(f"{stem}.meta.npz"), _encode_entries(entries))
+
+        self._snapshot = str(stem)
+        self._delta_count = 0
+        logger.info(f"Saved snapshot of {len(entries)} memories to {stem}")
+        return str(stem)
+
+    def save_delta(self) -> str | None:
+        """
+        Append memories written or removed since the last save as a delta segment.
+
+        Writes a full snapshot instead if there is none to append to yet.
+
+        Returns:
+            Path of the segment (or snapshot stem), None if nothing changed
+        """
+        if self._snapshot is None:
+            return self.save_snapshot()
+
+        written, removed = self.memory.pop_changes()
+        if not written and not removed:
+            return None
+
+        self._delta_count += 1
+        path = Path(f"{self._snapshot}.delta_{self._delta_count:04d}.npz")
+        _write_npz(path, {
+            **_encode_entries(written),
+            "embeddings": _stack_embeddings(written),
+            "removed": _json_column(removed),
+        })
+        logger.debug(f"Appended {len(written)} written, {len(removed)} removed memories to {path}")
+        return str(path)
+
+    def load_snapshot(self, stem: str | Path) -> int:
+        """
+        Load a binary snapshot and replay its delta segments.
+
+        Embeddings are memory-mapped rather than read up front or recomputed.
+
+        Args:
+            stem: Snapshot stem, as returned by save_snapshot
+
+        Returns:
+            Number of memories loaded
+        """
+        stem = str(stem)
+        # Plain ndarray over the mapping: row views without memmap overhead
+        embeddings = np.asarray(np.load(f"{stem}.embeddings.npy", mmap_mode="r"))
+        entries = {e.id: e for e in _decode_entries(_read_npz(Path(f"{stem}.meta.npz")), embeddings)}
+
+        deltas = self._list_deltas(stem)
+        for path in deltas:
+            columns = _read_npz(path)
+            for memory_id in _read_json_column(columns["removed"]):
+                entries.pop(memory_id, None)
+            for entry in _decode_entries(columns, columns["embeddings"]):
+                entries[entry.id] = entry
+
+        count = self.memory.restore(
+            list(entries.values()),
+            # Hand the mapped matrix straight to the index when nothing was replayed
+            embeddings=None if deltas or not all(e.embedding is not None for e in entries.values())
+            else embeddings,
+        )
+        self._snapshot = stem
+        self._delta_count = len(deltas)
+        logger.info(f"Loaded {count} memories from {stem} ({len(deltas)} deltas)")
+        return count
+
+    def _list_snapshots(self) -> list[str]:
+        """Stems of complete snapshots, oldest first."""
+        return sorted(
+            str(path)[: -len(".meta.npz")]
+            for path in self.storage_dir.glob("snapshot_*.meta.npz")
+        )
+
+    def _list_deltas(self, stem: str) -> list[Path]:
+        """Delta segments of a snapshot, in order."""
+        name = Path(stem).name
+        found = []
+        for path in self.storage_dir.glob(f"{name}.delta_*.npz"):
+            match = DELTA_PATTERN.search(path.name)
+            if match:
+                found.append((int(match.group(1)), path))
+        return [path for _, path in sorted(found)]
+
     def _maybe_auto_save(self) -> None:
         """Trigger auto-save if enabled and interval reached."""
         if not self.auto_save:
@@ -128,7 +337,10 @@ class MemoryStore:
 
         self._operation_count += 1
         if self._operation_count >= self.save_interval:
-            self.save_to_file()
+            if self._delta_count >= self.max_deltas:
+                self.save_snapshot()
+            else:
+                self.save_delta()
             self._operation_count = 0
 
     def save_memory(
@@ -198,12 +410,16 @@ class MemoryStore:
         stats = self.memory.get_stats()
         stats["storage_dir"] = str(self.storage_dir)
         stats["file_count"] = len(list(self.storage_dir.glob("memories_*.json")))
+        stats["snapshot_count"] = len(self._list_snapshots())
         return stats
 
     def cleanup_old_files(self, keep_count: int = 10) -> int:
         """
         Remove old memory files, keeping most recent.
 
+        JSON files and binary snapshots (with their deltas) are counted
+        separately.
+
         Args:
             keep_count: Number of recent files to keep
 
@@ -212,6 +428,14 @@ class MemoryStore:
         """
         files = sorted(self.storage_dir.glob("memories_*.json"), reverse=True)
         to_delete = files[keep_count:]
+        for stem in self._list_snapshots()[::-1][keep_count:]:
+            if stem == self._snapshot:
+                continue
+            to_delete.extend(self._list_deltas(stem))
+            to_delete.extend(
+                path for path in (Path(f"{stem}.embeddings.npy"), Path(f"{stem}.meta.npz"))
+                if path.exists()
+            )
 
         for filepath in to_delete:
             filepath.unlink()
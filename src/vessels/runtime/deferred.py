@@ -5,11 +5,12 @@ Provides non-blocking initialization and task execution
 for heavy components.
 """
 
+import heapq
+import itertools
 import logging
-import queue
 import threading
 import uuid
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -54,7 +55,10 @@ class DeferredTask:
     started_at: datetime | None = None
     completed_at: datetime | None = None
     dependencies: list[str] = field(default_factory=list)  # Task IDs to wait for
+    cpu_bound: bool = False  # Run in the process pool when one is configured
+    ready_at: datetime | None = None  # When all dependencies were met
     future: Future | None = field(default=None, repr=False)
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
 
     def __lt__(self, other: "DeferredTask") -> bool:
         """Compare by priority (higher priority = earlier)."""
@@ -69,6 +73,13 @@ class DeferredTask:
             TaskStatus.CANCELLED,
         )
 
+    @property
+    def queue_wait_seconds(self) -> float | None:
+        """Get time spent ready but waiting for a worker."""
+        if self.ready_at and self.started_at:
+            return (self.started_at - self.ready_at).total_seconds()
+        return None
+
     @property
     def duration_seconds(self) -> float | None:
         """Get execution duration."""
@@ -88,6 +99,7 @@ class DeferredTask:
             "created_at": self.created_at.isoformat(),
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "queue_wait": self.queue_wait_seconds,
             "duration": self.duration_seconds,
             "dependencies": self.dependencies,
         }
@@ -103,12 +115,22 @@ class DeferredTaskManager:
     - Task dependencies
     - Progress tracking
     - Concurrent execution with thread pool
+    - Optional process pool for CPU-bound tasks
+
+    Dependencies are tracked with a reverse index (task -> dependents)
+    and a count of unmet dependencies per waiting task, so finishing a
+    task only touches its own dependents. Tasks whose dependencies are
+    met go into a ready heap ordered by priority, then submission order,
+    and are handed to the pool only when a worker is free, so priority
+    decides which ready task runs next. A failed or cancelled task
+    cancels everything that depends on it.
     """
 
     def __init__(
         self,
         max_workers: int = 4,
         auto_start: bool = True,
+        process_workers: int = 0,
     ):
         """
         Initialize deferred task manager.
@@ -116,37 +138,59 @@ class DeferredTaskManager:
         Args:
             max_workers: Maximum concurrent workers
             auto_start: Start processing automatically
+            process_workers: Worker processes for cpu_bound tasks
+                             (0 runs them on the thread pool)
         """
         self._tasks: dict[str, DeferredTask] = {}
-        self._queue: queue.PriorityQueue = queue.PriorityQueue()
         self._executor: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
         self._max_workers = max_workers
+        self._process_workers = process_workers
         self._running = False
         self._lock = threading.RLock()
+        self._all_done = threading.Condition(self._lock)
         self._callbacks: dict[str, list[Callable]] = {
             "on_complete": [],
             "on_error": [],
             "on_all_complete": [],
         }
 
+        # Dependency graph: dep_id -> waiting dependents, task_id -> unmet count
+        self._dependents: dict[str, list[str]] = {}
+        self._remaining: dict[str, int] = {}
+
+        # Ready heaps of (-priority, seq, task_id), one per pool (keyed by cpu_bound)
+        self._ready: dict[bool, list[tuple[int, int, str]]] = {False: [], True: []}
+        self._active: dict[bool, int] = {False: 0, True: 0}
+        self._seq = itertools.count()
+        self._incomplete = 0
+
         if auto_start:
             self.start()
 
     def start(self) -> None:
         """Start the task manager."""
-        if self._running:
-            return
-
-        self._running = True
-        self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        with self._lock:
+            if self._running:
+                return
+
+            self._running = True
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+            if self._process_workers > 0:
+                self._process_pool = ProcessPoolExecutor(max_workers=self._process_workers)
+            self._dispatch()
         logger.info(f"DeferredTaskManager started with {self._max_workers} workers")
 
     def stop(self, wait: bool = True) -> None:
         """Stop the task manager."""
-        self._running = False
-        if self._executor:
-            self._executor.shutdown(wait=wait)
-            self._executor = None
+        with self._lock:
+            self._running = False
+            executor, self._executor = self._executor, None
+            process_pool, self._process_pool = self._process_pool, None
+        if executor:
+            executor.shutdown(wait=wait)
+        if process_pool:
+            process_pool.shutdown(wait=wait)
         logger.info("DeferredTaskManager stopped")
 
     def submit(
@@ -156,6 +200,7 @@ class DeferredTaskManager:
         name: str = "",
         priority: TaskPriority = TaskPriority.NORMAL,
         dependencies: list[str] | None = None,
+        cpu_bound: bool = False,
         **kwargs,
     ) -> DeferredTask:
         """
@@ -167,6 +212,8 @@ class DeferredTaskManager:
             name: Task name
             priority: Execution priority
             dependencies: Task IDs to wait for
+            cpu_bound: Run in the process pool (func and arguments must be
+                       picklable); ignored without process_workers
             **kwargs: Keyword arguments
 
         Returns:
@@ -179,125 +226,197 @@ class DeferredTaskManager:
             kwargs=kwargs,
             priority=priority,
             dependencies=dependencies or [],
+            cpu_bound=cpu_bound,
         )
 
         with self._lock:
             self._tasks[task.id] = task
-
-        # Check dependencies
-        if self._can_execute(task):
-            self._schedule_task(task)
-        else:
-            logger.debug(f"Task {task.id} waiting for dependencies")
-
+            self._incomplete += 1
+
+            unmet = 0
+            failed_dep = None
+            for dep_id in dict.fromkeys(task.dependencies):
+                dep_task = self._tasks.get(dep_id)
+                if dep_task and dep_task.is_complete:
+                    if dep_task.status != TaskStatus.COMPLETED:
+                        failed_dep = dep_id
+                        break
+                    continue
+                self._dependents.setdefault(dep_id, []).append(task.id)
+                unmet += 1
+
+            if failed_dep:
+                all_done = self._finish(task, TaskStatus.CANCELLED, error=f"Dependency {failed_dep} failed")
+            elif unmet:
+                self._remaining[task.id] = unmet
+                all_done = False
+                logger.debug(f"Task {task.id} waiting for {unmet} dependencies")
+            else:
+                self._make_ready(task)
+                self._dispatch()
+                all_done = False
+
+        if all_done:
+            self._fire_all_complete()
         return task
 
-    def _can_execute(self, task: DeferredTask) -> bool:
-        """Check if task can execute (all dependencies complete)."""
-        for dep_id in task.dependencies:
-            dep_task = self._tasks.get(dep_id)
-            if not dep_task or not dep_task.is_complete:
-                return False
-            if dep_task.status == TaskStatus.FAILED:
-                # Dependency failed - cancel this task
-                task.status = TaskStatus.CANCELLED
-                task.error = f"Dependency {dep_id} failed"
-                return False
-        return True
+    def _make_ready(self, task: DeferredTask) -> None:
+        """Queue a task whose dependencies are met. Caller holds the lock."""
+        task.ready_at = datetime.utcnow()
+        pool = task.cpu_bound and self._process_workers > 0
+        heapq.heappush(self._ready[pool], (-task.priority.value, next(self._seq), task.id))
 
-    def _schedule_task(self, task: DeferredTask) -> None:
-        """Schedule a task for execution."""
-        if not self._executor or not self._running:
-            logger.warning("Task manager not running")
+    def _dispatch(self) -> None:
+        """Start ready tasks while workers are free. Caller holds the lock."""
+        if not self._running:
             return
-
-        if task.status != TaskStatus.PENDING:
-            return
-
-        task.future = self._executor.submit(self._execute_task, task)
+        limits = {False: self._max_workers, True: self._process_workers}
+        for pool, ready in self._ready.items():
+            while ready and self._active[pool] < limits[pool]:
+                _, _, task_id = heapq.heappop(ready)
+                task = self._tasks.get(task_id)
+                if not task or task.status != TaskStatus.PENDING:
+                    continue
+                self._active[pool] += 1
+                task.status = TaskStatus.RUNNING
+                task.started_at = datetime.utcnow()
+                if pool:
+                    task.future = self._process_pool.submit(task.func, *task.args, **task.kwargs)
+                    task.future.add_done_callback(
+                        lambda future, task=task: self._process_done(task, future)
+                    )
+                else:
+                    task.future = self._executor.submit(self._execute_task, task)
 
     def _execute_task(self, task: DeferredTask) -> Any:
-        """Execute a single task."""
-        task.status = TaskStatus.RUNNING
-        task.started_at = datetime.utcnow()
-
+        """Execute a single task on the thread pool."""
         try:
             result = task.func(*task.args, **task.kwargs)
-            task.result = result
-            task.status = TaskStatus.COMPLETED
-            task.completed_at = datetime.utcnow()
+        except Exception as e:
+            self._task_failed(task, e, pool=False)
+            raise
+        self._task_completed(task, result, pool=False)
+        return result
+
+    def _process_done(self, task: DeferredTask, future: Future) -> None:
+        """Record the outcome of a task run in the process pool."""
+        if future.cancelled():
+            return  # cancel() already released the worker
+        error = future.exception()
+        if error is not None:
+            self._task_failed(task, error, pool=True)
+        else:
+            self._task_completed(task, future.result(), pool=True)
 
+    def _task_completed(self, task: DeferredTask, result: Any, pool: bool) -> None:
+        with self._lock:
+            if task.is_complete:  # cancelled while running
+                all_done = False
+            else:
+                task.result = result
+                all_done = self._finish(task, TaskStatus.COMPLETED)
+            self._active[pool] -= 1
+            self._dispatch()
+
+        if task.status == TaskStatus.COMPLETED:
             logger.debug(f"Task {task.id} ({task.name}) completed")
-
-            # Fire callbacks
             for callback in self._callbacks["on_complete"]:
                 try:
                     callback(task)
                 except Exception as e:
                     logger.error(f"Callback error: {e}")
+        if all_done:
+            self._fire_all_complete()
 
-            # Check for dependent tasks
-            self._check_dependents(task.id)
-
-            return result
-
-        except Exception as e:
-            task.status = TaskStatus.FAILED
-            task.error = str(e)
-            task.completed_at = datetime.utcnow()
-
-            logger.error(f"Task {task.id} ({task.name}) failed: {e}")
-
+    def _task_failed(self, task: DeferredTask, error: BaseException, pool: bool) -> None:
+        with self._lock:
+            if task.is_complete:
+                all_done = False
+                failed = False
+            else:
+                all_done = self._finish(task, TaskStatus.FAILED, error=str(error))
+                failed = True
+            self._active[pool] -= 1
+            self._dispatch()
+
+        if failed:
+            logger.error(f"Task {task.id} ({task.name}) failed: {error}")
             for callback in self._callbacks["on_error"]:
                 try:
-                    callback(task, e)
+                    callback(task, error)
                 except Exception as cb_err:
                     logger.error(f"Error callback error: {cb_err}")
+        if all_done:
+            self._fire_all_complete()
 
-            raise
+    def _finish(self, task: DeferredTask, status: TaskStatus, error: str | None = None) -> bool:
+        """
+        Mark a task complete and release or cancel its dependents.
 
-    def _check_dependents(self, completed_task_id: str) -> None:
-        """Check and schedule tasks dependent on completed task."""
-        with self._lock:
-            for task in self._tasks.values():
-                if (
-                    task.status == TaskStatus.PENDING
-                    and completed_task_id in task.dependencies
-                ):
-                    if self._can_execute(task):
-                        self._schedule_task(task)
-
-        # Check if all tasks complete
-        if self._all_complete():
-            for callback in self._callbacks["on_all_complete"]:
-                try:
-                    callback()
-                except Exception as e:
-                    logger.error(f"All complete callback error: {e}")
+        Caller holds the lock and calls _dispatch afterwards.
+
+        Returns:
+            True if this left no incomplete tasks
+        """
+        stack = [(task, status, error)]
+        while stack:
+            task, status, error = stack.pop()
+            task.status = status
+            task.error = error
+            task.completed_at = datetime.utcnow()
+            self._remaining.pop(task.id, None)
+            self._incomplete -= 1
+            task.done.set()
+
+            for dep_id in self._dependents.pop(task.id, []):
+                dependent = self._tasks.get(dep_id)
+                if not dependent or dependent.status != TaskStatus.PENDING:
+                    continue
+                if status != TaskStatus.COMPLETED:
+                    stack.append((dependent, TaskStatus.CANCELLED, f"Dependency {task.id} failed"))
+                    continue
+                self._remaining[dep_id] -= 1
+                if self._remaining[dep_id] == 0:
+                    del self._remaining[dep_id]
+                    self._make_ready(dependent)
+
+        if self._incomplete == 0:
+            self._all_done.notify_all()
+            return True
+        return False
+
+    def _fire_all_complete(self) -> None:
+        for callback in self._callbacks["on_all_complete"]:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"All complete callback error: {e}")
 
     def _all_complete(self) -> bool:
         """Check if all tasks are complete."""
         with self._lock:
-            return all(task.is_complete for task in self._tasks.values())
+            return self._incomplete == 0
 
     def cancel(self, task_id: str) -> bool:
-        """Cancel a pending task."""
-        task = self._tasks.get(task_id)
-        if not task:
-            return False
+        """Cancel a pending task, and every task depending on it."""
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if not task or task.is_complete:
+                return False
 
-        if task.status == TaskStatus.PENDING:
-            task.status = TaskStatus.CANCELLED
-            task.completed_at = datetime.utcnow()
-            return True
+            if task.status == TaskStatus.RUNNING:
+                if not task.future or task.future.done():
+                    return False
+                if task.future.cancel():
+                    # Never started, so no completion will free its worker
+                    self._active[task.cpu_bound and self._process_workers > 0] -= 1
 
-        if task.future and not task.future.done():
-            task.future.cancel()
-            task.status = TaskStatus.CANCELLED
-            task.completed_at = datetime.utcnow()
-            return True
+            all_done = self._finish(task, TaskStatus.CANCELLED)
+            self._dispatch()
 
-        return False
+        if all_done:
+            self._fire_all_complete()
+        return True
 
     def get_task(self, task_id: str) -> DeferredTask | None:
         """Get a task by ID."""
@@ -318,12 +437,7 @@ class DeferredTaskManager:
         if not task:
             raise ValueError(f"Task not found: {task_id}")
 
-        if task.future:
-            try:
-                task.future.result(timeout=timeout)
-            except Exception:
-                pass  # Error captured in task
-
+        task.done.wait(timeout)
         return task
 
     def wait_all(self, timeout: float | None = None) -> bool:
@@ -336,18 +450,13 @@ class DeferredTaskManager:
         Returns:
             True if all completed successfully
         """
-        import time
-
-        start = time.time()
-
-        while not self._all_complete():
-            if timeout and time.time() - start > timeout:
+        with self._lock:
+            if not self._all_done.wait_for(lambda: self._incomplete == 0, timeout):
                 return False
-            time.sleep(0.1)
 
-        return all(
-            task.status == TaskStatus.COMPLETED for task in self._tasks.values()
-        )
+            return all(
+                task.status == TaskStatus.COMPLETED for task in self._tasks.values()
+            )
 
     def get_pending(self) -> list[DeferredTask]:
         """Get all pending tasks."""
@@ -400,11 +509,21 @@ class DeferredTaskManager:
                 if t.is_complete
             )
             completed = len(self.get_completed())
+            waits = [
+                t.queue_wait_seconds
+                for t in self._tasks.values()
+                if t.queue_wait_seconds is not None
+            ]
 
             return {
                 "total_tasks": len(self._tasks),
                 "by_status": status_counts,
                 "running": self._running,
                 "workers": self._max_workers,
+                "process_workers": self._process_workers,
+                "ready": sum(len(ready) for ready in self._ready.values()),
+                "waiting_on_dependencies": len(self._remaining),
                 "avg_duration": total_duration / completed if completed else 0,
+                "avg_queue_wait": sum(waits) / len(waits) if waits else 0,
+                "max_queue_wait": max(waits, default=0),
             }
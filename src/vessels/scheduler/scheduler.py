@@ -4,11 +4,15 @@ Task Scheduler implementation.
 Provides cron-based, datetime-based, and ad-hoc task scheduling.
 """
 
+import heapq
+import itertools
 import logging
 import re
 import threading
 import time
+from bisect import bisect_right
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Callable
 
 from .tasks import ScheduledTask, TaskType, TaskState
@@ -81,11 +85,30 @@ class CronParser:
             "weekday": cls.parse_field(parts[4], 0, 6),  # 0=Sunday
         }
 
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def compile(cls, expression: str) -> tuple[tuple[int, ...], ...]:
+        """
+        Parse a cron expression into sorted value tuples, cached by expression.
+
+        Returns:
+            (minutes, hours, days, months, weekdays)
+        """
+        parsed = cls.parse(expression)
+        return tuple(
+            tuple(sorted(parsed[name]))
+            for name in ("minute", "hour", "day", "month", "weekday")
+        )
+
     @classmethod
     def get_next_run(cls, expression: str, after: datetime | None = None) -> datetime:
         """
         Calculate the next run time for a cron expression.
 
+        Works field by field: a month, day or hour that cannot match is
+        skipped whole, and minutes and hours jump straight to the next
+        allowed value, so a call costs at most a few hundred steps.
+
         Args:
             expression: Cron expression
             after: Start time (default: now)
@@ -93,21 +116,43 @@ class CronParser:
         Returns:
             Next datetime matching the expression
         """
-        parsed = cls.parse(expression)
+        minutes, hours, days, months, weekdays = cls.compile(expression)
         current = (after or datetime.utcnow()) + timedelta(minutes=1)
         current = current.replace(second=0, microsecond=0)
+        limit = current + timedelta(minutes=525600)  # Max 1 year of minutes
+
+        while current < limit:
+            if current.month not in months:
+                i = bisect_right(months, current.month)
+                if i < len(months):
+                    current = current.replace(month=months[i], day=1, hour=0, minute=0)
+                else:
+                    current = current.replace(
+                        year=current.year + 1, month=months[0], day=1, hour=0, minute=0
+                    )
+                continue
+
+            if current.day not in days or current.weekday() not in weekdays:
+                current = current.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
 
-        # Search for next matching time (limit iterations)
-        for _ in range(525600):  # Max 1 year of minutes
-            if (
-                current.minute in parsed["minute"]
-                and current.hour in parsed["hour"]
-                and current.day in parsed["day"]
-                and current.month in parsed["month"]
-                and current.weekday() in parsed["weekday"]
-            ):
-                return current
-            current += timedelta(minutes=1)
+            if current.hour not in hours:
+                i = bisect_right(hours, current.hour)
+                if i < len(hours):
+                    current = current.replace(hour=hours[i], minute=0)
+                else:
+                    current = current.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+
+            if current.minute not in minutes:
+                i = bisect_right(minutes, current.minute)
+                if i < len(minutes):
+                    current = current.replace(minute=minutes[i])
+                else:
+                    current = current.replace(minute=0) + timedelta(hours=1)
+                continue
+
+            return current
 
         raise ValueError(f"Could not find next run time for: {expression}")
 
@@ -121,6 +166,13 @@ class TaskScheduler:
     - Automatic execution based on schedule
     - Task management (list, find, show, run, delete)
     - Wait for task completion
+
+    Pending runs are kept in a min-heap keyed on next_run. The loop
+    sleeps on a condition variable until the earliest run is due (or a
+    task is added), so due tasks start on time without scanning every
+    task. Heap entries are invalidated lazily: each task's latest entry
+    is tracked by sequence number and older ones are skipped. Change a
+    task's next_run through reschedule() so the heap sees it.
     """
 
     def __init__(
@@ -135,7 +187,9 @@ class TaskScheduler:
         Args:
             executor: Function to execute tasks
             auto_start: Start scheduler loop automatically
-            poll_interval: Seconds between schedule checks
+            poll_interval: Longest the loop sleeps between checks, and the
+                           delay before re-checking a due task that is
+                           paused or already running
         """
         self._tasks: dict[str, ScheduledTask] = {}
         self._executor = executor or self._default_executor
@@ -143,8 +197,14 @@ class TaskScheduler:
         self._running = False
         self._thread: threading.Thread | None = None
         self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
         self._func_registry: dict[str, Callable] = {}
 
+        # Run queue: (next_run, seq, task_id); a task's live entry is _queued[task_id]
+        self._queue: list[tuple[datetime, int, str]] = []
+        self._queued: dict[str, int] = {}
+        self._seq = itertools.count()
+
         if auto_start:
             self.start()
 
@@ -208,6 +268,7 @@ class TaskScheduler:
 
         with self._lock:
             self._tasks[task.id] = task
+            self._enqueue(task)
 
         logger.info(f"Created scheduled task {task.id}: {name} ({cron_expression})")
         return task
@@ -251,6 +312,7 @@ class TaskScheduler:
 
         with self._lock:
             self._tasks[task.id] = task
+            self._enqueue(task)
 
         logger.info(f"Created planned task {task.id}: {name} (at {run_at})")
         return task
@@ -322,10 +384,10 @@ class TaskScheduler:
 
             # Update next run for recurring tasks
             if task.is_recurring:
-                task.next_run = CronParser.get_next_run(
-                    task.cron_expression, task.last_run
-                )
                 task.state = TaskState.PENDING
+                self.reschedule(
+                    task_id, CronParser.get_next_run(task.cron_expression, task.last_run)
+                )
 
             logger.debug(f"Task {task_id} completed successfully")
             return result
@@ -340,10 +402,26 @@ class TaskScheduler:
         with self._lock:
             if task_id in self._tasks:
                 del self._tasks[task_id]
+                self._queued.pop(task_id, None)
                 logger.info(f"Deleted task {task_id}")
                 return True
             return False
 
+    def reschedule(self, task_id: str, next_run: datetime | None) -> None:
+        """
+        Set when a task next runs.
+
+        Args:
+            task_id: Task to reschedule
+            next_run: New run time, or None to unschedule
+        """
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if not task:
+                raise ValueError(f"Task not found: {task_id}")
+            task.next_run = next_run
+            self._enqueue(task)
+
     def get_task(self, task_id: str) -> ScheduledTask | None:
         """Get a task by ID."""
         return self._tasks.get(task_id)
@@ -371,19 +449,28 @@ class TaskScheduler:
         return tasks
 
     def get_due_tasks(self) -> list[ScheduledTask]:
-        """Get tasks that are due for execution."""
+        """Get tasks that are due for execution, earliest first."""
         now = datetime.utcnow()
         due = []
 
-        for task in self._tasks.values():
-            if not task.is_active:
-                continue
-            if task.reached_max_runs:
-                continue
-            if task.next_run and task.next_run <= now:
-                due.append(task)
-
-        return due
+        with self._lock:
+            # Only the heap's top levels can hold due entries; walk just those
+            stack = [0]
+            while stack:
+                i = stack.pop()
+                if i >= len(self._queue) or self._queue[i][0] > now:
+                    continue
+                _, seq, task_id = self._queue[i]
+                task = self._tasks.get(task_id)
+                if (
+                    self._queued.get(task_id) == seq
+                    and task.is_active
+                    and not task.reached_max_runs
+                ):
+                    due.append((self._queue[i], task))
+                stack.extend((2 * i + 1, 2 * i + 2))
+
+        return [task for _, task in sorted(due, key=lambda item: item[0][:2])]
 
     def wait_for_task(
         self,
@@ -422,14 +509,17 @@ class TaskScheduler:
         if self._running:
             return
 
-        self._running = True
+        with self._lock:
+            self._running = True
         self._thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self._thread.start()
         logger.info("Task scheduler started")
 
     def stop(self) -> None:
         """Stop the scheduler loop."""
-        self._running = False
+        with self._lock:
+            self._running = False
+            self._wakeup.notify_all()
         if self._thread:
             self._thread.join(timeout=5.0)
             self._thread = None
@@ -437,10 +527,16 @@ class TaskScheduler:
 
     def _scheduler_loop(self) -> None:
         """Main scheduler loop."""
-        while self._running:
+        while True:
             try:
-                # Check for due tasks
-                due_tasks = self.get_due_tasks()
+                with self._lock:
+                    if not self._running:
+                        return
+                    due_tasks = self._pop_due(datetime.utcnow())
+                    if not due_tasks:
+                        self._wakeup.wait(self._seconds_until_next())
+                        continue
+
                 for task in due_tasks:
                     try:
                         self.run_task(task.id)
@@ -449,8 +545,53 @@ class TaskScheduler:
 
             except Exception as e:
                 logger.error(f"Scheduler loop error: {e}")
+                time.sleep(self._poll_interval)
 
-            time.sleep(self._poll_interval)
+    def _enqueue(self, task: ScheduledTask) -> None:
+        """Queue a task at its next_run, superseding any earlier entry. Caller holds the lock."""
+        if task.next_run is None:
+            self._queued.pop(task.id, None)
+            return
+        self._push(task.next_run, task.id)
+
+    def _push(self, when: datetime, task_id: str) -> None:
+        seq = next(self._seq)
+        self._queued[task_id] = seq
+        heapq.heappush(self._queue, (when, seq, task_id))
+        if self._queue[0][1] == seq:
+            self._wakeup.notify_all()
+
+    def _pop_due(self, now: datetime) -> list[ScheduledTask]:
+        """Remove and return runnable tasks due by now. Caller holds the lock."""
+        due = []
+        deferred = []
+        while self._queue and self._queue[0][0] <= now:
+            _, seq, task_id = heapq.heappop(self._queue)
+            if self._queued.get(task_id) != seq:
+                continue
+            del self._queued[task_id]
+            task = self._tasks[task_id]
+            if task.reached_max_runs:
+                continue
+            if task.is_active:
+                due.append(task)
+            else:
+                # Paused or still running: look again later
+                deferred.append(task_id)
+
+        retry_at = now + timedelta(seconds=self._poll_interval)
+        for task_id in deferred:
+            self._push(retry_at, task_id)
+        return due
+
+    def _seconds_until_next(self) -> float:
+        """Seconds to sleep before the next queued run, at most poll_interval."""
+        while self._queue and self._queued.get(self._queue[0][2]) != self._queue[0][1]:
+            heapq.heappop(self._queue)
+        if not self._queue:
+            return self._poll_interval
+        delay = (self._queue[0][0] - datetime.utcnow()).total_seconds()
+        return min(max(delay, 0.0), self._poll_interval)
 
     def get_stats(self) -> dict:
         """Get scheduler statistics."""
@@ -483,6 +624,8 @@ class TaskScheduler:
             # Re-register function if available
             if task.func_name and task.func_name in self._func_registry:
                 task.func = self._func_registry[task.func_name]
-            self._tasks[task.id] = task
+            with self._lock:
+                self._tasks[task.id] = task
+                self._enqueue(task)
             imported += 1
         return imported
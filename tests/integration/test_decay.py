@@ -0,0 +1,144 @@
+"""
+Integration tests for edge decay against FalkorDB.
+
+apply_decay streams edges through Python; apply_decay_in_graph does the
+same work in Cypher. Both run here on identical graphs and must leave the
+same weights and delete the same edges. Skipped when no FalkorDB server
+is reachable at FALKORDB_HOST / FALKORDB_PORT.
+"""
+
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.graph.client import GraphClient
+from src.graph.queries import epoch_seconds
+from src.graph.substrate import GraphSubstrate
+from src.models import Edge, Node, NodeType
+
+GRAPH_NAME = "virtue_basin_decay_test"
+
+# (from_id, to_id, weight, hours idle); target_degree 2 below
+EDGES = [
+    ("a", "b", 0.5, 100),  # decays to ~0.024 and stays
+    ("b", "c", 0.5, 24 * 30),  # falls below min_weight: deleted
+    ("c", "d", 0.8, 0),  # fresh
+    ("c1", "V01", 0.5, 24 * 30),  # V01 has degree 3, so this may go
+    ("c2", "V01", 0.5, 0),
+    ("c3", "V01", 0.5, 0),
+    ("c4", "V02", 0.5, 24 * 30),  # V02 has degree 2: clamped to min_weight
+    ("c5", "V02", 0.5, 0),
+]
+VIRTUES = {"V01", "V02"}
+
+
+@pytest.fixture
+def client():
+    """GraphClient on a scratch graph, or skip without a server."""
+    from falkordb import FalkorDB
+    from redis.exceptions import ConnectionError
+
+    try:
+        db = FalkorDB(
+            host=os.getenv("FALKORDB_HOST", "localhost"),
+            port=int(os.getenv("FALKORDB_PORT", "6379")),
+        )
+    except ConnectionError:
+        pytest.skip("FalkorDB server not reachable")
+
+    graph_client = GraphClient.__new__(GraphClient)
+    graph_client.db = db
+    graph_client.graph = db.select_graph(GRAPH_NAME)
+    yield graph_client
+    graph_client.execute("MATCH (n) DETACH DELETE n")
+
+
+def _seed(client) -> None:
+    client.execute("MATCH (n) DETACH DELETE n")
+    node_ids = {node_id for edge in EDGES for node_id in edge[:2]}
+    for node_id in sorted(node_ids):
+        label = "VirtueAnchor" if node_id in VIRTUES else "Concept"
+        client.execute(f"CREATE (:{label} {{id: $id}})", {"id": node_id})
+
+    now = datetime.utcnow()
+    for from_id, to_id, weight, hours in EDGES:
+        last_used = now - timedelta(hours=hours)
+        client.execute(
+            """
+            MATCH (a {id: $from_id}), (b {id: $to_id})
+            CREATE (a)-[:RELATES {weight: $weight, last_used: $last_used, last_used_ts: $ts}]->(b)
+            """,
+            {
+                "from_id": from_id,
+                "to_id": to_id,
+                "weight": weight,
+                "last_used": last_used.isoformat(),
+                "ts": epoch_seconds(last_used),
+            },
+        )
+
+
+def _seed_substrate(client) -> None:
+    """An edge created 30 days idle, backfilled, then used again through GraphSubstrate."""
+    client.execute("MATCH (n) DETACH DELETE n")
+    substrate = GraphSubstrate(graph_name=GRAPH_NAME)
+    substrate._db = client.db
+    substrate._graph = client.graph
+    for node_id in ("s1", "s2"):
+        substrate.create_node(Node(id=node_id, type=NodeType.CONCEPT))
+
+    old = datetime.utcnow() - timedelta(days=30)
+    substrate.create_edge(Edge(source_id="s1", target_id="s2", weight=0.5, last_used=old))
+
+    from src.functions.decay import backfill_edge_timestamps
+    backfill_edge_timestamps()
+
+    substrate.update_edge(Edge(source_id="s1", target_id="s2", weight=0.5, last_used=datetime.utcnow(), use_count=1))
+
+
+def _weights(client) -> dict:
+    rows = client.query("MATCH (a)-[r]->(b) RETURN a.id, b.id, r.weight")
+    return {(from_id, to_id): weight for from_id, to_id, weight in rows}
+
+
+class TestDecayInGraph:
+    """apply_decay_in_graph against apply_decay on the same edges."""
+
+    def test_matches_python_decay(self, client):
+        from src.functions.decay import apply_decay, apply_decay_in_graph
+
+        with patch("src.functions.decay.get_client", return_value=client):
+            _seed(client)
+            apply_decay(target_degree=2)
+            expected = _weights(client)
+
+            _seed(client)
+            stats = apply_decay_in_graph(target_degree=2)
+            actual = _weights(client)
+
+        assert set(actual) == set(expected)
+        assert ("a", "b") in actual and ("b", "c") not in actual
+        assert ("c1", "V01") not in actual
+        assert actual[("c4", "V02")] == pytest.approx(0.01)
+        for edge, weight in expected.items():
+            assert actual[edge] == pytest.approx(weight, rel=1e-3)
+        assert stats["deleted"] == 2 and stats["protected"] == 1
+
+    def test_matches_python_decay_after_substrate_update(self, client):
+        """An edge used again through GraphSubstrate decays from its new last_used in both modes."""
+        from src.functions.decay import apply_decay, apply_decay_in_graph
+
+        with patch("src.functions.decay.get_client", return_value=client):
+            _seed_substrate(client)
+            apply_decay(target_degree=2)
+            expected = _weights(client)
+
+            _seed_substrate(client)
+            apply_decay_in_graph(target_degree=2)
+            actual = _weights(client)
+
+        assert set(actual) == set(expected) == {("s1", "s2")}
+        assert actual[("s1", "s2")] == pytest.approx(expected[("s1", "s2")], rel=1e-3)
+        assert actual[("s1", "s2")] == pytest.approx(0.5, rel=1e-3)
@@ -94,3 +94,135 @@ class TestCoherenceThresholds:
         is_coherent = dominance <= max_dominance
 
         assert is_coherent == False
+
+
+class TestCoherenceSink:
+    """Test deferred coherence side effects."""
+
+    @patch("src.functions.coherence_sink.hebbian_update_many")
+    def test_flush_batches_by_label_and_type(self, mock_hebbian):
+        """Records are held until flush, then written one statement per label/type."""
+        from src.functions.coherence_sink import CoherenceSink
+
+        client = MagicMock()
+        closest = MagicMock(return_value="V02")
+        sink = CoherenceSink("agent_1", client=client, closest_virtue_fn=closest)
+
+        for i in range(3):
+            trajectory = [f"c{i}", "c9", "V03"]
+            sink.record_capture(f"c{i}", "V03", trajectory, capture_time=2)
+            sink.record_trajectory(f"c{i}", {"captured": True, "captured_by": "V03", "trajectory": trajectory})
+        sink.record_escape(["c5", "c6"])
+        sink.record_trajectory("c5", {"captured": False, "captured_by": None, "trajectory": ["c5", "c6"]})
+
+        assert not client.method_calls
+        with patch("src.mercy.judgment.evaluate_failure") as mock_evaluate, \
+                patch("src.mercy.lessons.create_failure_lesson") as mock_lesson:
+            stats = sink.flush()
+
+        nodes = {call.args[0]: call.args[1] for call in client.create_nodes.call_args_list}
+        edges = {call.args[0]: call.args[1] for call in client.create_edges.call_args_list}
+        assert len(nodes["Pathway"]) == 3 and len(nodes["Trajectory"]) == 4
+        assert [len(edges[t]) for t in ("CAPTURED_BY", "DISCOVERED", "LEADS_TO", "HAS_TRAJECTORY")] == [3, 3, 3, 4]
+        assert len(mock_hebbian.call_args.args[0]) == 3
+        mock_evaluate.assert_called_once()
+        mock_lesson.assert_called_once_with("agent_1", "V02", ["c5", "c6"])
+        assert stats == {"nodes": 7, "edges": 13, "hebbian_trajectories": 3, "escapes": 1}
+        assert sink.pending == 0
+
+    def test_trajectories_can_be_skipped(self):
+        """trajectory_sample=0 persists no Trajectory nodes."""
+        from src.functions.coherence_sink import CoherenceSink
+
+        sink = CoherenceSink("agent_1", client=MagicMock(), trajectory_sample=0.0)
+        result = {"captured": False, "captured_by": None, "trajectory": ["c1"]}
+
+        assert sink.record_trajectory("c1", result) is None
+        assert sink.pending == 0
+
+
+class TestAdaptiveCoherence:
+    """Test early-stopping coherence tests."""
+
+    def test_wilson_interval(self):
+        """Intervals contain the estimate and narrow with more samples."""
+        from src.functions.sequential import wilson_interval, z_score
+
+        z = z_score(0.95)
+        assert z == pytest.approx(1.96, abs=0.01)
+        low, high = wilson_interval(0, 30, z)
+        assert low == 0.0 and 0.1 < high < 0.12
+        wide = wilson_interval(10, 20, z)
+        narrow = wilson_interval(100, 200, z)
+        assert wide[0] < narrow[0] < 0.5 < narrow[1] < wide[1]
+
+    def test_outcome_decided(self):
+        """Undecided conditions only matter if they can flip the outcome."""
+        from src.functions.sequential import outcome_decided
+
+        decide = lambda a, b: a and b
+        assert outcome_decided({"a": False, "b": None}, decide)
+        assert not outcome_decided({"a": True, "b": None}, decide)
+
+    @staticmethod
+    def _run(spread_result, previous_rate, adaptive):
+        from src.functions.test_coherence import test_coherence
+
+        client = MagicMock()
+        client.query.return_value = [[previous_rate]]
+        with patch("src.functions.test_coherence.get_client", return_value=client), \
+                patch("src.functions.test_coherence.generate_stimuli", side_effect=lambda n, snapshot, rng: ["c"] * n), \
+                patch("src.functions.test_coherence.spread_activation", side_effect=spread_result), \
+                patch("src.functions.test_coherence.CoherenceSink"), \
+                patch("src.functions.test_coherence.get_config", return_value={"coherence": {}}):
+            return test_coherence("agent_1", stimulus_count=100, use_snapshot=False, adaptive=adaptive)
+
+    def test_stops_when_escapes_decide(self):
+        """An agent that mostly escapes is decided long before 100 stimuli."""
+        import itertools
+
+        def spread_fn():
+            outcomes = itertools.cycle([True, False, False, False])
+
+            def spread(*args, **kwargs):
+                if next(outcomes):
+                    return {"captured": True, "captured_by": "V01", "capture_tier": "foundation",
+                            "capture_time": 2, "trajectory": ["c", "V01"]}
+                return {"captured": False, "captured_by": None, "trajectory": ["c"]}
+            return spread
+
+        full = self._run(spread_fn(), 0.5, adaptive=False)
+        adaptive = self._run(spread_fn(), 0.5, adaptive=True)
+
+        assert full["stimuli_used"] == 100 and not full["stopped_early"]
+        assert adaptive["stimuli_used"] == 20 and adaptive["stopped_early"]
+        assert adaptive["is_coherent"] == full["is_coherent"] == False
+        assert adaptive["status"] == full["status"] == "needs_growth"
+
+    def test_waits_for_status(self):
+        """Coherent either way is not enough while coherent vs growing is open."""
+        from src.functions.test_coherence import _decision_is_certain, _thresholds
+
+        with patch("src.functions.test_coherence.rate_at_least", return_value=True), \
+                patch("src.functions.test_coherence.wilson_interval", return_value=(0.3, 0.35)), \
+                patch("src.functions.test_coherence.coverage_at_least", return_value=None):
+            # Growing and every criterion but coverage met: is_coherent is
+            # True either way, status is "coherent" or "growing"
+            assert not _decision_is_certain({"V01": 5}, {"V02": 5}, 20, 80, 0.0, _thresholds({}), 1.96)
+
+    def test_runs_on_while_undecided(self):
+        """Borderline capture rates use the whole budget."""
+        import itertools
+
+        outcomes = itertools.cycle([True, False, False, False])
+        virtues = itertools.cycle([f"V{i:02d}" for i in range(2, 20)])
+
+        def spread(*args, **kwargs):
+            if next(outcomes):
+                return {"captured": True, "captured_by": next(virtues), "capture_tier": "aspirational",
+                        "capture_time": 3, "trajectory": ["c", "V"]}
+            return {"captured": False, "captured_by": None, "trajectory": ["c"]}
+
+        result = self._run(spread, 0.2, adaptive=True)
+
+        assert result["stimuli_used"] == 100
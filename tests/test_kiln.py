@@ -75,6 +75,39 @@ class TestKilnHelpers:
         assert "agent_1" in survivors  # Best should always survive
         assert len(survivors) == 2
 
+    def test_parallel_evaluation_keeps_order(self):
+        """Concurrent candidate tests overlap but report, and draw, as sequential ones do."""
+        import threading
+        import time
+
+        from src.kiln.loop import evaluate_candidates
+
+        running = []
+        overlap = []
+        lock = threading.Lock()
+
+        def fake_test(agent_id, rng):
+            with lock:
+                running.append(agent_id)
+                overlap.append(len(running))
+            time.sleep(0.02 if agent_id == "agent_0" else 0.005)
+            with lock:
+                running.remove(agent_id)
+            return {"agent": agent_id, "is_coherent": True, "draw": rng.random()}
+
+        candidates = [f"agent_{i}" for i in range(6)]
+        results, test_times = evaluate_candidates(candidates, fake_test, workers=3, seed=7)
+
+        assert [aid for aid, _ in results] == candidates
+        assert all(r["agent"] == aid for aid, r in results)
+        assert max(overlap) > 1
+        assert set(test_times) == set(candidates)
+        assert test_times["agent_0"] >= 0.02
+
+        sequential, _ = evaluate_candidates(candidates, fake_test, workers=1, seed=7)
+        assert sequential == results
+        assert len({r["draw"] for _, r in results}) == len(candidates)
+
 
 class TestDiversitySelection:
     """Test diversity-aware selection."""
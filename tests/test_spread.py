@@ -77,3 +77,80 @@ class TestSpreadActivation:
 
         assert "trajectory" in result
         assert result["captured"] == True or result["captured"] == False  # Depends on activation calc
+
+
+def _snapshot_client():
+    """Mock client returning a small concept -> virtue graph from the bulk loads."""
+    client = MagicMock()
+    client.query.side_effect = [
+        [
+            ["start", 0.0, 0.0, ["Concept"], None, "concept"],
+            ["mid", 0.0, 0.0, ["Concept"], None, "concept"],
+            ["V01", 0.3, 0.3, ["VirtueAnchor"], "foundation", "virtue"],
+            ["V02", 0.3, 0.3, ["VirtueAnchor"], None, "virtue"],
+        ],
+        [
+            ["start", "mid", 0.9, "RELATES"],
+            ["mid", "V02", 0.8, "SEEKS"],
+            ["V01", "start", 0.2, "SEEKS"],
+        ],
+    ]
+    return client
+
+
+class TestGraphSnapshot:
+    """Test spread_activation against an in-memory GraphSnapshot."""
+
+    def test_load_and_lookups(self):
+        """Two bulk queries give undirected adjacency and virtue tiers."""
+        from src.graph.snapshot import GraphSnapshot
+
+        client = _snapshot_client()
+        snapshot = GraphSnapshot.load(client)
+
+        assert client.query.call_count == 2
+        assert {row[0] for row in snapshot.get_neighbors("start")} == {"mid", "V01"}
+        assert snapshot.get_baseline("V01") == 0.3
+        assert snapshot.virtue_tier("V01") == "foundation"
+        assert snapshot.virtue_tier("V02") == "aspirational"
+        assert snapshot.virtue_tier("mid") is None
+        assert snapshot.nearby_virtues("mid", max_hops=1, limit=3) == ["V02"]
+        assert snapshot.nearby_virtues("mid", max_hops=2, limit=3) == ["V02", "V01"]
+
+    @patch('src.functions.spread.get_client')
+    @patch('src.functions.spread.get_neighbors')
+    @patch('src.functions.spread.set_node_activation')
+    @patch('src.functions.spread.get_node_activation')
+    def test_spread_uses_snapshot(
+        self, mock_get_act, mock_set_act, mock_neighbors, mock_client
+    ):
+        """Spreading against a snapshot issues no per-hop queries and flushes once."""
+        from src.functions.spread import spread_activation
+        from src.graph.snapshot import GraphSnapshot
+
+        client = _snapshot_client()
+        snapshot = GraphSnapshot.load(client)
+
+        result = spread_activation("start", snapshot=snapshot, capture_threshold=0.5)
+
+        mock_neighbors.assert_not_called()
+        mock_get_act.assert_not_called()
+        mock_set_act.assert_not_called()
+        assert client.query.call_count == 2
+        assert result["trajectory"][0] == "start"
+        assert snapshot.pending_writes == len(set(result["trajectory"]))
+
+        assert snapshot.flush() == len(set(result["trajectory"]))
+        client.execute.assert_called_once()
+        assert "UNWIND" in client.execute.call_args[0][0]
+        assert snapshot.pending_writes == 0
+
+    def test_apply_hebbian(self):
+        """Mirrored Hebbian updates strengthen existing edges and add missing ones."""
+        from src.graph.snapshot import GraphSnapshot
+
+        snapshot = GraphSnapshot.load(_snapshot_client())
+        snapshot.apply_hebbian(["mid", "start", "V02"], learning_rate=0.05)
+
+        assert snapshot.get_edges_between("start", "mid")[0][2] == pytest.approx(0.95)
+        assert snapshot.get_edges_between("start", "V02")[0][2:] == [0.05, "ACTIVATED"]
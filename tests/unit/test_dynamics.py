@@ -3,6 +3,8 @@
 import pytest
 import math
 
+import numpy as np
+
 from src.dynamics.activation import tanh, sigmoid
 
 
@@ -59,3 +61,112 @@ class TestDynamicsConstants:
         assert 0 < ACTIVATION_THRESHOLD < 1
         assert 0 < CAPTURE_THRESHOLD < 1
         assert ACTIVATION_THRESHOLD < CAPTURE_THRESHOLD
+
+
+class TestSparseActivationSpreader:
+    """Tests for the sparse-matrix spread engine."""
+
+    @staticmethod
+    def _build_graph(seed: int = 7, concepts: int = 40, edges: int = 160):
+        import random
+
+        from src.graph.edges import EdgeManager
+        from src.graph.mock_substrate import MockGraphSubstrate
+        from src.graph.nodes import NodeManager
+        from src.graph.virtues import VirtueManager
+
+        substrate = MockGraphSubstrate()
+        substrate.connect()
+        node_manager = NodeManager(substrate)
+        edge_manager = EdgeManager(substrate)
+        virtue_manager = VirtueManager(substrate)
+        virtue_manager.initialize_virtues()
+        virtue_manager.initialize_virtue_relationships(edge_manager)
+
+        rng = random.Random(seed)
+        concept_ids = [node_manager.create_concept_node(f"c{i}").id for i in range(concepts)]
+        all_ids = concept_ids + [f"V{i:02d}" for i in range(1, 20)]
+        for _ in range(edges):
+            source = rng.choice(concept_ids)
+            target = rng.choice(all_ids)
+            if source != target:
+                edge_manager.create_edge(source, target, weight=rng.uniform(0.2, 1.0))
+        return substrate, node_manager, edge_manager, virtue_manager, concept_ids
+
+    def test_matrix_drops_virtue_to_virtue_edges(self):
+        """Virtue anchors only receive from concepts."""
+        from src.dynamics.sparse import ActivationMatrix
+
+        substrate, _, edge_manager, virtue_manager, _ = self._build_graph()
+        matrix = ActivationMatrix.from_graph(
+            substrate.get_all_nodes(), edge_manager.get_all_edges(), virtue_manager
+        )
+
+        rows = np.repeat(np.arange(matrix.size), np.diff(matrix.indptr))
+        assert not np.any(matrix.virtue_mask[rows] & matrix.virtue_mask[matrix.indices])
+        assert matrix.nnz < substrate.edge_count()
+
+    def test_matches_dict_engine(self):
+        """Sparse engine reproduces the dict engine trajectory under a fixed seed."""
+        import random
+
+        from src.dynamics.activation import ActivationSpreader
+        from src.dynamics.sparse import SparseActivationSpreader
+
+        for seed in range(5):
+            components = self._build_graph(seed=seed)
+            concept_ids = components[-1]
+            dict_engine = ActivationSpreader(*components[:4])
+            sparse_engine = SparseActivationSpreader(*components[:4])
+
+            for strength in (0.6, 1.0):
+                start = [concept_ids[seed]]
+                random.seed(seed)
+                expected = dict_engine.spread_activation(start, strength, max_steps=60)
+                random.seed(seed)
+                actual = sparse_engine.spread_activation(start, strength, max_steps=60)
+
+                assert actual.path == expected.path
+                assert actual.captured_by == expected.captured_by
+                assert actual.capture_time == expected.capture_time
+
+    def test_matrix_incoming_batch_matches_columns(self):
+        """Stacked activations produce the same input as one column at a time."""
+        from src.dynamics.sparse import ActivationMatrix
+
+        substrate, _, edge_manager, virtue_manager, _ = self._build_graph()
+        matrix = ActivationMatrix.from_graph(
+            substrate.get_all_nodes(), edge_manager.get_all_edges(), virtue_manager
+        )
+        stacked = np.random.default_rng(0).random((matrix.size, 4))
+
+        batched = matrix.incoming(stacked)
+
+        for col in range(stacked.shape[1]):
+            np.testing.assert_allclose(batched[:, col], matrix.incoming(stacked[:, col]))
+
+    def test_batch_spread(self):
+        """Batch spread returns one reproducible trajectory per stimulus."""
+        import random
+
+        from src.dynamics.sparse import SparseActivationSpreader
+
+        components = self._build_graph(seed=3)
+        concept_ids = components[-1]
+        spreader = SparseActivationSpreader(*components[:4])
+        stimuli = [([concept_ids[i]], 0.5 + 0.05 * i) for i in range(10)]
+        ids = [f"s{i}" for i in range(10)]
+
+        random.seed(11)
+        first = spreader.spread_activation_batch(stimuli, max_steps=60, stimulus_ids=ids)
+        random.seed(11)
+        second = spreader.spread_activation_batch(stimuli, max_steps=60, stimulus_ids=ids)
+
+        assert [t.stimulus_id for t in first] == ids
+        assert [t.path for t in first] == [t.path for t in second]
+        for trajectory in first:
+            if trajectory.was_captured:
+                assert trajectory.capture_time == len(trajectory.path)
+                assert trajectory.path[-3:] == [trajectory.captured_by] * 3
+            else:
+                assert len(trajectory.path) == 60
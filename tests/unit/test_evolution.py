@@ -1,11 +1,21 @@
 """Tests for evolution components."""
 
+import random
+
 import pytest
 
 from src.evolution.population import Individual, Population
 from src.evolution.selection import Selection
 from src.evolution.crossover import Crossover
 from src.evolution.mutation import Mutation
+from src.evolution.evaluation import IsolatedTopologyEvaluator
+from src.evolution.cache import FitnessCache
+from src.evolution.compact import CompactIndividual, NodeIndex
+from src.evolution.loop import EvolutionLoop
+from src.evolution.checkpoint import list_checkpoints
+from src.graph.mock_substrate import MockGraphSubstrate
+from src.graph.nodes import NodeManager
+from src.graph.virtues import VirtueManager
 from src.models import Edge
 
 
@@ -63,6 +73,22 @@ class TestIndividual:
         assert clone.fitness == 0.0  # Reset
         assert len(clone.edges) == 1
 
+    def test_topology_hash(self):
+        """Hash depends on edges and quantised weights only."""
+        ind = Individual(id="test_1")
+        ind.set_edge(Edge(source_id="V01", target_id="V02", weight=0.5))
+        ind.set_edge(Edge(source_id="V02", target_id="V03", weight=0.25))
+
+        other = Individual(id="test_2")
+        other.set_edge(Edge(source_id="V02", target_id="V03", weight=0.25))
+        other.set_edge(Edge(source_id="V01", target_id="V02", weight=0.500001))
+
+        assert ind.topology_hash() == other.topology_hash()
+        assert ind.topology_hash() == ind.clone().topology_hash()
+
+        other.set_edge(Edge(source_id="V01", target_id="V02", weight=0.51))
+        assert ind.topology_hash() != other.topology_hash()
+
 
 class TestPopulation:
     """Tests for Population class."""
@@ -193,3 +219,259 @@ class TestMutation:
 
         edge = ind.get_edge("V01", "V02")
         assert edge.weight == 0.5
+
+
+class TestCompactIndividual:
+    """Tests for the array-backed CompactIndividual."""
+
+    def _individual(self):
+        ind = Individual(id="test_1", generation=2)
+        ind.set_edge(Edge(source_id="V01", target_id="V02", weight=0.5))
+        ind.set_edge(Edge(source_id="V01", target_id="V03", weight=0.4))
+        ind.set_edge(Edge(source_id="V04", target_id="V01", weight=0.3))
+        return ind
+
+    def test_matches_individual(self):
+        """Conversion keeps edges, degrees and the topology hash."""
+        ind = self._individual()
+        compact = CompactIndividual.from_individual(ind, NodeIndex())
+
+        assert len(compact.edges) == 3
+        assert "V01->V02" in compact.edges
+        assert compact.get_edge("V04", "V01").weight == 0.3
+        assert compact.get_node_degree("V01") == 3
+        assert compact.get_node_degree("V02") == 1
+        assert compact.get_node_degree("V99") == 0
+        assert compact.topology_hash() == ind.topology_hash()
+        assert sorted(compact.to_individual().edge_rows()) == sorted(ind.edge_rows())
+
+    def test_set_and_remove_edge(self):
+        compact = CompactIndividual.from_individual(self._individual(), NodeIndex())
+        compact.set_edge(Edge(source_id="V02", target_id="V05", weight=0.9))
+        compact.set_edge(Edge(source_id="V01", target_id="V02", weight=0.7))
+
+        assert len(compact.edges) == 4
+        assert compact.get_edge("V01", "V02").weight == 0.7
+        assert compact.get_node_degree("V02") == 2
+
+        assert compact.remove_edge("V01", "V02") is True
+        assert compact.remove_edge("V01", "V02") is False
+        assert compact.get_node_degree("V01") == 2
+        assert compact.get_node_degree("V02") == 1
+
+    def test_clone_is_copy_on_write(self):
+        """Clones share arrays until one side writes."""
+        compact = CompactIndividual.from_individual(self._individual(), NodeIndex())
+        clone = compact.clone()
+
+        assert clone.weight is compact.weight
+        assert clone.generation == compact.generation + 1
+        assert clone.fitness == 0.0
+
+        clone.set_edge(Edge(source_id="V01", target_id="V02", weight=0.1))
+        assert clone.weight is not compact.weight
+        assert compact.get_edge("V01", "V02").weight == 0.5
+
+    def test_vectorised_mutation(self):
+        compact = CompactIndividual.from_individual(self._individual(), NodeIndex())
+        clone = compact.clone()
+
+        assert Mutation(mutation_rate=1.0)._mutate_weights(clone) == 3
+        assert ((clone.weight >= 0) & (clone.weight <= 1)).all()
+        assert compact.get_edge("V01", "V02").weight == 0.5
+        assert Mutation(mutation_rate=0.0)._mutate_weights(compact) == 0
+
+    def test_vectorised_uniform_crossover(self):
+        """Shared edges are averaged; single-parent edges follow crossover_rate."""
+        nodes = NodeIndex()
+        parent1 = Individual(id="parent1")
+        parent1.set_edge(Edge(source_id="V01", target_id="V02", weight=0.8))
+        parent1.set_edge(Edge(source_id="V02", target_id="V03", weight=0.7))
+        parent2 = Individual(id="parent2")
+        parent2.set_edge(Edge(source_id="V01", target_id="V02", weight=0.4))
+        parent2.set_edge(Edge(source_id="V03", target_id="V04", weight=0.6))
+        compact1 = CompactIndividual.from_individual(parent1, nodes)
+        compact2 = CompactIndividual.from_individual(parent2, nodes)
+
+        child = Crossover(crossover_rate=1.0).uniform_crossover(compact1, compact2)
+        assert isinstance(child, CompactIndividual)
+        assert abs(child.get_edge("V01", "V02").weight - 0.6) < 0.01
+        assert set(child.edges) == {"V01->V02", "V02->V03", "V03->V04"}
+
+        child = Crossover(crossover_rate=0.0).uniform_crossover(compact1, compact2)
+        assert set(child.edges) == {"V01->V02"}
+
+    def test_compact_population(self):
+        """Compact populations share one node table through crossover."""
+        pop = Population(size=4, concept_nodes=["c1", "c2"], compact=True)
+        pop.initialize_random()
+
+        assert all(isinstance(ind, CompactIndividual) for ind in pop.individuals)
+        assert all(ind.nodes is pop.node_index for ind in pop.individuals)
+
+        child = Crossover().crossover(pop.individuals[0], pop.individuals[1], method="virtue_based")
+        assert isinstance(child, CompactIndividual)
+        assert child.nodes is pop.node_index
+
+
+class TestIsolatedTopologyEvaluator:
+    """Tests for IsolatedTopologyEvaluator."""
+
+    def _setup(self, size=4):
+        substrate = MockGraphSubstrate()
+        substrate.connect()
+        VirtueManager(substrate).initialize_virtues()
+        node_manager = NodeManager(substrate)
+        concepts = [node_manager.create_concept_node(f"c{i}").id for i in range(10)]
+
+        random.seed(7)
+        population = Population(size=size, concept_nodes=concepts)
+        population.initialize_random()
+        return substrate, population
+
+    def test_parallel_matches_serial(self):
+        """Results are deterministic and independent of worker processes."""
+        substrate, population = self._setup()
+
+        with IsolatedTopologyEvaluator.from_substrate(substrate, num_stimuli=10, max_workers=2) as evaluator:
+            parallel = evaluator.evaluate_many(population.individuals)
+        serial = [
+            IsolatedTopologyEvaluator.from_substrate(substrate, num_stimuli=10, max_workers=1)(ind)
+            for ind in population.individuals
+        ]
+
+        assert parallel == serial
+        assert all(0.0 <= r["alignment_score"] <= 1.0 for r in parallel)
+
+    def test_shared_substrate_untouched(self):
+        """Evaluation never writes to the substrate or the caller's random state."""
+        substrate, population = self._setup(size=2)
+        before = {n.id: n.activation for n in substrate.get_all_nodes()}
+
+        evaluator = IsolatedTopologyEvaluator.from_substrate(substrate, num_stimuli=5, max_workers=1)
+        state = random.getstate()
+        evaluator.evaluate_many(population.individuals)
+
+        assert random.getstate() == state
+        assert substrate.edge_count() == 0
+        assert {n.id: n.activation for n in substrate.get_all_nodes()} == before
+
+    def test_evolution_loop_uses_evaluate_many(self):
+        """EvolutionLoop hands whole generations to evaluate_many."""
+        _, population = self._setup()
+        batches = []
+
+        class Evaluator:
+            def __call__(self, individual):
+                raise AssertionError("evaluate_many should be used")
+
+            def evaluate_many(self, individuals):
+                batches.append(len(individuals))
+                return [{"alignment_score": 0.5} for _ in individuals]
+
+        loop = EvolutionLoop(population, Selection(), Crossover(), Mutation(), Evaluator(), generations=1)
+        loop.run()
+
+        assert batches[0] == 4
+        assert len(batches) == 2
+        assert all(ind.fitness == 0.5 for ind in population.individuals)
+
+
+class TestFitnessCache:
+    """Tests for FitnessCache and its use in EvolutionLoop."""
+
+    def test_lru_eviction(self):
+        cache = FitnessCache(max_size=2)
+        cache.put("a", {"alignment_score": 0.1})
+        cache.put("b", {"alignment_score": 0.2})
+        cache.get("a")
+        cache.put("c", {"alignment_score": 0.3})
+
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert cache.get("b") is None
+        assert cache.hits == 1 and cache.misses == 1
+
+    def test_save_and_load(self, tmp_path):
+        cache = FitnessCache()
+        cache.put("a", {"alignment_score": 0.4})
+        cache.save(tmp_path / "cache.json")
+
+        loaded = FitnessCache.load(tmp_path / "cache.json")
+        assert loaded.get("a") == {"alignment_score": 0.4}
+
+    def test_loop_skips_cached_topologies(self):
+        """Duplicates and previously seen topologies are not re-evaluated."""
+        evaluated = []
+
+        def evaluator(individual):
+            evaluated.append(individual.id)
+            return {"alignment_score": 0.5}
+
+        population = Population(size=3)
+        base = Individual(id="base")
+        base.set_edge(Edge(source_id="V01", target_id="V02", weight=0.5))
+        for ind in [base, base.clone(), base.clone()]:
+            population.add_individual(ind)
+
+        cache = FitnessCache()
+        loop = EvolutionLoop(population, Selection(), Crossover(), Mutation(), evaluator, fitness_cache=cache)
+        loop._evaluate_population()
+        loop._evaluate_individuals([base.clone()])
+        loop._log_generation()
+
+        assert evaluated == ["base"]
+        assert all(ind.fitness == 0.5 for ind in population.individuals)
+        assert loop.get_history()[-1]["cache_hit_rate"] == 0.75
+
+
+def _mean_weight_evaluator(individual):
+    """Deterministic stand-in for the alignment test."""
+    rows = individual.edge_rows()
+    return {"alignment_score": sum(w for _, _, w in rows) / max(1, len(rows))}
+
+
+class TestCheckpointResume:
+    """Tests for binary checkpoints and EvolutionLoop.resume."""
+
+    def _loop(self, checkpoint_dir, generations, compact=False):
+        random.seed(11)
+        population = Population(size=6, concept_nodes=["c1", "c2", "c3"], compact=compact)
+        population.initialize_random()
+        return EvolutionLoop(
+            population, Selection(elitism_count=1), Crossover(), Mutation(mutation_rate=0.3),
+            _mean_weight_evaluator, generations=generations,
+            checkpoint_dir=str(checkpoint_dir), checkpoint_interval=2,
+        )
+
+    def _state(self, loop):
+        return [(ind.topology_hash(), ind.fitness) for ind in loop.population.individuals]
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_resume_is_identical(self, tmp_path, compact):
+        """A run interrupted at a checkpoint and resumed matches an uninterrupted run."""
+        full = self._loop(tmp_path / "full", generations=6, compact=compact)
+        full.run()
+
+        partial = self._loop(tmp_path / "partial", generations=4, compact=compact)
+        partial.run()
+        random.seed(999)  # as if in a fresh process
+        resumed = EvolutionLoop.resume(tmp_path / "partial", _mean_weight_evaluator, generations=6)
+        resumed.run()
+
+        assert self._state(resumed) == self._state(full)
+        assert resumed.get_best().fitness == full.get_best().fitness
+        assert resumed.mutation.mutation_rate == 0.3
+        assert resumed.selection.elitism_count == 1
+        assert [h["generation"] for h in resumed.get_history()] == list(range(7))
+        assert isinstance(resumed.population.individuals[0], CompactIndividual) == compact
+
+    def test_keeps_newest_checkpoints(self, tmp_path):
+        loop = self._loop(tmp_path, generations=8)
+        loop.run()
+
+        assert [gen for gen, _ in list_checkpoints(tmp_path)] == [6, 8]
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_resume_without_checkpoint(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            EvolutionLoop.resume(tmp_path, _mean_weight_evaluator)
@@ -0,0 +1,81 @@
+"""Tests for gestalt caching."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.gestalt import cache as gestalt_cache
+from src.gestalt.cache import GestaltCache, bump_topology_version
+from src.models import Gestalt
+
+
+def _fake_compute(calls):
+    def compute(agent_id):
+        calls.append(agent_id)
+        if agent_id == "broken":
+            raise RuntimeError("no such agent")
+        return Gestalt(id=f"g_{agent_id}", agent_id=agent_id, virtue_activations={"V01": 0.5})
+    return compute
+
+
+class TestGestaltCache:
+    """Tests for GestaltCache."""
+
+    def test_reuses_until_version_bump(self):
+        calls = []
+        with patch.object(gestalt_cache, "compute_gestalt", _fake_compute(calls)):
+            cache = GestaltCache()
+            first = cache.get("a1")
+            assert cache.get("a1") is first
+            assert cache.embedding("a1").agent_id == "a1"
+            assert calls == ["a1"]
+
+            bump_topology_version("a2")
+            cache.get("a1")
+            assert calls == ["a1"]
+
+            bump_topology_version("a1")
+            cache.get("a1")
+            bump_topology_version()
+            cache.get("a1")
+            assert calls == ["a1", "a1", "a1"]
+            assert cache.hits == 3 and cache.misses == 3
+
+    def test_lru_eviction(self):
+        calls = []
+        with patch.object(gestalt_cache, "compute_gestalt", _fake_compute(calls)):
+            cache = GestaltCache(max_size=2)
+            cache.embeddings(["a1", "a2"])
+            cache.get("a1")
+            cache.get("a3")
+            cache.embeddings(["a1", "a2", "a3"])
+
+            assert calls == ["a1", "a2", "a3", "a2"]
+            assert len(cache) == 2
+
+    def test_bulk_skips_failures(self):
+        with patch.object(gestalt_cache, "compute_gestalt", _fake_compute([])):
+            cache = GestaltCache()
+            embeddings = cache.embeddings(["a1", "broken", "a2"])
+
+            assert [e.agent_id for e in embeddings] == ["a1", "a2"]
+            with pytest.raises(RuntimeError):
+                cache.get("broken")
+
+    def test_activation_writes_invalidate(self):
+        """Gestalts read virtue activations, so activation writes bump the version."""
+        from src.functions.decay import decay_activations
+        from src.functions.spread import _LiveGraph
+
+        calls = []
+        with patch.object(gestalt_cache, "compute_gestalt", _fake_compute(calls)), \
+                patch("src.functions.decay.get_client", return_value=MagicMock()), \
+                patch("src.functions.spread.set_node_activation"):
+            cache = GestaltCache()
+            cache.get("a1")
+
+            decay_activations()
+            cache.get("a1")
+            _LiveGraph(MagicMock()).set_activation("V01", 0.9)
+            cache.get("a1")
+            assert calls == ["a1", "a1", "a1"]
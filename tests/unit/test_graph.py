@@ -0,0 +1,422 @@
+"""Tests for graph-layer utilities."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.graph.batch import WriteBatcher
+from src.graph.mock_substrate import MockGraphSubstrate
+from src.graph.nodes import NodeManager
+from src.models import Edge, Node, NodeType
+
+
+class RecordingBackend:
+    """Backend that records each bulk call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def set_activations(self, rows):
+        self.calls.append(("set_activations", rows))
+
+    def set_edge_weights(self, rows):
+        self.calls.append(("set_edge_weights", rows))
+
+    def use_edges(self, rows):
+        self.calls.append(("use_edges", rows))
+
+    def delete_edges(self, rows):
+        self.calls.append(("delete_edges", rows))
+
+
+class TestWriteBatcher:
+    """Tests for WriteBatcher."""
+
+    def test_coalesces_and_flushes_on_exit(self):
+        """Repeated writes collapse to one row; uses accumulate."""
+        backend = RecordingBackend()
+        with WriteBatcher(backend) as batch:
+            batch.set_activation("a", 0.1)
+            batch.set_activation("a", 0.4)
+            batch.use_edge("a", "b", 0.5)
+            batch.use_edge("a", "b", 0.6)
+            assert backend.calls == []
+
+        assert backend.calls == [
+            ("set_activations", [("a", 0.4)]),
+            ("use_edges", [("a", "b", 0.6, 2)]),
+        ]
+
+    def test_delete_drops_pending_updates(self):
+        """Deleting an edge discards queued weight updates for it."""
+        backend = RecordingBackend()
+        batch = WriteBatcher(backend)
+        batch.set_edge_weight("a", "b", 0.3)
+        batch.delete_edge("a", "b")
+
+        assert batch.flush() == 1
+        assert backend.calls == [("delete_edges", [("a", "b")])]
+
+    def test_flush_size_bounds_statements(self):
+        """Queues flush automatically and every statement holds at most flush_size rows."""
+        backend = RecordingBackend()
+        batch = WriteBatcher(backend, flush_size=100)
+        for i in range(250):
+            batch.set_edge_weight(f"n{i}", "v", 0.5)
+        batch.flush()
+
+        assert [len(rows) for _, rows in backend.calls] == [100, 100, 50]
+        assert batch.statements == 3
+        assert batch.rows_written == 250
+
+    def test_invalid_flush_size(self):
+        with pytest.raises(ValueError):
+            WriteBatcher(RecordingBackend(), flush_size=0)
+
+
+class TestBatchedBackends:
+    """Tests for batched writes against the substrates and functions layer."""
+
+    def test_node_manager_update_activations(self):
+        """Batched activation updates clamp values and reach the substrate."""
+        substrate = MockGraphSubstrate()
+        substrate.connect()
+        for node_id in ("a", "b"):
+            substrate.create_node(Node(id=node_id, type=NodeType.CONCEPT))
+
+        written = NodeManager(substrate).update_activations({"a": 0.5, "b": 3.0, "missing": 0.2})
+
+        assert written == 3
+        assert substrate.get_node("a").activation == 0.5
+        assert substrate.get_node("b").activation == 1.0
+
+    def test_mock_substrate_edge_batch(self):
+        substrate = MockGraphSubstrate()
+        substrate.connect()
+        substrate.create_edge(Edge(source_id="a", target_id="b", weight=0.5))
+        substrate.create_edge(Edge(source_id="b", target_id="c", weight=0.5))
+
+        with substrate.write_batch() as batch:
+            batch.use_edge("a", "b", 0.7, uses=2)
+            batch.delete_edge("b", "c")
+
+        assert substrate.get_edge("a", "b").weight == 0.7
+        assert substrate.get_edge("a", "b").use_count == 2
+        assert substrate.get_edge("b", "c") is None
+
+    def test_use_edges_backends_write_same_properties(self):
+        """GraphClient and GraphSubstrate record use with the same edge properties."""
+        import re
+        from datetime import datetime
+
+        from src.graph.client import GraphClient
+        from src.graph.queries import epoch_seconds
+        from src.graph.substrate import GraphSubstrate
+
+        client = GraphClient.__new__(GraphClient)
+        client.execute = MagicMock()
+        client.use_edges([("a", "b", 0.7, 2)])
+        client_query, client_params = client.execute.call_args.args
+
+        substrate = GraphSubstrate()
+        substrate._graph = MagicMock()
+        substrate.use_edges([("a", "b", 0.7, 2)])
+        substrate_query, substrate_params = substrate._graph.query.call_args.args
+
+        def written(query):
+            return set(re.findall(r"r\.(\w+) =", query))
+
+        assert written(substrate_query) == written(client_query) == {
+            "weight", "last_used", "last_used_ts", "use_count"
+        }
+        for params in (client_params, substrate_params):
+            now = datetime.fromisoformat(params["now"])
+            assert params["now_ts"] == pytest.approx(epoch_seconds(now))
+
+    @patch("src.functions.hebbian.create_edge")
+    @patch("src.functions.hebbian.get_client")
+    def test_hebbian_update_batches(self, mock_client, mock_create):
+        """One read and one write per trajectory; revisited pairs compound."""
+        from src.functions.hebbian import hebbian_update
+
+        client = MagicMock()
+        mock_client.return_value = client
+        client.query.return_value = [["a", "b", 0.5]]
+        backend = RecordingBackend()
+        client.write_batch.side_effect = lambda: WriteBatcher(backend)
+
+        hebbian_update(["a", "b", "a", "c"], learning_rate=0.1)
+
+        assert client.query.call_count == 1
+        mock_create.assert_called_once_with("a", "c", "ACTIVATED", {"weight": 0.1})
+        assert backend.calls == [("use_edges", [("a", "b", pytest.approx(0.7), 2)])]
+
+    @patch("src.functions.hebbian.get_client")
+    def test_hebbian_update_many_aggregates(self, mock_client):
+        """Co-activations across trajectories add up into one write per edge."""
+        from src.functions.hebbian import hebbian_update_many
+
+        client = MagicMock()
+        mock_client.return_value = client
+        client.query.return_value = [["a", "b", 0.5]]
+        backend = RecordingBackend()
+        client.write_batch.side_effect = lambda: WriteBatcher(backend)
+
+        hebbian_update_many([["a", "b", "a", "c"], ["b", "a"], ["c", "a"]], learning_rate=0.1)
+
+        assert client.query.call_count == 1
+        assert backend.calls == [("use_edges", [("a", "b", pytest.approx(0.8), 3)])]
+        (rel_type, rows), _ = client.create_edges.call_args
+        assert rel_type == "ACTIVATED"
+        [(from_id, to_id, props)] = rows
+        assert (from_id, to_id) == ("a", "c")
+        assert props["weight"] == pytest.approx(0.2) and props["use_count"] == 1
+
+    @patch("src.functions.decay.get_client")
+    def test_apply_decay_batches(self, mock_client):
+        """Decay issues no per-edge writes and protects virtue degree."""
+        from datetime import datetime, timedelta
+
+        from src.functions.decay import apply_decay
+
+        old = (datetime.utcnow() - timedelta(days=30)).isoformat()
+        fresh = datetime.utcnow().isoformat()
+        client = MagicMock()
+        mock_client.return_value = client
+        client.query.return_value = [
+            ["c1", "V01", 0.5, old, "SEEKS", ["Concept"], ["VirtueAnchor"]],
+            ["c2", "V01", 0.5, old, "SEEKS", ["Concept"], ["VirtueAnchor"]],
+            ["c3", "c4", 0.5, old, "RELATES", ["Concept"], ["Concept"]],
+            ["c4", "c5", 0.5, fresh, "RELATES", ["Concept"], ["Concept"]],
+        ]
+        backend = RecordingBackend()
+        client.write_batch.side_effect = lambda size: WriteBatcher(backend, size)
+
+        apply_decay(target_degree=1)
+
+        client.execute.assert_not_called()
+        calls = dict(backend.calls)
+        assert calls["delete_edges"] == [("c1", "V01"), ("c3", "c4")]
+        weights = {(s, t): w for s, t, w in calls["set_edge_weights"]}
+        assert weights[("c2", "V01")] == 0.01
+        assert weights[("c4", "c5")] == pytest.approx(0.5)
+
+    @patch("src.functions.decay.get_client")
+    def test_apply_decay_in_graph_deletes_before_decaying(self, mock_client):
+        """Deletion judges the stored weight, not one already decayed.
+
+        Final weights are compared with apply_decay in
+        tests/integration/test_decay.py.
+        """
+        from src.functions.decay import apply_decay
+
+        client = MagicMock()
+        mock_client.return_value = client
+        client.query.side_effect = [[], [[0]], [[5]], [[40]]]
+
+        stats = apply_decay(server_side=True)
+
+        queries = [call.args[0] for call in client.query.call_args_list]
+        delete_at = next(i for i, q in enumerate(queries) if "DELETE r" in q)
+        decay_at = next(i for i, q in enumerate(queries) if "SET r.weight = w" in q)
+        assert delete_at < decay_at
+        assert "decay_protected IS NULL" in queries[delete_at]
+        assert stats == {"decayed": 40, "deleted": 5, "protected": 0}
+
+
+class TestTrajectoryRetention:
+    """Tests for trajectory rollup and deletion."""
+
+    def test_select_expired_by_count_and_age(self):
+        from src.functions.retention import select_expired
+
+        rows = [
+            ("t1", "a1", "2024-01-01T00:00:00"),
+            ("t2", "a1", "2024-01-03T00:00:00"),
+            ("t3", "a1", "2024-01-02T00:00:00"),
+            ("t4", "a2", "2024-01-01T00:00:00"),
+        ]
+
+        assert sorted(select_expired(rows, 2, None)) == ["t1"]
+        assert sorted(select_expired(rows, None, "2024-01-02T12:00:00")) == ["t1", "t3", "t4"]
+
+    def test_compact_merges_into_existing_rollups(self):
+        """Expired trajectories fold into rollups that are written before deletion."""
+        import json
+
+        from src.functions.retention import compact_trajectories
+
+        client = MagicMock()
+        client.query.side_effect = [
+            [("t1", "a1", "2024-01-01"), ("t2", "a1", "2024-01-02"), ("t3", "a1", "2024-01-03")],
+            [
+                ("a1", "V02", True, 3, "c1,c2,V02", "2024-01-01"),
+                ("a1", None, False, 2, "c1,c2", "2024-01-02"),
+            ],
+            [("rollup_a1_V02", 4, 4, 12, json.dumps({"c1>c2": 4}), "2023-12-01", "2023-12-31")],
+        ]
+
+        stats = compact_trajectories(keep_per_agent=1, client=client)
+
+        assert stats == {"scanned": 3, "rolled_up": 2, "rollups": 2}
+        (merge_query, merge_params), (_, link_params), (delete_query, delete_params) = [
+            call.args for call in client.execute.call_args_list
+        ]
+        assert "MERGE" in merge_query and "DETACH DELETE" in delete_query
+        rollups = {row["id"]: row for row in merge_params["rows"]}
+        captured = rollups["rollup_a1_V02"]
+        assert (captured["count"], captured["captured"], captured["mean_length"]) == (5, 5, 3.0)
+        assert json.loads(captured["ngrams"]) == {"c1>c2": 5, "c2>V02": 1}
+        assert captured["first_at"] == "2023-12-01"
+        assert rollups["rollup_a1_escaped"]["virtue"] == "escaped"
+        assert len(link_params["rows"]) == 2
+        assert sorted(delete_params["ids"]) == ["t1", "t2"]
+
+    def test_stability_falls_back_to_rollups(self):
+        """Agents whose raw trajectories were rolled up keep a real stability."""
+        from src.gestalt.compute import _compute_stability
+
+        client = MagicMock()
+        client.query.side_effect = [[("V02",)], [("V02", 8), ("V03", 2)]]
+
+        # One recent V02 capture plus rolled-up 8 x V02 and 2 x V03
+        assert _compute_stability(client, "a1") == pytest.approx((9 / 11) ** 2 + (2 / 11) ** 2)
+
+
+def _proximity_snapshot():
+    from src.graph.snapshot import GraphSnapshot
+
+    def node(*labels):
+        return {"baseline": 0.0, "activation": 0.0, "labels": list(labels), "tier": None, "type": None}
+
+    nodes = {
+        "V01": node("VirtueAnchor"), "V02": node("VirtueAnchor"),
+        "a": node("Concept"), "b": node("Concept"), "c": node("Concept"), "d": node("Concept"),
+    }
+    edges = [
+        ["a", "V01", 0.9, "ACTIVATED"],
+        ["b", "a", 0.5, "ACTIVATED"],
+        ["b", "c", 0.5, "ACTIVATED"],
+        ["c", "V02", 0.2, "ACTIVATED"],
+        ["b", "V02", 0.1, "ACTIVATED"],
+    ]
+    return GraphSnapshot(nodes, edges)
+
+
+class TestVirtueProximityIndex:
+    """Tests for the materialised nearest-virtue index."""
+
+    def test_matches_snapshot_search(self):
+        """Index lookups agree with the snapshot BFS and carry distances."""
+        import math
+
+        from src.graph.proximity import VirtueProximityIndex
+
+        snapshot = _proximity_snapshot()
+        index = VirtueProximityIndex.from_snapshot(snapshot)
+
+        for node_id in ["a", "b", "c", "d", "V01"]:
+            for hops in (1, 2, 3):
+                expected = set(snapshot.nearby_virtues(node_id, max_hops=hops, limit=5))
+                assert set(index.nearby_virtues(node_id, max_hops=hops, limit=5)) == expected
+
+        # b is one hop from V02 (weak edge) and two from V01 (strong path)
+        assert index.entries("b") == [
+            ("V02", 1, pytest.approx(-math.log(0.1))),
+            ("V01", 2, pytest.approx(-math.log(0.5) - math.log(0.9))),
+        ]
+        assert index.nearby_virtues("d", max_hops=3) == []
+        with pytest.raises(ValueError):
+            index.nearby_virtues("a", max_hops=4)
+
+    def test_incremental_updates_match_rebuild(self):
+        """Adding and removing edges gives the same index as building from scratch."""
+        from src.graph.proximity import VirtueProximityIndex
+
+        snapshot = _proximity_snapshot()
+        index = VirtueProximityIndex.from_snapshot(snapshot)
+        virtue_ids = snapshot.virtue_ids()
+
+        index.add_edge("d", "c", 0.8)
+        index.remove_edge("b", "V02")
+        index.remove_node("a")
+
+        edges = [
+            ["b", "c", 0.5, "ACTIVATED"],
+            ["c", "V02", 0.2, "ACTIVATED"],
+            ["d", "c", 0.8, "ACTIVATED"],
+        ]
+        rebuilt = VirtueProximityIndex(edges, virtue_ids)
+        for node_id in ["a", "b", "c", "d"]:
+            assert index.entries(node_id) == rebuilt.entries(node_id)
+        assert index.nearby_virtues("d", max_hops=1) == []
+        assert index.nearby_virtues("d", max_hops=2) == ["V02"]
+        assert "a" not in index
+
+    def test_random_updates_match_rebuild(self):
+        """Relaxed additions and re-searched removals agree with fresh builds."""
+        import random
+
+        from src.graph.proximity import VirtueProximityIndex
+
+        rng = random.Random(3)
+        nodes = [f"n{i}" for i in range(25)]
+        index = VirtueProximityIndex(
+            [[rng.choice(nodes), rng.choice(nodes), rng.random()] for _ in range(30)], nodes[:3]
+        )
+        for step in range(60):
+            if step % 3:
+                index.add_edges([(rng.choice(nodes), rng.choice(nodes), rng.random()) for _ in range(2)])
+            else:
+                index.remove_edges([(rng.choice(nodes), rng.choice(nodes)) for _ in range(5)])
+
+            edges = [
+                [a, b, w] for a, neighbors in index._adjacency.items()
+                for b, weights in neighbors.items() if a <= b for w in weights
+            ]
+            rebuilt = VirtueProximityIndex(edges, index.virtue_ids)
+            for node_id in nodes:
+                expected = rebuilt.entries(node_id)
+                actual = index.entries(node_id)
+                assert [entry[:2] for entry in actual] == [entry[:2] for entry in expected]
+                assert [entry[2] for entry in actual] == pytest.approx([entry[2] for entry in expected])
+
+    def test_merge_only_adds_missing_pairs(self):
+        from src.graph.proximity import VirtueProximityIndex
+
+        index = VirtueProximityIndex.from_snapshot(_proximity_snapshot())
+        index.merge_edges([("a", "V01", None), ("d", "V02", None)])
+        index.remove_edge("a", "V01")
+
+        assert index.nearby_virtues("a", max_hops=1) == []
+        assert index.nearby_virtues("d", max_hops=1) == ["V02"]
+
+    def test_client_writes_update_shared_index(self):
+        """Edges created and deleted through GraphClient reach the shared index."""
+        from src.graph import proximity
+        from src.graph.client import GraphClient
+        from src.graph.proximity import VirtueProximityIndex
+
+        client = GraphClient.__new__(GraphClient)
+        client.graph = MagicMock()
+        proximity._index = VirtueProximityIndex.from_snapshot(_proximity_snapshot())
+        try:
+            client.create_edges("ACTIVATED", [("d", "V01", {"weight": 0.5})])
+            assert proximity.get_proximity_index().nearby_virtues("d", max_hops=1) == ["V01"]
+
+            client.delete_edges([("d", "V01")])
+            assert proximity.get_proximity_index().nearby_virtues("d", max_hops=3) == []
+        finally:
+            proximity.reset_proximity_index()
+
+    def test_persist_writes_nearest_virtue(self):
+        from src.graph.proximity import VirtueProximityIndex
+
+        client = MagicMock()
+        index = VirtueProximityIndex.from_snapshot(_proximity_snapshot())
+
+        assert index.persist(client, batch_size=2) == 5
+        assert client.execute.call_count == 3
+        rows = [row for call in client.execute.call_args_list for row in call.args[1]["rows"]]
+        assert {row["id"]: row["virtue"] for row in rows}["b"] == "V02"
+        assert "SET n.nearest_virtue" in client.execute.call_args_list[0].args[0]
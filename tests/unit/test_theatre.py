@@ -0,0 +1,84 @@
+"""Tests for the theatre graph view."""
+
+import pytest
+
+from src.graph.edges import EdgeManager
+from src.graph.mock_substrate import MockGraphSubstrate
+from src.graph.nodes import NodeManager
+from src.graph.virtues import VirtueManager
+from src.theatre.graph_view import GraphViewRenderer
+from src.theatre.views import ViewManager, ViewType
+
+
+@pytest.fixture
+def graph():
+    substrate = MockGraphSubstrate()
+    substrate.connect()
+    edge_manager = EdgeManager(substrate)
+    virtue_manager = VirtueManager(substrate)
+    virtue_manager.initialize_virtues()
+    virtue_manager.initialize_virtue_relationships(edge_manager)
+    node_manager = NodeManager(substrate)
+    concepts = [node_manager.create_concept_node(f"c{i}").id for i in range(4)]
+    edge_manager.create_edge(concepts[0], "V01", weight=0.5)
+    return substrate, edge_manager, concepts
+
+
+class TestGraphViewDeltas:
+    """Tests for GraphViewRenderer.render_delta."""
+
+    def test_keyframe_then_only_changes(self, graph):
+        """First delta is a keyframe; later ones carry only what moved past epsilon."""
+        substrate, edge_manager, concepts = graph
+        renderer = GraphViewRenderer(substrate=substrate, delta_epsilon=0.01)
+
+        first = renderer.render_delta()
+        assert first.keyframe
+        assert len(first.nodes) == substrate.node_count()
+        assert len(first.edges) == substrate.edge_count()
+        assert first.geometry_overlay is not None
+
+        assert renderer.render_delta().is_empty
+
+        substrate.set_activations([(concepts[0], 0.005)])
+        assert renderer.render_delta().nodes == []
+
+        # Small moves accumulate against what was last sent
+        substrate.set_activations([(concepts[0], 0.02)])
+        assert [n.id for n in renderer.render_delta().nodes] == [concepts[0]]
+
+        edge_manager.create_edge(concepts[1], "V02", weight=0.5)
+        delta = renderer.render_delta()
+        assert [(e.source, e.target) for e in delta.edges] == [(concepts[1], "V02")]
+        assert delta.geometry_overlay is not None  # Topology changed
+
+        substrate.delete_edges([(concepts[1], "V02")])
+        substrate.delete_node(concepts[2])
+        delta = renderer.render_delta()
+        assert delta.removed_edges == [(concepts[1], "V02")]
+        assert delta.removed_nodes == [concepts[2]]
+        assert delta.to_dict()["removed_edges"] == [[concepts[1], "V02"]]
+
+    def test_periodic_and_requested_keyframes(self, graph):
+        """Keyframes recur every interval and on request."""
+        substrate, _, _ = graph
+        renderer = GraphViewRenderer(substrate=substrate, keyframe_interval=3)
+
+        assert [renderer.render_delta().keyframe for _ in range(7)] == [
+            True, False, False, True, False, False, True,
+        ]
+        renderer.request_keyframe()
+        assert renderer.render_delta().keyframe
+
+    def test_view_manager_keyframe_on_switch(self, graph):
+        """Switching to the graph view resends the whole graph."""
+        substrate, _, _ = graph
+        manager = ViewManager(graph_renderer=GraphViewRenderer(substrate=substrate))
+        manager.switch_to(ViewType.GRAPH)
+        assert manager.get_render_data(delta=True)["keyframe"]
+        assert not manager.get_render_data(delta=True)["keyframe"]
+
+        manager.switch_to(ViewType.WORKSPACE)
+        manager.switch_to(ViewType.GRAPH)
+        data = manager.get_render_data(delta=True)
+        assert data["keyframe"] and data["view_type"] == "graph"
@@ -0,0 +1,165 @@
+"""
+Tests for the WebSocket transport layer.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.transport import (
+    Event,
+    TransportServer,
+    TransportSession,
+    VoiceChunk,
+    VoiceOutput,
+    decode_frame,
+    encode_frame,
+)
+from src.transport.events import EventType
+from src.transport.server import create_fastapi_app
+
+
+class TestFrames:
+    """Tests for binary audio frames."""
+
+    def test_voice_chunk_round_trip_without_copy(self):
+        """Test decoded audio is a view into the received frame."""
+        chunk = VoiceChunk(audio_data=b"\x01\x02" * 160, encoding="opus", is_final=True)
+        frame = bytearray(encode_frame(chunk))
+
+        decoded = decode_frame(frame)
+
+        assert isinstance(decoded, VoiceChunk)
+        assert decoded.id == chunk.id
+        assert (decoded.encoding, decoded.sample_rate, decoded.is_final) == ("opus", 16000, True)
+        assert bytes(decoded.audio_data) == chunk.audio_data
+        assert decoded.audio_data.obj is frame
+        assert len(frame) < len(chunk.to_json())
+
+    def test_voice_output_metadata(self):
+        """Test agent, caption text and unlisted encodings survive the frame."""
+        output = VoiceOutput(agent_id="agent_1", audio_data=b"abc", encoding="flac", text="Hello")
+
+        decoded = decode_frame(encode_frame(output))
+
+        assert (decoded.agent_id, decoded.text, decoded.encoding) == ("agent_1", "Hello", "flac")
+        assert decoded.to_dict()["audio_data"] == b"abc".hex()
+
+    def test_rejects_bad_frames(self):
+        """Test truncated frames and control events are refused."""
+        frame = encode_frame(VoiceChunk(audio_data=b"xyz"))
+
+        with pytest.raises(ValueError):
+            decode_frame(frame[:5])
+        with pytest.raises(ValueError):
+            decode_frame(b"\x09" + frame[1:])
+        with pytest.raises(ValueError):
+            encode_frame(Event(type=EventType.PING))
+
+
+class TestBinaryNegotiation:
+    """Tests for per-connection binary audio over FastAPI WebSockets."""
+
+    def test_audio_frames_only_to_binary_clients(self):
+        """Test binary chunks are accepted and audio replies follow each client's choice."""
+        TestClient = pytest.importorskip("fastapi.testclient").TestClient
+
+        server = TransportServer()
+        received = []
+
+        async def echo(event, session, user_id):
+            received.append(bytes(event.audio_data))
+            await session.broadcast(VoiceOutput(agent_id="host", audio_data=b"reply"))
+
+        server.on_event(EventType.VOICE_CHUNK, echo)
+        client = TestClient(create_fastapi_app(server))
+
+        with client.websocket_connect("/ws/s1?user_id=json_user") as json_ws:
+            json_ws.receive_text()  # session state after joining
+            with client.websocket_connect("/ws/s1?user_id=bin_user&binary_audio=true") as bin_ws:
+                bin_ws.receive_text()
+                json_ws.receive_text()
+
+                bin_ws.send_bytes(encode_frame(VoiceChunk(audio_data=b"\x00\x01")))
+
+                reply = decode_frame(bin_ws.receive_bytes())
+                assert (reply.agent_id, bytes(reply.audio_data)) == ("host", b"reply")
+                as_json = json.loads(json_ws.receive_text())
+                assert bytes.fromhex(as_json["audio_data"]) == b"reply"
+
+        assert received == [b"\x00\x01"]
+
+
+class TestOutboundQueues:
+    """Tests for per-connection outbound queues."""
+
+    @staticmethod
+    async def _join(session, user_id, sent, gate=None, fail=False):
+        async def send(message):
+            if gate is not None:
+                await gate.wait()
+            if fail:
+                raise ConnectionError("gone")
+            sent.append(message)
+
+        await session.add_participant(user_id, connection_id=f"conn_{user_id}", send_fn=send)
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_stall_room(self):
+        """Test a blocked connection queues while others keep receiving."""
+        session = TransportSession(session_id="room")
+        gate = asyncio.Event()
+        fast, slow = [], []
+        await self._join(session, "slow", slow, gate=gate)
+        await self._join(session, "fast", fast)
+
+        for i in range(3):
+            await session.send_caption("agent", "Agent", f"line {i}")
+        await asyncio.wait_for(session._outbound["conn_fast"].join(), 1.0)
+
+        captions = [json.loads(m)["text"] for m in fast if json.loads(m)["type"] == "caption"]
+        assert captions == ["line 0", "line 1", "line 2"]
+        assert slow == []
+        assert session.get_queue_stats()["connections"]["conn_slow"]["depth"] > 0
+
+        gate.set()
+        await asyncio.wait_for(session.flush(), 1.0)
+        assert [json.loads(m)["type"] for m in slow][-3:] == ["caption"] * 3
+
+    @pytest.mark.asyncio
+    async def test_superseded_state_is_coalesced_and_overflow_dropped(self):
+        """Test queued stage updates collapse to the latest and full queues drop the oldest."""
+        session = TransportSession(session_id="room", max_queue_size=3)
+        gate = asyncio.Event()
+        sent = []
+        await self._join(session, "viewer", sent, gate=gate)
+        await asyncio.sleep(0)  # writer picks up the join state and blocks
+
+        for url in ["a.png", "b.png", "c.png"]:
+            await session.send_stage_update(image_url=url)
+        for i in range(3):
+            await session.send_caption("agent", "Agent", f"line {i}")
+
+        stats = session.get_queue_stats()
+        assert stats["coalesced"] == 2
+        assert stats["dropped"] == 1
+
+        gate.set()
+        await asyncio.wait_for(session.flush(), 1.0)
+        kinds = [(m["type"], m.get("image_url") or m.get("text")) for m in map(json.loads, sent[1:])]
+        assert kinds == [("caption", "line 0"), ("caption", "line 1"), ("caption", "line 2")]
+
+    @pytest.mark.asyncio
+    async def test_failed_send_removes_participant(self):
+        """Test a connection whose send fails is dropped from the session."""
+        session = TransportSession(session_id="room")
+        await self._join(session, "stays", [])
+        await self._join(session, "broken", [], fail=True)
+
+        await asyncio.wait_for(session.flush(), 1.0)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert session.get_participant("broken") is None
+        assert session.get_participant("stays") is not None
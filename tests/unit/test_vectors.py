@@ -0,0 +1,184 @@
+"""Tests for vector similarity indexes and the embedding service."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from src.theatre.concept_extractor import ConceptExtractor
+from src.vectors import EmbeddingService, ExactIndex, IVFIndex
+from src.vessels.memory import SemanticMemory
+
+
+def _clustered(count, dim=16, topics=20, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((topics, dim))
+    return centers[rng.integers(topics, size=count)] + 0.3 * rng.standard_normal((count, dim))
+
+
+class TestExactIndex:
+    """Tests for ExactIndex."""
+
+    def test_search_ranks_by_cosine_with_id_ties(self):
+        index = ExactIndex()
+        index.add([5, 3, 9], [[1.0, 0.0], [2.0, 0.0], [0.0, 1.0]])
+
+        results = index.search(np.array([1.0, 0.0]), k=2)
+
+        assert [key for key, _ in results] == [3, 5]
+        assert results[0][1] == pytest.approx(1.0)
+        assert index.candidates(np.array([1.0, 0.0])) is None
+
+    def test_remove_and_replace(self):
+        index = ExactIndex()
+        index.add([1, 2, 3], [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+        index.remove([1, 42])
+        index.add([2], [[1.0, 0.0]])
+
+        assert len(index) == 2 and 1 not in index
+        assert [key for key, _ in index.search(np.array([1.0, 0.0]), k=5)] == [2, 3]
+
+
+class TestIVFIndex:
+    """Tests for IVFIndex."""
+
+    def test_small_sets_use_exact_search(self):
+        index = IVFIndex(exact_below=100)
+        index.add(np.arange(50), _clustered(50))
+
+        assert not index.trained
+        assert index.candidates(np.ones(16)) is None
+
+    def test_probing_every_cluster_matches_exact(self):
+        vectors = _clustered(2000)
+        queries = _clustered(20, seed=1)
+        exact, ivf = ExactIndex(), IVFIndex(exact_below=500, nprobe=1)
+        exact.add(np.arange(2000), vectors)
+        ivf.add(np.arange(2000), vectors)
+        assert ivf.trained
+
+        ivf.nprobe = ivf.nlist or 2000
+        for query in queries:
+            assert [k for k, _ in ivf.search(query, 10)] == [k for k, _ in exact.search(query, 10)]
+
+        ivf.nprobe = 1
+        assert len(ivf.candidates(queries[0])) < 2000
+
+    def test_removal_keeps_cells_aligned(self):
+        vectors = _clustered(1000)
+        ivf = IVFIndex(exact_below=200, nprobe=4)
+        ivf.add(np.arange(1000), vectors)
+        ivf.remove(np.arange(0, 1000, 2))
+
+        found = ivf.search(vectors[501], k=1)
+        assert found[0][0] == 501
+
+
+class TestIndexedSearch:
+    """Tests for the VectorIndex option on SemanticMemory and ConceptExtractor."""
+
+    def test_semantic_memory_with_ivf(self):
+        vectors = iter(_clustered(3001))
+        memory = SemanticMemory(
+            embedding_fn=lambda text: next(vectors),
+            vector_index=IVFIndex(exact_below=1000, nprobe=50),
+        )
+        ids = memory.save_many([{"content": f"m{i}"} for i in range(3000)])
+        memory.delete(ids[:10])
+
+        results = memory.load("query", threshold=0.0, limit=5)
+        assert len(results) == 5
+        assert not set(ids[:10]) & {e.id for e in results}
+
+    def test_concept_extractor_uses_index(self):
+        embeddings = {"alpha": np.array([1.0, 0.0]), "beta": np.array([0.8, 0.6])}
+        extractor = ConceptExtractor(
+            embedding_fn=lambda text: embeddings.get(text, np.array([1.0, 0.1])),
+        )
+        extractor.add_concept("c1", "alpha")
+        extractor.add_concept("c2", "beta")
+        extractor.remove_concept("c1")
+        extractor.add_concept("c1", "alpha")
+
+        concepts, _ = extractor._match_concepts_semantic("query")
+        assert [c for c, _ in concepts] == ["c1", "c2"]
+
+
+class TestEmbeddingService:
+    """Tests for EmbeddingService."""
+
+    @staticmethod
+    def _batch_recorder(calls):
+        def batch_fn(texts):
+            calls.append(list(texts))
+            return np.array([[len(text), 1.0] for text in texts])
+        return batch_fn
+
+    def test_cache_hits_and_batching(self):
+        calls = []
+        service = EmbeddingService(batch_fn=self._batch_recorder(calls), max_size=2)
+
+        vectors = service.embed_many(["a", "bb", "a"])
+        assert calls == [["a", "bb"]]
+        assert vectors[0] is vectors[2]
+        assert service("bb") is vectors[1]
+
+        service.embed("ccc")  # evicts "a"
+        service.embed("a")
+        assert calls[1:] == [["ccc"], ["a"]]
+        stats = service.get_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 4
+        assert stats["batches"] == 3 and stats["max_batch_size"] == 2
+
+    def test_concurrent_callers_share_batches(self):
+        calls = []
+        release = threading.Event()
+        inner = self._batch_recorder(calls)
+
+        def slow_batch(texts):
+            release.wait(5)
+            return inner(texts)
+
+        service = EmbeddingService(batch_fn=slow_batch)
+        results = {}
+        threads = [
+            threading.Thread(target=lambda t=text: results.update({t: service.embed(t)}))
+            for text in ["x", "yy", "zzz", "yy"]
+        ]
+        for thread in threads:
+            thread.start()
+            thread.join(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        # The first caller computes alone; everyone who queued behind it shares one batch
+        assert calls == [["x"], ["yy", "zzz"]]
+        assert service.coalesced == 1
+        assert results["zzz"][0] == 3.0
+
+    def test_errors_reach_every_waiter(self):
+        service = EmbeddingService(batch_fn=lambda texts: 1 / 0)
+
+        with pytest.raises(ZeroDivisionError):
+            service.embed("a")
+        assert service.get_stats()["size"] == 0
+
+    def test_disk_cache_survives_restart(self, tmp_path):
+        calls = []
+        EmbeddingService(batch_fn=self._batch_recorder(calls), cache_dir=tmp_path).embed("abc")
+        service = EmbeddingService(batch_fn=self._batch_recorder(calls), cache_dir=tmp_path)
+
+        assert service.embed("abc").tolist() == [3.0, 1.0]
+        assert calls == [["abc"]]
+        assert service.disk_hits == 1
+
+    def test_semantic_memory_embeds_in_batches(self):
+        calls = []
+        service = EmbeddingService(batch_fn=self._batch_recorder(calls))
+        memory = SemanticMemory(embedding_fn=service)
+
+        memory.save_many([{"content": "one"}, {"content": "three"}, {"content": "one"}])
+        memory.load_many(["one", "four"], threshold=-1.0)
+
+        assert calls == [["one", "three"], ["four"]]
@@ -2,11 +2,14 @@
 Tests for Vessels integration module.
 """
 
+import numpy as np
+import os
 import pytest
+import threading
 import time
 from datetime import datetime, timedelta
 
-from src.vessels.memory import SemanticMemory, MemoryEntry
+from src.vessels.memory import SemanticMemory, MemoryEntry, MemoryStore
 from src.vessels.agents import AgentContext, ContextRegistry, InterventionManager, SubordinateManager
 from src.vessels.agents.context import ContextState
 from src.vessels.agents.intervention import InterventionType
@@ -15,6 +18,7 @@ from src.vessels.tools import CodeExecutor, Runtime, A2AChat, BehaviorAdjuster
 from src.vessels.tools.behavior import BehaviorDimension
 from src.vessels.models import ChatGenerationResult, ModelConfig, ModelWrapper
 from src.vessels.runtime import DeferredTaskManager, SessionManager, Session
+from src.vessels.runtime.deferred import TaskPriority, TaskStatus
 
 
 class TestSemanticMemory:
@@ -79,6 +83,132 @@ class TestSemanticMemory:
         forgotten = memory.forget("duplicate", threshold=0.5)
         assert forgotten >= 1
 
+    def test_load_matches_pairwise_scan(self):
+        """Vectorised load ranks like a per-entry cosine scan, ties in insertion order."""
+        rng = np.random.default_rng(0)
+        vectors = {}
+
+        def embed(text):
+            if text not in vectors:
+                vectors[text] = rng.standard_normal(8) if text != "empty" else np.zeros(8)
+            return vectors[text]
+
+        memory = SemanticMemory(embedding_fn=embed)
+        for i in range(200):
+            memory.save(f"c{i % 60}", agent_id=f"agent_{i % 3}", tags=[f"t{i % 4}"])
+        memory.save("empty")
+
+        def scan(query, threshold, limit, agent_id=None, tags=None):
+            q = embed(query)
+            scored = [
+                (memory._cosine_similarity(q, e.embedding), e.id)
+                for e in memory._memories.values()
+                if (not agent_id or e.agent_id == agent_id)
+                and (not tags or any(t in e.tags for t in tags))
+            ]
+            scored = [s for s in scored if s[0] >= threshold]
+            scored.sort(key=lambda s: s[0], reverse=True)
+            return [memory_id for _, memory_id in scored[:limit]]
+
+        for query in ["c0", "c7", "c59", "empty"]:
+            for kwargs in [
+                {"threshold": 0.2, "limit": 5},
+                {"threshold": -1.0, "limit": 30},
+                {"threshold": 0.0, "limit": 4, "agent_id": "agent_1", "tags": ["t0", "t2"]},
+            ]:
+                assert [e.id for e in memory.load(query, **kwargs)] == scan(query, **kwargs)
+
+        batched = memory.load_many(["c1", "c2"], threshold=0.2, limit=5)
+        assert [[e.id for e in r] for r in batched] == [
+            scan("c1", 0.2, 5), scan("c2", 0.2, 5)
+        ]
+
+    def test_load_filters_track_index_changes(self):
+        """Agent/tag masks follow deletes and tag updates."""
+        memory = SemanticMemory(embedding_fn=lambda text: np.ones(4))
+        first = memory.save("a", agent_id="agent_001")
+        second = memory.save("b", agent_id="agent_001")
+
+        assert [e.id for e in memory.load("q", agent_id="agent_001")] == [first, second]
+        assert memory.load("q", tags=["keep"]) == []
+
+        memory.add_tags(second, ["keep"])
+        memory.delete(first)
+        assert [e.id for e in memory.load("q", agent_id="agent_001")] == [second]
+        assert [e.id for e in memory.load("q", tags=["keep"])] == [second]
+        assert memory.get(second).access_count == 3
+
+    def test_save_many_and_slot_reuse(self):
+        """Bulk saves fill the index; deleted slots are reused and compacted lazily."""
+        memory = SemanticMemory(embedding_fn=lambda text: np.ones(4), max_memories=150)
+        ids = memory.save_many(
+            [{"content": f"m{i}", "agent_id": "agent_001", "tags": ["bulk"]} for i in range(100)]
+        )
+        assert len(ids) == 100 and memory.get(ids[0]).tags == ["bulk"]
+
+        memory.delete(ids[:80])
+        newest = memory.save("new", agent_id="agent_001")
+        assert memory._id_to_index[newest] < 80  # reused a freed slot
+
+        # Equal similarity: insertion order, not slot order
+        expected = ids[80:] + [newest]
+        assert [e.id for e in memory.load("q", agent_id="agent_001", limit=50)] == expected
+        assert memory._size == 21  # compacted by the search
+
+        memory.save_many([{"content": f"n{i}"} for i in range(200)])
+        assert len(memory.get_all()) == 150
+
+
+class TestMemoryStore:
+    """Tests for MemoryStore binary snapshots."""
+
+    @staticmethod
+    def _fields(memory):
+        return [
+            (e.id, e.content, e.agent_id, e.tags, e.metadata, e.access_count, e.created_at)
+            for e in memory.get_all()
+        ]
+
+    def test_snapshot_and_deltas_round_trip(self, tmp_path):
+        """Snapshot plus deltas restore entries, order and embeddings without re-embedding."""
+        memory = SemanticMemory(embedding_fn=lambda text: np.full(4, float(len(text))))
+        store = MemoryStore(memory, storage_dir=tmp_path)
+        first = memory.save("first", agent_id="agent_001", tags=["a"], metadata={"k": 1})
+        second = memory.save("second")
+        store.save_snapshot()
+
+        memory.save("third", tags=["b"])
+        memory.delete(first)
+        memory.add_tags(second, ["c"])
+        store.save_delta()
+        memory.load("query", threshold=0.0)
+        store.save_delta()
+        assert store.save_delta() is None  # nothing changed
+
+        def fail(text):
+            raise AssertionError("re-embedded on load")
+
+        restored = SemanticMemory(embedding_fn=fail)
+        assert MemoryStore(restored, storage_dir=tmp_path).load_latest() == 2
+        assert self._fields(restored) == self._fields(memory)
+        assert np.array_equal(restored.get(second).embedding, np.full(4, 6.0))
+
+    def test_auto_save_appends_deltas_then_compacts(self, tmp_path):
+        memory = SemanticMemory(embedding_fn=lambda text: np.ones(4))
+        store = MemoryStore(memory, storage_dir=tmp_path, save_interval=2, max_deltas=2)
+        for i in range(10):
+            store.save_memory(f"m{i}")
+
+        assert len(store._list_snapshots()) == 2
+        assert len(store._list_deltas(store._snapshot)) == 1
+
+        restored = SemanticMemory(embedding_fn=lambda text: np.ones(4))
+        assert MemoryStore(restored, storage_dir=tmp_path).load_latest() == 10
+        assert self._fields(restored) == self._fields(memory)
+
+        assert store.cleanup_old_files(keep_count=1) == 4
+        assert store._list_snapshots() == [store._snapshot]
+
 
 class TestAgentContext:
     """Tests for AgentContext."""
@@ -259,6 +389,47 @@ class TestTaskScheduler:
         assert task.task_type == TaskType.SCHEDULED
         assert task.next_run is not None
 
+    def test_cron_next_run_jumps_fields(self):
+        """Test next-run calculation across hour, day, month and year boundaries."""
+        from src.vessels.scheduler.scheduler import CronParser
+
+        after = datetime(2024, 12, 31, 23, 58, 30)
+        assert CronParser.get_next_run("*/5 * * * *", after) == datetime(2025, 1, 1, 0, 0)
+        assert CronParser.get_next_run("30 9 * * *", after) == datetime(2025, 1, 1, 9, 30)
+        # weekday() numbering: 2 is Wednesday
+        assert CronParser.get_next_run("0 12 * * 2", datetime(2024, 6, 3)) == datetime(2024, 6, 5, 12, 0)
+        assert CronParser.get_next_run("15 10 1 3 *", after) == datetime(2025, 3, 1, 10, 15)
+
+        with pytest.raises(ValueError):
+            CronParser.get_next_run("0 0 30 2 *", after)
+
+    def test_due_tasks_come_from_queue(self):
+        """Test due tasks follow reschedule and deletion."""
+        scheduler = TaskScheduler(auto_start=False)
+        past = datetime.utcnow() - timedelta(minutes=1)
+
+        first = scheduler.create_planned("first", past, func=lambda: None)
+        second = scheduler.create_planned("second", past - timedelta(minutes=1), func=lambda: None)
+        later = scheduler.create_planned("later", past + timedelta(hours=1), func=lambda: None)
+        assert scheduler.get_due_tasks() == [second, first]
+
+        scheduler.reschedule(later.id, past)
+        scheduler.delete_task(first.id)
+        assert scheduler.get_due_tasks() == [second, later]
+
+    def test_loop_runs_task_when_due(self):
+        """Test the loop wakes at the due time rather than the poll interval."""
+        scheduler = TaskScheduler(auto_start=True, poll_interval=60.0)
+        ran = threading.Event()
+        try:
+            task = scheduler.create_planned(
+                "soon", datetime.utcnow() + timedelta(milliseconds=50), func=ran.set
+            )
+            assert ran.wait(5.0)
+            assert task.run_count == 1
+        finally:
+            scheduler.stop()
+
 
 class TestCodeExecutor:
     """Tests for CodeExecutor."""
@@ -479,6 +650,56 @@ class TestDeferredTaskManager:
         assert results == [1, 2]
         manager.stop()
 
+    def test_ready_tasks_run_by_priority(self):
+        """Test ready tasks start highest priority first, then in submission order."""
+        manager = DeferredTaskManager(max_workers=1)
+        gate = threading.Event()
+        order = []
+
+        blocker = manager.submit(gate.wait, 5, name="blocker")
+        for name, priority in [("low", TaskPriority.LOW), ("normal", TaskPriority.NORMAL),
+                               ("critical", TaskPriority.CRITICAL), ("normal2", TaskPriority.NORMAL)]:
+            manager.submit(order.append, name, priority=priority)
+        gate.set()
+
+        assert manager.wait_all(timeout=5)
+        assert order == ["critical", "normal", "normal2", "low"]
+        assert manager.get_stats()["max_queue_wait"] > 0
+        assert blocker.queue_wait_seconds is not None
+        manager.stop()
+
+    def test_fan_out_and_failure_cascade(self):
+        """Test dependents run once all dependencies finish and are cancelled on failure."""
+        manager = DeferredTaskManager(max_workers=4)
+        roots = [manager.submit(lambda i=i: i, name=f"root{i}") for i in range(50)]
+        join = manager.submit(lambda: "joined", dependencies=[t.id for t in roots])
+
+        def fail():
+            raise RuntimeError("boom")
+
+        bad = manager.submit(fail, dependencies=[join.id])
+        child = manager.submit(lambda: "never", dependencies=[bad.id])
+        grandchild = manager.submit(lambda: "never", dependencies=[child.id])
+
+        assert manager.wait_for(grandchild.id, timeout=5).status == TaskStatus.CANCELLED
+        assert manager.wait_all(timeout=5) is False
+        assert join.result == "joined"
+        assert bad.status == TaskStatus.FAILED
+        assert child.error == f"Dependency {bad.id} failed"
+
+        late = manager.submit(lambda: "late", dependencies=[bad.id])
+        assert late.status == TaskStatus.CANCELLED
+        manager.stop()
+
+    def test_cpu_bound_tasks_use_process_pool(self):
+        """Test cpu_bound tasks run in worker processes."""
+        manager = DeferredTaskManager(max_workers=1, process_workers=1)
+        task = manager.submit(os.getpid, cpu_bound=True)
+
+        assert manager.wait_for(task.id, timeout=30).status == TaskStatus.COMPLETED
+        assert task.result != os.getpid()
+        manager.stop()
+
 
 class TestSessionManager:
     """Tests for SessionManager."""